@@ -7,8 +7,13 @@ import os
 import shutil
 import subprocess
 import tarfile
+import uuid
+from contextlib import suppress
 from pathlib import Path
 
+DEFAULT_ZSTD_LEVEL = 19
+_STREAM_CHUNK_BYTES = 1024 * 1024
+
 
 class ArchiveError(RuntimeError):
     """Raised for archive pack/unpack failures."""
@@ -30,70 +35,119 @@ def _zstd_bin() -> str:
     return binary
 
 
-def compress_tar_zst(*, tar_path: Path, out_path: Path, level: int = 19) -> None:
-    """Compress a `.tar` file into `.tar.zst` using the zstd CLI."""
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    zstd = _zstd_bin()
+def _compression_args(level: int, threads: int) -> list[str]:
     bounded_level = max(1, min(22, int(level)))
-    completed = subprocess.run(
-        [
-            zstd,
-            "-T0",
-            f"-{bounded_level}",
-            "-f",
-            str(tar_path),
-            "-o",
-            str(out_path),
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    if completed.returncode != 0:
-        raise ArchiveError(f"zstd compression failed: {completed.stderr.strip()}")
-
-
-def decompress_zst_to_tar(*, zst_path: Path, tar_path: Path) -> None:
-    """Decompress a `.zst` file into a `.tar` file using the zstd CLI."""
-    tar_path.parent.mkdir(parents=True, exist_ok=True)
-    zstd = _zstd_bin()
-    completed = subprocess.run(
-        [
-            zstd,
-            "-d",
-            "-f",
-            str(zst_path),
-            "-o",
-            str(tar_path),
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
+    args = [f"-T{max(0, int(threads))}", f"-{bounded_level}"]
+    if bounded_level > 19:
+        args.append("--ultra")
+    return args
+
+
+def _safe_member_target(destination: Path, name: str) -> None:
+    member_target = (destination / name).resolve()
+    common = os.path.commonpath([str(destination), str(member_target)])
+    if common != str(destination):
+        raise ArchiveError(f"unsafe tar member path: {name}")
+
+
+def write_tar_zst(
+    *,
+    out_path: Path,
+    root: Path,
+    files: list[Path],
+    level: int = DEFAULT_ZSTD_LEVEL,
+    threads: int = 0,
+) -> None:
+    """Stream a tar of `files` (rooted at `root`) through multi-threaded zstd.
+
+    No intermediate `.tar` is written: tar blocks are piped straight into `zstd`, which
+    compresses on `threads` workers (0 = one per core) into a temp file that replaces
+    `out_path` only on success.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".tmp-{out_path.name}-{uuid.uuid4().hex}")
+    process = subprocess.Popen(
+        [_zstd_bin(), *_compression_args(level, threads), "-q", "-f", "-o", str(tmp_path)],
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
-    if completed.returncode != 0:
-        raise ArchiveError(f"zstd decompression failed: {completed.stderr.strip()}")
-
-
-def write_tar(*, tar_path: Path, root: Path, files: list[Path]) -> None:
-    """Write a tar archive rooted at `root` for a list of files."""
-    tar_path.parent.mkdir(parents=True, exist_ok=True)
-    with tarfile.open(tar_path, "w") as tar:
-        for file_path in sorted(files):
-            arcname = file_path.relative_to(root).as_posix()
-            tar.add(file_path, arcname=arcname, recursive=False)
-
-
-def safe_extract_tar(*, tar_path: Path, destination: Path) -> list[str]:
-    """Extract tar contents, rejecting path traversal entries."""
+    assert process.stdin is not None and process.stderr is not None
+    try:
+        try:
+            with tarfile.open(fileobj=process.stdin, mode="w|") as tar:
+                for file_path in sorted(files):
+                    arcname = file_path.relative_to(root).as_posix()
+                    tar.add(file_path, arcname=arcname, recursive=False)
+        finally:
+            process.stdin.close()
+        stderr = process.stderr.read().decode("utf-8", errors="replace")
+        if process.wait() != 0:
+            raise ArchiveError(f"zstd compression failed: {stderr.strip()}")
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        raise
+    finally:
+        process.stderr.close()
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+def _promote_tree(staging: Path, destination: Path) -> None:
+    for dirpath, dirnames, filenames in os.walk(staging):
+        source_dir = Path(dirpath)
+        target_dir = destination / source_dir.relative_to(staging)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        linked_dirs = [name for name in dirnames if (source_dir / name).is_symlink()]
+        for name in [*filenames, *linked_dirs]:
+            os.replace(source_dir / name, target_dir / name)
+
+
+def extract_tar_zst(*, zst_path: Path, destination: Path) -> list[str]:
+    """Stream-decompress a `.tar.zst` and extract it, rejecting path traversal entries.
+
+    Members land in a temp directory under `destination` and are moved into place only
+    after every member passed the path check and `zstd` exited cleanly, so an unsafe or
+    truncated archive leaves `destination` untouched.
+    """
     destination.mkdir(parents=True, exist_ok=True)
     destination_resolved = destination.resolve()
-    with tarfile.open(tar_path, "r") as archive:
-        names: list[str] = []
-        for member in archive.getmembers():
-            member_target = (destination_resolved / member.name).resolve()
-            common = os.path.commonpath([str(destination_resolved), str(member_target)])
-            if common != str(destination_resolved):
-                raise ArchiveError(f"unsafe tar member path: {member.name}")
-            names.append(member.name)
-        archive.extractall(destination_resolved, filter="data")
-        return names
+    staging = destination_resolved / f".tmp-extract-{uuid.uuid4().hex}"
+    staging.mkdir()
+    process = subprocess.Popen(
+        [_zstd_bin(), "-d", "-c", "-q", str(zst_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout is not None and process.stderr is not None
+    names: list[str] = []
+    try:
+        try:
+            with tarfile.open(fileobj=process.stdout, mode="r|") as archive:
+                for member in archive:
+                    _safe_member_target(staging, member.name)
+                    archive.extract(member, staging, filter="data")
+                    names.append(member.name)
+            # Drain tar end-of-archive padding so zstd can exit.
+            while process.stdout.read(_STREAM_CHUNK_BYTES):
+                pass
+        except tarfile.TarError as exc:
+            process.kill()
+            raise ArchiveError(f"invalid tar.zst archive {zst_path}: {exc}") from exc
+        finally:
+            process.stdout.close()
+        stderr = process.stderr.read().decode("utf-8", errors="replace")
+        if process.wait() != 0:
+            raise ArchiveError(f"zstd decompression failed: {stderr.strip()}")
+        _promote_tree(staging, destination_resolved)
+    except BaseException:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        raise
+    finally:
+        process.stderr.close()
+        shutil.rmtree(staging, ignore_errors=True)
+    return names
@@ -8,8 +8,8 @@ import json
 from pathlib import Path
 from typing import Any
 
-from prop_ev.nba_data.repo import NBARepository
 from prop_ev.time_utils import utc_now_str
+from prop_ev.util.jsonl import write_jsonl
 from prop_ev.util.parsing import safe_float as _safe_float
 
 ROW_SELECTIONS = {"eligible", "ranked", "top_ev", "one_source", "all_candidates"}
@@ -177,13 +177,6 @@ def _write_json(path: Path, payload: Any) -> None:
     path.write_text(json.dumps(payload, sort_keys=True, indent=2) + "\n", encoding="utf-8")
 
 
-def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        for row in rows:
-            handle.write(json.dumps(row, sort_keys=True) + "\n")
-
-
 def _write_template_csv(path: Path, rows: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     columns = [
@@ -284,6 +277,8 @@ def build_backtest_readiness(
     featured_path = derived_dir / "featured_odds.jsonl"
     strategy_path = strategy_report_path or (reports_dir / "strategy-report.json")
     odds_data_root = snapshot_dir.parent.parent
+    from prop_ev.nba_data.repo import NBARepository
+
     context_repo = NBARepository(
         odds_data_root=odds_data_root,
         snapshot_id=str(report.get("snapshot_id", "")).strip() or snapshot_dir.name,
@@ -387,7 +382,7 @@ def write_backtest_artifacts(
     def _write(
         seed_path: Path, template_path: Path, readiness_path: Path, strategy_path: Path
     ) -> None:
-        _write_jsonl(seed_path, seed_rows)
+        write_jsonl(seed_path, seed_rows)
         _write_template_csv(template_path, seed_rows)
         readiness = build_backtest_readiness(
             snapshot_dir=snapshot_dir,
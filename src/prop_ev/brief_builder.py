@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Callable
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from prop_ev.markdown_tree import PAGEBREAK_MARKER, MarkdownDocument, split_table_row
 from prop_ev.nba_data.normalize import canonical_team_name
 from prop_ev.time_utils import parse_iso_z
 
@@ -28,6 +30,7 @@ REQUIRED_PASS2_HEADINGS = [
     "## Confidence",
 ]
 
+ACTION_PLAN_HEADING = "## Action Plan (GO / LEAN / NO-GO)"
 P_HIT_NOTES_HEADING = "### Interpreting p(hit)"
 
 ET_ZONE = ZoneInfo("America/New_York")
@@ -217,18 +220,6 @@ def _md_cell(value: Any) -> str:
     return text.replace("|", "\\|")
 
 
-def _split_markdown_row(line: str) -> list[str] | None:
-    stripped = line.strip()
-    if not (stripped.startswith("|") and stripped.endswith("|")):
-        return None
-    placeholder = "__PIPE_PLACEHOLDER__"
-    normalized = stripped.replace("\\|", placeholder)
-    cells = [cell.strip().replace(placeholder, "|") for cell in normalized[1:-1].split("|")]
-    if not cells:
-        return None
-    return cells
-
-
 def _make_ticket(
     *,
     player: str,
@@ -1091,46 +1082,42 @@ def _render_game_cards_section(
     return "\n".join(lines).strip()
 
 
-def append_game_cards_section(markdown: str, *, brief_input: dict[str, Any]) -> str:
-    """Append deterministic per-game cards (one game per page in PDF)."""
-    base = markdown.rstrip()
+def _append_game_cards(document: MarkdownDocument, *, brief_input: dict[str, Any]) -> None:
     section_heading = "## Game Cards by Matchup"
-    if section_heading in base:
-        return base + "\n"
-
+    if any(section_heading in line for line in document.lines()):
+        return
     game_cards_section = _render_game_cards_section(
         brief_input=brief_input,
         include_pagebreak_markers=True,
     )
-    if not game_cards_section:
-        return base + "\n"
-    return base + "\n\n" + game_cards_section + "\n"
+    if game_cards_section:
+        document.normalize_tail()
+        separator = [""] if document.preamble or document.sections else ["", ""]
+        document.append(separator + game_cards_section.splitlines())
 
 
-def enforce_readability_labels(markdown: str, *, top_n: int) -> str:
-    """Ensure stable reader-facing labels are present in brief markdown."""
-    lines = markdown.splitlines()
+def append_game_cards_section(markdown: str, *, brief_input: dict[str, Any]) -> str:
+    """Append deterministic per-game cards (one game per page in PDF)."""
+    return _apply(markdown, _append_game_cards, brief_input=brief_input)
 
-    def _insert_after_heading(heading: str, required_line: str) -> None:
-        for idx, line in enumerate(lines):
-            if line.strip() != heading:
-                continue
-            probe = idx + 1
-            while probe < len(lines) and not lines[probe].strip():
-                probe += 1
-            if probe < len(lines) and lines[probe].strip() == required_line:
-                return
-            lines.insert(idx + 1, "")
-            lines.insert(idx + 2, required_line)
-            lines.insert(idx + 3, "")
-            return
-
-    _insert_after_heading(
-        "## Action Plan (GO / LEAN / NO-GO)",
-        f"### Top {max(0, top_n)} Across All Games",
-    )
 
-    return "\n".join(lines).rstrip() + "\n"
+def _enforce_readability_labels(document: MarkdownDocument, *, top_n: int) -> None:
+    section = document.find(ACTION_PLAN_HEADING)
+    if section is None:
+        return
+    required_line = f"### Top {max(0, top_n)} Across All Games"
+    body = section.lines
+    probe = 0
+    while probe < len(body) and not body[probe].strip():
+        probe += 1
+    if probe < len(body) and body[probe].strip() == required_line:
+        return
+    body[0:0] = ["", required_line, ""]
+
+
+def enforce_readability_labels(markdown: str, *, top_n: int) -> str:
+    """Ensure stable reader-facing labels are present in brief markdown."""
+    return _apply(markdown, _enforce_readability_labels, top_n=top_n)
 
 
 def _best_available_row(brief_input: dict[str, Any]) -> dict[str, Any] | None:
@@ -1209,48 +1196,30 @@ def render_best_available_section(brief_input: dict[str, Any]) -> str:
     return "\n".join(lines).strip()
 
 
-def upsert_best_available_section(markdown: str, *, brief_input: dict[str, Any]) -> str:
-    """Insert/replace Best Available section before Action Plan."""
-    lines = markdown.splitlines()
-    lines, _ = _extract_top_level_section(lines, "## Best Available Bet Right Now")
-
-    action_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == "## Action Plan (GO / LEAN / NO-GO)":
-            action_idx = idx
-            break
-    if action_idx is None:
-        return markdown.rstrip() + "\n"
+def _upsert_best_available(document: MarkdownDocument, *, brief_input: dict[str, Any]) -> None:
+    if document.index(ACTION_PLAN_HEADING) is None:
+        return
+    document.extract("## Best Available Bet Right Now")
+    action_idx = document.index(ACTION_PLAN_HEADING)
+    assert action_idx is not None
+    document.insert(action_idx, render_best_available_section(brief_input).splitlines() + [""])
 
-    block = render_best_available_section(brief_input).splitlines()
-    merged = lines[:action_idx] + block + [""] + lines[action_idx:]
-    return "\n".join(merged).rstrip() + "\n"
 
+def upsert_best_available_section(markdown: str, *, brief_input: dict[str, Any]) -> str:
+    """Insert/replace Best Available section before Action Plan."""
+    return _apply(markdown, _upsert_best_available, brief_input=brief_input)
 
-def strip_empty_go_placeholder_rows(markdown: str) -> str:
-    """Remove synthetic GO placeholder rows from Action Plan tables."""
-    lines = markdown.splitlines()
-    action_heading = "## Action Plan (GO / LEAN / NO-GO)"
-    start_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == action_heading:
-            start_idx = idx
-            break
-    if start_idx is None:
-        return markdown.rstrip() + "\n"
 
-    end_idx = len(lines)
-    for idx in range(start_idx + 1, len(lines)):
-        if lines[idx].strip().startswith("## "):
-            end_idx = idx
-            break
+def _strip_empty_go_placeholder_rows(document: MarkdownDocument) -> None:
+    section = document.find(ACTION_PLAN_HEADING)
+    if section is None:
+        return
 
-    section = lines[start_idx + 1 : end_idx]
     filtered: list[str] = []
     changed = False
-    for line in section:
+    for line in section.lines:
         stripped = line.strip()
-        cells = _split_markdown_row(stripped)
+        cells = split_table_row(stripped)
         if cells is not None:
             action = _to_str(cells[0]).strip().upper()
             joined = " ".join(cells).lower()
@@ -1282,16 +1251,19 @@ def strip_empty_go_placeholder_rows(markdown: str) -> str:
         filtered.append(line)
 
     if not changed:
-        return markdown.rstrip() + "\n"
+        return
 
     normalized: list[str] = []
     for line in filtered:
         if not line.strip() and normalized and not normalized[-1].strip():
             continue
         normalized.append(line)
+    section.lines = normalized
 
-    merged = lines[: start_idx + 1] + normalized + lines[end_idx:]
-    return "\n".join(merged).rstrip() + "\n"
+
+def strip_empty_go_placeholder_rows(markdown: str) -> str:
+    """Remove synthetic GO placeholder rows from Action Plan tables."""
+    return _apply(markdown, _strip_empty_go_placeholder_rows)
 
 
 def build_analyst_web_prompt(brief_input: dict[str, Any], pass1: dict[str, Any]) -> str:
@@ -1687,199 +1659,113 @@ def render_analyst_take_section(
     return "\n".join(lines).strip()
 
 
+def _upsert_analyst_take(document: MarkdownDocument, analyst_section_markdown: str) -> None:
+    if document.index(ACTION_PLAN_HEADING) is None:
+        return
+    document.extract("## Pre-Bet Checklist")
+    document.extract("## Analyst Take")
+    action_idx = document.index(ACTION_PLAN_HEADING)
+    assert action_idx is not None
+    block = [PAGEBREAK_MARKER, ""]
+    block.extend(analyst_section_markdown.splitlines())
+    block.extend(["", PAGEBREAK_MARKER, ""])
+    document.insert(action_idx, block)
+
+
 def upsert_analyst_take_section(markdown: str, analyst_section_markdown: str) -> str:
     """Insert/replace Analyst Take section before Action Plan with page breaks."""
-    lines = markdown.splitlines()
-    lines, _ = _extract_top_level_section(lines, "## Pre-Bet Checklist")
-    lines, _ = _extract_top_level_section(lines, "## Analyst Take")
-
-    action_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == "## Action Plan (GO / LEAN / NO-GO)":
-            action_idx = idx
-            break
-    if action_idx is None:
-        return markdown.rstrip() + "\n"
-
-    block = ["<!-- pagebreak -->", ""]
-    block.extend(analyst_section_markdown.splitlines())
-    block.extend(["", "<!-- pagebreak -->", ""])
-    merged = lines[:action_idx] + block + lines[action_idx:]
-    return "\n".join(merged).rstrip() + "\n"
+    return _apply(markdown, _upsert_analyst_take, analyst_section_markdown)
 
 
 def strip_risks_and_watchouts_section(markdown: str) -> str:
     """Remove legacy risks/watchouts section from markdown output."""
-    lines = markdown.splitlines()
-    while True:
-        start_idx: int | None = None
-        for idx, line in enumerate(lines):
-            if line.strip() == "## Risks and Watchouts":
-                start_idx = idx
-                break
-        if start_idx is None:
-            break
-
-        end_idx = len(lines)
-        for idx in range(start_idx + 1, len(lines)):
-            if lines[idx].strip().startswith("## "):
-                end_idx = idx
-                break
-        del lines[start_idx:end_idx]
-
-    return "\n".join(lines).rstrip() + "\n"
+    return _apply(markdown, MarkdownDocument.drop, "## Risks and Watchouts")
 
 
 def strip_tier_b_view_section(markdown: str) -> str:
     """Remove legacy Tier B table section from markdown output."""
-    lines = markdown.splitlines()
-    while True:
-        start_idx: int | None = None
-        for idx, line in enumerate(lines):
-            if line.strip() == "## Tier B View (Single-Book Lines)":
-                start_idx = idx
-                break
-        if start_idx is None:
-            break
+    return _apply(markdown, MarkdownDocument.drop, "## Tier B View (Single-Book Lines)")
 
-        end_idx = len(lines)
-        for idx in range(start_idx + 1, len(lines)):
-            if lines[idx].strip().startswith("## "):
-                end_idx = idx
-                break
-        del lines[start_idx:end_idx]
 
-    return "\n".join(lines).rstrip() + "\n"
-
-
-def _extract_top_level_section(lines: list[str], heading: str) -> tuple[list[str], list[str]]:
-    start_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == heading:
-            start_idx = idx
-            break
-    if start_idx is None:
-        return lines, []
-
-    end_idx = len(lines)
-    for idx in range(start_idx + 1, len(lines)):
-        if lines[idx].strip().startswith("## "):
-            end_idx = idx
-            break
-
-    trim_idx = end_idx
-    while trim_idx > start_idx and not lines[trim_idx - 1].strip():
-        trim_idx -= 1
-    if trim_idx > start_idx and lines[trim_idx - 1].strip() == "<!-- pagebreak -->":
-        trim_idx -= 1
-        while trim_idx > start_idx and not lines[trim_idx - 1].strip():
-            trim_idx -= 1
-
-    section = lines[start_idx:trim_idx]
-    remaining = lines[:start_idx] + lines[trim_idx:]
-    return remaining, section
-
-
-def _ensure_pagebreak_before_heading(lines: list[str], heading: str) -> list[str]:
-    target_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == heading:
-            target_idx = idx
-            break
-    if target_idx is None:
-        return lines
-
-    probe = target_idx - 1
-    while probe >= 0 and not lines[probe].strip():
-        probe -= 1
-    if probe >= 0 and lines[probe].strip() == "<!-- pagebreak -->":
-        return lines
-
-    return lines[:target_idx] + ["<!-- pagebreak -->", ""] + lines[target_idx:]
+def _ensure_pagebreak_before(document: MarkdownDocument, title: str) -> None:
+    idx = document.index(title)
+    if idx is None:
+        return
+    before = document.lines_before(idx)
+    previous = next((line.strip() for line in reversed(before) if line.strip()), "")
+    if previous == PAGEBREAK_MARKER:
+        return
+    before.extend([PAGEBREAK_MARKER, ""])
 
 
 def ensure_pagebreak_before_action_plan(markdown: str) -> str:
     """Guarantee a page break immediately before the Action Plan heading."""
-    lines = markdown.splitlines()
-    lines = _ensure_pagebreak_before_heading(lines, "## Action Plan (GO / LEAN / NO-GO)")
-    return "\n".join(lines).rstrip() + "\n"
+    return _apply(markdown, _ensure_pagebreak_before, ACTION_PLAN_HEADING)
 
 
-def move_disclosures_to_end(markdown: str) -> str:
-    """Move Data Quality/Confidence to the end with a page break before disclosures."""
-    lines = markdown.splitlines()
-    lines, data_quality = _extract_top_level_section(lines, "## Data Quality")
-    lines, confidence = _extract_top_level_section(lines, "## Confidence")
-    lines = _ensure_pagebreak_before_heading(lines, "## Game Cards by Matchup")
-    if not data_quality and not confidence:
-        return markdown.rstrip() + "\n"
-
-    out: list[str] = list(lines)
-    while out and not out[-1].strip():
-        out.pop()
-    last_nonempty = out[-1].strip() if out else ""
-    if last_nonempty != "<!-- pagebreak -->":
-        out.append("")
-        out.append("<!-- pagebreak -->")
-        out.append("")
-    else:
-        out.append("")
+def _move_disclosures_to_end(document: MarkdownDocument) -> None:
+    data_quality = document.extract("## Data Quality")
+    confidence = document.extract("## Confidence")
+    if data_quality is None and confidence is None:
+        return
+    _ensure_pagebreak_before(document, "## Game Cards by Matchup")
 
-    if data_quality:
-        out.extend(data_quality)
-        if confidence:
-            out.append("")
-    if confidence:
-        out.extend(confidence)
+    tail = document.last_lines()
+    while tail and not tail[-1].strip():
+        tail.pop()
+    if tail:
+        last_nonempty = tail[-1].strip()
+    else:
+        last_nonempty = document.sections[-1].title if document.sections else ""
+    if last_nonempty != PAGEBREAK_MARKER:
+        tail.extend(["", PAGEBREAK_MARKER, ""])
+    else:
+        tail.append("")
 
-    return "\n".join(out).rstrip() + "\n"
+    if data_quality is not None:
+        document.sections.append(data_quality)
+        if confidence is not None:
+            data_quality.lines.append("")
+    if confidence is not None:
+        document.sections.append(confidence)
 
 
-def upsert_action_plan_table(markdown: str, *, brief_input: dict[str, Any], top_n: int) -> str:
-    """Replace the Action Plan table with a deterministic, sorted table."""
-    lines = markdown.splitlines()
-    action_heading = "## Action Plan (GO / LEAN / NO-GO)"
+def move_disclosures_to_end(markdown: str) -> str:
+    """Move Data Quality/Confidence to the end with a page break before disclosures."""
+    return _apply(markdown, _move_disclosures_to_end)
 
-    action_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == action_heading:
-            action_idx = idx
-            break
-    if action_idx is None:
-        return markdown.rstrip() + "\n"
 
-    section_end = len(lines)
-    for idx in range(action_idx + 1, len(lines)):
-        if lines[idx].strip().startswith("## "):
-            section_end = idx
-            break
+def _upsert_action_plan_table(
+    document: MarkdownDocument, *, brief_input: dict[str, Any], top_n: int
+) -> None:
+    section = document.find(ACTION_PLAN_HEADING)
+    if section is None:
+        return
+    body = section.lines
 
     # Find the Top-N label if present; otherwise insert immediately after the Action Plan heading.
     top_label = f"### Top {max(0, top_n)} Across All Games"
     top_idx: int | None = None
-    for idx in range(action_idx + 1, section_end):
-        if lines[idx].strip() == top_label:
+    for idx, line in enumerate(body):
+        if line.strip() == top_label:
             top_idx = idx
             break
     if top_idx is None:
-        for idx in range(action_idx + 1, section_end):
-            if lines[idx].strip().startswith("### Top ") and " Across All Games" in lines[idx]:
+        for idx, line in enumerate(body):
+            if line.strip().startswith("### Top ") and " Across All Games" in line:
                 top_idx = idx
                 break
-    if top_idx is None:
-        top_idx = action_idx
 
-    search_start = top_idx + 1
-    search_end = section_end
-    for idx in range(search_start, section_end):
-        stripped = lines[idx].strip()
-        if stripped.startswith("## ") or stripped.startswith("### "):
+    search_start = 0 if top_idx is None else top_idx + 1
+    search_end = len(body)
+    for idx in range(search_start, len(body)):
+        if body[idx].strip().startswith("### "):
             search_end = idx
             break
 
     table_start: int | None = None
     for idx in range(search_start, search_end):
-        if _split_markdown_row(lines[idx]) is not None:
+        if split_table_row(body[idx]) is not None:
             table_start = idx
             break
 
@@ -1889,7 +1775,7 @@ def upsert_action_plan_table(markdown: str, *, brief_input: dict[str, Any], top_
     else:
         replace_start = table_start
         table_end = table_start
-        while table_end < search_end and _split_markdown_row(lines[table_end]) is not None:
+        while table_end < search_end and split_table_row(body[table_end]) is not None:
             table_end += 1
         replace_end = table_end
 
@@ -1899,73 +1785,55 @@ def upsert_action_plan_table(markdown: str, *, brief_input: dict[str, Any], top_
     clipped = top_plays[: max(0, int(top_n))]
     table_lines = _render_action_plan_table_rows([row for row in clipped if isinstance(row, dict)])
 
+    # The heading precedes the body and the next heading (or document end) follows it.
     block: list[str] = []
-    if replace_start <= len(lines) and (replace_start == 0 or lines[replace_start - 1].strip()):
+    if replace_start == 0 or body[replace_start - 1].strip():
         block.append("")
     block.extend(table_lines)
-    if replace_end >= len(lines) or lines[replace_end].strip():
+    if replace_end >= len(body) or body[replace_end].strip():
         block.append("")
+    body[replace_start:replace_end] = block
 
-    merged = lines[:replace_start] + block + lines[replace_end:]
-    return "\n".join(merged).rstrip() + "\n"
 
+def upsert_action_plan_table(markdown: str, *, brief_input: dict[str, Any], top_n: int) -> str:
+    """Replace the Action Plan table with a deterministic, sorted table."""
+    return _apply(markdown, _upsert_action_plan_table, brief_input=brief_input, top_n=top_n)
 
-def enforce_p_hit_notes(markdown: str) -> str:
-    """Ensure Confidence includes a short explainer for p(hit)."""
-    lines = markdown.splitlines()
-    confidence_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == "## Confidence":
-            confidence_idx = idx
-            break
-    if confidence_idx is None:
-        return markdown.rstrip() + "\n"
-
-    section_end = len(lines)
-    for idx in range(confidence_idx + 1, len(lines)):
-        if lines[idx].strip().startswith("## "):
-            section_end = idx
-            break
 
-    section = lines[confidence_idx + 1 : section_end]
-    if any(row.strip() == P_HIT_NOTES_HEADING for row in section):
-        return markdown.rstrip() + "\n"
+def _enforce_p_hit_notes(document: MarkdownDocument) -> None:
+    section = document.find("## Confidence")
+    if section is None:
+        return
+    body = section.lines
+    if any(row.strip() == P_HIT_NOTES_HEADING for row in body):
+        return
 
-    insert_at = section_end
-    while insert_at > confidence_idx + 1 and not lines[insert_at - 1].strip():
+    insert_at = len(body)
+    while insert_at > 0 and not body[insert_at - 1].strip():
         insert_at -= 1
 
     block: list[str] = []
-    if insert_at > confidence_idx + 1 and lines[insert_at - 1].strip():
+    if insert_at > 0:
         block.append("")
     block.extend(_p_hit_notes_block())
     block.append("")
-    merged = lines[:insert_at] + block + lines[insert_at:]
-    return "\n".join(merged).rstrip() + "\n"
+    body[insert_at:insert_at] = block
 
 
-def enforce_snapshot_mode_labels(
-    markdown: str, *, llm_pass1_status: str, llm_pass2_status: str
-) -> str:
-    """Clarify source/scoring/narrative modes inside Snapshot section."""
-    lines = markdown.splitlines()
-    snapshot_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == "## Snapshot":
-            snapshot_idx = idx
-            break
-    if snapshot_idx is None:
-        return markdown.rstrip() + "\n"
+def enforce_p_hit_notes(markdown: str) -> str:
+    """Ensure Confidence includes a short explainer for p(hit)."""
+    return _apply(markdown, _enforce_p_hit_notes)
 
-    section_end = len(lines)
-    for idx in range(snapshot_idx + 1, len(lines)):
-        if lines[idx].strip().startswith("## "):
-            section_end = idx
-            break
 
-    section = lines[snapshot_idx + 1 : section_end]
+def _enforce_snapshot_mode_labels(
+    document: MarkdownDocument, *, llm_pass1_status: str, llm_pass2_status: str
+) -> None:
+    section = document.find("## Snapshot")
+    if section is None:
+        return
+
     filtered: list[str] = []
-    for row in section:
+    for row in section.lines:
         stripped = row.strip()
         if stripped.startswith("- source:"):
             continue
@@ -1994,31 +1862,28 @@ def enforce_snapshot_mode_labels(
     new_section = filtered[:insert_at] + source_lines + filtered[insert_at:]
     while len(new_section) >= 2 and not new_section[-1].strip() and not new_section[-2].strip():
         new_section.pop()
+    section.lines = new_section
 
-    merged = lines[: snapshot_idx + 1] + new_section + lines[section_end:]
-    return "\n".join(merged).rstrip() + "\n"
 
+def enforce_snapshot_mode_labels(
+    markdown: str, *, llm_pass1_status: str, llm_pass2_status: str
+) -> str:
+    """Clarify source/scoring/narrative modes inside Snapshot section."""
+    return _apply(
+        markdown,
+        _enforce_snapshot_mode_labels,
+        llm_pass1_status=llm_pass1_status,
+        llm_pass2_status=llm_pass2_status,
+    )
 
-def enforce_snapshot_dates_et(markdown: str, *, brief_input: dict[str, Any]) -> str:
-    """Ensure Snapshot uses ET date/time labels and removes UTC/Z narrative lines."""
-    lines = markdown.splitlines()
-    snapshot_idx: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == "## Snapshot":
-            snapshot_idx = idx
-            break
-    if snapshot_idx is None:
-        return markdown.rstrip() + "\n"
 
-    section_end = len(lines)
-    for idx in range(snapshot_idx + 1, len(lines)):
-        if lines[idx].strip().startswith("## "):
-            section_end = idx
-            break
+def _enforce_snapshot_dates_et(document: MarkdownDocument, *, brief_input: dict[str, Any]) -> None:
+    section = document.find("## Snapshot")
+    if section is None:
+        return
 
-    section = lines[snapshot_idx + 1 : section_end]
     filtered: list[str] = []
-    for row in section:
+    for row in section.lines:
         stripped = row.strip()
         if stripped.startswith(
             ("- snapshot_id:", "- modeled_date_et:", "- generated_at_et:", "- execution_books:")
@@ -2057,15 +1922,16 @@ def enforce_snapshot_dates_et(markdown: str, *, brief_input: dict[str, Any]) ->
         meta.append(f"- execution_books: `{', '.join(_to_str(book) for book in execution_books)}`")
 
     if not meta:
-        return markdown.rstrip() + "\n"
+        return
 
     while filtered and not filtered[0].strip():
         filtered.pop(0)
+    section.lines = meta + filtered
+
 
-    new_section = meta[:]
-    new_section.extend(filtered)
-    merged = lines[: snapshot_idx + 1] + new_section + lines[section_end:]
-    return "\n".join(merged).rstrip() + "\n"
+def enforce_snapshot_dates_et(markdown: str, *, brief_input: dict[str, Any]) -> str:
+    """Ensure Snapshot uses ET date/time labels and removes UTC/Z narrative lines."""
+    return _apply(markdown, _enforce_snapshot_dates_et, brief_input=brief_input)
 
 
 def normalize_pass2_markdown(pass2_text: str, fallback_markdown: str) -> str:
@@ -2076,3 +1942,47 @@ def normalize_pass2_markdown(pass2_text: str, fallback_markdown: str) -> str:
     if all(heading in text for heading in REQUIRED_PASS2_HEADINGS):
         return text if text.endswith("\n") else text + "\n"
     return fallback_markdown
+
+
+def _apply(markdown: str, rule: Callable[..., None], *args: Any, **kwargs: Any) -> str:
+    document = MarkdownDocument.parse(markdown)
+    rule(document, *args, **kwargs)
+    return document.to_markdown()
+
+
+def build_brief_document(
+    markdown: str,
+    *,
+    brief_input: dict[str, Any],
+    top_n: int,
+    analyst_section_markdown: str,
+    llm_pass1_status: str,
+    llm_pass2_status: str,
+) -> MarkdownDocument:
+    """Parse brief markdown once and apply every deterministic post-processing rule in order."""
+    document = MarkdownDocument.parse(markdown)
+    rules: list[tuple[Callable[..., None], tuple[Any, ...], dict[str, Any]]] = [
+        (MarkdownDocument.drop, ("## Risks and Watchouts",), {}),
+        (MarkdownDocument.drop, ("## Tier B View (Single-Book Lines)",), {}),
+        (_strip_empty_go_placeholder_rows, (), {}),
+        (_enforce_readability_labels, (), {"top_n": top_n}),
+        (_upsert_action_plan_table, (), {"brief_input": brief_input, "top_n": top_n}),
+        (_upsert_analyst_take, (analyst_section_markdown,), {}),
+        (_upsert_best_available, (), {"brief_input": brief_input}),
+        (_ensure_pagebreak_before, (ACTION_PLAN_HEADING,), {}),
+        (_append_game_cards, (), {"brief_input": brief_input}),
+        (_move_disclosures_to_end, (), {}),
+        (_enforce_p_hit_notes, (), {}),
+        (
+            _enforce_snapshot_mode_labels,
+            (),
+            {"llm_pass1_status": llm_pass1_status, "llm_pass2_status": llm_pass2_status},
+        ),
+        (_enforce_snapshot_dates_et, (), {"brief_input": brief_input}),
+    ]
+    document.normalize_tail()
+    for rule, args, kwargs in rules:
+        rule(document, *args, **kwargs)
+        # Rules see the same trailing-whitespace-free tail a serialize/parse round trip gives.
+        document.normalize_tail()
+    return document
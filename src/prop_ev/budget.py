@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from prop_ev.data_paths import resolve_runtime_root
+from prop_ev.usage_ledger import load_usage_rollup
 from prop_ev.util.parsing import safe_float as _safe_float_impl
 from prop_ev.util.parsing import safe_int as _safe_int_impl
 
@@ -27,60 +27,37 @@ def _safe_float(value: Any) -> float:
     return parsed if parsed is not None else 0.0
 
 
-def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        item = json.loads(line)
-        if isinstance(item, dict):
-            rows.append(item)
-    return rows
-
-
 def read_odds_usage(data_root: Path, month: str) -> dict[str, Any]:
-    """Summarize Odds API usage for one month from the usage ledger."""
+    """Summarize Odds API usage for one month from the usage ledger rollup."""
     path = data_root / "usage" / f"usage-{month}.jsonl"
-    rows = _load_jsonl(path)
-    total_credits = 0
-    provider_remaining: str = ""
-    for row in rows:
-        total_credits += _safe_int(row.get("x_requests_last", 0))
-        provider_remaining = str(row.get("x_requests_remaining", provider_remaining))
+    rollup = load_usage_rollup(path, kind="odds")
+    totals = rollup.get("totals", {})
     return {
         "month": month,
         "path": str(path),
-        "rows": len(rows),
-        "total_credits": total_credits,
-        "provider_remaining": provider_remaining,
+        "rows": _safe_int(totals.get("rows", 0)),
+        "total_credits": _safe_int(totals.get("credits", 0)),
+        "provider_remaining": str(rollup.get("last", {}).get("provider_remaining", "")),
     }
 
 
 def read_llm_usage(data_root: Path, month: str) -> dict[str, Any]:
-    """Summarize LLM usage for one month from the usage ledger."""
+    """Summarize LLM usage for one month from the usage ledger rollup."""
     root = Path(data_root).resolve()
     if root.name == "runtime":
         path = root / "llm_usage" / f"usage-{month}.jsonl"
     else:
         path = resolve_runtime_root(root) / "llm_usage" / f"usage-{month}.jsonl"
-    rows = _load_jsonl(path)
-    total_cost_usd = 0.0
-    total_input_tokens = 0
-    total_output_tokens = 0
-    total_requests = 0
-    for row in rows:
-        total_cost_usd += _safe_float(row.get("cost_usd", 0.0))
-        total_input_tokens += _safe_int(row.get("input_tokens", 0))
-        total_output_tokens += _safe_int(row.get("output_tokens", 0))
-        total_requests += 1
+    totals = load_usage_rollup(path, kind="llm").get("totals", {})
+    total_input_tokens = _safe_int(totals.get("input_tokens", 0))
+    total_output_tokens = _safe_int(totals.get("output_tokens", 0))
+    total_requests = _safe_int(totals.get("rows", 0))
     return {
         "month": month,
         "path": str(path),
-        "rows": len(rows),
+        "rows": total_requests,
         "request_count": total_requests,
-        "total_cost_usd": round(total_cost_usd, 6),
+        "total_cost_usd": round(_safe_float(totals.get("cost_usd", 0.0)), 6),
         "total_input_tokens": total_input_tokens,
         "total_output_tokens": total_output_tokens,
         "total_tokens": total_input_tokens + total_output_tokens,
@@ -26,7 +26,8 @@ def _sync_overrides() -> None:
             continue
         if name == "_run_strategy_for_playbook":
             if value is _DEFAULT_RUN_STRATEGY_FOR_PLAYBOOK:
-                setattr(_impl, name, _IMPL_RUN_STRATEGY_FOR_PLAYBOOK)
+                # Drop any earlier override; the implementation module re-resolves lazily.
+                vars(_impl).pop(name, None)
             else:
                 setattr(_impl, name, value)
             continue
@@ -40,7 +41,6 @@ def _run_strategy_for_playbook(*args: Any, **kwargs: Any) -> int:
 
 
 _DEFAULT_RUN_STRATEGY_FOR_PLAYBOOK = _run_strategy_for_playbook
-_IMPL_RUN_STRATEGY_FOR_PLAYBOOK = _impl._run_strategy_for_playbook
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -4,13 +4,11 @@ from __future__ import annotations
 
 import argparse
 import sys
+from collections.abc import Callable
+from importlib import import_module
 from pathlib import Path
+from typing import Any
 
-from prop_ev import cli_ablation_helpers as _ablation_helpers
-from prop_ev import cli_data_impl as _data_impl
-from prop_ev import cli_playbook_impl as _playbook_impl
-from prop_ev import cli_snapshot_impl as _snapshot_impl
-from prop_ev import cli_strategy_impl as _strategy_impl
 from prop_ev.backtest import ROW_SELECTIONS
 from prop_ev.cli_global_overrides import (
     extract_global_overrides as _extract_global_overrides_impl,
@@ -26,67 +24,103 @@ from prop_ev.cli_shared import (
 from prop_ev.cli_shared import (
     _resolve_bookmakers as _resolve_bookmakers_impl,
 )
-from prop_ev.odds_client import OddsAPIError
+from prop_ev.odds_client import OddsAPIClient, OddsAPIError  # noqa: F401
 from prop_ev.odds_data.errors import CreditBudgetExceeded, OfflineCacheMiss, SpendBlockedError
-from prop_ev.playbook import generate_brief_for_snapshot  # noqa: F401
 from prop_ev.runtime_config import load_runtime_config, set_current_runtime_config
 
-# Parser-dispatched command handlers (kept as module attributes for compatibility/monkeypatch).
-_cmd_snapshot_slate = _snapshot_impl._cmd_snapshot_slate
-_cmd_snapshot_props = _snapshot_impl._cmd_snapshot_props
-_cmd_snapshot_ls = _snapshot_impl._cmd_snapshot_ls
-_cmd_snapshot_show = _snapshot_impl._cmd_snapshot_show
-_cmd_snapshot_diff = _snapshot_impl._cmd_snapshot_diff
-_cmd_snapshot_verify = _snapshot_impl._cmd_snapshot_verify
-_cmd_snapshot_lake = _snapshot_impl._cmd_snapshot_lake
-_cmd_snapshot_pack = _snapshot_impl._cmd_snapshot_pack
-_cmd_snapshot_unpack = _snapshot_impl._cmd_snapshot_unpack
-_cmd_credits_report = _snapshot_impl._cmd_credits_report
-_cmd_credits_budget = _snapshot_impl._cmd_credits_budget
-
-_cmd_data_datasets_ls = _data_impl._cmd_data_datasets_ls
-_cmd_data_datasets_show = _data_impl._cmd_data_datasets_show
-_cmd_data_status = _data_impl._cmd_data_status
-_cmd_data_done_days = _data_impl._cmd_data_done_days
-_cmd_data_export_denorm = _data_impl._cmd_data_export_denorm
-_cmd_data_backfill = _data_impl._cmd_data_backfill
-_cmd_data_verify = _data_impl._cmd_data_verify
-_cmd_data_repair_derived = _data_impl._cmd_data_repair_derived
-_cmd_data_guardrails = _data_impl._cmd_data_guardrails
-_cmd_data_migrate_layout = _data_impl._cmd_data_migrate_layout
-
-_cmd_strategy_health = _strategy_impl._cmd_strategy_health
-_cmd_strategy_run = _strategy_impl._cmd_strategy_run
-_cmd_strategy_ls = _strategy_impl._cmd_strategy_ls
-_cmd_strategy_compare = _strategy_impl._cmd_strategy_compare
-_cmd_strategy_ablation = _strategy_impl._cmd_strategy_ablation
-_cmd_strategy_backtest_summarize = _strategy_impl._cmd_strategy_backtest_summarize
-_cmd_strategy_backtest_prep = _strategy_impl._cmd_strategy_backtest_prep
-_cmd_strategy_settle = _strategy_impl._cmd_strategy_settle
-_parse_positive_int_csv = _strategy_impl._parse_positive_int_csv
-_preflight_context_for_snapshot = _strategy_impl._preflight_context_for_snapshot
-_resolve_input_probabilistic_profile = _strategy_impl._resolve_input_probabilistic_profile
-_build_discovery_execution_report = _strategy_impl._build_discovery_execution_report
-_parse_strategy_ids = _strategy_impl._parse_strategy_ids
-
-_ablation_prune_cap_root = _ablation_helpers.ablation_prune_cap_root
-_ablation_strategy_cache_valid = _ablation_helpers.ablation_strategy_cache_valid
-_ablation_write_state = _ablation_helpers.ablation_write_state
-_build_ablation_analysis_run_id = _ablation_helpers.build_ablation_analysis_run_id
-_build_ablation_input_hash = _ablation_helpers.build_ablation_input_hash
-
-_run_strategy_for_playbook = _playbook_impl._run_strategy_for_playbook
-_run_snapshot_bundle_for_playbook = _playbook_impl._run_snapshot_bundle_for_playbook
-_cmd_playbook_run = _playbook_impl._cmd_playbook_run
-_cmd_playbook_render = _playbook_impl._cmd_playbook_render
-_cmd_playbook_publish = _playbook_impl._cmd_playbook_publish
-_cmd_playbook_budget = _playbook_impl._cmd_playbook_budget
-_cmd_playbook_discover_execute = _playbook_impl._cmd_playbook_discover_execute
-OddsAPIClient = _playbook_impl.OddsAPIClient
+_SNAPSHOT_IMPL = "prop_ev.cli_snapshot_impl"
+_DATA_IMPL = "prop_ev.cli_data_impl"
+_STRATEGY_IMPL = "prop_ev.cli_strategy_impl"
+_ABLATION_HELPERS = "prop_ev.cli_ablation_helpers"
+_PLAYBOOK_IMPL = "prop_ev.cli_playbook_impl"
+
+# Parser-dispatched command handlers and helpers, kept as module attributes for
+# compatibility/monkeypatch. Implementation modules (and the polars/numpy/sklearn/httpx
+# stacks behind them) are imported on first attribute access, so `--help` and light
+# commands only pay for the module they actually run.
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "_cmd_snapshot_slate": (_SNAPSHOT_IMPL, "_cmd_snapshot_slate"),
+    "_cmd_snapshot_props": (_SNAPSHOT_IMPL, "_cmd_snapshot_props"),
+    "_cmd_snapshot_ls": (_SNAPSHOT_IMPL, "_cmd_snapshot_ls"),
+    "_cmd_snapshot_show": (_SNAPSHOT_IMPL, "_cmd_snapshot_show"),
+    "_cmd_snapshot_diff": (_SNAPSHOT_IMPL, "_cmd_snapshot_diff"),
+    "_cmd_snapshot_lines": (_SNAPSHOT_IMPL, "_cmd_snapshot_lines"),
+    "_cmd_snapshot_verify": (_SNAPSHOT_IMPL, "_cmd_snapshot_verify"),
+    "_cmd_snapshot_lake": (_SNAPSHOT_IMPL, "_cmd_snapshot_lake"),
+    "_cmd_snapshot_pack": (_SNAPSHOT_IMPL, "_cmd_snapshot_pack"),
+    "_cmd_snapshot_unpack": (_SNAPSHOT_IMPL, "_cmd_snapshot_unpack"),
+    "_cmd_credits_report": (_SNAPSHOT_IMPL, "_cmd_credits_report"),
+    "_cmd_credits_budget": (_SNAPSHOT_IMPL, "_cmd_credits_budget"),
+    "_cmd_data_datasets_ls": (_DATA_IMPL, "_cmd_data_datasets_ls"),
+    "_cmd_data_datasets_show": (_DATA_IMPL, "_cmd_data_datasets_show"),
+    "_cmd_data_status": (_DATA_IMPL, "_cmd_data_status"),
+    "_cmd_data_done_days": (_DATA_IMPL, "_cmd_data_done_days"),
+    "_cmd_data_export_denorm": (_DATA_IMPL, "_cmd_data_export_denorm"),
+    "_cmd_data_backfill": (_DATA_IMPL, "_cmd_data_backfill"),
+    "_cmd_data_bench_jsonl": (_DATA_IMPL, "_cmd_data_bench_jsonl"),
+    "_cmd_data_verify": (_DATA_IMPL, "_cmd_data_verify"),
+    "_cmd_data_repair_derived": (_DATA_IMPL, "_cmd_data_repair_derived"),
+    "_cmd_data_guardrails": (_DATA_IMPL, "_cmd_data_guardrails"),
+    "_cmd_data_migrate_layout": (_DATA_IMPL, "_cmd_data_migrate_layout"),
+    "_cmd_strategy_health": (_STRATEGY_IMPL, "_cmd_strategy_health"),
+    "_cmd_strategy_run": (_STRATEGY_IMPL, "_cmd_strategy_run"),
+    "_cmd_strategy_ls": (_STRATEGY_IMPL, "_cmd_strategy_ls"),
+    "_cmd_strategy_compare": (_STRATEGY_IMPL, "_cmd_strategy_compare"),
+    "_cmd_strategy_ablation": (_STRATEGY_IMPL, "_cmd_strategy_ablation"),
+    "_cmd_strategy_backtest_summarize": (_STRATEGY_IMPL, "_cmd_strategy_backtest_summarize"),
+    "_cmd_strategy_backtest_prep": (_STRATEGY_IMPL, "_cmd_strategy_backtest_prep"),
+    "_cmd_strategy_settle": (_STRATEGY_IMPL, "_cmd_strategy_settle"),
+    "_parse_positive_int_csv": (_STRATEGY_IMPL, "_parse_positive_int_csv"),
+    "_preflight_context_for_snapshot": (_STRATEGY_IMPL, "_preflight_context_for_snapshot"),
+    "_resolve_input_probabilistic_profile": (
+        _STRATEGY_IMPL,
+        "_resolve_input_probabilistic_profile",
+    ),
+    "_build_discovery_execution_report": (_STRATEGY_IMPL, "_build_discovery_execution_report"),
+    "_parse_strategy_ids": (_STRATEGY_IMPL, "_parse_strategy_ids"),
+    "_ablation_prune_cap_root": (_ABLATION_HELPERS, "ablation_prune_cap_root"),
+    "_ablation_strategy_cache_valid": (_ABLATION_HELPERS, "ablation_strategy_cache_valid"),
+    "_ablation_write_state": (_ABLATION_HELPERS, "ablation_write_state"),
+    "_build_ablation_analysis_run_id": (_ABLATION_HELPERS, "build_ablation_analysis_run_id"),
+    "_build_ablation_input_hash": (_ABLATION_HELPERS, "build_ablation_input_hash"),
+    "_run_strategy_for_playbook": (_PLAYBOOK_IMPL, "_run_strategy_for_playbook"),
+    "_run_snapshot_bundle_for_playbook": (_PLAYBOOK_IMPL, "_run_snapshot_bundle_for_playbook"),
+    "_cmd_playbook_run": (_PLAYBOOK_IMPL, "_cmd_playbook_run"),
+    "_cmd_playbook_render": (_PLAYBOOK_IMPL, "_cmd_playbook_render"),
+    "_cmd_playbook_publish": (_PLAYBOOK_IMPL, "_cmd_playbook_publish"),
+    "_cmd_playbook_budget": (_PLAYBOOK_IMPL, "_cmd_playbook_budget"),
+    "_cmd_playbook_cache_gc": (_PLAYBOOK_IMPL, "_cmd_playbook_cache_gc"),
+    "_cmd_playbook_discover_execute": (_PLAYBOOK_IMPL, "_cmd_playbook_discover_execute"),
+    "generate_brief_for_snapshot": ("prop_ev.playbook", "generate_brief_for_snapshot"),
+}
 _default_window = _default_window_impl
 _resolve_bookmakers = _resolve_bookmakers_impl
 
 
+def __getattr__(name: str) -> Any:
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+class _DeferredHandlers:
+    """Parser handler namespace that resolves `_cmd_*` functions only when dispatched."""
+
+    def __getattr__(self, name: str) -> Callable[[argparse.Namespace], int]:
+        if name not in _LAZY_ATTRS:
+            raise AttributeError(name)
+
+        def _dispatch(args: argparse.Namespace) -> int:
+            return int(getattr(sys.modules[__name__], name)(args))
+
+        _dispatch.__name__ = name
+        return _dispatch
+
+
 def _extract_global_overrides(argv: list[str]) -> tuple[list[str], str, str, str, str, str]:
     try:
         return _extract_global_overrides_impl(argv)
@@ -96,7 +130,7 @@ def _extract_global_overrides(argv: list[str]) -> tuple[list[str], str, str, str
 
 def _build_parser() -> argparse.ArgumentParser:
     return _build_parser_impl(
-        handlers=sys.modules[__name__],
+        handlers=_DeferredHandlers(),
         odds_api_default_max_credits=_runtime_odds_api_default_max_credits(),
         row_selections=ROW_SELECTIONS,
     )
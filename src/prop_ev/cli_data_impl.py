@@ -30,16 +30,12 @@ from prop_ev.cli_shared import (
 )
 from prop_ev.lake_guardrails import build_guardrail_report
 from prop_ev.lake_migration import migrate_layout
-from prop_ev.odds_data.backfill import backfill_days
 from prop_ev.odds_data.cache_store import GlobalCacheStore
 from prop_ev.odds_data.day_index import compute_day_status_from_cache, load_day_status
-from prop_ev.odds_data.denorm_export import export_dataset_denorm
+from prop_ev.odds_data.request_plan import RequestPlan
 from prop_ev.odds_data.spec import dataset_id
+from prop_ev.odds_rate import rate_controller
 from prop_ev.quote_table import EVENT_PROPS_TABLE
-from prop_ev.snapshot_artifacts import (
-    repair_snapshot_derived_contracts,
-    verify_snapshot_derived_contracts,
-)
 from prop_ev.storage import SnapshotStore
 from prop_ev.time_utils import iso_z
 
@@ -258,6 +254,8 @@ def _cmd_data_datasets_show(args: argparse.Namespace) -> int:
 
 
 def _cmd_data_export_denorm(args: argparse.Namespace) -> int:
+    from prop_ev.odds_data.denorm_export import export_dataset_denorm
+
     data_root = Path(_runtime_odds_data_dir())
     dataset_id_value = str(getattr(args, "dataset_id", "")).strip()
     if not dataset_id_value:
@@ -555,6 +553,8 @@ def _cmd_data_done_days(args: argparse.Namespace) -> int:
 
 
 def _cmd_data_backfill(args: argparse.Namespace) -> int:
+    from prop_ev.odds_data.backfill import backfill_days
+
     data_root = Path(_runtime_odds_data_dir())
     spec = _dataset_spec_from_args(args)
     try:
@@ -568,6 +568,13 @@ def _cmd_data_backfill(args: argparse.Namespace) -> int:
         raise CLIError(str(exc)) from exc
 
     policy = _spend_policy_from_args(args)
+
+    def _print_plan(day: str, plan: RequestPlan) -> None:
+        if not plan.calls and not plan.deferred:
+            return
+        for line in plan.describe():
+            print(f"day={day} {line}")
+
     summaries = backfill_days(
         data_root=data_root,
         spec=spec,
@@ -575,6 +582,8 @@ def _cmd_data_backfill(args: argparse.Namespace) -> int:
         tz_name=str(getattr(args, "tz_name", "America/New_York")),
         policy=policy,
         dry_run=bool(getattr(args, "dry_run", False)),
+        on_plan=_print_plan,
+        workers=max(1, int(getattr(args, "workers", 4) or 1)),
     )
 
     had_error = False
@@ -601,10 +610,21 @@ def _cmd_data_backfill(args: argparse.Namespace) -> int:
                 error,
             )
         )
+    for line in rate_controller().describe():
+        print(line)
     return 2 if had_error else 0
 
 
+def _snapshot_workers(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import default_snapshot_workers
+
+    requested = int(getattr(args, "workers", 0) or 0)
+    return requested if requested > 0 else default_snapshot_workers()
+
+
 def _cmd_data_verify(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import run_snapshot_jobs, verify_snapshot_job
+
     data_root = Path(_runtime_odds_data_dir())
     dataset_id_value = str(getattr(args, "dataset_id", "")).strip()
     if not dataset_id_value:
@@ -635,6 +655,7 @@ def _cmd_data_verify(args: argparse.Namespace) -> int:
     )
 
     day_reports: list[dict[str, Any]] = []
+    verify_jobs: list[tuple[str, dict[str, Any]]] = []
     issue_count = 0
     checked_complete_days = 0
     for day in selected_days:
@@ -696,15 +717,20 @@ def _cmd_data_verify(args: argparse.Namespace) -> int:
                         }
                     )
                 else:
-                    derived_issues = verify_snapshot_derived_contracts(
-                        snapshot_dir=snapshot_dir,
-                        require_parquet=bool(getattr(args, "require_parquet", False)),
-                        require_canonical_jsonl=bool(
-                            getattr(args, "require_canonical_jsonl", False)
-                        ),
-                        required_tables=(EVENT_PROPS_TABLE,),
+                    verify_jobs.append(
+                        (
+                            day,
+                            {
+                                "snapshot_dir": snapshot_dir.as_posix(),
+                                "require_parquet": bool(getattr(args, "require_parquet", False)),
+                                "require_canonical_jsonl": bool(
+                                    getattr(args, "require_canonical_jsonl", False)
+                                ),
+                                "required_tables": [EVENT_PROPS_TABLE],
+                                "force": bool(getattr(args, "force", False)),
+                            },
+                        )
                     )
-                    row_issues.extend(derived_issues)
 
         issue_count += len(row_issues)
         day_reports.append(
@@ -715,6 +741,26 @@ def _cmd_data_verify(args: argparse.Namespace) -> int:
             }
         )
 
+    workers = _snapshot_workers(args)
+    verify_results = run_snapshot_jobs(
+        verify_snapshot_job,
+        verify_jobs,
+        workers=workers,
+        label="data_verify",
+        progress=not bool(getattr(args, "json_output", False)),
+    )
+    skipped_verified = 0
+    for report in day_reports:
+        result = verify_results.get(str(report.get("day", "")))
+        if result is None:
+            continue
+        if bool(result.get("skipped", False)):
+            skipped_verified += 1
+        derived_issues = list(result.get("issues", []))
+        report["issues"].extend(derived_issues)
+        report["issue_count"] = len(report["issues"])
+        issue_count += len(derived_issues)
+
     payload: dict[str, Any] = {
         "dataset_id": dataset_id_value,
         "sport_key": spec.sport_key,
@@ -727,6 +773,8 @@ def _cmd_data_verify(args: argparse.Namespace) -> int:
         "available_to_day": available_days[-1] if available_days else "",
         "checked_days": len(selected_days),
         "checked_complete_days": checked_complete_days,
+        "skipped_verified_snapshots": skipped_verified,
+        "workers": workers,
         "issue_count": issue_count,
         "require_complete": bool(getattr(args, "require_complete", False)),
         "require_parquet": bool(getattr(args, "require_parquet", False)),
@@ -741,11 +789,13 @@ def _cmd_data_verify(args: argparse.Namespace) -> int:
         print(json.dumps(payload, sort_keys=True))
     else:
         print(
-            "dataset_id={} checked_days={} checked_complete_days={} issue_count={} "
+            "dataset_id={} checked_days={} checked_complete_days={} "
+            "skipped_verified_snapshots={} issue_count={} "
             "require_complete={} require_parquet={} require_canonical_jsonl={}".format(
                 dataset_id_value,
                 len(selected_days),
                 checked_complete_days,
+                skipped_verified,
                 issue_count,
                 str(bool(getattr(args, "require_complete", False))).lower(),
                 str(bool(getattr(args, "require_parquet", False))).lower(),
@@ -775,6 +825,8 @@ def _cmd_data_verify(args: argparse.Namespace) -> int:
 
 
 def _cmd_data_repair_derived(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import repair_snapshot_job, run_snapshot_jobs
+
     data_root = Path(_runtime_odds_data_dir())
     dataset_id_value = str(getattr(args, "dataset_id", "")).strip()
     if not dataset_id_value:
@@ -798,6 +850,7 @@ def _cmd_data_repair_derived(args: argparse.Namespace) -> int:
         selected_days = available_days
 
     day_reports: list[dict[str, Any]] = []
+    repair_jobs: list[tuple[str, dict[str, Any]]] = []
     issue_count = 0
     repaired_days = 0
     skipped_incomplete_days = 0
@@ -886,39 +939,43 @@ def _cmd_data_repair_derived(args: argparse.Namespace) -> int:
             )
             continue
 
-        try:
-            repair_report = repair_snapshot_derived_contracts(snapshot_dir)
-        except (FileNotFoundError, ValueError) as exc:
-            issues = [{"code": "repair_failed", "detail": str(exc)}]
-            issue_count += len(issues)
-            day_reports.append(
+        repair_jobs.append(
+            (
+                day,
                 {
-                    "day": day,
-                    "status": "error",
-                    "snapshot_id": snapshot_id,
-                    "jsonl_rewritten": 0,
-                    "parquet_written": 0,
-                    "issue_count": len(issues),
-                    "issues": issues,
-                }
+                    "snapshot_dir": snapshot_dir.as_posix(),
+                    "required_tables": [EVENT_PROPS_TABLE],
+                    "force": bool(getattr(args, "force", False)),
+                },
             )
-            continue
-
-        issues = verify_snapshot_derived_contracts(
-            snapshot_dir=snapshot_dir,
-            require_parquet=True,
-            require_canonical_jsonl=True,
-            required_tables=(EVENT_PROPS_TABLE,),
         )
+        day_reports.append({"day": day, "snapshot_id": snapshot_id})
+
+    workers = _snapshot_workers(args)
+    repair_results = run_snapshot_jobs(
+        repair_snapshot_job,
+        repair_jobs,
+        workers=workers,
+        label="data_repair_derived",
+        progress=not bool(getattr(args, "json_output", False)),
+    )
+    skipped_verified_days = 0
+    for report in day_reports:
+        result = repair_results.get(str(report.get("day", "")))
+        if result is None:
+            continue
+        issues = list(result.get("issues", []))
+        status = str(result.get("status", "error"))
         issue_count += len(issues)
-        repaired_days += 1
-        day_reports.append(
+        if status == "skipped_verified":
+            skipped_verified_days += 1
+        elif status != "error":
+            repaired_days += 1
+        report.update(
             {
-                "day": day,
-                "status": "repaired" if not issues else "repaired_with_issues",
-                "snapshot_id": snapshot_id,
-                "jsonl_rewritten": len(repair_report.get("jsonl_rewritten", [])),
-                "parquet_written": len(repair_report.get("parquet_written", [])),
+                "status": status,
+                "jsonl_rewritten": int(result.get("jsonl_rewritten", 0)),
+                "parquet_written": int(result.get("parquet_written", 0)),
                 "issue_count": len(issues),
                 "issues": issues,
             }
@@ -929,6 +986,8 @@ def _cmd_data_repair_derived(args: argparse.Namespace) -> int:
         "selected_days": len(selected_days),
         "repaired_days": repaired_days,
         "skipped_incomplete_days": skipped_incomplete_days,
+        "skipped_verified_days": skipped_verified_days,
+        "workers": workers,
         "issue_count": issue_count,
         "days": day_reports,
         "generated_at_utc": iso_z(_utc_now()),
@@ -940,7 +999,7 @@ def _cmd_data_repair_derived(args: argparse.Namespace) -> int:
         print(
             f"dataset_id={dataset_id_value} selected_days={len(selected_days)} "
             f"repaired_days={repaired_days} skipped_incomplete_days={skipped_incomplete_days} "
-            f"issue_count={issue_count}"
+            f"skipped_verified_days={skipped_verified_days} issue_count={issue_count}"
         )
         for row in day_reports:
             issue_codes = ",".join(
@@ -960,6 +1019,42 @@ def _cmd_data_repair_derived(args: argparse.Namespace) -> int:
     return 2 if issue_count else 0
 
 
+def _cmd_data_bench_jsonl(args: argparse.Namespace) -> int:
+    from prop_ev.util.jsonl import benchmark_parse
+
+    path_value = str(getattr(args, "path", "")).strip()
+    if path_value:
+        path = Path(path_value)
+    else:
+        store = SnapshotStore(_runtime_odds_data_dir())
+        snapshot_id = str(getattr(args, "snapshot_id", "")).strip()
+        if not snapshot_id:
+            snapshot_ids = sorted(
+                item.name
+                for item in store.snapshots_dir.glob("*")
+                if store.derived_path(item.name, f"{EVENT_PROPS_TABLE}.jsonl").exists()
+            )
+            if not snapshot_ids:
+                raise CLIError("no snapshot with derived event_props.jsonl found")
+            snapshot_id = snapshot_ids[-1]
+        path = store.derived_path(snapshot_id, f"{EVENT_PROPS_TABLE}.jsonl")
+    if not path.exists():
+        raise CLIError(f"missing JSONL file: {path}")
+
+    report = benchmark_parse(path, repeat=int(getattr(args, "repeat", 3)))
+    if bool(getattr(args, "json_output", False)):
+        print(json.dumps(report, sort_keys=True))
+        return 0
+    print(f"path={report['path']} bytes={report['bytes']} repeat={report['repeat']}")
+    print(f"default_backend={report['default_backend']}")
+    for row in report["results"]:
+        print(
+            f"backend={row['backend']} rows={row['rows']} best_s={row['best_s']} "
+            f"rows_per_s={row['rows_per_s']}"
+        )
+    return 0
+
+
 def _cmd_data_guardrails(args: argparse.Namespace) -> int:
     store = SnapshotStore(_runtime_odds_data_dir())
     report = build_guardrail_report(store.root)
@@ -16,6 +16,7 @@ def build_parser(
     _cmd_credits_budget = handlers._cmd_credits_budget
     _cmd_credits_report = handlers._cmd_credits_report
     _cmd_data_backfill = handlers._cmd_data_backfill
+    _cmd_data_bench_jsonl = handlers._cmd_data_bench_jsonl
     _cmd_data_datasets_ls = handlers._cmd_data_datasets_ls
     _cmd_data_datasets_show = handlers._cmd_data_datasets_show
     _cmd_data_done_days = handlers._cmd_data_done_days
@@ -26,12 +27,14 @@ def build_parser(
     _cmd_data_status = handlers._cmd_data_status
     _cmd_data_verify = handlers._cmd_data_verify
     _cmd_playbook_budget = handlers._cmd_playbook_budget
+    _cmd_playbook_cache_gc = handlers._cmd_playbook_cache_gc
     _cmd_playbook_discover_execute = handlers._cmd_playbook_discover_execute
     _cmd_playbook_publish = handlers._cmd_playbook_publish
     _cmd_playbook_render = handlers._cmd_playbook_render
     _cmd_playbook_run = handlers._cmd_playbook_run
     _cmd_snapshot_diff = handlers._cmd_snapshot_diff
     _cmd_snapshot_lake = handlers._cmd_snapshot_lake
+    _cmd_snapshot_lines = handlers._cmd_snapshot_lines
     _cmd_snapshot_ls = handlers._cmd_snapshot_ls
     _cmd_snapshot_pack = handlers._cmd_snapshot_pack
     _cmd_snapshot_props = handlers._cmd_snapshot_props
@@ -117,6 +120,13 @@ def build_parser(
     snapshot_props.add_argument("--offline", action="store_true")
     snapshot_props.add_argument("--block-paid", action="store_true")
     snapshot_props.add_argument("--dry-run", action="store_true")
+    snapshot_props.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only re-fetch events whose bookmaker last_update changed since the prior snapshot",
+    )
+    snapshot_props.add_argument("--delta-from", default="")
+    snapshot_props.add_argument("--delta-pre-tip-minutes", type=int, default=60)
 
     snapshot_ls = snapshot_subparsers.add_parser("ls", help="List snapshots")
     snapshot_ls.set_defaults(func=_cmd_snapshot_ls)
@@ -130,6 +140,34 @@ def build_parser(
     snapshot_diff.add_argument("--a", required=True)
     snapshot_diff.add_argument("--b", required=True)
 
+    snapshot_lines = snapshot_subparsers.add_parser(
+        "lines", help="Query the line-movement history built from event props snapshots"
+    )
+    snapshot_lines.set_defaults(func=_cmd_snapshot_lines)
+    snapshot_lines.add_argument(
+        "--ingest",
+        action="append",
+        default=[],
+        help="Append one existing snapshot's event props into the history (repeatable)",
+    )
+    snapshot_lines.add_argument(
+        "--ingest-all",
+        action="store_true",
+        help="Append every snapshot with derived event props (already ingested ones are skipped)",
+    )
+    snapshot_lines.add_argument("--event-id", default="")
+    snapshot_lines.add_argument("--player", default="")
+    snapshot_lines.add_argument("--market", default="")
+    snapshot_lines.add_argument(
+        "--since", default="", help="Measure moves from the price as of this UTC timestamp"
+    )
+    snapshot_lines.add_argument(
+        "--steam", action="store_true", help="Show same-direction moves across books"
+    )
+    snapshot_lines.add_argument("--min-books", type=int, default=2)
+    snapshot_lines.add_argument("--min-prob-delta", type=float, default=0.02)
+    snapshot_lines.add_argument("--limit", type=int, default=50)
+
     snapshot_verify = snapshot_subparsers.add_parser("verify", help="Verify snapshot artifacts")
     snapshot_verify.set_defaults(func=_cmd_snapshot_verify)
     snapshot_verify.add_argument("--snapshot-id", required=True)
@@ -162,6 +200,10 @@ def build_parser(
     snapshot_pack.set_defaults(func=_cmd_snapshot_pack)
     snapshot_pack.add_argument("--snapshot-id", required=True)
     snapshot_pack.add_argument("--out", default="")
+    snapshot_pack.add_argument("--level", type=int, default=19, help="zstd level (1-22)")
+    snapshot_pack.add_argument(
+        "--threads", type=int, default=0, help="zstd worker threads (0 = one per core)"
+    )
 
     snapshot_unpack = snapshot_subparsers.add_parser(
         "unpack", help="Unpack a snapshot bundle into the data directory"
@@ -297,6 +339,17 @@ def build_parser(
         default=[],
         help="Allow incomplete reason code (repeatable, supports comma-separated values)",
     )
+    data_verify.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Snapshot worker processes (default: min(8, cpu count))",
+    )
+    data_verify.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-verify snapshots whose content hash was already verified clean",
+    )
     data_verify.add_argument(
         "--json",
         dest="json_output",
@@ -313,6 +366,17 @@ def build_parser(
     data_repair.add_argument("--from", dest="from_day", default="")
     data_repair.add_argument("--to", dest="to_day", default="")
     data_repair.add_argument("--tz", dest="tz_name", default="America/New_York")
+    data_repair.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Snapshot worker processes (default: min(8, cpu count))",
+    )
+    data_repair.add_argument(
+        "--force",
+        action="store_true",
+        help="Repair snapshots whose content hash was already verified clean",
+    )
     data_repair.add_argument(
         "--json",
         dest="json_output",
@@ -349,6 +413,25 @@ def build_parser(
         help="Emit machine-readable JSON payload",
     )
 
+    data_bench_jsonl = data_subparsers.add_parser(
+        "bench-jsonl",
+        help="Benchmark JSONL parse throughput per parser backend",
+    )
+    data_bench_jsonl.set_defaults(func=_cmd_data_bench_jsonl)
+    data_bench_jsonl.add_argument(
+        "--snapshot-id",
+        default="",
+        help="Benchmark <snapshot>/derived/event_props.jsonl (default: latest snapshot).",
+    )
+    data_bench_jsonl.add_argument("--path", default="", help="Benchmark an explicit JSONL path.")
+    data_bench_jsonl.add_argument("--repeat", type=int, default=3)
+    data_bench_jsonl.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="Emit machine-readable JSON payload",
+    )
+
     data_backfill = data_subparsers.add_parser("backfill", help="Backfill day snapshots")
     data_backfill.set_defaults(func=_cmd_data_backfill)
     data_backfill.add_argument("--sport-key", default="basketball_nba")
@@ -376,6 +459,12 @@ def build_parser(
     data_backfill.add_argument("--block-paid", action="store_true")
     data_backfill.add_argument("--force", action="store_true")
     data_backfill.add_argument("--dry-run", action="store_true")
+    data_backfill.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent fetch workers draining the backfill queue (default: 4)",
+    )
 
     data_guardrails = data_subparsers.add_parser(
         "guardrails",
@@ -418,6 +507,27 @@ def build_parser(
     credits_report = credits_subparsers.add_parser("report", help="Report usage ledger")
     credits_report.set_defaults(func=_cmd_credits_report)
     credits_report.add_argument("--month", default="")
+    credits_report.add_argument(
+        "--by",
+        choices=("endpoint", "day", "snapshot"),
+        default="endpoint",
+        help="Slice credits by endpoint, UTC day, or snapshot id.",
+    )
+    credits_report.add_argument(
+        "--day",
+        default="",
+        help=(
+            "Restrict totals and endpoint slices to one UTC day (YYYY-MM-DD); "
+            "not valid with --by snapshot."
+        ),
+    )
+    credits_report.add_argument("--limit", type=int, default=10)
+    credits_report.add_argument(
+        "--json",
+        dest="json_output",
+        action="store_true",
+        help="Emit machine-readable JSON payload",
+    )
 
     credits_budget = credits_subparsers.add_parser("budget", help="Estimate budget")
     credits_budget.set_defaults(func=_cmd_credits_budget)
@@ -1056,6 +1166,24 @@ def build_parser(
     playbook_budget.set_defaults(func=_cmd_playbook_budget)
     playbook_budget.add_argument("--month", default="")
 
+    playbook_cache_gc = playbook_subparsers.add_parser(
+        "cache-gc", help="Evict old or least recently used LLM cache entries"
+    )
+    playbook_cache_gc.set_defaults(func=_cmd_playbook_cache_gc)
+    playbook_cache_gc.add_argument(
+        "--max-mb",
+        type=float,
+        default=None,
+        help="Evict least recently used entries until the cache fits in this many MiB.",
+    )
+    playbook_cache_gc.add_argument(
+        "--max-age-days",
+        type=float,
+        default=None,
+        help="Evict entries not read for this many days.",
+    )
+    playbook_cache_gc.add_argument("--dry-run", action="store_true")
+
     playbook_discover_execute = playbook_subparsers.add_parser(
         "discover-execute",
         help="Run all-books discovery + execution-book comparison in one flow",
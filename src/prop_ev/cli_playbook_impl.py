@@ -29,10 +29,12 @@ from prop_ev.cli_strategy_impl import (
     _official_injury_hard_fail_message,
     _teams_in_scope_from_events,
 )
+from prop_ev.data_paths import resolve_runtime_root
 from prop_ev.discovery_execution import (
     build_discovery_execution_report,
     write_discovery_execution_reports,
 )
+from prop_ev.llm_cache import LLM_CACHE_DIRNAME, LLMResponseCache
 from prop_ev.odds_client import (
     OddsAPIClient,  # noqa: F401
     OddsAPIError,
@@ -671,6 +673,20 @@ def _cmd_playbook_budget(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_playbook_cache_gc(args: argparse.Namespace) -> int:
+    store = SnapshotStore(_runtime_odds_data_dir())
+    cache = LLMResponseCache(resolve_runtime_root(store.root) / LLM_CACHE_DIRNAME)
+    max_mb = args.max_mb
+    payload = cache.gc(
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+        max_age_days=args.max_age_days,
+        dry_run=bool(args.dry_run),
+    )
+    payload["cache_dir"] = str(cache.cache_dir)
+    print(json.dumps(payload, sort_keys=True, indent=2))
+    return 0
+
+
 def _cmd_playbook_discover_execute(args: argparse.Namespace) -> int:
     store = SnapshotStore(_runtime_odds_data_dir())
     settings = Settings.from_runtime()
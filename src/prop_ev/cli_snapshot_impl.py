@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from prop_ev.cli_shared import (
+    CLIError,
     OfflineCacheMissError,
     _default_window,
     _enforce_credit_cap,
@@ -29,14 +30,25 @@ from prop_ev.odds_client import (
     regions_equivalent,
 )
 from prop_ev.odds_data.cache_store import GlobalCacheStore
-from prop_ev.settings import Settings
-from prop_ev.snapshot_artifacts import (
-    lake_snapshot_derived,
-    pack_snapshot,
-    unpack_snapshot,
-    verify_snapshot_derived_contracts,
+from prop_ev.slate_lines import (
+    event_context_from_featured,
+    summarize_slate_lines,
+    write_slate_lines,
+)
+from prop_ev.snapshot_delta import (
+    DELTA_PROBE_MARKETS,
+    EVENT_BOOK_UPDATES_FILENAME,
+    DeltaPlan,
+    event_book_updates_from_featured,
+    find_previous_props_snapshot,
+    index_event_book_updates,
+    load_event_book_updates,
+    load_reusable_event_rows,
+    plan_delta_refresh,
 )
 from prop_ev.storage import SnapshotStore, make_snapshot_id, request_hash
+from prop_ev.usage_ledger import load_usage_rollup
+from prop_ev.util.jsonl import iter_jsonl
 
 
 def _cmd_snapshot_slate(args: argparse.Namespace) -> int:
@@ -75,6 +87,8 @@ def _cmd_snapshot_slate(args: argparse.Namespace) -> int:
         print(f"bookmakers_source={bookmakers_source} bookmakers={bookmakers}")
         return 0
 
+    from prop_ev.settings import Settings
+
     settings = Settings.from_runtime()
     run_config = {
         "mode": "snapshot_slate",
@@ -117,6 +131,13 @@ def _cmd_snapshot_slate(args: argparse.Namespace) -> int:
                 filename="featured_odds.jsonl",
                 rows=rows,
             )
+            write_slate_lines(
+                store,
+                snapshot_id,
+                summarize_slate_lines(
+                    rows, event_context_from_featured(data), snapshot_id=snapshot_id
+                ),
+            )
             print(f"snapshot_id={snapshot_id} request_key={key} status={status}")
             print(f"bookmakers_source={bookmakers_source} bookmakers={bookmakers}")
             print(
@@ -128,7 +149,123 @@ def _cmd_snapshot_slate(args: argparse.Namespace) -> int:
     return 0
 
 
+def _plan_props_delta(
+    *,
+    args: argparse.Namespace,
+    store: SnapshotStore,
+    client: OddsAPIClient,
+    snapshot_id: str,
+    event_list: list[Any],
+    event_ids: list[str],
+    markets: list[str],
+    bookmakers: str,
+    commence_from: str,
+    commence_to: str,
+) -> tuple[DeltaPlan, dict[str, list[dict[str, Any]]], int]:
+    probe_markets = list(DELTA_PROBE_MARKETS)
+    probe_path = f"/sports/{args.sport_key}/odds"
+    probe_params: dict[str, Any] = {
+        "markets": ",".join(probe_markets),
+        "oddsFormat": "american",
+        "dateFormat": "iso",
+        "commenceTimeFrom": commence_from,
+        "commenceTimeTo": commence_to,
+    }
+    if bookmakers:
+        probe_params["bookmakers"] = bookmakers
+    elif args.regions:
+        probe_params["regions"] = args.regions
+    probe_key = request_hash("GET", probe_path, probe_params)
+    probe_refresh = not (args.resume and store.has_response(snapshot_id, probe_key))
+    probe_estimate = (
+        estimate_featured_credits(probe_markets, regions_equivalent(args.regions, bookmakers))
+        if probe_refresh
+        else 0
+    )
+    _enforce_credit_cap(probe_estimate, args.max_credits, args.force)
+    probe_data, _, probe_status, _ = _execute_request(
+        store=store,
+        snapshot_id=snapshot_id,
+        label="delta_probe",
+        path=probe_path,
+        params=probe_params,
+        fetcher=lambda: client.get_featured_odds(
+            sport_key=args.sport_key,
+            markets=probe_markets,
+            regions=args.regions,
+            bookmakers=bookmakers,
+            commence_from=commence_from,
+            commence_to=commence_to,
+        ),
+        offline=False,
+        block_paid=bool(getattr(args, "block_paid", False)),
+        is_paid=True,
+        refresh=probe_refresh,
+        resume=args.resume,
+    )
+    probe_rows = event_book_updates_from_featured(probe_data)
+    _write_derived(
+        store=store,
+        snapshot_id=snapshot_id,
+        filename=EVENT_BOOK_UPDATES_FILENAME,
+        rows=probe_rows,
+    )
+
+    source_snapshot_id = str(getattr(args, "delta_from", "") or "").strip()
+    if source_snapshot_id:
+        if not store.derived_path(source_snapshot_id, "event_props.jsonl").exists():
+            raise CLIError(f"--delta-from snapshot has no event_props: {source_snapshot_id}")
+    else:
+        source_snapshot_id = find_previous_props_snapshot(
+            store,
+            snapshot_id=snapshot_id,
+            markets=markets,
+            bookmakers=bookmakers,
+        )
+    reusable = load_reusable_event_rows(
+        store,
+        source_snapshot_id=source_snapshot_id,
+        snapshot_id=snapshot_id,
+    )
+    previous = (
+        index_event_book_updates(
+            load_event_book_updates(
+                store.derived_path(source_snapshot_id, EVENT_BOOK_UPDATES_FILENAME)
+            )
+        )
+        if source_snapshot_id
+        else {}
+    )
+    commence_times = {
+        str(item.get("id", "")): str(item.get("commence_time", ""))
+        for item in event_list
+        if isinstance(item, dict)
+    }
+    plan = plan_delta_refresh(
+        event_ids=event_ids,
+        current=index_event_book_updates(probe_rows),
+        previous=previous,
+        previous_event_ids=set(reusable),
+        commence_times=commence_times,
+        now=_utc_now(),
+        pre_tip_minutes=int(getattr(args, "delta_pre_tip_minutes", 60)),
+        source_snapshot_id=source_snapshot_id,
+    )
+    print(
+        "delta_probe_status={} delta_source={} delta_refresh={} delta_reuse={}".format(
+            probe_status,
+            source_snapshot_id or "none",
+            len(plan.refresh),
+            len(plan.reuse),
+        )
+    )
+    return plan, reusable, probe_estimate
+
+
 def _cmd_snapshot_props(args: argparse.Namespace) -> int:
+    from prop_ev.odds_data.line_history import LineHistoryStore
+    from prop_ev.settings import Settings
+
     store = SnapshotStore(_runtime_odds_data_dir())
     cache = GlobalCacheStore(store.root)
     snapshot_id = args.snapshot_id or make_snapshot_id()
@@ -140,6 +277,9 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
         args.bookmakers,
         allow_config=not bool(getattr(args, "ignore_bookmaker_config", False)),
     )
+    delta = bool(getattr(args, "delta", False))
+    if delta and args.offline:
+        raise CLIError("--delta needs live bookmaker updates and cannot be combined with --offline")
 
     with store.lock_snapshot(snapshot_id):
         run_config = {
@@ -154,6 +294,7 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
             "include_links": args.include_links,
             "include_sids": args.include_sids,
             "max_events": args.max_events,
+            "delta": delta,
         }
         store.ensure_snapshot(snapshot_id, run_config=run_config)
         if args.dry_run:
@@ -165,7 +306,8 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
             return 0
 
         counters: Counter[str] = Counter()
-        all_rows: list[dict[str, Any]] = []
+        event_ids: list[str] = []
+        rows_by_event: dict[str, list[dict[str, Any]]] = {}
         settings = Settings.from_runtime()
         with OddsAPIClient(settings) as client:
             events_path = f"/sports/{args.sport_key}/events"
@@ -188,7 +330,7 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
                 offline=args.offline,
                 block_paid=bool(getattr(args, "block_paid", False)),
                 is_paid=False,
-                refresh=args.refresh,
+                refresh=args.refresh or delta,
                 resume=args.resume,
             )
             event_list = events_data if isinstance(events_data, list) else []
@@ -209,17 +351,49 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
                 event_request_params["includeLinks"] = "true"
             if args.include_sids:
                 event_request_params["includeSids"] = "true"
+            fetch_event_ids = event_ids
+            refresh_event_ids: set[str] = set()
+            reused_rows: dict[str, list[dict[str, Any]]] = {}
+            probe_estimate = 0
+            if delta:
+                plan, reused_rows, probe_estimate = _plan_props_delta(
+                    args=args,
+                    store=store,
+                    client=client,
+                    snapshot_id=snapshot_id,
+                    event_list=event_list,
+                    event_ids=event_ids,
+                    markets=markets,
+                    bookmakers=bookmakers,
+                    commence_from=commence_from,
+                    commence_to=commence_to,
+                )
+                fetch_event_ids = plan.refresh
+                for event_id in plan.reuse:
+                    rows_by_event[event_id] = reused_rows.get(event_id, [])
+                    counters["reused"] += 1
+                for event_id in plan.refresh:
+                    event_path = f"/sports/{args.sport_key}/events/{event_id}/odds"
+                    event_key = request_hash("GET", event_path, event_request_params)
+                    if not (args.resume and store.has_response(snapshot_id, event_key)):
+                        refresh_event_ids.add(event_id)
             missing_event_ids: list[str] = []
-            for event_id in event_ids:
+            for event_id in fetch_event_ids:
                 event_path = f"/sports/{args.sport_key}/events/{event_id}/odds"
                 event_key = request_hash("GET", event_path, event_request_params)
-                cached_hit = not args.refresh and (
-                    store.has_response(snapshot_id, event_key) or cache.has_response(event_key)
+                cached_hit = (
+                    not args.refresh
+                    and event_id not in refresh_event_ids
+                    and (
+                        store.has_response(snapshot_id, event_key) or cache.has_response(event_key)
+                    )
                 )
                 if not cached_hit:
                     missing_event_ids.append(event_id)
             regions_factor = regions_equivalent(args.regions, bookmakers)
-            estimate = estimate_event_credits(markets, regions_factor, len(missing_event_ids))
+            estimate = probe_estimate + estimate_event_credits(
+                markets, regions_factor, len(missing_event_ids)
+            )
             _print_estimate(estimate, args.max_credits)
             _enforce_credit_cap(estimate, args.max_credits, args.force)
             print(
@@ -231,7 +405,7 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
             )
             print(f"bookmakers_source={bookmakers_source} bookmakers={bookmakers}")
 
-            for event_id in event_ids:
+            for event_id in fetch_event_ids:
                 path = f"/sports/{args.sport_key}/events/{event_id}/odds"
                 params = dict(event_request_params)
                 try:
@@ -253,11 +427,11 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
                         offline=args.offline,
                         block_paid=bool(getattr(args, "block_paid", False)),
                         is_paid=True,
-                        refresh=args.refresh,
+                        refresh=args.refresh or event_id in refresh_event_ids,
                         resume=args.resume,
                     )
                     rows = normalize_event_odds(data, snapshot_id=snapshot_id, provider="odds_api")
-                    all_rows.extend(rows)
+                    rows_by_event[event_id] = rows
                     counters[status] += 1
                     print(
                         (
@@ -285,18 +459,26 @@ def _cmd_snapshot_props(args: argparse.Namespace) -> int:
                     )
                     print(f"event_id={event_id} status=failed error={exc}")
 
+        all_rows = [row for event_id in event_ids for row in rows_by_event.get(event_id, [])]
         _write_derived(
             store=store,
             snapshot_id=snapshot_id,
             filename="event_props.jsonl",
             rows=all_rows,
         )
+        history = LineHistoryStore(store.root).append_snapshot(snapshot_id, all_rows)
+        print(
+            "line_history_status={} rows_appended={}".format(
+                history.get("status", ""), history.get("rows_appended", 0)
+            )
+        )
         print(
-            "snapshot_id={} succeeded={} cached={} skipped={} failed={}".format(
+            "snapshot_id={} succeeded={} cached={} skipped={} reused={} failed={}".format(
                 snapshot_id,
                 counters.get("ok", 0),
                 counters.get("cached", 0),
                 counters.get("skipped", 0),
+                counters.get("reused", 0),
                 counters.get("failed", 0),
             )
         )
@@ -368,7 +550,58 @@ def _cmd_snapshot_diff(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_snapshot_lines(args: argparse.Namespace) -> int:
+    from prop_ev.odds_data.line_history import LineHistoryStore
+
+    store = SnapshotStore(_runtime_odds_data_dir())
+    history = LineHistoryStore(store.root)
+    ingest_ids = [str(item).strip() for item in getattr(args, "ingest", []) if str(item).strip()]
+    if bool(getattr(args, "ingest_all", False)) and store.snapshots_dir.exists():
+        ingest_ids.extend(
+            path.name
+            for path in sorted(store.snapshots_dir.iterdir(), key=lambda item: item.name)
+            if (path / "derived" / "event_props.jsonl").exists()
+        )
+    for snapshot_id in ingest_ids:
+        path = store.derived_path(snapshot_id, "event_props.jsonl")
+        if not path.exists():
+            print(f"snapshot_id={snapshot_id} line_history_status=missing_event_props")
+            continue
+        result = history.append_snapshot(snapshot_id, list(iter_jsonl(path)))
+        print(
+            "snapshot_id={} line_history_status={} rows_in={} rows_appended={}".format(
+                snapshot_id,
+                result.get("status", ""),
+                result.get("rows_in", 0),
+                result.get("rows_appended", 0),
+            )
+        )
+
+    filters = {
+        "event_id": str(getattr(args, "event_id", "")).strip(),
+        "player": str(getattr(args, "player", "")).strip(),
+        "market": str(getattr(args, "market", "")).strip(),
+    }
+    since = str(getattr(args, "since", "")).strip()
+    if bool(getattr(args, "steam", False)):
+        frame = history.steam_moves(
+            since=since,
+            min_books=int(getattr(args, "min_books", 2)),
+            min_prob_delta=float(getattr(args, "min_prob_delta", 0.02)),
+            **filters,
+        )
+    else:
+        frame = history.line_moves(since=since, **filters)
+    limit = max(0, int(getattr(args, "limit", 0)))
+    if limit:
+        frame = frame.head(limit)
+    print(json.dumps(frame.to_dicts(), sort_keys=True, indent=2, default=str))
+    return 0
+
+
 def _cmd_snapshot_verify(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import verify_snapshot_derived_contracts
+
     store = SnapshotStore(_runtime_odds_data_dir())
     snapshot_dir = store.snapshot_dir(args.snapshot_id)
     manifest = store.load_manifest(args.snapshot_id)
@@ -380,14 +613,14 @@ def _cmd_snapshot_verify(args: argparse.Namespace) -> int:
     missing = 0
     for request_key in requests:
         request_path = snapshot_dir / "requests" / f"{request_key}.json"
-        response_path = snapshot_dir / "responses" / f"{request_key}.json"
+        has_response = store.has_response(args.snapshot_id, request_key)
         meta_path = snapshot_dir / "meta" / f"{request_key}.json"
-        if not request_path.exists() or not response_path.exists() or not meta_path.exists():
+        if not request_path.exists() or not has_response or not meta_path.exists():
             missing += 1
             print(
                 f"missing_artifacts request_key={request_key} "
                 f"request={request_path.exists()} "
-                f"response={response_path.exists()} "
+                f"response={has_response} "
                 f"meta={meta_path.exists()}"
             )
 
@@ -424,6 +657,8 @@ def _cmd_snapshot_verify(args: argparse.Namespace) -> int:
 
 
 def _cmd_snapshot_lake(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import lake_snapshot_derived
+
     store = SnapshotStore(_runtime_odds_data_dir())
     snapshot_dir = store.snapshot_dir(args.snapshot_id)
     parquet_paths = lake_snapshot_derived(snapshot_dir)
@@ -434,12 +669,16 @@ def _cmd_snapshot_lake(args: argparse.Namespace) -> int:
 
 
 def _cmd_snapshot_pack(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import pack_snapshot
+
     store = SnapshotStore(_runtime_odds_data_dir())
     out_path = Path(str(args.out)).expanduser() if str(args.out).strip() else None
     bundle_path, sidecar_path = pack_snapshot(
         data_root=store.root,
         snapshot_id=args.snapshot_id,
         out_path=out_path,
+        level=int(getattr(args, "level", 19)),
+        threads=int(getattr(args, "threads", 0)),
     )
     print(f"snapshot_id={args.snapshot_id}")
     print(f"bundle={bundle_path}")
@@ -448,6 +687,8 @@ def _cmd_snapshot_pack(args: argparse.Namespace) -> int:
 
 
 def _cmd_snapshot_unpack(args: argparse.Namespace) -> int:
+    from prop_ev.snapshot_artifacts import unpack_snapshot
+
     store = SnapshotStore(_runtime_odds_data_dir())
     payload = unpack_snapshot(
         data_root=store.root,
@@ -469,26 +710,47 @@ def _cmd_credits_report(args: argparse.Namespace) -> int:
         print(f"no usage ledger for month={month}")
         return 0
 
-    total = 0
-    endpoint_totals: Counter[str] = Counter()
-    remaining = ""
-    for line in usage_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        item = json.loads(line)
-        endpoint = str(item.get("endpoint", ""))
-        last_raw = str(item.get("x_requests_last", "0"))
-        remaining = str(item.get("x_requests_remaining", remaining))
-        try:
-            spent = int(last_raw)
-        except ValueError:
-            spent = 0
-        total += spent
-        endpoint_totals[endpoint] += spent
-
-    print(f"month={month} total_credits={total} remaining={remaining}")
-    for endpoint, spent in endpoint_totals.most_common(10):
-        print(f"endpoint={endpoint} credits={spent}")
+    rollup = load_usage_rollup(usage_path, kind="odds")
+    slice_by = str(getattr(args, "by", "endpoint") or "endpoint")
+    day = str(getattr(args, "day", "") or "")
+    if day and slice_by == "snapshot":
+        raise CLIError("--day cannot be combined with --by snapshot")
+    totals = rollup.get("totals", {})
+    if day:
+        totals = rollup.get("by_day", {}).get(day, {})
+    slices = rollup.get(f"by_{slice_by}", {})
+    if day and slice_by == "endpoint":
+        slices = rollup.get("by_day_endpoint", {}).get(day, {})
+    ranked = [
+        (str(key), int(value.get("credits", 0)), int(value.get("rows", 0)))
+        for key, value in slices.items()
+    ]
+    if slice_by == "day":
+        ranked.sort()
+    else:
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        ranked = ranked[: max(0, int(getattr(args, "limit", 10)))]
+    remaining = str(rollup.get("last", {}).get("provider_remaining", ""))
+    total = int(totals.get("credits", 0))
+
+    if bool(getattr(args, "json_output", False)):
+        payload = {
+            "month": month,
+            "day": day,
+            "total_credits": total,
+            "rows": int(totals.get("rows", 0)),
+            "remaining": remaining,
+            "by": slice_by,
+            "slices": [
+                {slice_by: key, "credits": credits, "rows": rows} for key, credits, rows in ranked
+            ],
+        }
+        print(json.dumps(payload, sort_keys=True))
+        return 0
+    day_label = f" day={day}" if day else ""
+    print(f"month={month}{day_label} total_credits={total} remaining={remaining}")
+    for key, credits, rows in ranked:
+        print(f"{slice_by}={key} credits={credits} rows={rows}")
     return 0
 
 
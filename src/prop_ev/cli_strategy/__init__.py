@@ -2,33 +2,36 @@
 
 from __future__ import annotations
 
-from .ablation import (
-    _cmd_strategy_ablation,
-    _complete_day_snapshots,
-    _parse_positive_int_csv,
-    _resolve_complete_day_dataset_id,
-    _run_cli_subcommand,
-)
-from .backtest import _cmd_strategy_backtest_prep, _cmd_strategy_backtest_summarize
-from .compare import (
-    _cmd_strategy_compare,
-    _cmd_strategy_ls,
-    _parse_strategy_ids,
-)
-from .discovery import _build_discovery_execution_report, _write_discovery_execution_reports
-from .health import _cmd_strategy_health
-from .run import _cmd_strategy_run
-from .settle import _cmd_strategy_settle
-from .shared import (
-    _allow_secondary_injuries_override,
-    _latest_snapshot_id,
-    _official_injury_hard_fail_message,
-    _preflight_context_for_snapshot,
-    _resolve_input_probabilistic_profile,
-    _snapshot_date,
-    _teams_in_scope,
-    _teams_in_scope_from_events,
-)
+from importlib import import_module
+from typing import Any
+
+# Submodules load on first attribute access; `strategy ls` should not pay for the
+# modeling stack that `strategy run` needs.
+_EXPORTS: dict[str, str] = {
+    "_cmd_strategy_ablation": "ablation",
+    "_complete_day_snapshots": "ablation",
+    "_parse_positive_int_csv": "ablation",
+    "_resolve_complete_day_dataset_id": "ablation",
+    "_run_cli_subcommand": "ablation",
+    "_cmd_strategy_backtest_prep": "backtest",
+    "_cmd_strategy_backtest_summarize": "backtest",
+    "_cmd_strategy_compare": "compare",
+    "_cmd_strategy_ls": "compare",
+    "_parse_strategy_ids": "compare",
+    "_build_discovery_execution_report": "discovery",
+    "_write_discovery_execution_reports": "discovery",
+    "_cmd_strategy_health": "health",
+    "_cmd_strategy_run": "run",
+    "_cmd_strategy_settle": "settle",
+    "_allow_secondary_injuries_override": "shared",
+    "_latest_snapshot_id": "shared",
+    "_official_injury_hard_fail_message": "shared",
+    "_preflight_context_for_snapshot": "shared",
+    "_resolve_input_probabilistic_profile": "shared",
+    "_snapshot_date": "shared",
+    "_teams_in_scope": "shared",
+    "_teams_in_scope_from_events": "shared",
+}
 
 __all__ = [
     "_allow_secondary_injuries_override",
@@ -55,3 +58,12 @@ __all__ = [
     "_teams_in_scope_from_events",
     "_write_discovery_execution_reports",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
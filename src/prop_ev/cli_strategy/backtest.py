@@ -426,6 +426,8 @@ def _cmd_strategy_backtest_summarize(args: argparse.Namespace) -> int:
             if stale_md_path.exists():
                 stale_md_path.unlink()
         if write_analysis_pdf:
+            from prop_ev.data_paths import resolve_runtime_root
+            from prop_ev.latex_renderer import render_cache_dir
             from prop_ev.scoreboard_pdf import render_aggregate_scoreboard_pdf
 
             analysis_pdf_path = analysis_dir / "aggregate-scoreboard.pdf"
@@ -435,6 +437,7 @@ def _cmd_strategy_backtest_summarize(args: argparse.Namespace) -> int:
                 tex_path=analysis_tex_source,
                 pdf_path=analysis_pdf_path,
                 keep_tex=keep_analysis_tex,
+                cache_dir=render_cache_dir(resolve_runtime_root(store.root)),
             )
             analysis_pdf_status = str(pdf_result.get("status", "")).strip()
             analysis_pdf_message = str(pdf_result.get("message", "")).strip()
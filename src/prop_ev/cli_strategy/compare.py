@@ -19,7 +19,6 @@ from prop_ev.cli_shared import (
     _runtime_strategy_probabilistic_profile,
     _utc_now,
 )
-from prop_ev.cli_strategy.run import _load_strategy_inputs
 from prop_ev.cli_strategy.shared import (
     _latest_snapshot_id,
     _load_rolling_priors_for_strategy,
@@ -77,6 +76,8 @@ def _ranked_key(row: dict[str, Any]) -> tuple[str, str, str, float, str]:
 
 
 def _cmd_strategy_compare(args: argparse.Namespace) -> int:
+    from prop_ev.cli_strategy.run import _load_strategy_inputs
+
     store = SnapshotStore(_runtime_odds_data_dir())
     snapshot_id = args.snapshot_id or _latest_snapshot_id(store)
     reports_dir = snapshot_reports_dir(store, snapshot_id)
@@ -109,7 +110,7 @@ def _cmd_strategy_compare(args: argparse.Namespace) -> int:
         manifest,
         rows,
         event_context,
-        slate_rows,
+        slate_lines,
         injuries,
         roster,
         player_identity_map,
@@ -165,7 +166,8 @@ def _cmd_strategy_compare(args: argparse.Namespace) -> int:
             injuries=injuries if isinstance(injuries, dict) else None,
             roster=roster if isinstance(roster, dict) else None,
             event_context=event_context if isinstance(event_context, dict) else None,
-            slate_rows=slate_rows,
+            slate_rows=None,
+            slate_lines=slate_lines,
             player_identity_map=(
                 player_identity_map if isinstance(player_identity_map, dict) else None
             ),
@@ -5,23 +5,78 @@ from __future__ import annotations
 import argparse
 import sys
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 from prop_ev.cli_shared import (
     _default_window,
+    _env_bool,
     _iso,
+    _runtime_runtime_dir,
 )
+from prop_ev.execution_projection import ExecutionQuoteIndex, build_execution_quote_index
+from prop_ev.slate_lines import SLATE_LINES_FILENAME, load_slate_lines
 from prop_ev.storage import SnapshotStore
 from prop_ev.strategy import (
     load_jsonl,
 )
+from prop_ev.strategy_inputs_bundle import StrategyInputsBundle, bundle_path_for
 
 
-def _load_slate_rows(store: SnapshotStore, snapshot_id: str) -> list[dict[str, Any]]:
-    path = store.derived_path(snapshot_id, "featured_odds.jsonl")
-    if not path.exists():
-        return []
-    return load_jsonl(path)
+def _load_slate_lines(
+    store: SnapshotStore,
+    snapshot_id: str,
+    event_context: dict[str, dict[str, str]] | None = None,
+) -> list[dict[str, Any]]:
+    return load_slate_lines(store, snapshot_id, event_context=event_context)
+
+
+def _strategy_inputs_bundle(snapshot_id: str) -> StrategyInputsBundle:
+    return StrategyInputsBundle(
+        bundle_path_for(Path(_runtime_runtime_dir()).expanduser().resolve(), snapshot_id),
+        enabled=_env_bool("PROP_EV_STRATEGY_INPUTS_CACHE", True),
+    )
+
+
+def _snapshot_input_sources(store: SnapshotStore, snapshot_id: str) -> dict[str, Path]:
+    return {
+        "manifest": store.snapshot_dir(snapshot_id) / "manifest.json",
+        "event_props": store.derived_path(snapshot_id, "event_props.jsonl"),
+        "slate_lines": store.derived_path(snapshot_id, SLATE_LINES_FILENAME),
+    }
+
+
+def _load_snapshot_inputs(
+    store: SnapshotStore,
+    snapshot_id: str,
+    manifest: dict[str, Any],
+    bundle: StrategyInputsBundle,
+) -> tuple[list[dict[str, Any]], dict[str, dict[str, str]]]:
+    """Return event props rows and event context, reusing the bundle when unchanged."""
+    sources = _snapshot_input_sources(store, snapshot_id)
+    cached = bundle.get("snapshot", sources)
+    if cached is not None:
+        return cached["rows"], cached["event_context"]
+    rows = load_jsonl(sources["event_props"])
+    event_context = _load_event_context(store, snapshot_id, manifest)
+    bundle.put("snapshot", sources, {"rows": rows, "event_context": event_context})
+    return rows, event_context
+
+
+def _load_execution_quote_index(
+    store: SnapshotStore,
+    snapshot_id: str,
+    rows: list[dict[str, Any]],
+    bundle: StrategyInputsBundle,
+) -> ExecutionQuoteIndex:
+    """Return the snapshot's execution quote index, built once per ``event_props`` state."""
+    sources = {"event_props": store.derived_path(snapshot_id, "event_props.jsonl")}
+    cached = bundle.get("execution_quotes", sources)
+    if cached is not None and isinstance(cached.get("quote_index"), ExecutionQuoteIndex):
+        return cached["quote_index"]
+    quote_index = build_execution_quote_index(rows)
+    bundle.put("execution_quotes", sources, {"quote_index": quote_index})
+    return quote_index
 
 
 def _derive_window_from_events(
@@ -11,7 +11,11 @@ from prop_ev.cli_shared import (
     _runtime_odds_data_dir,
     _utc_now,
 )
-from prop_ev.cli_strategy.context import _load_event_context, _load_slate_rows
+from prop_ev.cli_strategy.context import (
+    _load_slate_lines,
+    _load_snapshot_inputs,
+    _strategy_inputs_bundle,
+)
 from prop_ev.cli_strategy.shared import (
     _allow_secondary_injuries_override,
     _coerce_dict,
@@ -32,7 +36,6 @@ from prop_ev.state_keys import (
 from prop_ev.storage import SnapshotStore
 from prop_ev.strategy import (
     build_strategy_report,
-    load_jsonl,
 )
 
 
@@ -45,9 +48,10 @@ def _cmd_strategy_health(args: argparse.Namespace) -> int:
     if not derived_path.exists():
         raise CLIError(f"missing derived props file: {derived_path}")
 
-    rows = load_jsonl(derived_path)
-    event_context = _load_event_context(store, snapshot_id, manifest)
-    slate_rows = _load_slate_rows(store, snapshot_id)
+    rows, event_context = _load_snapshot_inputs(
+        store, snapshot_id, manifest, _strategy_inputs_bundle(snapshot_id)
+    )
+    slate_lines = _load_slate_lines(store, snapshot_id, event_context)
     policy = _strategy_policy_from_runtime()
     allow_secondary_injuries = _allow_secondary_injuries_override(
         cli_flag=bool(getattr(args, "allow_secondary_injuries", False)),
@@ -86,7 +90,7 @@ def _cmd_strategy_health(args: argparse.Namespace) -> int:
         injuries=injuries,
         roster=roster,
         event_context=event_context,
-        slate_rows=slate_rows,
+        slate_lines=slate_lines,
         player_identity_map=None,
         min_ev=0.01,
         allow_tier_b=False,
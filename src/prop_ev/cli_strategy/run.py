@@ -18,8 +18,11 @@ from prop_ev.cli_shared import (
 )
 from prop_ev.cli_strategy.context import (
     _hydrate_slate_for_strategy,
-    _load_event_context,
-    _load_slate_rows,
+    _load_execution_quote_index,
+    _load_slate_lines,
+    _load_snapshot_inputs,
+    _snapshot_input_sources,
+    _strategy_inputs_bundle,
 )
 from prop_ev.cli_strategy.shared import (
     _allow_secondary_injuries_override,
@@ -37,7 +40,10 @@ from prop_ev.cli_strategy.shared import (
     _snapshot_date,
     _teams_in_scope,
 )
-from prop_ev.execution_projection import ExecutionProjectionConfig, project_execution_report
+from prop_ev.execution_projection import (
+    ExecutionProjectionConfig,
+    project_execution_report,
+)
 from prop_ev.identity_map import load_identity_map, update_identity_map
 from prop_ev.nba_data.minutes_prob import load_minutes_prob_index_for_snapshot
 from prop_ev.nba_data.repo import NBARepository
@@ -60,11 +66,11 @@ from prop_ev.strategies.base import (
     normalize_strategy_id,
 )
 from prop_ev.strategy import (
-    load_jsonl,
     write_execution_plan,
     write_strategy_reports,
     write_tagged_strategy_reports,
 )
+from prop_ev.strategy_inputs_bundle import StrategyInputsBundle
 
 
 def _load_strategy_inputs(
@@ -75,6 +81,7 @@ def _load_strategy_inputs(
     block_paid: bool,
     refresh_context: bool,
     probabilistic_profile: str,
+    bundle: StrategyInputsBundle | None = None,
 ) -> tuple[
     Path,
     dict[str, Any],
@@ -92,21 +99,21 @@ def _load_strategy_inputs(
     if not derived_path.exists():
         raise CLIError(f"missing derived props file: {derived_path}")
 
-    rows = load_jsonl(derived_path)
-    event_context = _load_event_context(store, snapshot_id, manifest)
-    slate_rows = _load_slate_rows(store, snapshot_id)
-    if not slate_rows and not offline and not block_paid:
+    slate_lines = _load_slate_lines(store, snapshot_id)
+    if not slate_lines and not offline and not block_paid:
         _hydrate_slate_for_strategy(store, snapshot_id, manifest)
         manifest = store.load_manifest(snapshot_id)
-        event_context = _load_event_context(store, snapshot_id, manifest)
-        slate_rows = _load_slate_rows(store, snapshot_id)
+        slate_lines = _load_slate_lines(store, snapshot_id)
+    if bundle is None:
+        bundle = _strategy_inputs_bundle(snapshot_id)
+    rows, event_context = _load_snapshot_inputs(store, snapshot_id, manifest, bundle)
 
     injuries_stale_hours = _env_float("PROP_EV_CONTEXT_INJURIES_STALE_HOURS", 6.0)
     roster_stale_hours = _env_float("PROP_EV_CONTEXT_ROSTER_STALE_HOURS", 24.0)
     context_repo = NBARepository.from_store(store=store, snapshot_id=snapshot_id)
     identity_map_path = context_repo.identity_map_path()
     teams_in_scope = sorted(_teams_in_scope(event_context))
-    injuries, roster, _, _ = _load_strategy_context(
+    injuries, roster, _, roster_path = _load_strategy_context(
         store=store,
         snapshot_id=snapshot_id,
         teams_in_scope=teams_in_scope,
@@ -115,13 +122,23 @@ def _load_strategy_inputs(
         injuries_stale_hours=injuries_stale_hours,
         roster_stale_hours=roster_stale_hours,
     )
-    update_identity_map(
-        path=identity_map_path,
-        rows=rows,
-        roster=roster if isinstance(roster, dict) else None,
-        event_context=event_context,
-    )
-    player_identity_map = load_identity_map(identity_map_path)
+    identity_sources = {
+        **_snapshot_input_sources(store, snapshot_id),
+        "roster": roster_path,
+        "identity_map": identity_map_path,
+    }
+    cached_identity = bundle.get("identity", identity_sources)
+    if cached_identity is not None:
+        player_identity_map = cached_identity["player_identity_map"]
+    else:
+        update_identity_map(
+            path=identity_map_path,
+            rows=rows,
+            roster=roster if isinstance(roster, dict) else None,
+            event_context=event_context,
+        )
+        player_identity_map = load_identity_map(identity_map_path)
+        bundle.put("identity", identity_sources, {"player_identity_map": player_identity_map})
     minutes_probabilities = load_minutes_prob_index_for_snapshot(
         layout=build_nba_layout(Path(_runtime_nba_data_dir()).expanduser().resolve()),
         snapshot_day=_snapshot_date(snapshot_id),
@@ -133,7 +150,7 @@ def _load_strategy_inputs(
         manifest,
         rows,
         event_context,
-        slate_rows,
+        slate_lines,
         injuries,
         roster,
         player_identity_map,
@@ -168,12 +185,13 @@ def _cmd_strategy_run(args: argparse.Namespace) -> int:
         stale_quote_minutes=stale_quote_minutes_env,
         require_fresh_context=require_fresh_context_env,
     )
+    inputs_bundle = _strategy_inputs_bundle(snapshot_id)
     (
         snapshot_dir,
         manifest,
         rows,
         event_context,
-        slate_rows,
+        slate_lines,
         injuries,
         roster,
         player_identity_map,
@@ -185,6 +203,7 @@ def _cmd_strategy_run(args: argparse.Namespace) -> int:
         block_paid=bool(getattr(args, "block_paid", False)),
         refresh_context=bool(args.refresh_context),
         probabilistic_profile=probabilistic_profile,
+        bundle=inputs_bundle,
     )
     official = _coerce_dict(injuries.get("official")) if isinstance(injuries, dict) else {}
     secondary = _coerce_dict(injuries.get("secondary")) if isinstance(injuries, dict) else {}
@@ -235,7 +254,8 @@ def _cmd_strategy_run(args: argparse.Namespace) -> int:
         injuries=injuries if isinstance(injuries, dict) else None,
         roster=roster if isinstance(roster, dict) else None,
         event_context=event_context if isinstance(event_context, dict) else None,
-        slate_rows=slate_rows,
+        slate_rows=None,
+        slate_lines=slate_lines,
         player_identity_map=player_identity_map if isinstance(player_identity_map, dict) else None,
         rolling_priors=rolling_priors,
         minutes_probabilities=(
@@ -362,6 +382,7 @@ def _cmd_strategy_run(args: argparse.Namespace) -> int:
             report=report,
             event_prop_rows=rows,
             config=execution_config,
+            quote_index=_load_execution_quote_index(store, snapshot_id, rows, inputs_bundle),
         )
         execution_tag = _execution_projection_tag(execution_books)
         execution_json, execution_md = write_tagged_strategy_reports(
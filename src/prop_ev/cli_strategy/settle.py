@@ -13,6 +13,8 @@ from prop_ev.cli_shared import (
     _runtime_odds_data_dir,
 )
 from prop_ev.cli_strategy.shared import _latest_snapshot_id
+from prop_ev.data_paths import resolve_runtime_root
+from prop_ev.latex_renderer import render_cache_dir
 from prop_ev.report_paths import (
     snapshot_reports_dir,
 )
@@ -143,6 +145,7 @@ def _cmd_strategy_settle(args: argparse.Namespace) -> int:
         output_suffix=output_suffix,
         seed_rows_override=seed_rows_override,
         strategy_report_path=strategy_report_for_settlement,
+        render_cache_dir=render_cache_dir(resolve_runtime_root(store.root)),
     )
 
     if bool(getattr(args, "json_output", True)):
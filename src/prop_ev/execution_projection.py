@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from prop_ev.nba_data.normalize import normalize_person_name
@@ -25,6 +24,9 @@ class ExecutionProjectionConfig:
     tier_b_min_ev: float
 
 
+QuoteKey = tuple[str, str, str, float, str]
+
+
 def _normalize_side(raw: Any) -> str:
     side = str(raw).strip().lower()
     if side in {"over", "o"}:
@@ -115,28 +117,63 @@ def _projection_metadata(
     }
 
 
-def project_execution_report(
-    report: dict[str, Any],
-    event_prop_rows: list[dict[str, Any]],
-    config: ExecutionProjectionConfig,
-) -> dict[str, Any]:
-    """Project one modeled strategy report into execution-bookmaker outputs."""
-    projected = deepcopy(report)
-    candidates_raw = projected.get("candidates", [])
-    candidates = [dict(row) for row in candidates_raw if isinstance(row, dict)]
-
-    books = _bookkeepers(config.bookmakers)
-    book_priority = {book: idx for idx, book in enumerate(books)}
-    quotes: dict[tuple[str, str, str, float, str], dict[str, Any]] = {}
-    allowed = set(books)
+@dataclass(frozen=True)
+class ExecutionQuoteIndex:
+    """Per-snapshot execution quotes keyed by (event, player_norm, market, point, side).
+
+    Built once from ``event_props`` rows and shared by every execution projection of the
+    same snapshot; each key holds the quotes of every book so bookmaker filtering happens
+    at lookup time.
+    """
+
+    quotes: dict[QuoteKey, tuple[dict[str, Any], ...]]
+    _player_norms: dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+
+    def player_norm(self, raw: Any) -> str:
+        """Normalize a player name through the index's shared memo."""
+        name = str(raw)
+        cached = self._player_norms.get(name)
+        if cached is None:
+            cached = normalize_person_name(name)
+            self._player_norms[name] = cached
+        return cached
+
+    def best_quote(
+        self,
+        key: QuoteKey,
+        *,
+        allowed: set[str] | frozenset[str],
+        priority: dict[str, int],
+    ) -> dict[str, Any] | None:
+        """Return the best-priced quote for one key among the allowed books."""
+        best: dict[str, Any] | None = None
+        for quote in self.quotes.get(key, ()):
+            if quote["book_key"] not in allowed:
+                continue
+            if best is None or _quote_rank(quote, priority=priority) > _quote_rank(
+                best, priority=priority
+            ):
+                best = quote
+        return best
+
+
+def build_execution_quote_index(event_prop_rows: list[dict[str, Any]]) -> ExecutionQuoteIndex:
+    """Index snapshot ``event_props`` rows for repeated execution projections."""
+    player_norms: dict[str, str] = {}
+    grouped: dict[QuoteKey, list[dict[str, Any]]] = {}
     for row in event_prop_rows:
         if not isinstance(row, dict):
             continue
-        book = str(row.get("book", "")).strip().lower()
-        if not book or book not in allowed:
+        book = str(row.get("book", "")).strip()
+        book_key = book.lower()
+        if not book_key:
             continue
         event_id = str(row.get("event_id", "")).strip()
-        player_norm = normalize_person_name(str(row.get("player", "")))
+        player_raw = str(row.get("player", ""))
+        player_norm = player_norms.get(player_raw)
+        if player_norm is None:
+            player_norm = normalize_person_name(player_raw)
+            player_norms[player_raw] = player_norm
         market = str(row.get("market", "")).strip()
         point = _normalize_point(row.get("point"))
         side = _normalize_side(row.get("side"))
@@ -150,30 +187,55 @@ def project_execution_report(
             or price is None
         ):
             continue
-        key = (event_id, player_norm, market, point, side)
-        candidate_quote = {
-            "book": str(row.get("book", "")).strip(),
-            "price": price,
-            "link": str(row.get("link", "")).strip(),
-            "last_update": str(row.get("last_update", "")).strip(),
-        }
-        current = quotes.get(key)
-        if current is None or _quote_rank(candidate_quote, priority=book_priority) > _quote_rank(
-            current,
-            priority=book_priority,
-        ):
-            quotes[key] = candidate_quote
+        grouped.setdefault((event_id, player_norm, market, point, side), []).append(
+            {
+                "book": book,
+                "book_key": book_key,
+                "price": price,
+                "link": str(row.get("link", "")).strip(),
+                "last_update": str(row.get("last_update", "")).strip(),
+            }
+        )
+    return ExecutionQuoteIndex(
+        quotes={key: tuple(values) for key, values in grouped.items()},
+        _player_norms=player_norms,
+    )
+
+
+def project_execution_report(
+    report: dict[str, Any],
+    event_prop_rows: list[dict[str, Any]] | None,
+    config: ExecutionProjectionConfig,
+    *,
+    quote_index: ExecutionQuoteIndex | None = None,
+) -> dict[str, Any]:
+    """Project one modeled strategy report into execution-bookmaker outputs.
+
+    The returned report shares untouched sections with ``report``; every section the
+    projection rewrites is replaced by a new object, so ``report`` is never mutated.
+    """
+    if quote_index is None:
+        quote_index = build_execution_quote_index(event_prop_rows or [])
+    projected = dict(report)
+    candidates_raw = projected.get("candidates", [])
+    candidates = [dict(row) for row in candidates_raw if isinstance(row, dict)]
+
+    books = _bookkeepers(config.bookmakers)
+    book_priority = {book: idx for idx, book in enumerate(books)}
+    allowed = frozenset(books)
 
     for row in candidates:
         event_id = str(row.get("event_id", "")).strip()
-        player_norm = normalize_person_name(str(row.get("player", "")))
+        player_norm = quote_index.player_norm(row.get("player", ""))
         market = str(row.get("market", "")).strip()
         point = _normalize_point(row.get("point"))
         side = _normalize_side(row.get("recommended_side"))
         execution_quote = None
         if event_id and player_norm and market and point is not None and side:
             quote_key = (event_id, player_norm, market, point, side)
-            execution_quote = quotes.get(quote_key)
+            execution_quote = quote_index.best_quote(
+                quote_key, allowed=allowed, priority=book_priority
+            )
         selected_book = str(execution_quote.get("book", "")).strip() if execution_quote else ""
         selected_price = _to_price(execution_quote.get("price")) if execution_quote else None
         selected_link = str(execution_quote.get("link", "")).strip() if execution_quote else ""
@@ -328,9 +390,8 @@ def project_execution_report(
     strategy_mode = "full_board" if eligible_rows else "watchlist_only"
     projected["strategy_mode"] = strategy_mode
 
-    summary = projected.get("summary")
-    if not isinstance(summary, dict):
-        summary = {}
+    summary_raw = projected.get("summary")
+    summary = dict(summary_raw) if isinstance(summary_raw, dict) else {}
     summary.update(
         {
             "events": len(
@@ -359,8 +420,7 @@ def project_execution_report(
 
     health_report = projected.get("health_report")
     if isinstance(health_report, dict):
-        health_report["strategy_mode"] = strategy_mode
-        projected["health_report"] = health_report
+        projected["health_report"] = {**health_report, "strategy_mode": strategy_mode}
 
     metadata = _projection_metadata(
         config,
@@ -368,9 +428,8 @@ def project_execution_report(
         eligible_count=len(eligible_rows),
     )
     projected["execution_projection"] = metadata
-    audit = projected.get("audit")
-    if not isinstance(audit, dict):
-        audit = {}
+    audit_raw = projected.get("audit")
+    audit = dict(audit_raw) if isinstance(audit_raw, dict) else {}
     audit["execution_projection"] = metadata
     projected["audit"] = audit
 
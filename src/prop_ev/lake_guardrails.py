@@ -73,7 +73,7 @@ def _scan_nba_blobs_under_odds(odds_root: Path) -> list[GuardrailViolation]:
 
 def _scan_runtime_inside_lake(odds_root: Path) -> list[GuardrailViolation]:
     violations: list[GuardrailViolation] = []
-    runtime_dirs = ("cache", "llm_cache", "llm_usage", "nba_cache")
+    runtime_dirs = ("cache", "llm_cache", "llm_usage", "nba_cache", "render_cache")
     for name in runtime_dirs:
         path = odds_root / name
         if not path.exists():
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 import shutil
 import subprocess
+import uuid
 from pathlib import Path
 from typing import Any
 
+from prop_ev.markdown_tree import MarkdownDocument
+
+RENDER_CACHE_DIRNAME = "render_cache"
+
 INLINE_TOKEN_RE = re.compile(r"\*\*([^*]+)\*\*|`([^`]+)`|\[([^\]]+)\]\(([^)]+)\)")
 
 
@@ -54,34 +61,6 @@ def _render_inline_markdown(text: str) -> str:
     return "".join(rendered)
 
 
-def _split_table_row(line: str) -> list[str] | None:
-    stripped = line.strip()
-    if not (stripped.startswith("|") and stripped.endswith("|")):
-        return None
-    placeholder = "__PIPE_PLACEHOLDER__"
-    normalized = stripped.replace("\\|", placeholder)
-    parts = [cell.strip().replace(placeholder, "|") for cell in normalized[1:-1].split("|")]
-    if not parts:
-        return None
-    return parts
-
-
-def _is_separator_cell(value: str) -> bool:
-    raw = value.strip()
-    if not raw:
-        return False
-    if "-" not in raw:
-        return False
-    return bool(re.fullmatch(r":?-{3,}:?", raw))
-
-
-def _is_table_separator(line: str, column_count: int) -> bool:
-    cells = _split_table_row(line)
-    if not cells or len(cells) != column_count:
-        return False
-    return all(_is_separator_cell(cell) for cell in cells)
-
-
 def _table_colspec(headers: list[str]) -> str:
     numeric_headers = {
         "ev",
@@ -196,14 +175,13 @@ def _render_table_latex(headers: list[str], rows: list[list[str]]) -> list[str]:
     return lines
 
 
-def markdown_to_latex(
-    markdown: str,
+def document_to_latex(
+    document: MarkdownDocument,
     *,
     title: str = "Strategy Brief",
     landscape: bool = False,
 ) -> str:
-    """Convert simple markdown to a deterministic LaTeX document."""
-    lines = markdown.splitlines()
+    """Convert a parsed markdown document to a deterministic LaTeX document."""
     geometry = (
         r"\usepackage[margin=1in,landscape]{geometry}"
         if landscape
@@ -229,90 +207,32 @@ def markdown_to_latex(
         rf"\begin{{center}}\LARGE\textbf{{{escape_latex(title)}}}\end{{center}}",
         r"\vspace{0.5em}",
     ]
+    heading_commands = {1: "section", 2: "subsection", 3: "subsubsection"}
 
     in_list = False
-    idx = 0
-    while idx < len(lines):
-        raw_line = lines[idx]
-        line = raw_line.rstrip()
-        stripped = line.strip()
-        if not stripped:
-            if in_list:
-                out.append(r"\end{itemize}")
-                in_list = False
-            out.append("")
-            idx += 1
-            continue
-
-        if stripped.lower() in {"<!-- pagebreak -->", "<pagebreak>", "[pagebreak]", r"\newpage"}:
-            if in_list:
-                out.append(r"\end{itemize}")
-                in_list = False
-            out.append(r"\newpage")
-            idx += 1
-            continue
-
-        if stripped.startswith("# "):
-            if in_list:
-                out.append(r"\end{itemize}")
-                in_list = False
-            out.append(rf"\section*{{{_render_inline_markdown(stripped[2:].strip())}}}")
-            idx += 1
-            continue
-
-        if stripped.startswith("## "):
-            if in_list:
-                out.append(r"\end{itemize}")
-                in_list = False
-            out.append(rf"\subsection*{{{_render_inline_markdown(stripped[3:].strip())}}}")
-            idx += 1
-            continue
-
-        if stripped.startswith("### "):
-            if in_list:
-                out.append(r"\end{itemize}")
-                in_list = False
-            out.append(rf"\subsubsection*{{{_render_inline_markdown(stripped[4:].strip())}}}")
-            idx += 1
-            continue
-
-        header_cells = _split_table_row(stripped)
-        if (
-            header_cells
-            and idx + 1 < len(lines)
-            and _is_table_separator(lines[idx + 1], len(header_cells))
-        ):
-            if in_list:
-                out.append(r"\end{itemize}")
-                in_list = False
-            table_rows: list[list[str]] = []
-            row_idx = idx + 2
-            while row_idx < len(lines):
-                row_cells = _split_table_row(lines[row_idx].strip())
-                if row_cells is None:
-                    break
-                if len(row_cells) != len(header_cells):
-                    break
-                table_rows.append(row_cells)
-                row_idx += 1
-            out.extend(_render_table_latex(header_cells, table_rows))
-            out.append("")
-            idx = row_idx
-            continue
-
-        if stripped.startswith("- "):
+    for block in document.blocks():
+        if block.kind == "list_item":
             if not in_list:
                 out.append(r"\begin{itemize}")
                 in_list = True
-            out.append(rf"\item {_render_inline_markdown(stripped[2:].strip())}")
-            idx += 1
+            out.append(rf"\item {_render_inline_markdown(block.text)}")
             continue
 
         if in_list:
             out.append(r"\end{itemize}")
             in_list = False
-        out.append(_render_inline_markdown(stripped))
-        idx += 1
+        if block.kind == "blank":
+            out.append("")
+        elif block.kind == "pagebreak":
+            out.append(r"\newpage")
+        elif block.kind == "heading":
+            command = heading_commands[block.level]
+            out.append(rf"\{command}*{{{_render_inline_markdown(block.text)}}}")
+        elif block.kind == "table":
+            out.extend(_render_table_latex(list(block.headers), [list(row) for row in block.rows]))
+            out.append("")
+        else:
+            out.append(_render_inline_markdown(block.text))
 
     if in_list:
         out.append(r"\end{itemize}")
@@ -321,24 +241,57 @@ def markdown_to_latex(
     return "\n".join(out) + "\n"
 
 
-def write_latex(
+def markdown_to_latex(
     markdown: str,
     *,
+    title: str = "Strategy Brief",
+    landscape: bool = False,
+) -> str:
+    """Convert simple markdown to a deterministic LaTeX document."""
+    return document_to_latex(MarkdownDocument.parse(markdown), title=title, landscape=landscape)
+
+
+def write_latex(
+    markdown: str | MarkdownDocument,
+    *,
     tex_path: Path,
     title: str = "Strategy Brief",
     landscape: bool = False,
 ) -> Path:
-    """Write LaTeX source file from markdown."""
+    """Write LaTeX source file from markdown text or an already parsed document."""
+    document = (
+        markdown if isinstance(markdown, MarkdownDocument) else MarkdownDocument.parse(markdown)
+    )
     tex_path.parent.mkdir(parents=True, exist_ok=True)
     tex_path.write_text(
-        markdown_to_latex(markdown, title=title, landscape=landscape),
+        document_to_latex(document, title=title, landscape=landscape),
         encoding="utf-8",
     )
     return tex_path
 
 
-def compile_pdf(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
-    """Compile LaTeX into PDF with tectonic when available."""
+def tex_sha256(tex_path: Path) -> str:
+    """Return sha256 of LaTeX source bytes used as the render cache key."""
+    return hashlib.sha256(tex_path.read_bytes()).hexdigest()
+
+
+def render_cache_dir(runtime_root: Path) -> Path:
+    """Return the shared PDF render cache directory under one runtime root."""
+    return runtime_root / RENDER_CACHE_DIRNAME
+
+
+def _copy_atomic(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = destination.with_name(f".tmp-{destination.name}-{uuid.uuid4().hex}")
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, destination)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _run_tectonic(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
     tectonic = shutil.which("tectonic")
     if not tectonic:
         return {
@@ -374,17 +327,47 @@ def compile_pdf(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
     }
 
 
+def compile_pdf(*, tex_path: Path, pdf_path: Path, cache_dir: Path | None = None) -> dict[str, Any]:
+    """Compile LaTeX into PDF with tectonic when available.
+
+    When ``cache_dir`` is set, PDFs are stored by sha256 of the ``.tex`` source and
+    identical documents are copied from the cache instead of being recompiled.
+    """
+    if cache_dir is None:
+        return _run_tectonic(tex_path=tex_path, pdf_path=pdf_path)
+
+    digest = tex_sha256(tex_path)
+    cached_pdf = cache_dir / f"{digest}.pdf"
+    if cached_pdf.exists():
+        _copy_atomic(cached_pdf, pdf_path)
+        return {
+            "status": "ok",
+            "message": "pdf served from render cache",
+            "pdf_path": str(pdf_path),
+            "cache_hit": True,
+            "tex_sha256": digest,
+        }
+
+    result = _run_tectonic(tex_path=tex_path, pdf_path=pdf_path)
+    if result.get("status") == "ok" and pdf_path.exists():
+        _copy_atomic(pdf_path, cached_pdf)
+    result["cache_hit"] = False
+    result["tex_sha256"] = digest
+    return result
+
+
 def render_pdf_from_markdown(
-    markdown: str,
+    markdown: str | MarkdownDocument,
     *,
     tex_path: Path,
     pdf_path: Path,
     title: str = "Strategy Brief",
     landscape: bool = False,
+    cache_dir: Path | None = None,
 ) -> dict[str, Any]:
     """Write LaTeX and attempt PDF compilation."""
     write_latex(markdown, tex_path=tex_path, title=title, landscape=landscape)
-    return compile_pdf(tex_path=tex_path, pdf_path=pdf_path)
+    return compile_pdf(tex_path=tex_path, pdf_path=pdf_path, cache_dir=cache_dir)
 
 
 _LATEX_INTERMEDIATE_SUFFIXES: tuple[str, ...] = (
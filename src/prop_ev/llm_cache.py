@@ -0,0 +1,400 @@
+"""Content-addressed LLM response cache with an access index and eviction.
+
+Responses live under ``runtime/llm_cache``:
+
+- ``entries/<aa>/<cache_key>.json``: compact response rows (text, usage, web sources)
+  that reference their request payload by SHA-256 instead of embedding it.
+- ``payloads/<aa>/<sha256>.json``: content-addressed payload blobs, each stored once.
+  Every top-level payload value of at least ``PAYLOAD_PART_MIN_BYTES`` is its own blob,
+  and the remaining small keys (``task`` and the like) share one blob. Pass1, pass2 and
+  analyst payloads for a snapshot all embed the same ``brief_input``, and the later two
+  the same ``pass1``, so each of those is stored once rather than once per call.
+- ``index.jsonl``: an append-only journal of ``put`` and ``hit`` rows (task, model,
+  snapshot_id, sizes, last access). ``gc`` folds it, evicts by age and/or total size,
+  and rewrites it compacted to one row per live entry.
+
+Every file is written via tmp file + ``os.replace``, and writers hold an flock on
+``.index.lock`` so concurrent processes never observe a half-written entry. Flat
+``<cache_key>.json`` files from the previous layout are migrated on first read.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from prop_ev.time_utils import parse_iso_z, utc_now, utc_now_str
+from prop_ev.util.jsonl import dumps_row
+
+LLM_CACHE_DIRNAME = "llm_cache"
+CACHE_SCHEMA_VERSION = 3
+PAYLOAD_PART_MIN_BYTES = 1024
+INDEX_FILENAME = "index.jsonl"
+_ENTRIES_DIRNAME = "entries"
+_PAYLOADS_DIRNAME = "payloads"
+
+
+def _access_stamp() -> str:
+    # Fixed-width microsecond stamps keep string order equal to time order.
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def payload_sha256(payload: dict[str, Any]) -> str:
+    """Return the content hash identifying a whole payload."""
+    return _sha256(_compact_json(payload))
+
+
+def split_payload(payload: dict[str, Any]) -> tuple[dict[str, str], dict[str, Any]]:
+    """Split ``payload`` into blob texts by top-level key and the small remaining keys."""
+    parts: dict[str, str] = {}
+    rest: dict[str, Any] = {}
+    for key, value in payload.items():
+        text = _compact_json(value)
+        if len(text) >= PAYLOAD_PART_MIN_BYTES:
+            parts[key] = text
+        else:
+            rest[key] = value
+    return parts, rest
+
+
+def _write_atomic(path: Path, text: str) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".tmp-{path.name}-{uuid.uuid4().hex}")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+    return path.stat().st_size
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _record_blobs(record: dict[str, Any]) -> dict[str, int]:
+    """Return ``{blob sha256: bytes}`` for an index record of any schema version."""
+    blobs = record.get("payload_blobs")
+    if isinstance(blobs, dict):
+        return {str(sha): int(size) for sha, size in blobs.items()}
+    sha256 = str(record.get("payload_sha256", ""))
+    return {sha256: int(record.get("payload_bytes", 0))} if sha256 else {}
+
+
+class LLMResponseCache:
+    """Response rows keyed by cache key, request payloads keyed by content hash."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.index_path = cache_dir / INDEX_FILENAME
+
+    def entry_path(self, cache_key: str) -> Path:
+        return self.cache_dir / _ENTRIES_DIRNAME / cache_key[:2] / f"{cache_key}.json"
+
+    def payload_path(self, sha256: str) -> Path:
+        return self.cache_dir / _PAYLOADS_DIRNAME / sha256[:2] / f"{sha256}.json"
+
+    def _legacy_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}.json"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with (self.cache_dir / ".index.lock").open("a", encoding="utf-8") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _append_index(self, row: dict[str, Any]) -> None:
+        with self.index_path.open("a", encoding="utf-8") as handle:
+            handle.write(dumps_row(row, compact=True) + "\n")
+
+    def get(self, cache_key: str, *, snapshot_id: str = "") -> dict[str, Any] | None:
+        """Return the cached response row for ``cache_key`` and record the access."""
+        entry = _read_json(self.entry_path(cache_key))
+        if entry is None:
+            entry = self._migrate_legacy(cache_key, snapshot_id=snapshot_id)
+        if entry is None:
+            return None
+        with self._locked():
+            self._append_index({"op": "hit", "cache_key": cache_key, "at": _access_stamp()})
+        return entry
+
+    def load_payload(self, entry: dict[str, Any]) -> dict[str, Any] | None:
+        """Reassemble the request payload an entry references from its blobs."""
+        parts = entry.get("payload_parts")
+        if not isinstance(parts, dict):
+            # Schema 2 entries reference one whole-payload blob.
+            return _read_json(self.payload_path(str(entry.get("payload_sha256", ""))))
+        rest_sha256 = str(entry.get("payload_rest_sha256", ""))
+        payload = _read_json(self.payload_path(rest_sha256)) if rest_sha256 else {}
+        if payload is None:
+            return None
+        for key, sha256 in parts.items():
+            try:
+                payload[key] = json.loads(self.payload_path(str(sha256)).read_text("utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return None
+        return payload
+
+    def _write_blob(self, text: str) -> tuple[str, int]:
+        """Write one payload blob unless its hash exists; caller holds the lock."""
+        sha256 = _sha256(text)
+        path = self.payload_path(sha256)
+        if path.exists():
+            return sha256, path.stat().st_size
+        return sha256, _write_atomic(path, text + "\n")
+
+    def put(
+        self,
+        cache_key: str,
+        *,
+        task: str,
+        prompt_version: str,
+        model: str,
+        snapshot_id: str,
+        payload: dict[str, Any],
+        request_options: dict[str, Any],
+        response_text: str,
+        web_sources: list[dict[str, str]],
+        usage: dict[str, Any],
+        created_at_utc: str = "",
+    ) -> dict[str, Any]:
+        """Store one response; payload blobs are only written when their hash is new."""
+        sha256 = payload_sha256(payload)
+        part_texts, rest = split_payload(payload)
+        now = _access_stamp()
+        entry = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "cache_key": cache_key,
+            "created_at_utc": created_at_utc or utc_now_str(),
+            "task": task,
+            "prompt_version": prompt_version,
+            "model": model,
+            "payload_sha256": sha256,
+            "payload_parts": {},
+            "payload_rest_sha256": "",
+            "request_options": request_options,
+            "response_text": response_text,
+            "web_sources": web_sources,
+            "usage": usage,
+        }
+        with self._locked():
+            blobs: dict[str, int] = {}
+            for key, text in part_texts.items():
+                part_sha256, blobs[part_sha256] = self._write_blob(text)
+                entry["payload_parts"][key] = part_sha256
+            if rest:
+                rest_sha256, blobs[rest_sha256] = self._write_blob(_compact_json(rest))
+                entry["payload_rest_sha256"] = rest_sha256
+            entry_bytes = _write_atomic(self.entry_path(cache_key), _compact_json(entry) + "\n")
+            self._append_index(
+                {
+                    "op": "put",
+                    "cache_key": cache_key,
+                    "task": task,
+                    "model": model,
+                    "snapshot_id": snapshot_id,
+                    "payload_sha256": sha256,
+                    "payload_blobs": blobs,
+                    "entry_bytes": entry_bytes,
+                    "payload_bytes": sum(blobs.values()),
+                    "created_at_utc": entry["created_at_utc"],
+                    "at": now,
+                }
+            )
+        return entry
+
+    def _migrate_legacy(self, cache_key: str, *, snapshot_id: str) -> dict[str, Any] | None:
+        legacy_path = self._legacy_path(cache_key)
+        legacy = _read_json(legacy_path)
+        if legacy is None:
+            return None
+        payload = legacy.get("payload")
+        request_options = legacy.get("request_options")
+        web_sources = legacy.get("web_sources")
+        usage = legacy.get("usage")
+        entry = self.put(
+            cache_key,
+            task=str(legacy.get("task", "")),
+            prompt_version=str(legacy.get("prompt_version", "")),
+            model=str(legacy.get("model", "")),
+            snapshot_id=snapshot_id,
+            payload=payload if isinstance(payload, dict) else {},
+            request_options=request_options if isinstance(request_options, dict) else {},
+            response_text=str(legacy.get("response_text", "")),
+            web_sources=web_sources if isinstance(web_sources, list) else [],
+            usage=usage if isinstance(usage, dict) else {},
+            created_at_utc=str(legacy.get("created_at_utc", "")),
+        )
+        with suppress(FileNotFoundError):
+            legacy_path.unlink()
+        return entry
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """Fold the journal into one record per cache key; caller holds the lock."""
+        records: dict[str, dict[str, Any]] = {}
+        if not self.index_path.exists():
+            return records
+        with self.index_path.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n") or not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(row, dict):
+                    continue
+                cache_key = str(row.get("cache_key", ""))
+                at = str(row.get("at", ""))
+                if row.get("op") == "put":
+                    record = {key: value for key, value in row.items() if key not in {"op", "at"}}
+                    record["last_access_utc"] = at
+                    records[cache_key] = record
+                elif row.get("op") == "hit" and cache_key in records:
+                    records[cache_key]["last_access_utc"] = max(
+                        at, str(records[cache_key].get("last_access_utc", ""))
+                    )
+        return records
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the index, one record per cached response, oldest access first."""
+        with self._locked():
+            records = self._load_index()
+        return sorted(records.values(), key=lambda row: str(row.get("last_access_utc", "")))
+
+    def gc(
+        self,
+        *,
+        max_bytes: int | None = None,
+        max_age_days: float | None = None,
+        dry_run: bool = False,
+        now: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Evict stale and least recently used entries, then drop unreferenced payload blobs.
+
+        Entries last read more than ``max_age_days`` ago go first; after that the least
+        recently used are evicted until entries plus the blobs they reference fit in
+        ``max_bytes``. Flat legacy files are migrated beforehand; a dry run leaves them in
+        place and only reports their count and size.
+        """
+        legacy_paths = sorted(self.cache_dir.glob("*.json"))
+        legacy_bytes = 0
+        for legacy_path in legacy_paths:
+            if dry_run:
+                with suppress(FileNotFoundError):
+                    legacy_bytes += legacy_path.stat().st_size
+            else:
+                self._migrate_legacy(legacy_path.stem, snapshot_id="")
+
+        with self._locked():
+            records = {
+                key: record
+                for key, record in self._load_index().items()
+                if self.entry_path(key).exists()
+            }
+            payload_sizes: dict[str, int] = {}
+            payload_refs: dict[str, int] = {}
+            for record in records.values():
+                for sha256, size in _record_blobs(record).items():
+                    payload_sizes[sha256] = size
+                    payload_refs[sha256] = payload_refs.get(sha256, 0) + 1
+
+            def _total_bytes() -> int:
+                entry_total = sum(int(record.get("entry_bytes", 0)) for record in records.values())
+                return entry_total + sum(payload_sizes[sha] for sha in payload_refs)
+
+            bytes_before = _total_bytes()
+            entries_before = len(records)
+            evicted: list[str] = []
+
+            def _evict(cache_key: str) -> None:
+                record = records.pop(cache_key)
+                for sha256 in _record_blobs(record):
+                    payload_refs[sha256] -= 1
+                    if payload_refs[sha256] <= 0:
+                        del payload_refs[sha256]
+                evicted.append(cache_key)
+
+            by_access = sorted(records, key=lambda key: str(records[key].get("last_access_utc")))
+            if max_age_days is not None:
+                cutoff = (now or utc_now()) - timedelta(days=max_age_days)
+                for cache_key in by_access:
+                    last_access = parse_iso_z(str(records[cache_key].get("last_access_utc", "")))
+                    if last_access is None or last_access < cutoff:
+                        _evict(cache_key)
+            if max_bytes is not None:
+                total = _total_bytes()
+                for cache_key in by_access:
+                    if total <= max_bytes:
+                        break
+                    if cache_key not in records:
+                        continue
+                    freed = int(records[cache_key].get("entry_bytes", 0))
+                    for sha256 in _record_blobs(records[cache_key]):
+                        if payload_refs.get(sha256) == 1:
+                            freed += payload_sizes.get(sha256, 0)
+                    _evict(cache_key)
+                    total -= freed
+
+            orphan_payloads = [
+                path
+                for path in sorted((self.cache_dir / _PAYLOADS_DIRNAME).glob("*/*.json"))
+                if path.stem not in payload_refs
+            ]
+            if not dry_run:
+                for cache_key in evicted:
+                    with suppress(FileNotFoundError):
+                        self.entry_path(cache_key).unlink()
+                for path in orphan_payloads:
+                    with suppress(FileNotFoundError):
+                        path.unlink()
+                rows = [
+                    {
+                        "op": "put",
+                        **{key: value for key, value in record.items() if key != "last_access_utc"},
+                        "at": record.get("last_access_utc", ""),
+                    }
+                    for record in sorted(
+                        records.values(), key=lambda row: str(row.get("last_access_utc", ""))
+                    )
+                ]
+                _write_atomic(
+                    self.index_path, "".join(dumps_row(row, compact=True) + "\n" for row in rows)
+                )
+
+            return {
+                "dry_run": dry_run,
+                "entries_before": entries_before,
+                "entries_after": len(records),
+                "evicted_entries": len(evicted),
+                "removed_payloads": len(orphan_payloads),
+                "bytes_before": bytes_before,
+                "bytes_after": _total_bytes(),
+                "legacy_files": len(legacy_paths),
+                "legacy_bytes": legacy_bytes,
+            }
@@ -5,8 +5,10 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -14,10 +16,12 @@ import httpx
 
 from prop_ev.budget import current_month_utc, llm_budget_status
 from prop_ev.data_paths import resolve_runtime_root
+from prop_ev.llm_cache import LLM_CACHE_DIRNAME, LLMResponseCache
 from prop_ev.odds_client import parse_csv
 from prop_ev.runtime_config import current_runtime_config
 from prop_ev.settings import Settings
 from prop_ev.time_utils import utc_now_str
+from prop_ev.usage_ledger import append_usage_row
 
 INPUT_RATE_PER_1M_USD = 0.25
 OUTPUT_RATE_PER_1M_USD = 1.0
@@ -301,10 +305,13 @@ class LLMClient:
         self.post_fn = post_fn or _default_post
         default_key_root = current_runtime_config().config_path.parent.resolve()
         self.key_root = key_root or default_key_root
-        self.cache_dir = self.runtime_root / "llm_cache"
+        self.cache_dir = self.runtime_root / LLM_CACHE_DIRNAME
         self.usage_dir = self.runtime_root / "llm_usage"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.usage_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = LLMResponseCache(self.cache_dir)
+        self._budget_lock = threading.Lock()
+        self._reserved_usd = 0.0
 
     def _cache_key(
         self,
@@ -325,12 +332,36 @@ class LLMClient:
         serialized = json.dumps(object_for_hash, sort_keys=True, separators=(",", ":"))
         return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
-    def _cache_path(self, cache_key: str) -> Path:
-        return self.cache_dir / f"{cache_key}.json"
-
     def _usage_path(self, month: str) -> Path:
         return self.usage_dir / f"usage-{month}.jsonl"
 
+    @contextmanager
+    def _budget_reservation(
+        self, *, month: str, prompt: str, max_output_tokens: int
+    ) -> Iterator[None]:
+        """Hold a worst-case cost reservation for one live call.
+
+        Concurrent calls from this client see each other's in-flight reservations, so two
+        passes cannot both pass the cap check on the same remaining budget. The reservation
+        is released once the call has finished and its usage row is in the ledger.
+        """
+        estimate = _estimate_cost_usd(max(1, len(prompt) // 4), max(0, int(max_output_tokens)))
+        with self._budget_lock:
+            budget = llm_budget_status(self.runtime_root, month, self.settings.llm_monthly_cap_usd)
+            used = float(budget.get("used_usd", 0.0))
+            cap = float(budget.get("cap_usd", 0.0))
+            if bool(budget.get("cap_reached", False)) or used + self._reserved_usd >= cap:
+                raise LLMBudgetExceededError(
+                    f"llm monthly cap reached: used={budget['used_usd']} cap={budget['cap_usd']}"
+                    + (f" in_flight={round(self._reserved_usd, 6)}" if self._reserved_usd else "")
+                )
+            self._reserved_usd += estimate
+        try:
+            yield
+        finally:
+            with self._budget_lock:
+                self._reserved_usd = max(0.0, self._reserved_usd - estimate)
+
     def _append_usage(
         self,
         *,
@@ -359,10 +390,7 @@ class LLMClient:
             "total_tokens": total_tokens,
             "cost_usd": round(cost_usd, 6),
         }
-        path = self._usage_path(month)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(row, sort_keys=True, ensure_ascii=True) + "\n")
+        append_usage_row(self._usage_path(month), row, kind="llm")
 
     def cached_completion(
         self,
@@ -387,11 +415,10 @@ class LLMClient:
             payload=payload,
             request_options=request_options,
         )
-        cache_path = self._cache_path(cache_key)
         month = current_month_utc()
 
-        if not refresh and cache_path.exists():
-            cached_row = json.loads(cache_path.read_text(encoding="utf-8"))
+        cached_row = None if refresh else self.cache.get(cache_key, snapshot_id=snapshot_id)
+        if cached_row is not None:
             result = {
                 "cache_key": cache_key,
                 "cached": True,
@@ -419,12 +446,38 @@ class LLMClient:
         if offline:
             raise LLMOfflineCacheMissError(f"offline cache miss for task={task}")
 
-        budget = llm_budget_status(self.runtime_root, month, self.settings.llm_monthly_cap_usd)
-        if bool(budget.get("cap_reached", False)):
-            raise LLMBudgetExceededError(
-                f"llm monthly cap reached: used={budget['used_usd']} cap={budget['cap_usd']}"
+        with self._budget_reservation(
+            month=month, prompt=prompt, max_output_tokens=max_output_tokens
+        ):
+            return self._live_completion(
+                task=task,
+                prompt_version=prompt_version,
+                prompt=prompt,
+                payload=payload,
+                snapshot_id=snapshot_id,
+                model=model,
+                max_output_tokens=max_output_tokens,
+                temperature=temperature,
+                request_options=request_options,
+                cache_key=cache_key,
+                month=month,
             )
 
+    def _live_completion(
+        self,
+        *,
+        task: str,
+        prompt_version: str,
+        prompt: str,
+        payload: dict[str, Any],
+        snapshot_id: str,
+        model: str,
+        max_output_tokens: int,
+        temperature: float,
+        request_options: dict[str, Any] | None,
+        cache_key: str,
+        month: str,
+    ) -> dict[str, Any]:
         api_key = resolve_openai_api_key(self.settings, self.key_root)
         headers = {
             "Authorization": f"Bearer {api_key}",
@@ -474,21 +527,17 @@ class LLMClient:
             "total_tokens": total_tokens,
             "cost_usd": cost_usd,
         }
-        cache_data = {
-            "schema_version": 1,
-            "cache_key": cache_key,
-            "created_at_utc": _now_utc(),
-            "task": task,
-            "prompt_version": prompt_version,
-            "model": model,
-            "payload": payload,
-            "request_options": request_options or {},
-            "response_text": text,
-            "web_sources": web_sources,
-            "usage": usage_row,
-        }
-        cache_path.write_text(
-            json.dumps(cache_data, sort_keys=True, indent=2) + "\n", encoding="utf-8"
+        self.cache.put(
+            cache_key,
+            task=task,
+            prompt_version=prompt_version,
+            model=model,
+            snapshot_id=snapshot_id,
+            payload=payload,
+            request_options=request_options or {},
+            response_text=text,
+            web_sources=web_sources,
+            usage=usage_row,
         )
         self._append_usage(
             month=month,
@@ -0,0 +1,230 @@
+"""Section tree for strategy brief markdown.
+
+The brief is parsed once into a preamble plus one section per ``## `` heading. Post-processing
+rules edit sections in place and the document is serialized once at the end; the LaTeX
+renderer walks the same sections as typed blocks (headings, tables, list items, paragraphs,
+page breaks). Section bodies keep their original lines, so serializing an untouched document
+reproduces the input apart from trailing whitespace.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+PAGEBREAK_MARKER = "<!-- pagebreak -->"
+PAGEBREAK_MARKERS = frozenset({PAGEBREAK_MARKER, "<pagebreak>", "[pagebreak]", r"\newpage"})
+
+
+def split_table_row(line: str) -> list[str] | None:
+    """Return the cells of a ``| a | b |`` row, or None when ``line`` is not a table row."""
+    stripped = line.strip()
+    if not (stripped.startswith("|") and stripped.endswith("|")):
+        return None
+    placeholder = "__PIPE_PLACEHOLDER__"
+    normalized = stripped.replace("\\|", placeholder)
+    cells = [cell.strip().replace(placeholder, "|") for cell in normalized[1:-1].split("|")]
+    if not cells:
+        return None
+    return cells
+
+
+def _is_separator_cell(value: str) -> bool:
+    raw = value.strip()
+    if not raw:
+        return False
+    if "-" not in raw:
+        return False
+    return bool(re.fullmatch(r":?-{3,}:?", raw))
+
+
+def _is_table_separator(line: str, column_count: int) -> bool:
+    cells = split_table_row(line)
+    if not cells or len(cells) != column_count:
+        return False
+    return all(_is_separator_cell(cell) for cell in cells)
+
+
+def _is_section_heading(line: str) -> bool:
+    return line.strip().startswith("## ")
+
+
+def _trim_trailing_blank(lines: list[str]) -> None:
+    while lines and not lines[-1].strip():
+        lines.pop()
+
+
+@dataclass(frozen=True)
+class MarkdownBlock:
+    """One rendered unit of a section: heading, table, list item, paragraph, break or blank."""
+
+    kind: str
+    text: str = ""
+    level: int = 0
+    headers: tuple[str, ...] = ()
+    rows: tuple[tuple[str, ...], ...] = ()
+
+
+def _heading_block(stripped: str) -> MarkdownBlock | None:
+    for level, prefix in ((1, "# "), (2, "## "), (3, "### ")):
+        if stripped.startswith(prefix):
+            return MarkdownBlock(kind="heading", text=stripped[len(prefix) :].strip(), level=level)
+    return None
+
+
+def parse_blocks(lines: list[str]) -> Iterator[MarkdownBlock]:
+    """Yield the blocks of a run of markdown lines."""
+    idx = 0
+    while idx < len(lines):
+        stripped = lines[idx].strip()
+        if not stripped:
+            yield MarkdownBlock(kind="blank")
+            idx += 1
+            continue
+        if stripped.lower() in PAGEBREAK_MARKERS:
+            yield MarkdownBlock(kind="pagebreak")
+            idx += 1
+            continue
+        heading = _heading_block(stripped)
+        if heading is not None:
+            yield heading
+            idx += 1
+            continue
+        header_cells = split_table_row(stripped)
+        if (
+            header_cells
+            and idx + 1 < len(lines)
+            and _is_table_separator(lines[idx + 1], len(header_cells))
+        ):
+            rows: list[tuple[str, ...]] = []
+            row_idx = idx + 2
+            while row_idx < len(lines):
+                row_cells = split_table_row(lines[row_idx])
+                if row_cells is None or len(row_cells) != len(header_cells):
+                    break
+                rows.append(tuple(row_cells))
+                row_idx += 1
+            yield MarkdownBlock(kind="table", headers=tuple(header_cells), rows=tuple(rows))
+            idx = row_idx
+            continue
+        if stripped.startswith("- "):
+            yield MarkdownBlock(kind="list_item", text=stripped[2:].strip())
+            idx += 1
+            continue
+        yield MarkdownBlock(kind="paragraph", text=stripped)
+        idx += 1
+
+
+@dataclass
+class MarkdownSection:
+    """A ``## `` heading line and the body lines up to the next one."""
+
+    heading: str
+    lines: list[str] = field(default_factory=list)
+
+    @property
+    def title(self) -> str:
+        return self.heading.strip()
+
+
+class MarkdownDocument:
+    """Markdown split into a preamble and top-level (``## ``) sections."""
+
+    def __init__(self, preamble: list[str], sections: list[MarkdownSection]) -> None:
+        self.preamble = preamble
+        self.sections = sections
+
+    @classmethod
+    def parse(cls, markdown: str) -> MarkdownDocument:
+        return cls._from_lines(markdown.splitlines())
+
+    @classmethod
+    def _from_lines(cls, lines: list[str]) -> MarkdownDocument:
+        preamble: list[str] = []
+        sections: list[MarkdownSection] = []
+        for line in lines:
+            if _is_section_heading(line):
+                sections.append(MarkdownSection(heading=line))
+            elif sections:
+                sections[-1].lines.append(line)
+            else:
+                preamble.append(line)
+        return cls(preamble, sections)
+
+    def lines(self) -> Iterator[str]:
+        yield from self.preamble
+        for section in self.sections:
+            yield section.heading
+            yield from section.lines
+
+    def to_markdown(self) -> str:
+        return "\n".join(self.lines()).rstrip() + "\n"
+
+    def blocks(self) -> Iterator[MarkdownBlock]:
+        """Yield every block in document order, section headings included."""
+        yield from parse_blocks(self.preamble)
+        for section in self.sections:
+            yield from parse_blocks([section.heading])
+            yield from parse_blocks(section.lines)
+
+    def index(self, title: str) -> int | None:
+        """Return the position of the first section whose heading is ``title``."""
+        for idx, section in enumerate(self.sections):
+            if section.title == title:
+                return idx
+        return None
+
+    def find(self, title: str) -> MarkdownSection | None:
+        idx = self.index(title)
+        return None if idx is None else self.sections[idx]
+
+    def drop(self, title: str) -> None:
+        """Remove every section whose heading is ``title``."""
+        self.sections = [section for section in self.sections if section.title != title]
+
+    def lines_before(self, idx: int) -> list[str]:
+        """Return the body that directly precedes section ``idx`` (preamble for the first)."""
+        return self.preamble if idx == 0 else self.sections[idx - 1].lines
+
+    def last_lines(self) -> list[str]:
+        return self.sections[-1].lines if self.sections else self.preamble
+
+    def extract(self, title: str) -> MarkdownSection | None:
+        """Remove and return the first ``title`` section, trimmed of its closing page break.
+
+        Trailing blank lines and a final page-break marker stay in place, attached to the
+        section that preceded the extracted one.
+        """
+        idx = self.index(title)
+        if idx is None:
+            return None
+        section = self.sections.pop(idx)
+        body = section.lines
+        trim = len(body)
+        while trim > 0 and not body[trim - 1].strip():
+            trim -= 1
+        if trim > 0 and body[trim - 1].strip() == PAGEBREAK_MARKER:
+            trim -= 1
+            while trim > 0 and not body[trim - 1].strip():
+                trim -= 1
+        self.lines_before(idx).extend(body[trim:])
+        return MarkdownSection(heading=section.heading, lines=body[:trim])
+
+    def insert(self, idx: int, lines: list[str]) -> None:
+        """Splice markdown ``lines`` in directly before section ``idx``."""
+        fragment = MarkdownDocument._from_lines(lines)
+        self.lines_before(idx).extend(fragment.preamble)
+        self.sections[idx:idx] = fragment.sections
+
+    def append(self, lines: list[str]) -> None:
+        self.insert(len(self.sections), lines)
+
+    def normalize_tail(self) -> None:
+        """Drop trailing blank lines and trailing whitespace, as ``to_markdown`` would."""
+        last = self.last_lines()
+        _trim_trailing_blank(last)
+        if last:
+            last[-1] = last[-1].rstrip()
+        elif self.sections:
+            self.sections[-1].heading = self.sections[-1].heading.rstrip()
@@ -1,9 +1,20 @@
 """NBA data module: ingestion plus unified runtime repository."""
 
-from prop_ev.nba_data.normalize import canonical_team_name, normalize_person_name
-from prop_ev.nba_data.repo import NBARepository
-from prop_ev.nba_data.schema_version import SCHEMA_VERSION
-from prop_ev.nba_data.source_policy import ResultsSourceMode, normalize_results_source_mode
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+# Exports resolve on first access so light submodules (normalize, schema_version) can be
+# imported without the HTTP-backed repository.
+_EXPORTS: dict[str, str] = {
+    "NBARepository": "prop_ev.nba_data.repo",
+    "ResultsSourceMode": "prop_ev.nba_data.source_policy",
+    "SCHEMA_VERSION": "prop_ev.nba_data.schema_version",
+    "canonical_team_name": "prop_ev.nba_data.normalize",
+    "normalize_person_name": "prop_ev.nba_data.normalize",
+    "normalize_results_source_mode": "prop_ev.nba_data.source_policy",
+}
 
 __all__ = [
     "NBARepository",
@@ -13,3 +24,12 @@ __all__ = [
     "normalize_person_name",
     "normalize_results_source_mode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
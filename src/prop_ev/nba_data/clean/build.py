@@ -14,6 +14,7 @@ from prop_ev.nba_data.clean.schemas import TABLE_SORT_KEYS, enforce_schema
 from prop_ev.nba_data.schema_version import SCHEMA_VERSION
 from prop_ev.nba_data.store.layout import NBADataLayout
 from prop_ev.nba_data.store.manifest import RESOURCE_NAMES, load_manifest
+from prop_ev.util.jsonl import iter_jsonl
 
 
 def _read_json(path: Path) -> dict[str, Any]:
@@ -21,17 +22,6 @@ def _read_json(path: Path) -> dict[str, Any]:
     return payload if isinstance(payload, dict) else {}
 
 
-def _read_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        row = json.loads(line)
-        if isinstance(row, dict):
-            rows.append(row)
-    return rows
-
-
 def _extract_boxscore_rows(payload: dict[str, Any]) -> list[dict[str, Any]]:
     candidates = []
     for key in ("players", "player_stats", "rows"):
@@ -153,7 +143,7 @@ def build_clean(
 
             pbp_path = layout.root / row["resources"]["enhanced_pbp"]["path"]
             if pbp_path.exists():
-                for record in _read_jsonl(pbp_path):
+                for record in iter_jsonl(pbp_path):
                     pbp_rows.append(
                         {
                             "season": row["season"],
@@ -174,7 +164,7 @@ def build_clean(
 
             possession_path = layout.root / row["resources"]["possessions"]["path"]
             if possession_path.exists():
-                for record in _read_jsonl(possession_path):
+                for record in iter_jsonl(possession_path):
                     possessions_rows.append(
                         {
                             "season": row["season"],
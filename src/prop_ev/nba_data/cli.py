@@ -14,16 +14,28 @@ from prop_ev.nba_data.export import export_clean_artifacts, export_raw_archives
 from prop_ev.nba_data.ingest.discover import discover_games
 from prop_ev.nba_data.ingest.fetch import ingest_resources, parse_resources
 from prop_ev.nba_data.io_utils import atomic_write_json
+from prop_ev.nba_data.minutes_prob import (
+    BUNDLE_FORMATS as MINUTES_PROB_BUNDLE_FORMATS,
+)
 from prop_ev.nba_data.minutes_prob import (
     DEFAULT_MARKETS as MINUTES_PROB_DEFAULT_MARKETS,
 )
+from prop_ev.nba_data.minutes_prob import (
+    TRAINING_BACKENDS as MINUTES_PROB_TRAINING_BACKENDS,
+)
 from prop_ev.nba_data.minutes_prob import (
     MinutesProbTrainConfig,
+    benchmark_minutes_prob_backends,
     evaluate_minutes_prob_predictions_file,
     minutes_prob_root,
     predict_minutes_probabilities,
+    predict_pregame_minutes_probabilities,
+    refresh_minutes_prob_rolling_state,
     resolve_default_predictions_out,
+    resolve_latest_model_dir,
+    rolling_state_dir,
     train_minutes_prob_model,
+    update_rolling_state,
 )
 from prop_ev.nba_data.minutes_usage import (
     MinutesUsageBuildConfig,
@@ -182,6 +194,22 @@ def _cmd_clean(args: argparse.Namespace) -> int:
             counts.get("possessions", 0),
         )
     )
+    if counts.get("games", 0) and counts.get("boxscore_players", 0):
+        # Refresh the state the latest model's pre-game predictions read: it is keyed on
+        # the model's seasons, not the seasons this clean run touched.
+        root = minutes_prob_root(layout)
+        try:
+            model_dir = resolve_latest_model_dir(out_dir=root)
+            state = refresh_minutes_prob_rolling_state(
+                layout=layout, model_dir=model_dir, state_root=root
+            )
+        except (FileNotFoundError, ValueError):
+            return 0
+        print(
+            "minutes_prob_state mode={} games_added={} watermark={}".format(
+                state["mode"], state["games_added"], state["watermark_date"]
+            )
+        )
     return 0
 
 
@@ -253,6 +281,7 @@ def _cmd_export_raw_archive(args: argparse.Namespace) -> int:
         season_type=str(args.season_type),
         compression_level=int(args.compression_level),
         overwrite=bool(args.overwrite),
+        threads=int(args.threads),
     )
     if args.json_output:
         print(json.dumps(summary, sort_keys=True, indent=2))
@@ -310,6 +339,22 @@ def _cmd_minutes_usage_baseline(args: argparse.Namespace) -> int:
     return 0
 
 
+def _minutes_prob_train_config(args: argparse.Namespace) -> MinutesProbTrainConfig:
+    return MinutesProbTrainConfig(
+        seasons=_parse_seasons(args.seasons),
+        season_type=str(args.season_type),
+        history_games=int(args.history_games),
+        min_history_games=int(args.min_history_games),
+        eval_days=int(args.eval_days),
+        schema_version=int(args.schema_version),
+        random_seed=int(args.random_seed),
+        model_version=str(args.model_version),
+        backend=str(getattr(args, "backend", "gbr")),
+        fit_workers=int(getattr(args, "fit_workers", 1)),
+        bundle_format=str(getattr(args, "bundle_format", "pickle")),
+    )
+
+
 def _cmd_minutes_prob_train(args: argparse.Namespace) -> int:
     source_config = load_config(data_dir=getattr(args, "data_dir", None))
     source_layout = build_layout(source_config.data_dir)
@@ -317,16 +362,7 @@ def _cmd_minutes_prob_train(args: argparse.Namespace) -> int:
     out_dir = Path(out_dir_raw).expanduser() if out_dir_raw else minutes_prob_root(source_layout)
     summary = train_minutes_prob_model(
         layout=source_layout,
-        config=MinutesProbTrainConfig(
-            seasons=_parse_seasons(args.seasons),
-            season_type=str(args.season_type),
-            history_games=int(args.history_games),
-            min_history_games=int(args.min_history_games),
-            eval_days=int(args.eval_days),
-            schema_version=int(args.schema_version),
-            random_seed=int(args.random_seed),
-            model_version=str(args.model_version),
-        ),
+        config=_minutes_prob_train_config(args),
         out_dir=out_dir,
     )
     if args.json_output:
@@ -348,6 +384,42 @@ def _cmd_minutes_prob_train(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_minutes_prob_benchmark(args: argparse.Namespace) -> int:
+    source_config = load_config(data_dir=getattr(args, "data_dir", None))
+    source_layout = build_layout(source_config.data_dir)
+    out_dir_raw = str(getattr(args, "out_dir", "")).strip()
+    out_dir = (
+        Path(out_dir_raw).expanduser()
+        if out_dir_raw
+        else minutes_prob_root(source_layout) / "benchmarks"
+    )
+    backends = tuple(item.strip().lower() for item in str(args.backends).split(",") if item.strip())
+    unknown = [item for item in backends if item not in MINUTES_PROB_TRAINING_BACKENDS]
+    if not backends or unknown:
+        raise CLIError(f"invalid --backends: {args.backends}")
+    report = benchmark_minutes_prob_backends(
+        layout=source_layout,
+        config=_minutes_prob_train_config(args),
+        out_dir=out_dir,
+        backends=backends,
+    )
+    if args.json_output:
+        print(json.dumps(report, sort_keys=True, indent=2))
+    else:
+        for row in report.get("results", []):
+            print(
+                ("backend={} train_wall_s={} fit_total_wall_s={} mae={} coverage={}").format(
+                    row.get("backend", ""),
+                    row.get("train_wall_s"),
+                    row.get("fit_total_wall_s"),
+                    row.get("mae"),
+                    row.get("coverage_p10_p90"),
+                )
+            )
+        print(f"report={report.get('report_path', '')}")
+    return 0
+
+
 def _cmd_minutes_prob_predict(args: argparse.Namespace) -> int:
     source_config = load_config(data_dir=getattr(args, "data_dir", None))
     source_layout = build_layout(source_config.data_dir)
@@ -360,14 +432,33 @@ def _cmd_minutes_prob_predict(args: argparse.Namespace) -> int:
             model_dir=model_dir,
             as_of_date=str(args.as_of_date),
         )
-    summary = predict_minutes_probabilities(
-        layout=source_layout,
-        model_dir=model_dir,
-        as_of_date=str(args.as_of_date),
-        out_path=out_path,
-        snapshot_id=str(getattr(args, "snapshot_id", "")).strip(),
-        markets=_parse_markets(str(getattr(args, "markets", ""))),
-    )
+    if bool(getattr(args, "pregame", False)):
+        games_json = str(getattr(args, "games_json", "")).strip()
+        games = None
+        if games_json:
+            payload = json.loads(Path(games_json).expanduser().read_text(encoding="utf-8"))
+            rows = payload.get("games", []) if isinstance(payload, dict) else payload
+            if not isinstance(rows, list):
+                raise CLIError(f"invalid --games-json payload: {games_json}")
+            games = [row for row in rows if isinstance(row, dict)]
+        summary = predict_pregame_minutes_probabilities(
+            layout=source_layout,
+            model_dir=model_dir,
+            as_of_date=str(args.as_of_date),
+            out_path=out_path,
+            snapshot_id=str(getattr(args, "snapshot_id", "")).strip(),
+            markets=_parse_markets(str(getattr(args, "markets", ""))),
+            games=games,
+        )
+    else:
+        summary = predict_minutes_probabilities(
+            layout=source_layout,
+            model_dir=model_dir,
+            as_of_date=str(args.as_of_date),
+            out_path=out_path,
+            snapshot_id=str(getattr(args, "snapshot_id", "")).strip(),
+            markets=_parse_markets(str(getattr(args, "markets", ""))),
+        )
     if args.json_output:
         print(json.dumps(summary, sort_keys=True, indent=2))
     else:
@@ -382,6 +473,41 @@ def _cmd_minutes_prob_predict(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_minutes_prob_state(args: argparse.Namespace) -> int:
+    source_config = load_config(data_dir=getattr(args, "data_dir", None))
+    source_layout = build_layout(source_config.data_dir)
+    seasons = _parse_seasons(args.seasons)
+    out_dir_raw = str(getattr(args, "out_dir", "")).strip()
+    root = Path(out_dir_raw).expanduser() if out_dir_raw else minutes_prob_root(source_layout)
+    summary = update_rolling_state(
+        layout=source_layout,
+        state_dir=rolling_state_dir(
+            root,
+            seasons=seasons,
+            season_type=str(args.season_type),
+            schema_version=int(args.schema_version),
+        ),
+        seasons=seasons,
+        season_type=str(args.season_type),
+        schema_version=int(args.schema_version),
+        rebuild=bool(getattr(args, "rebuild", False)),
+    )
+    if args.json_output:
+        print(json.dumps(summary, sort_keys=True, indent=2))
+    else:
+        print(
+            ("mode={} games_added={} games_folded={} players={} watermark={} state_dir={}").format(
+                summary.get("mode", ""),
+                summary.get("games_added", 0),
+                summary.get("games_folded", 0),
+                summary.get("players", 0),
+                summary.get("watermark_date", ""),
+                summary.get("state_dir", ""),
+            )
+        )
+    return 0
+
+
 def _cmd_minutes_prob_evaluate(args: argparse.Namespace) -> int:
     model_dir = Path(str(args.model_dir)).expanduser()
     if not model_dir.exists():
@@ -482,6 +608,9 @@ def _build_parser() -> argparse.ArgumentParser:
     export_raw_archive.add_argument("--seasons", default="2023-24,2024-25,2025-26")
     export_raw_archive.add_argument("--season-type", default="Regular Season")
     export_raw_archive.add_argument("--compression-level", type=int, default=19)
+    export_raw_archive.add_argument(
+        "--threads", type=int, default=0, help="zstd worker threads (0 = one per core)"
+    )
     export_raw_archive.add_argument("--overwrite", action="store_true")
     export_raw_archive.add_argument("--json", dest="json_output", action="store_true")
 
@@ -518,8 +647,46 @@ def _build_parser() -> argparse.ArgumentParser:
     minutes_prob_train.add_argument("--eval-days", type=int, default=30)
     minutes_prob_train.add_argument("--model-version", default="minutes_prob_v1")
     minutes_prob_train.add_argument("--random-seed", type=int, default=42)
+    minutes_prob_train.add_argument(
+        "--backend",
+        choices=MINUTES_PROB_TRAINING_BACKENDS,
+        default="gbr",
+        help="Quantile boosting backend (gbr: exact GradientBoosting, hist: histogram-based)",
+    )
+    minutes_prob_train.add_argument(
+        "--fit-workers",
+        type=int,
+        default=1,
+        help="Processes used to fit the activity and q10/q50/q90 models in parallel",
+    )
+    minutes_prob_train.add_argument(
+        "--bundle-format",
+        choices=MINUTES_PROB_BUNDLE_FORMATS,
+        default="pickle",
+        help="pickle: single model.pkl; mmap: bundle.json + memory-mapped models.joblib",
+    )
     minutes_prob_train.add_argument("--json", dest="json_output", action="store_true")
 
+    minutes_prob_benchmark = minutes_prob_subparsers.add_parser(
+        "benchmark", help="Compare training backends on fit time, MAE and p10-p90 coverage"
+    )
+    minutes_prob_benchmark.set_defaults(func=_cmd_minutes_prob_benchmark)
+    minutes_prob_benchmark.add_argument("--data-dir", default="")
+    minutes_prob_benchmark.add_argument("--out-dir", default="")
+    minutes_prob_benchmark.add_argument("--seasons", default="2023-24,2024-25,2025-26")
+    minutes_prob_benchmark.add_argument("--season-type", default="Regular Season")
+    minutes_prob_benchmark.add_argument("--schema-version", type=int, default=SCHEMA_VERSION)
+    minutes_prob_benchmark.add_argument("--history-games", type=int, default=10)
+    minutes_prob_benchmark.add_argument("--min-history-games", type=int, default=3)
+    minutes_prob_benchmark.add_argument("--eval-days", type=int, default=30)
+    minutes_prob_benchmark.add_argument("--model-version", default="minutes_prob_v1")
+    minutes_prob_benchmark.add_argument("--random-seed", type=int, default=42)
+    minutes_prob_benchmark.add_argument(
+        "--backends", default=",".join(MINUTES_PROB_TRAINING_BACKENDS)
+    )
+    minutes_prob_benchmark.add_argument("--fit-workers", type=int, default=4)
+    minutes_prob_benchmark.add_argument("--json", dest="json_output", action="store_true")
+
     minutes_prob_predict = minutes_prob_subparsers.add_parser(
         "predict", help="Generate per-player probabilistic minutes predictions for one day"
     )
@@ -533,8 +700,30 @@ def _build_parser() -> argparse.ArgumentParser:
         default=",".join(MINUTES_PROB_DEFAULT_MARKETS),
     )
     minutes_prob_predict.add_argument("--out", default="")
+    minutes_prob_predict.add_argument(
+        "--pregame",
+        action="store_true",
+        help="Score scheduled games from the rolling state instead of ingested boxscores",
+    )
+    minutes_prob_predict.add_argument(
+        "--games-json",
+        default="",
+        help="With --pregame: JSON games list (schedule.json shape) overriding the schedule",
+    )
     minutes_prob_predict.add_argument("--json", dest="json_output", action="store_true")
 
+    minutes_prob_state = minutes_prob_subparsers.add_parser(
+        "state", help="Update the per-player rolling state used for pre-game predictions"
+    )
+    minutes_prob_state.set_defaults(func=_cmd_minutes_prob_state)
+    minutes_prob_state.add_argument("--data-dir", default="")
+    minutes_prob_state.add_argument("--out-dir", default="")
+    minutes_prob_state.add_argument("--seasons", default="2023-24,2024-25,2025-26")
+    minutes_prob_state.add_argument("--season-type", default="Regular Season")
+    minutes_prob_state.add_argument("--schema-version", type=int, default=SCHEMA_VERSION)
+    minutes_prob_state.add_argument("--rebuild", action="store_true")
+    minutes_prob_state.add_argument("--json", dest="json_output", action="store_true")
+
     minutes_prob_evaluate = minutes_prob_subparsers.add_parser(
         "evaluate", help="Evaluate a probabilistic minutes predictions parquet artifact"
     )
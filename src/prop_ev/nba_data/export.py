@@ -5,10 +5,9 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 from shutil import copy2
-from tempfile import TemporaryDirectory
 from typing import Any
 
-from prop_ev.archive_utils import compress_tar_zst, sha256_file, write_tar
+from prop_ev.archive_utils import sha256_file, write_tar_zst
 from prop_ev.nba_data.io_utils import atomic_write_json
 from prop_ev.nba_data.store.layout import NBADataLayout, slugify_season_type
 
@@ -129,6 +128,7 @@ def export_raw_archives(
     season_type: str,
     compression_level: int,
     overwrite: bool,
+    threads: int = 0,
 ) -> dict[str, Any]:
     season_slug = slugify_season_type(season_type)
     archive_records: list[dict[str, Any]] = []
@@ -157,10 +157,13 @@ def export_raw_archives(
             )
             continue
 
-        with TemporaryDirectory(prefix=f"raw-archive-{season}-") as tmp_dir:
-            tar_path = Path(tmp_dir) / "raw.tar"
-            write_tar(tar_path=tar_path, root=src_layout.root, files=source_files)
-            compress_tar_zst(tar_path=tar_path, out_path=archive_path, level=compression_level)
+        write_tar_zst(
+            out_path=archive_path,
+            root=src_layout.root,
+            files=source_files,
+            level=compression_level,
+            threads=threads,
+        )
 
         archive_records.append(
             {
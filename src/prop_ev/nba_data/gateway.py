@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
 
 
 def _get(url: str, *, timeout_s: float, accept: str) -> httpx.Response:
+    import httpx
+
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; prop-ev/0.1.0)",
         "Accept": accept,
@@ -11,6 +11,8 @@ from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
+from prop_ev.util.jsonl import write_jsonl
+
 
 def sha256_bytes(data: bytes) -> str:
     """Return SHA-256 hex digest for raw bytes."""
@@ -56,8 +58,4 @@ def atomic_write_json(path: Path, payload: Any) -> None:
 
 
 def atomic_write_jsonl(path: Path, rows: Iterable[Mapping[str, Any]]) -> None:
-    lines = [
-        json.dumps(row, sort_keys=True, ensure_ascii=True, separators=(",", ":")) + "\n"
-        for row in rows
-    ]
-    atomic_write_text(path, "".join(lines))
+    write_jsonl(path, rows, compact=True)
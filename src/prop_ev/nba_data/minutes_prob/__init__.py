@@ -8,29 +8,55 @@ from prop_ev.nba_data.minutes_prob.artifacts import (
 )
 from prop_ev.nba_data.minutes_prob.features import FEATURE_COLUMNS, MinutesProbFeatureConfig
 from prop_ev.nba_data.minutes_prob.model import (
+    BUNDLE_FORMATS,
     DEFAULT_MARKETS,
+    TRAINING_BACKENDS,
     MinutesProbModelBundle,
     MinutesProbTrainConfig,
+    benchmark_minutes_prob_backends,
+    clear_minutes_prob_model_cache,
     evaluate_minutes_prob_predictions_file,
+    load_minutes_prob_model,
     predict_minutes_probabilities,
+    predict_pregame_minutes_probabilities,
+    refresh_minutes_prob_rolling_state,
     resolve_default_predictions_out,
     resolve_latest_model_dir,
     train_minutes_prob_model,
+    write_minutes_prob_bundle,
+)
+from prop_ev.nba_data.minutes_prob.rolling_state import (
+    build_pregame_feature_frame,
+    load_rolling_state,
+    rolling_state_dir,
+    update_rolling_state,
 )
 
 __all__ = [
+    "BUNDLE_FORMATS",
     "DEFAULT_MARKETS",
     "FEATURE_COLUMNS",
     "MinutesProbFeatureConfig",
     "MinutesProbModelBundle",
     "MinutesProbTrainConfig",
+    "TRAINING_BACKENDS",
+    "benchmark_minutes_prob_backends",
+    "build_pregame_feature_frame",
+    "clear_minutes_prob_model_cache",
     "evaluate_minutes_prob_predictions_file",
     "load_minutes_prob_index_for_snapshot",
+    "load_minutes_prob_model",
+    "load_rolling_state",
     "load_predictions_index",
     "minutes_prob_root",
     "predict_minutes_probabilities",
+    "predict_pregame_minutes_probabilities",
     "predictions_path_for_day",
+    "refresh_minutes_prob_rolling_state",
     "resolve_default_predictions_out",
     "resolve_latest_model_dir",
+    "rolling_state_dir",
     "train_minutes_prob_model",
+    "update_rolling_state",
+    "write_minutes_prob_bundle",
 ]
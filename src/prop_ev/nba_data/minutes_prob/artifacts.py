@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import shutil
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -22,49 +23,211 @@ def predictions_path_for_day(*, root_dir: Path, snapshot_day: str) -> Path:
     return root_dir / "predictions" / f"snapshot_date={snapshot_day}" / "predictions.parquet"
 
 
+MINUTES_PROB_PAYLOAD_COLUMNS: tuple[str, ...] = (
+    "minutes_p10",
+    "minutes_p50",
+    "minutes_p90",
+    "minutes_mu",
+    "minutes_sigma_proxy",
+    "p_active",
+    "player_id",
+    "player_name",
+    "player_norm",
+    "games_on_team",
+    "days_on_team",
+    "new_team_phase",
+    "confidence_score",
+    "data_quality_flags",
+    "snapshot_date",
+)
+MinutesProbKey = tuple[str, str, str]
+
+
+def _clean_text(frame: pl.DataFrame, column: str) -> pl.Expr:
+    if column not in frame.columns:
+        return pl.lit("", dtype=pl.Utf8)
+    return pl.col(column).cast(pl.Utf8).fill_null("").str.strip_chars()
+
+
+def _exact_key(key: str) -> MinutesProbKey | None:
+    parts = key.rsplit("|", 2)
+    if len(parts) != 3:
+        return None
+    return parts[0], parts[1], parts[2]
+
+
+class MinutesProbIndex:
+    """Columnar minutes-probability predictions with integer row lookups.
+
+    Predictions stay in one Polars frame; ``(event_id, player_norm, market)`` and
+    ``player_norm`` map to row numbers, and payload dicts are only materialized for rows
+    that are actually looked up or joined.
+    """
+
+    def __init__(self, frame: pl.DataFrame) -> None:
+        raw_norm = _clean_text(frame, "player_norm")
+        player_name = _clean_text(frame, "player_name")
+        player_id = _clean_text(frame, "player_id")
+        keyed = frame.select(
+            _clean_text(frame, "event_id").alias("event_id"),
+            _clean_text(frame, "market").str.to_lowercase().alias("market"),
+            player_id.alias("player_id"),
+            player_name.alias("player_name"),
+            raw_norm.alias("_player_norm_raw"),
+        )
+        norm_cache: dict[tuple[str, str, str], str] = {}
+        player_norms: list[str] = []
+        for triple in zip(
+            keyed["_player_norm_raw"].to_list(),
+            keyed["player_name"].to_list(),
+            keyed["player_id"].to_list(),
+            strict=True,
+        ):
+            norm = norm_cache.get(triple)
+            if norm is None:
+                norm = (
+                    normalize_person_name(triple[0])
+                    or normalize_person_name(triple[1])
+                    or normalize_person_name(triple[2])
+                )
+                norm_cache[triple] = norm
+            player_norms.append(norm)
+        columns: list[pl.Series | pl.Expr] = []
+        for column in MINUTES_PROB_PAYLOAD_COLUMNS:
+            if column == "player_norm":
+                columns.append(pl.Series("player_norm", player_norms, dtype=pl.Utf8))
+            elif column in {"player_id", "player_name"}:
+                columns.append(keyed[column])
+            elif column in frame.columns:
+                columns.append(frame[column])
+            else:
+                columns.append(pl.Series(column, [None] * frame.height))
+        self.payload = pl.DataFrame(columns)
+        self.exact: dict[MinutesProbKey, int] = {}
+        self.player: dict[str, int] = {}
+        for row, (event_id, player_norm, market) in enumerate(
+            zip(keyed["event_id"].to_list(), player_norms, keyed["market"].to_list(), strict=True)
+        ):
+            if player_norm:
+                self.player[player_norm] = row
+            if event_id and player_norm and market:
+                self.exact[(event_id, player_norm, market)] = row
+
+    @classmethod
+    def from_parquet(cls, path: Path) -> MinutesProbIndex:
+        return cls(pl.read_parquet(path))
+
+    @property
+    def height(self) -> int:
+        return self.payload.height
+
+    def row_payload(self, row: int) -> dict[str, Any]:
+        return self.payload.row(row, named=True)
+
+    def lookup(self, *, event_id: str, player_norm: str, market: str) -> dict[str, Any]:
+        """Return the exact prediction, else the player's latest, else ``{}``."""
+        if not player_norm:
+            return {}
+        row = self.exact.get((event_id, player_norm, market.strip().lower()))
+        if row is None:
+            row = self.player.get(player_norm)
+        return {} if row is None else self.row_payload(row)
+
+    def join(self, keys: list[MinutesProbKey]) -> list[dict[str, Any]]:
+        """Resolve many ``(event_id, player_norm, market)`` keys in one vectorized join."""
+        if not keys:
+            return []
+        probe = pl.DataFrame(
+            {
+                "event_id": [key[0] for key in keys],
+                "player_norm": [key[1] for key in keys],
+                "market": [key[2].strip().lower() for key in keys],
+            },
+            schema={"event_id": pl.Utf8, "player_norm": pl.Utf8, "market": pl.Utf8},
+        ).with_row_index("_probe")
+        exact_rows = pl.DataFrame(
+            {
+                "event_id": [key[0] for key in self.exact],
+                "player_norm": [key[1] for key in self.exact],
+                "market": [key[2] for key in self.exact],
+                "_exact_row": list(self.exact.values()),
+            },
+            schema={
+                "event_id": pl.Utf8,
+                "player_norm": pl.Utf8,
+                "market": pl.Utf8,
+                "_exact_row": pl.Int64,
+            },
+        )
+        player_rows = pl.DataFrame(
+            {"player_norm": list(self.player), "_player_row": list(self.player.values())},
+            schema={"player_norm": pl.Utf8, "_player_row": pl.Int64},
+        )
+        resolved = (
+            probe.join(exact_rows, on=["event_id", "player_norm", "market"], how="left")
+            .join(player_rows, on="player_norm", how="left")
+            .with_columns(
+                pl.when(pl.col("player_norm") == "")
+                .then(None)
+                .otherwise(pl.coalesce("_exact_row", "_player_row"))
+                .alias("_row")
+            )
+            .sort("_probe")
+        )
+        rows = resolved["_row"].to_list()
+        hits = sorted({row for row in rows if row is not None})
+        payloads = dict(zip(hits, self.payload[hits].to_dicts(), strict=True)) if hits else {}
+        return [{} if row is None else payloads[row] for row in rows]
+
+
+class _ExactView(Mapping[str, dict[str, Any]]):
+    """``"event_id|player_norm|market"`` mapping view over a :class:`MinutesProbIndex`."""
+
+    def __init__(self, index: MinutesProbIndex) -> None:
+        self._index = index
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        parts = _exact_key(key)
+        row = self._index.exact.get(parts) if parts is not None else None
+        if row is None:
+            raise KeyError(key)
+        return self._index.row_payload(row)
+
+    def __iter__(self) -> Iterator[str]:
+        return ("|".join(key) for key in self._index.exact)
+
+    def __len__(self) -> int:
+        return len(self._index.exact)
+
+
+class _PlayerView(Mapping[str, dict[str, Any]]):
+    """``player_norm`` mapping view over a :class:`MinutesProbIndex`."""
+
+    def __init__(self, index: MinutesProbIndex) -> None:
+        self._index = index
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        row = self._index.player.get(key)
+        if row is None:
+            raise KeyError(key)
+        return self._index.row_payload(row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.player)
+
+    def __len__(self) -> int:
+        return len(self._index.player)
+
+
 def load_predictions_index(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {"exact": {}, "player": {}, "meta": {"path": str(path), "rows": 0}}
-    frame = pl.read_parquet(path)
-    exact: dict[str, dict[str, Any]] = {}
-    player: dict[str, dict[str, Any]] = {}
-    for row in frame.to_dicts():
-        event_id = str(row.get("event_id", "")).strip()
-        market = str(row.get("market", "")).strip().lower()
-        player_id = str(row.get("player_id", "")).strip()
-        player_name = str(row.get("player_name", "")).strip()
-        player_norm_raw = str(row.get("player_norm", "")).strip()
-        player_norm = (
-            normalize_person_name(player_norm_raw)
-            or normalize_person_name(player_name)
-            or normalize_person_name(player_id)
-        )
-        payload = {
-            "minutes_p10": row.get("minutes_p10"),
-            "minutes_p50": row.get("minutes_p50"),
-            "minutes_p90": row.get("minutes_p90"),
-            "minutes_mu": row.get("minutes_mu"),
-            "minutes_sigma_proxy": row.get("minutes_sigma_proxy"),
-            "p_active": row.get("p_active"),
-            "player_id": player_id,
-            "player_name": player_name,
-            "player_norm": player_norm,
-            "games_on_team": row.get("games_on_team"),
-            "days_on_team": row.get("days_on_team"),
-            "new_team_phase": row.get("new_team_phase"),
-            "confidence_score": row.get("confidence_score"),
-            "data_quality_flags": row.get("data_quality_flags"),
-            "snapshot_date": row.get("snapshot_date"),
-        }
-        if player_norm:
-            player[player_norm] = payload
-        if event_id and player_norm and market:
-            key = f"{event_id}|{player_norm}|{market}"
-            exact[key] = payload
+    index = MinutesProbIndex.from_parquet(path)
     return {
-        "exact": exact,
-        "player": player,
-        "meta": {"path": str(path), "rows": int(frame.height)},
+        "index": index,
+        "exact": _ExactView(index),
+        "player": _PlayerView(index),
+        "meta": {"path": str(path), "rows": int(index.height)},
     }
 
 
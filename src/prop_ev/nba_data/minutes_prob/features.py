@@ -23,6 +23,8 @@ FEATURE_COLUMNS: tuple[str, ...] = (
     "team_prev_active_count",
 )
 
+TEAM_HISTORY_GAMES = 5
+
 REQUIRED_COLUMNS: tuple[str, ...] = (
     "season",
     "season_type",
@@ -58,6 +60,7 @@ def _read_clean_table(
     seasons: list[str],
     season_type: str,
     schema_version: int,
+    predicate: pl.Expr | None = None,
 ) -> pl.DataFrame:
     glob_path = _clean_table_glob(layout, table=table, schema_version=schema_version)
     season_type_slug = slugify_season_type(season_type)
@@ -71,9 +74,42 @@ def _read_clean_table(
     frame = pl.scan_parquet(glob_path).filter(
         pl.col("season").is_in(seasons) & (season_type_slug_expr == season_type_slug)
     )
+    if predicate is not None:
+        frame = frame.filter(predicate)
     return frame.collect()
 
 
+def _player_game_rows(games: pl.DataFrame, boxscore: pl.DataFrame) -> pl.DataFrame:
+    """Join boxscore rows to game dates; one row per player per game, sorted by player."""
+    return (
+        boxscore.join(games, on=["season", "season_type", "game_id"], how="inner")
+        .with_columns(
+            pl.col("date").str.strptime(pl.Date, strict=False).alias("game_date"),
+            pl.col("minutes").fill_null(0.0).cast(pl.Float64).alias("actual_minutes"),
+            pl.col("player_id").cast(pl.Utf8),
+            pl.col("team_id").cast(pl.Utf8),
+        )
+        .filter(
+            (pl.col("player_id").str.len_chars() > 0)
+            & (pl.col("team_id").str.len_chars() > 0)
+            & pl.col("game_date").is_not_null()
+        )
+        .sort(["player_id", "game_date", "game_id"])
+    )
+
+
+def _team_game_totals(base: pl.DataFrame) -> pl.DataFrame:
+    """Per team-game minutes total and active player count, sorted by team and date."""
+    return (
+        base.group_by(["team_id", "game_id", "game_date"])
+        .agg(
+            pl.sum("actual_minutes").alias("team_minutes_total"),
+            (pl.col("actual_minutes") > 0.0).cast(pl.Int64).sum().alias("team_active_count"),
+        )
+        .sort(["team_id", "game_date", "game_id"])
+    )
+
+
 def _days_on_team_expr() -> pl.Expr:
     return (
         (pl.col("game_date").cast(pl.Int64) - pl.col("team_start_days").cast(pl.Int64))
@@ -92,6 +128,36 @@ def _new_team_phase_expr() -> pl.Expr:
     )
 
 
+def _derived_feature_exprs() -> list[pl.Expr]:
+    """Tenure phase and trend columns computed from the rolling and tenure columns."""
+    return [
+        _days_on_team_expr().alias("days_on_team"),
+        (pl.col("prev_minutes_short") - pl.col("prev_minutes_mean"))
+        .fill_null(0.0)
+        .alias("prev_minutes_trend"),
+        _new_team_phase_expr().alias("new_team_phase"),
+        pl.when(pl.col("games_on_team") < 5)
+        .then(pl.lit(0))
+        .when(pl.col("games_on_team") <= 10)
+        .then(pl.lit(1))
+        .otherwise(pl.lit(2))
+        .cast(pl.Int64)
+        .alias("new_team_phase_ord"),
+    ]
+
+
+def _feature_default_exprs() -> list[pl.Expr]:
+    """Defaults for rolling features that lack enough history."""
+    return [
+        pl.col("prev_minutes_std").fill_null(0.0),
+        pl.col("team_prev_minutes_mean").fill_null(240.0),
+        pl.col("team_prev_active_count").fill_null(8.0),
+        pl.col("prev_active_rate").fill_null(0.95),
+        pl.col("prev_minutes_short").fill_null(pl.col("prev_minutes_mean")).fill_null(24.0),
+        pl.col("prev_minutes_mean").fill_null(24.0),
+    ]
+
+
 def build_minutes_prob_feature_frame(
     *,
     layout: NBADataLayout,
@@ -143,38 +209,19 @@ def build_minutes_prob_feature_frame(
     min_history_games = max(1, int(config.min_history_games))
     short_window = min(3, history_games)
 
-    base = (
-        boxscore.join(games, on=["season", "season_type", "game_id"], how="inner")
-        .with_columns(
-            pl.col("date").str.strptime(pl.Date, strict=False).alias("game_date"),
-            pl.col("minutes").fill_null(0.0).cast(pl.Float64).alias("actual_minutes"),
-            pl.col("player_id").cast(pl.Utf8),
-            pl.col("team_id").cast(pl.Utf8),
-        )
-        .filter(
-            (pl.col("player_id").str.len_chars() > 0)
-            & (pl.col("team_id").str.len_chars() > 0)
-            & pl.col("game_date").is_not_null()
-        )
-        .sort(["player_id", "game_date", "game_id"])
-    )
+    base = _player_game_rows(games, boxscore)
 
     team_game = (
-        base.group_by(["team_id", "game_id", "game_date"])
-        .agg(
-            pl.sum("actual_minutes").alias("team_minutes_total"),
-            (pl.col("actual_minutes") > 0.0).cast(pl.Int64).sum().alias("team_active_count"),
-        )
-        .sort(["team_id", "game_date", "game_id"])
+        _team_game_totals(base)
         .with_columns(
             pl.col("team_minutes_total")
             .shift(1)
-            .rolling_mean(window_size=5, min_samples=2)
+            .rolling_mean(window_size=TEAM_HISTORY_GAMES, min_samples=2)
             .over("team_id")
             .alias("team_prev_minutes_mean"),
             pl.col("team_active_count")
             .shift(1)
-            .rolling_mean(window_size=5, min_samples=2)
+            .rolling_mean(window_size=TEAM_HISTORY_GAMES, min_samples=2)
             .over("team_id")
             .alias("team_prev_active_count"),
         )
@@ -239,28 +286,8 @@ def build_minutes_prob_feature_frame(
             .cast(pl.Int64)
             .alias("games_on_team")
         )
-        .with_columns(
-            _days_on_team_expr().alias("days_on_team"),
-            (pl.col("prev_minutes_short") - pl.col("prev_minutes_mean"))
-            .fill_null(0.0)
-            .alias("prev_minutes_trend"),
-            _new_team_phase_expr().alias("new_team_phase"),
-            pl.when(pl.col("games_on_team") < 5)
-            .then(pl.lit(0))
-            .when(pl.col("games_on_team") <= 10)
-            .then(pl.lit(1))
-            .otherwise(pl.lit(2))
-            .cast(pl.Int64)
-            .alias("new_team_phase_ord"),
-        )
-        .with_columns(
-            pl.col("prev_minutes_std").fill_null(0.0),
-            pl.col("team_prev_minutes_mean").fill_null(240.0),
-            pl.col("team_prev_active_count").fill_null(8.0),
-            pl.col("prev_active_rate").fill_null(0.95),
-            pl.col("prev_minutes_short").fill_null(pl.col("prev_minutes_mean")).fill_null(24.0),
-            pl.col("prev_minutes_mean").fill_null(24.0),
-        )
+        .with_columns(_derived_feature_exprs())
+        .with_columns(_feature_default_exprs())
         .select(list(REQUIRED_COLUMNS))
     )
     return frame
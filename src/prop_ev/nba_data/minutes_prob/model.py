@@ -6,8 +6,13 @@ import ast
 import json
 import os
 import pickle
-from dataclasses import dataclass
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, fields, replace
 from datetime import UTC, date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.error import URLError
@@ -15,7 +20,6 @@ from urllib.request import Request, urlopen
 
 import numpy as np
 import polars as pl
-from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingClassifier
 
 from prop_ev.nba_data.minutes_prob.conformal import symmetric_halfwidth_from_residuals
 from prop_ev.nba_data.minutes_prob.features import (
@@ -45,6 +49,17 @@ PLAYER_ID_NAME_MAP_FILE = "player_id_name_map.json"
 NBA_STATIC_PLAYERS_DATA_URL = (
     "https://raw.githubusercontent.com/swar/nba_api/master/src/nba_api/stats/library/data.py"
 )
+TRAINING_BACKENDS: tuple[str, ...] = ("gbr", "hist")
+DEFAULT_TRAINING_BACKEND = "gbr"
+_FIT_MODEL_NAMES: tuple[str, ...] = ("p_active", "q10", "q50", "q90")
+_QUANTILE_ALPHAS: dict[str, float] = {"q10": 0.10, "q50": 0.50, "q90": 0.90}
+BUNDLE_FORMATS: tuple[str, ...] = ("pickle", "mmap")
+DEFAULT_BUNDLE_FORMAT = "pickle"
+MODEL_PICKLE_FILENAME = "model.pkl"
+MODEL_BUNDLE_META_FILENAME = "bundle.json"
+MODEL_ARRAYS_FILENAME = "models.joblib"
+_BUNDLE_MODEL_FIELDS: tuple[str, ...] = ("p_active_model", "q10_model", "q50_model", "q90_model")
+_BUNDLE_CACHE_SIZE = 4
 
 
 @dataclass(frozen=True)
@@ -57,6 +72,9 @@ class MinutesProbTrainConfig:
     schema_version: int
     random_seed: int = 42
     model_version: str = "minutes_prob_v1"
+    backend: str = DEFAULT_TRAINING_BACKEND
+    fit_workers: int = 1
+    bundle_format: str = DEFAULT_BUNDLE_FORMAT
 
 
 @dataclass(frozen=True)
@@ -99,6 +117,7 @@ class MinutesProbModelBundle:
     eval_window_start: str
     eval_window_end: str
     generated_at_utc: str
+    training_backend: str = DEFAULT_TRAINING_BACKEND
 
 
 def _iso_z_now() -> str:
@@ -147,6 +166,8 @@ def _fit_classifier(matrix: np.ndarray, target: np.ndarray, *, random_seed: int)
     if matrix.shape[0] < 10 or np.unique(target).size < 2:
         probability = float(np.mean(target)) if target.size else 0.95
         return _ConstantProbabilityModel(probability=probability)
+    from sklearn.ensemble import HistGradientBoostingClassifier
+
     model = HistGradientBoostingClassifier(
         max_depth=4,
         max_iter=250,
@@ -159,12 +180,33 @@ def _fit_classifier(matrix: np.ndarray, target: np.ndarray, *, random_seed: int)
 
 
 def _fit_quantile_model(
-    matrix: np.ndarray, target: np.ndarray, *, alpha: float, random_seed: int
+    matrix: np.ndarray,
+    target: np.ndarray,
+    *,
+    alpha: float,
+    random_seed: int,
+    backend: str = DEFAULT_TRAINING_BACKEND,
 ) -> Any:
     if matrix.shape[0] < 25:
         if target.size == 0:
             return _ConstantRegressor(value=24.0)
         return _ConstantRegressor(value=float(np.quantile(target, alpha)))
+    if backend == "hist":
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        hist_model = HistGradientBoostingRegressor(
+            loss="quantile",
+            quantile=alpha,
+            max_iter=300,
+            learning_rate=0.05,
+            max_depth=3,
+            min_samples_leaf=20,
+            random_state=random_seed,
+        )
+        hist_model.fit(matrix, target)
+        return hist_model
+    from sklearn.ensemble import GradientBoostingRegressor
+
     model = GradientBoostingRegressor(
         loss="quantile",
         alpha=alpha,
@@ -178,6 +220,60 @@ def _fit_quantile_model(
     return model
 
 
+def _fit_model_job(job: dict[str, Any]) -> tuple[str, Any, float]:
+    """Fit one of the four minutes-prob models; runs in a worker process when parallel."""
+    name = str(job["name"])
+    threads = int(job.get("threads", 0) or 0)
+    started = time.perf_counter()
+    if threads > 0:
+        from threadpoolctl import threadpool_limits
+
+        with threadpool_limits(limits=threads):
+            model = _fit_named_model(job)
+    else:
+        model = _fit_named_model(job)
+    return name, model, time.perf_counter() - started
+
+
+def _fit_named_model(job: dict[str, Any]) -> Any:
+    name = str(job["name"])
+    if name == "p_active":
+        return _fit_classifier(job["matrix"], job["target"], random_seed=int(job["random_seed"]))
+    return _fit_quantile_model(
+        job["matrix"],
+        job["target"],
+        alpha=_QUANTILE_ALPHAS[name],
+        random_seed=int(job["random_seed"]),
+        backend=str(job["backend"]),
+    )
+
+
+def _fit_models(
+    jobs: list[dict[str, Any]], *, workers: int
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """Fit ``jobs`` sequentially or across ``workers`` spawned processes.
+
+    Each worker gets an equal share of the CPUs for the estimator's native threads so
+    the histogram backend does not oversubscribe when the four fits run together.
+    """
+    models: dict[str, Any] = {}
+    wall_s: dict[str, float] = {}
+    workers = max(1, min(int(workers), len(jobs)))
+    if workers == 1:
+        results = [_fit_model_job(job) for job in jobs]
+    else:
+        import multiprocessing
+
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            results = list(pool.map(_fit_model_job, [{**job, "threads": threads} for job in jobs]))
+    for name, model, elapsed in results:
+        models[name] = model
+        wall_s[name] = round(float(elapsed), 6)
+    return models, wall_s
+
+
 def _ensure_monotone_quantiles(
     q10: np.ndarray,
     q50: np.ndarray,
@@ -518,28 +614,31 @@ def train_minutes_prob_model(
     train_active = train_rows.get_column("active_target").to_numpy().astype(np.int64)
     train_minutes = train_rows.get_column("actual_minutes").to_numpy().astype(np.float64)
 
-    classifier = _fit_classifier(train_matrix, train_active, random_seed=config.random_seed)
+    backend = config.backend.strip().lower()
+    if backend not in TRAINING_BACKENDS:
+        raise ValueError(f"unknown minutes-prob training backend: {config.backend}")
     active_mask = train_active == 1
     active_matrix = train_matrix[active_mask]
     active_minutes = train_minutes[active_mask]
-    q10_model = _fit_quantile_model(
-        active_matrix,
-        active_minutes,
-        alpha=0.10,
-        random_seed=config.random_seed,
-    )
-    q50_model = _fit_quantile_model(
-        active_matrix,
-        active_minutes,
-        alpha=0.50,
-        random_seed=config.random_seed,
-    )
-    q90_model = _fit_quantile_model(
-        active_matrix,
-        active_minutes,
-        alpha=0.90,
-        random_seed=config.random_seed,
-    )
+    fit_jobs: list[dict[str, Any]] = []
+    for name in _FIT_MODEL_NAMES:
+        is_classifier = name == "p_active"
+        fit_jobs.append(
+            {
+                "name": name,
+                "matrix": train_matrix if is_classifier else active_matrix,
+                "target": train_active if is_classifier else active_minutes,
+                "random_seed": int(config.random_seed),
+                "backend": backend,
+            }
+        )
+    fit_started = time.perf_counter()
+    fitted, fit_wall_s = _fit_models(fit_jobs, workers=int(config.fit_workers))
+    fit_total_wall_s = round(time.perf_counter() - fit_started, 6)
+    classifier = fitted["p_active"]
+    q10_model = fitted["q10"]
+    q50_model = fitted["q50"]
+    q90_model = fitted["q90"]
 
     conformal_halfwidth = 4.0
     if active_matrix.shape[0] >= 40:
@@ -566,6 +665,8 @@ def train_minutes_prob_model(
         f"{config.season_type.strip().lower().replace(' ', '_')}"
         f"-h{int(config.history_games)}-e{int(config.eval_days)}"
     )
+    if backend != DEFAULT_TRAINING_BACKEND:
+        run_id = f"{run_id}-{backend}"
     model_dir = out_dir / run_id
     model_dir.mkdir(parents=True, exist_ok=True)
 
@@ -590,11 +691,12 @@ def train_minutes_prob_model(
         eval_window_start=eval_min_date.isoformat() if isinstance(eval_min_date, date) else "",
         eval_window_end=eval_max_date.isoformat() if isinstance(eval_max_date, date) else "",
         generated_at_utc=_iso_z_now(),
+        training_backend=backend,
     )
 
-    model_path = model_dir / "model.pkl"
-    with model_path.open("wb") as handle:
-        pickle.dump(bundle, handle)
+    model_path = write_minutes_prob_bundle(
+        bundle, model_dir=model_dir, bundle_format=config.bundle_format
+    )
 
     eval_predictions = _predict_internal(
         frame=eval_rows,
@@ -637,6 +739,13 @@ def train_minutes_prob_model(
         "rows_train": int(train_rows.height),
         "rows_eval": int(eval_rows.height),
         "rows_train_active": int(int(np.sum(train_active))),
+        "training": {
+            "backend": backend,
+            "fit_workers": max(1, min(int(config.fit_workers), len(fit_jobs))),
+            "fit_wall_s": fit_wall_s,
+            "fit_total_wall_s": fit_total_wall_s,
+            "bundle_format": config.bundle_format.strip().lower(),
+        },
         "artifacts": {
             "model_dir": str(model_dir),
             "model_path": str(model_path),
@@ -673,15 +782,174 @@ def train_minutes_prob_model(
     return metadata
 
 
+def benchmark_minutes_prob_backends(
+    *,
+    layout: NBADataLayout,
+    config: MinutesProbTrainConfig,
+    out_dir: Path,
+    backends: tuple[str, ...] = TRAINING_BACKENDS,
+) -> dict[str, Any]:
+    """Train once per backend on the same split and compare fit time and eval metrics."""
+    results: list[dict[str, Any]] = []
+    for backend in backends:
+        started = time.perf_counter()
+        summary = train_minutes_prob_model(
+            layout=layout,
+            config=replace(config, backend=backend),
+            out_dir=out_dir / f"backend={backend}",
+        )
+        train_wall_s = round(time.perf_counter() - started, 6)
+        training = summary.get("training", {})
+        metrics = summary.get("evaluation", {}).get("metrics", {})
+        results.append(
+            {
+                "backend": backend,
+                "run_id": summary.get("run_id", ""),
+                "train_wall_s": train_wall_s,
+                "fit_total_wall_s": training.get("fit_total_wall_s"),
+                "fit_wall_s": training.get("fit_wall_s", {}),
+                "rows_eval": int(summary.get("rows_eval", 0)),
+                "mae": metrics.get("mae"),
+                "rmse": metrics.get("rmse"),
+                "coverage_p10_p90": metrics.get("coverage_p10_p90"),
+                "model_dir": summary.get("artifacts", {}).get("model_dir", ""),
+            }
+        )
+    report = {
+        "schema_version": 1,
+        "generated_at_utc": _iso_z_now(),
+        "seasons": list(config.seasons),
+        "season_type": config.season_type,
+        "fit_workers": int(config.fit_workers),
+        "results": results,
+    }
+    out_dir.mkdir(parents=True, exist_ok=True)
+    report_path = out_dir / "benchmark.json"
+    report_path.write_text(json.dumps(report, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+    report["report_path"] = str(report_path)
+    return report
+
+
+def _atomic_write_bytes(path: Path, writer: Any) -> None:
+    tmp_path = path.with_name(f".tmp-{path.name}-{uuid.uuid4().hex}")
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+def write_minutes_prob_bundle(
+    bundle: MinutesProbModelBundle,
+    *,
+    model_dir: Path,
+    bundle_format: str = DEFAULT_BUNDLE_FORMAT,
+) -> Path:
+    """Write ``bundle`` into ``model_dir`` and return the path loaders should track.
+
+    ``pickle`` writes one ``model.pkl``. ``mmap`` writes the fitted estimators to an
+    uncompressed ``models.joblib`` whose numpy arrays are memory-mapped on load, plus the
+    scalar fields to ``bundle.json``; processes loading the same bundle share its pages.
+    Files from the other format are removed so a model dir holds exactly one bundle.
+    """
+    resolved = bundle_format.strip().lower()
+    if resolved not in BUNDLE_FORMATS:
+        raise ValueError(f"unknown minutes-prob bundle format: {bundle_format}")
+    model_dir.mkdir(parents=True, exist_ok=True)
+    pickle_path = model_dir / MODEL_PICKLE_FILENAME
+    meta_path = model_dir / MODEL_BUNDLE_META_FILENAME
+    arrays_path = model_dir / MODEL_ARRAYS_FILENAME
+    if resolved == "pickle":
+
+        def _write_pickle(tmp_path: Path) -> None:
+            with tmp_path.open("wb") as handle:
+                pickle.dump(bundle, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        _atomic_write_bytes(pickle_path, _write_pickle)
+        for stale in (meta_path, arrays_path):
+            stale.unlink(missing_ok=True)
+        return pickle_path
+
+    import joblib
+
+    models = {name: getattr(bundle, name) for name in _BUNDLE_MODEL_FIELDS}
+    _atomic_write_bytes(arrays_path, lambda tmp_path: joblib.dump(models, tmp_path, compress=0))
+    meta = {
+        field.name: getattr(bundle, field.name)
+        for field in fields(bundle)
+        if field.name not in _BUNDLE_MODEL_FIELDS
+    }
+    meta["bundle_format"] = "mmap"
+    meta["models_path"] = MODEL_ARRAYS_FILENAME
+    _atomic_write_bytes(
+        meta_path,
+        lambda tmp_path: tmp_path.write_text(
+            json.dumps(meta, sort_keys=True, indent=2) + "\n", encoding="utf-8"
+        ),
+    )
+    pickle_path.unlink(missing_ok=True)
+    return meta_path
+
+
+def _bundle_source_paths(model_dir: Path) -> tuple[Path, ...]:
+    meta_path = model_dir / MODEL_BUNDLE_META_FILENAME
+    if meta_path.exists():
+        return (meta_path, model_dir / MODEL_ARRAYS_FILENAME)
+    return (model_dir / MODEL_PICKLE_FILENAME,)
+
+
+@lru_cache(maxsize=_BUNDLE_CACHE_SIZE)
+def _load_bundle_cached(
+    sources: tuple[tuple[str, int, int], ...],
+) -> MinutesProbModelBundle:
+    paths = [Path(path) for path, _, _ in sources]
+    if len(paths) == 1:
+        with paths[0].open("rb") as handle:
+            payload = pickle.load(handle)
+        if not isinstance(payload, MinutesProbModelBundle):
+            raise ValueError(f"invalid minutes-prob model payload: {paths[0]}")
+        return payload
+
+    import joblib
+
+    meta_path, arrays_path = paths
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    models = joblib.load(arrays_path, mmap_mode="r")
+    if not isinstance(meta, dict) or not isinstance(models, dict):
+        raise ValueError(f"invalid minutes-prob model payload: {meta_path}")
+    known = {field.name for field in fields(MinutesProbModelBundle)}
+    values = {key: value for key, value in meta.items() if key in known}
+    values["seasons"] = tuple(values.get("seasons", ()))
+    values["feature_columns"] = tuple(values.get("feature_columns", ()))
+    for name in _BUNDLE_MODEL_FIELDS:
+        values[name] = models[name]
+    try:
+        return MinutesProbModelBundle(**values)
+    except TypeError as exc:
+        raise ValueError(f"invalid minutes-prob model payload: {meta_path}") from exc
+
+
 def load_minutes_prob_model(model_dir: Path) -> MinutesProbModelBundle:
-    model_path = model_dir / "model.pkl"
-    if not model_path.exists():
-        raise FileNotFoundError(f"minutes-prob model file not found: {model_path}")
-    with model_path.open("rb") as handle:
-        payload = pickle.load(handle)
-    if not isinstance(payload, MinutesProbModelBundle):
-        raise ValueError(f"invalid minutes-prob model payload: {model_path}")
-    return payload
+    """Load a model bundle, reusing the process-wide copy while its files are unchanged.
+
+    Cache entries are keyed by the resolved bundle files with their size and mtime, so
+    retraining into the same model dir is picked up on the next call.
+    """
+    paths = _bundle_source_paths(model_dir)
+    sources: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"minutes-prob model file not found: {path}") from exc
+        sources.append((str(path.resolve()), int(stat.st_size), int(stat.st_mtime_ns)))
+    return _load_bundle_cached(tuple(sources))
+
+
+def clear_minutes_prob_model_cache() -> None:
+    """Drop every cached model bundle in this process."""
+    _load_bundle_cached.cache_clear()
 
 
 def predict_minutes_probabilities(
@@ -722,6 +990,146 @@ def predict_minutes_probabilities(
         markets=markets,
         player_name_map=player_name_map,
     )
+    return _write_predictions(
+        predictions,
+        bundle=bundle,
+        model_dir=model_dir,
+        target_day=target_day,
+        snapshot_id=resolved_snapshot_id,
+        markets=markets,
+        out_path=out_path,
+    )
+
+
+def _model_rolling_state_dir(
+    bundle: MinutesProbModelBundle, *, model_dir: Path, state_root: Path | None
+) -> Path:
+    from prop_ev.nba_data.minutes_prob.rolling_state import rolling_state_dir
+
+    return rolling_state_dir(
+        state_root if state_root is not None else model_dir.parent,
+        seasons=bundle.seasons,
+        season_type=bundle.season_type,
+        schema_version=int(bundle.schema_version),
+    )
+
+
+def refresh_minutes_prob_rolling_state(
+    *,
+    layout: NBADataLayout,
+    model_dir: Path,
+    state_root: Path | None = None,
+) -> dict[str, Any]:
+    """Catch the rolling state a model predicts from up with the clean games table.
+
+    The state is keyed on the bundle's seasons, season type and clean schema under
+    ``state_root`` (default: the model root, ``model_dir.parent``), which is exactly the
+    state ``predict_pregame_minutes_probabilities`` reads.
+    """
+    from prop_ev.nba_data.minutes_prob.rolling_state import update_rolling_state
+
+    bundle = load_minutes_prob_model(model_dir)
+    return update_rolling_state(
+        layout=layout,
+        state_dir=_model_rolling_state_dir(bundle, model_dir=model_dir, state_root=state_root),
+        seasons=list(bundle.seasons),
+        season_type=bundle.season_type,
+        schema_version=int(bundle.schema_version),
+    )
+
+
+def predict_pregame_minutes_probabilities(
+    *,
+    layout: NBADataLayout,
+    model_dir: Path,
+    as_of_date: str,
+    out_path: Path,
+    snapshot_id: str = "",
+    markets: tuple[str, ...] = DEFAULT_MARKETS,
+    games: list[dict[str, Any]] | None = None,
+    state_root: Path | None = None,
+    refresh_state: bool = True,
+) -> dict[str, Any]:
+    """Predict minutes for games that have not been played yet.
+
+    Feature rows come from the rolling state (each player's latest history) and the
+    scheduled games for ``as_of_date``: ``games`` when given, else the season schedule
+    files. Unless the caller just refreshed it (``refresh_state=False``), the state is
+    caught up with the clean games table first; that fold is incremental, so only
+    boxscores of games past the state watermark are read.
+    """
+    from prop_ev.nba_data.minutes_prob.rolling_state import (
+        build_pregame_feature_frame,
+        load_rolling_state,
+        load_scheduled_games,
+    )
+
+    bundle = load_minutes_prob_model(model_dir)
+    target_day = _coerce_date(as_of_date)
+    if target_day is None:
+        raise ValueError(f"invalid as-of date: {as_of_date}")
+    state_dir = _model_rolling_state_dir(bundle, model_dir=model_dir, state_root=state_root)
+    if refresh_state:
+        refresh_minutes_prob_rolling_state(
+            layout=layout, model_dir=model_dir, state_root=state_root
+        )
+    state = load_rolling_state(state_dir)
+    if state is None:
+        raise ValueError(f"minutes-prob rolling state unavailable: {state_dir}")
+    scheduled = (
+        games
+        if games is not None
+        else load_scheduled_games(
+            layout=layout,
+            seasons=bundle.seasons,
+            season_type=bundle.season_type,
+            game_date=target_day,
+        )
+    )
+    inference = build_pregame_feature_frame(
+        state=state,
+        games=scheduled,
+        game_date=target_day,
+        history_games=int(bundle.history_games),
+        min_history_games=int(bundle.min_history_games),
+    )
+    if inference.is_empty():
+        raise ValueError(f"no scheduled players found for as-of date: {target_day.isoformat()}")
+    resolved_snapshot_id = snapshot_id.strip() or f"day-{target_day.isoformat()}"
+    predictions = _predict_internal(
+        frame=inference,
+        bundle=bundle,
+        snapshot_id=resolved_snapshot_id,
+        markets=markets,
+        player_name_map=_load_player_id_name_map(layout),
+    )
+    return _write_predictions(
+        predictions,
+        bundle=bundle,
+        model_dir=model_dir,
+        target_day=target_day,
+        snapshot_id=resolved_snapshot_id,
+        markets=markets,
+        out_path=out_path,
+        extra_meta={
+            "mode": "pregame",
+            "rolling_state_dir": str(state_dir),
+            "rolling_state_watermark": str(state["meta"].get("watermark_date", "")),
+        },
+    )
+
+
+def _write_predictions(
+    predictions: pl.DataFrame,
+    *,
+    bundle: MinutesProbModelBundle,
+    model_dir: Path,
+    target_day: date,
+    snapshot_id: str,
+    markets: tuple[str, ...],
+    out_path: Path,
+    extra_meta: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     predictions.write_parquet(out_path)
 
@@ -734,13 +1142,14 @@ def predict_minutes_probabilities(
     output_meta = {
         "schema_version": 1,
         "model_version": bundle.model_version,
-        "snapshot_id": resolved_snapshot_id,
+        "snapshot_id": snapshot_id,
         "as_of_date": target_day.isoformat(),
         "rows": int(predictions.height),
         "markets": list(markets),
         "out_path": str(out_path),
         "generated_at_utc": _iso_z_now(),
         "latest_predictions_path": str(latest_predictions),
+        **(extra_meta or {}),
     }
     meta_path = out_path.with_suffix(".meta.json")
     meta_path.write_text(json.dumps(output_meta, sort_keys=True, indent=2) + "\n", encoding="utf-8")
@@ -900,14 +1309,31 @@ def maybe_auto_build_predictions_for_day(
         return out_path
     model_dir = resolve_latest_model_dir(out_dir=model_root_dir)
     try:
-        predict_minutes_probabilities(
-            layout=layout,
-            model_dir=model_dir,
-            as_of_date=target_day.isoformat(),
-            out_path=out_path,
-            snapshot_id=f"day-{target_day.isoformat()}",
-            markets=DEFAULT_MARKETS,
+        state = refresh_minutes_prob_rolling_state(
+            layout=layout, model_dir=model_dir, state_root=model_root_dir
         )
+        watermark = _coerce_date(state.get("watermark_date"))
+        if watermark is not None and watermark >= target_day:
+            # The day's boxscores are ingested: score it from the full feature frame.
+            predict_minutes_probabilities(
+                layout=layout,
+                model_dir=model_dir,
+                as_of_date=target_day.isoformat(),
+                out_path=out_path,
+                snapshot_id=f"day-{target_day.isoformat()}",
+                markets=DEFAULT_MARKETS,
+            )
+        else:
+            predict_pregame_minutes_probabilities(
+                layout=layout,
+                model_dir=model_dir,
+                as_of_date=target_day.isoformat(),
+                out_path=out_path,
+                snapshot_id=f"day-{target_day.isoformat()}",
+                markets=DEFAULT_MARKETS,
+                state_root=model_root_dir,
+                refresh_state=False,
+            )
     except (FileNotFoundError, ValueError):
         return None
     return out_path if out_path.exists() else None
@@ -0,0 +1,392 @@
+"""Compact per-player rolling state for pre-game minutes inference.
+
+``build_minutes_prob_feature_frame`` derives features from every clean boxscore, so a row
+for a game only exists once that game has been played and ingested. The rolling state keeps
+just what the *next* game's features need: each player's last ``ROLLING_STATE_WINDOW``
+minutes, game counts and per-team tenure, plus each team's last ``TEAM_HISTORY_GAMES``
+totals. ``update_rolling_state`` folds in games newer than the stored watermark, so a
+refresh after a clean build only reads the new boxscores, and ``build_pregame_feature_frame``
+turns the state plus scheduled games into rows matching the training feature frame.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from prop_ev.nba_data.io_utils import atomic_write_bytes, atomic_write_json
+from prop_ev.nba_data.minutes_prob.features import (
+    REQUIRED_COLUMNS,
+    TEAM_HISTORY_GAMES,
+    _derived_feature_exprs,
+    _feature_default_exprs,
+    _player_game_rows,
+    _read_clean_table,
+    _team_game_totals,
+)
+from prop_ev.nba_data.store.layout import NBADataLayout, slugify_season_type
+
+ROLLING_STATE_SCHEMA_VERSION = 1
+ROLLING_STATE_WINDOW = 32
+DEFAULT_ROSTER_DAYS = 14
+PLAYERS_FILE = "players.parquet"
+PLAYER_TEAMS_FILE = "player_teams.parquet"
+TEAMS_FILE = "teams.parquet"
+STATE_META_FILE = "state.json"
+
+_PLAYERS_SCHEMA: dict[str, Any] = {
+    "player_id": pl.Utf8,
+    "team_id": pl.Utf8,
+    "last_game_date": pl.Date,
+    "games_played": pl.Int64,
+    "recent_minutes": pl.List(pl.Float64),
+}
+_PLAYER_TEAMS_SCHEMA: dict[str, Any] = {
+    "player_id": pl.Utf8,
+    "team_id": pl.Utf8,
+    "team_games": pl.Int64,
+    "team_start_date": pl.Date,
+}
+_TEAMS_SCHEMA: dict[str, Any] = {
+    "team_id": pl.Utf8,
+    "last_game_date": pl.Date,
+    "recent_team_minutes": pl.List(pl.Float64),
+    "recent_active_counts": pl.List(pl.Float64),
+}
+
+
+def rolling_state_dir(
+    root_dir: Path, *, seasons: list[str] | tuple[str, ...], season_type: str, schema_version: int
+) -> Path:
+    """Return the state directory for one seasons/season-type/schema selection."""
+    return (
+        root_dir
+        / "rolling_state"
+        / f"season_type={slugify_season_type(season_type)}"
+        / f"schema_v{int(schema_version)}"
+        / f"seasons={'_'.join(seasons)}"
+    )
+
+
+def load_rolling_state(state_dir: Path) -> dict[str, Any] | None:
+    """Load the state tables and meta, or ``None`` when absent or from another schema."""
+    meta_path = state_dir / STATE_META_FILE
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(meta, dict) or meta.get("schema_version") != ROLLING_STATE_SCHEMA_VERSION:
+        return None
+    try:
+        return {
+            "meta": meta,
+            "players": pl.read_parquet(state_dir / PLAYERS_FILE),
+            "player_teams": pl.read_parquet(state_dir / PLAYER_TEAMS_FILE),
+            "teams": pl.read_parquet(state_dir / TEAMS_FILE),
+        }
+    except (OSError, pl.exceptions.PolarsError):
+        return None
+
+
+def _empty_state() -> dict[str, Any]:
+    return {
+        "meta": {},
+        "players": pl.DataFrame(schema=_PLAYERS_SCHEMA),
+        "player_teams": pl.DataFrame(schema=_PLAYER_TEAMS_SCHEMA),
+        "teams": pl.DataFrame(schema=_TEAMS_SCHEMA),
+    }
+
+
+def _write_parquet(path: Path, frame: pl.DataFrame) -> None:
+    buffer = io.BytesIO()
+    frame.write_parquet(buffer)
+    atomic_write_bytes(path, buffer.getvalue())
+
+
+def _append_tail(existing: str, new: str, *, window: int) -> pl.Expr:
+    empty = pl.lit([], dtype=pl.List(pl.Float64))
+    return (
+        pl.concat_list(pl.col(existing).fill_null(empty), pl.col(new).fill_null(empty))
+        .list.tail(window)
+        .alias(existing)
+    )
+
+
+def _fold_games(state: dict[str, Any], base: pl.DataFrame) -> dict[str, Any]:
+    new_players = base.group_by("player_id", maintain_order=True).agg(
+        pl.col("actual_minutes").alias("new_minutes"),
+        pl.len().cast(pl.Int64).alias("new_games"),
+        pl.col("team_id").last().alias("new_team_id"),
+        pl.col("game_date").last().alias("new_last_game_date"),
+    )
+    players = (
+        state["players"]
+        .join(new_players, on="player_id", how="full", coalesce=True)
+        .with_columns(
+            _append_tail("recent_minutes", "new_minutes", window=ROLLING_STATE_WINDOW),
+            (pl.col("games_played").fill_null(0) + pl.col("new_games").fill_null(0)).alias(
+                "games_played"
+            ),
+            pl.coalesce("new_team_id", "team_id").alias("team_id"),
+            pl.coalesce("new_last_game_date", "last_game_date").alias("last_game_date"),
+        )
+        .select(list(_PLAYERS_SCHEMA))
+        .sort("player_id")
+    )
+
+    new_tenure = base.group_by(["player_id", "team_id"]).agg(
+        pl.len().cast(pl.Int64).alias("new_games"),
+        pl.min("game_date").alias("new_start_date"),
+    )
+    player_teams = (
+        state["player_teams"]
+        .join(new_tenure, on=["player_id", "team_id"], how="full", coalesce=True)
+        .with_columns(
+            (pl.col("team_games").fill_null(0) + pl.col("new_games").fill_null(0)).alias(
+                "team_games"
+            ),
+            pl.min_horizontal("team_start_date", "new_start_date").alias("team_start_date"),
+        )
+        .select(list(_PLAYER_TEAMS_SCHEMA))
+        .sort(["player_id", "team_id"])
+    )
+
+    new_teams = (
+        _team_game_totals(base)
+        .group_by("team_id", maintain_order=True)
+        .agg(
+            pl.col("team_minutes_total").cast(pl.Float64).alias("new_team_minutes"),
+            pl.col("team_active_count").cast(pl.Float64).alias("new_active_counts"),
+            pl.col("game_date").last().alias("new_last_game_date"),
+        )
+    )
+    teams = (
+        state["teams"]
+        .join(new_teams, on="team_id", how="full", coalesce=True)
+        .with_columns(
+            _append_tail("recent_team_minutes", "new_team_minutes", window=TEAM_HISTORY_GAMES),
+            _append_tail("recent_active_counts", "new_active_counts", window=TEAM_HISTORY_GAMES),
+            pl.coalesce("new_last_game_date", "last_game_date").alias("last_game_date"),
+        )
+        .select(list(_TEAMS_SCHEMA))
+        .sort("team_id")
+    )
+    return {"meta": state["meta"], "players": players, "player_teams": player_teams, "teams": teams}
+
+
+def update_rolling_state(
+    *,
+    layout: NBADataLayout,
+    state_dir: Path,
+    seasons: list[str],
+    season_type: str,
+    schema_version: int,
+    rebuild: bool = False,
+) -> dict[str, Any]:
+    """Fold clean games newer than the state watermark into the rolling state.
+
+    The state is rebuilt from scratch when it is missing, when ``rebuild`` is set, or when
+    the clean ``games`` table no longer has the same number of games at or before the
+    watermark (an overwrite corrected already-folded history).
+    """
+    games = (
+        _read_clean_table(
+            layout,
+            table="games",
+            seasons=seasons,
+            season_type=season_type,
+            schema_version=schema_version,
+        )
+        .select(["season", "season_type", "game_id", "date"])
+        .with_columns(pl.col("date").str.strptime(pl.Date, strict=False).alias("_game_date"))
+        .filter(pl.col("_game_date").is_not_null())
+    )
+    state = None if rebuild else load_rolling_state(state_dir)
+    meta = state["meta"] if state is not None else {}
+    watermark = date.fromisoformat(meta["watermark_date"]) if meta.get("watermark_date") else None
+    watermark_ids = [str(item) for item in meta.get("watermark_game_ids", [])]
+    if state is not None and watermark is not None:
+        folded = games.filter(pl.col("_game_date") <= pl.lit(watermark)).height
+        if folded != int(meta.get("games_folded", -1)):
+            state = None
+            watermark = None
+            watermark_ids = []
+    mode = "incremental" if state is not None else "rebuild"
+    if state is None:
+        state = _empty_state()
+        new_games = games
+    elif watermark is None:
+        new_games = games
+    else:
+        new_games = games.filter(
+            (pl.col("_game_date") > pl.lit(watermark))
+            | (
+                (pl.col("_game_date") == pl.lit(watermark))
+                & ~pl.col("game_id").is_in(watermark_ids)
+            )
+        )
+
+    if not new_games.is_empty():
+        new_ids = new_games.get_column("game_id").to_list()
+        boxscore = _read_clean_table(
+            layout,
+            table="boxscore_players",
+            seasons=seasons,
+            season_type=season_type,
+            schema_version=schema_version,
+            predicate=pl.col("game_id").is_in(new_ids),
+        ).select(["season", "season_type", "game_id", "team_id", "player_id", "minutes"])
+        base = _player_game_rows(new_games.drop("_game_date"), boxscore)
+        state = _fold_games(state, base)
+
+    new_last_day = new_games.select(pl.max("_game_date")).item()
+    days = [day for day in (watermark, new_last_day) if isinstance(day, date)]
+    last_day = max(days) if days else None
+    folded_games = (
+        games.filter(pl.col("_game_date") <= pl.lit(last_day)) if last_day else games.clear()
+    )
+    watermark_ids = sorted(
+        folded_games.filter(pl.col("_game_date") == pl.lit(last_day))
+        .get_column("game_id")
+        .to_list()
+        if last_day
+        else []
+    )
+    meta = {
+        "schema_version": ROLLING_STATE_SCHEMA_VERSION,
+        "seasons": list(seasons),
+        "season_type": season_type,
+        "clean_schema_version": int(schema_version),
+        "window": ROLLING_STATE_WINDOW,
+        "team_window": TEAM_HISTORY_GAMES,
+        "watermark_date": last_day.isoformat() if last_day else "",
+        "watermark_game_ids": watermark_ids,
+        "games_folded": int(folded_games.height),
+        "players": int(state["players"].height),
+    }
+    state_dir.mkdir(parents=True, exist_ok=True)
+    _write_parquet(state_dir / PLAYERS_FILE, state["players"])
+    _write_parquet(state_dir / PLAYER_TEAMS_FILE, state["player_teams"])
+    _write_parquet(state_dir / TEAMS_FILE, state["teams"])
+    atomic_write_json(state_dir / STATE_META_FILE, meta)
+    return {**meta, "mode": mode, "games_added": int(new_games.height), "state_dir": str(state_dir)}
+
+
+def load_scheduled_games(
+    *,
+    layout: NBADataLayout,
+    seasons: list[str] | tuple[str, ...],
+    season_type: str,
+    game_date: date,
+) -> list[dict[str, Any]]:
+    """Return schedule rows (``game_id``/``date``/home/away team ids) for ``game_date``."""
+    rows: list[dict[str, Any]] = []
+    for season in seasons:
+        path = layout.schedule_path(season=season, season_type=season_type)
+        if not path.exists():
+            continue
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        games = payload.get("games", []) if isinstance(payload, dict) else []
+        for row in games if isinstance(games, list) else []:
+            if isinstance(row, dict) and str(row.get("date", ""))[:10] == game_date.isoformat():
+                rows.append(row)
+    return rows
+
+
+def build_pregame_feature_frame(
+    *,
+    state: dict[str, Any],
+    games: list[dict[str, Any]],
+    game_date: date,
+    history_games: int,
+    min_history_games: int,
+    roster_days: int = DEFAULT_ROSTER_DAYS,
+) -> pl.DataFrame:
+    """Build feature rows for players on teams scheduled to play on ``game_date``.
+
+    A team's roster is every player whose latest team it is and who appeared in one of the
+    team's games within ``roster_days`` of its most recent game. Rolling windows use the
+    same sizes and minimum-history rules as ``build_minutes_prob_feature_frame``.
+    """
+    history_games = max(2, int(history_games))
+    min_history_games = max(1, int(min_history_games))
+    short_window = min(3, history_games)
+    if history_games > ROLLING_STATE_WINDOW:
+        raise ValueError(
+            f"history_games={history_games} exceeds rolling state window {ROLLING_STATE_WINDOW}"
+        )
+    watermark_raw = str(state["meta"].get("watermark_date", ""))
+    if watermark_raw and date.fromisoformat(watermark_raw) >= game_date:
+        raise ValueError(
+            f"rolling state already includes games on or after {game_date.isoformat()}"
+        )
+
+    scheduled: list[dict[str, str]] = []
+    for row in games:
+        game_id = str(row.get("game_id", "")).strip()
+        if not game_id or str(row.get("date", ""))[:10] != game_date.isoformat():
+            continue
+        for side in ("home_team_id", "away_team_id"):
+            team_id = str(row.get(side, "")).strip()
+            if team_id:
+                scheduled.append({"game_id": game_id, "team_id": team_id})
+    schedule = pl.DataFrame(scheduled, schema={"game_id": pl.Utf8, "team_id": pl.Utf8}).unique(
+        maintain_order=True
+    )
+
+    teams = state["teams"].rename({"last_game_date": "team_last_game_date"})
+    roster = (
+        state["players"]
+        .join(teams.select(["team_id", "team_last_game_date"]), on="team_id", how="inner")
+        .filter(
+            pl.col("last_game_date")
+            >= pl.col("team_last_game_date") - pl.duration(days=int(roster_days))
+        )
+        .drop("team_last_game_date")
+    )
+    recent = pl.col("recent_minutes").list.tail(history_games)
+    enough = recent.list.len() >= min_history_games
+    frame = (
+        schedule.join(roster, on="team_id", how="inner")
+        .join(state["player_teams"], on=["player_id", "team_id"], how="left")
+        .join(teams.drop("team_last_game_date"), on="team_id", how="left")
+        .with_columns(
+            pl.lit(str(state["meta"].get("seasons", [""])[-1])).alias("season"),
+            pl.lit(str(state["meta"].get("season_type", ""))).alias("season_type"),
+            pl.lit(game_date).alias("game_date"),
+            pl.lit(None, dtype=pl.Float64).alias("actual_minutes"),
+            pl.lit(None, dtype=pl.Int64).alias("active_target"),
+            pl.when(enough).then(recent.list.mean()).alias("prev_minutes_mean"),
+            pl.when(enough).then(recent.list.std()).alias("prev_minutes_std"),
+            pl.when(recent.list.len() > 0)
+            .then(recent.list.tail(short_window).list.mean())
+            .alias("prev_minutes_short"),
+            pl.when(enough)
+            .then(recent.list.eval((pl.element() > 0.0).cast(pl.Float64)).list.mean())
+            .alias("prev_active_rate"),
+            pl.col("games_played").fill_null(0).cast(pl.Int64),
+            pl.col("team_games").fill_null(0).cast(pl.Int64).alias("games_on_team"),
+            pl.coalesce("team_start_date", pl.lit(game_date)).alias("team_start_days"),
+            pl.when(pl.col("recent_team_minutes").list.len() >= 2)
+            .then(pl.col("recent_team_minutes").list.mean())
+            .alias("team_prev_minutes_mean"),
+            pl.when(pl.col("recent_active_counts").list.len() >= 2)
+            .then(pl.col("recent_active_counts").list.mean())
+            .alias("team_prev_active_count"),
+        )
+        .with_columns(_derived_feature_exprs())
+        .with_columns(_feature_default_exprs())
+        .select(list(REQUIRED_COLUMNS))
+        .sort(["game_id", "team_id", "player_id"])
+    )
+    return frame
@@ -30,6 +30,7 @@ from prop_ev.nba_data.request import NBADataRequest
 from prop_ev.nba_data.source_policy import ResultsSourceMode
 from prop_ev.storage import SnapshotStore
 from prop_ev.time_utils import utc_now_str
+from prop_ev.util.jsonl import iter_jsonl
 from prop_ev.util.parsing import safe_float as _safe_float
 
 RESULTS_SOURCE_LIVE = "nba_live_scoreboard_boxscore"
@@ -845,19 +846,10 @@ class NBARepository:
             return index
         for manifest_path in sorted(manifests_root.glob("season=*/season_type=*/manifest.jsonl")):
             try:
-                lines = manifest_path.read_text(encoding="utf-8").splitlines()
+                rows = list(iter_jsonl(manifest_path, skip_invalid=True))
             except OSError:
                 continue
-            for line in lines:
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    row = json.loads(raw)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(row, dict):
-                    continue
+            for row in rows:
                 game_id = str(row.get("game_id", "")).strip()
                 resources = row.get("resources", {})
                 if not game_id or not isinstance(resources, dict):
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal, TypedDict, cast
@@ -10,6 +9,7 @@ from typing import Any, Literal, TypedDict, cast
 from prop_ev.nba_data.io_utils import atomic_write_jsonl, sha256_file
 from prop_ev.nba_data.schema_version import SCHEMA_VERSION
 from prop_ev.nba_data.store.layout import slugify_season_type
+from prop_ev.util.jsonl import iter_jsonl
 
 ResourceStatus = Literal["missing", "ok", "error"]
 ResourceName = Literal["boxscore", "enhanced_pbp", "possessions"]
@@ -96,16 +96,8 @@ def _normalize_row(payload: dict[str, Any]) -> ManifestRow:
 
 
 def load_manifest(path: Path) -> dict[tuple[str, str, str], ManifestRow]:
-    if not path.exists():
-        return {}
     rows: dict[tuple[str, str, str], ManifestRow] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        payload = json.loads(line)
-        if not isinstance(payload, dict):
-            continue
+    for payload in iter_jsonl(path, missing_ok=True):
         row = _normalize_row(payload)
         rows[_key(row)] = row
     return rows
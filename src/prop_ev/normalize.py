@@ -1,4 +1,9 @@
-"""Normalization helpers for Odds API snapshots."""
+"""Normalization helpers for Odds API snapshots.
+
+Payloads may be passed decoded or as the raw response bytes. Rows are built in their
+canonical form during a single walk of the payload and sorted once, so there is no
+separate re-canonicalization or validation pass over the rows.
+"""
 
 from __future__ import annotations
 
@@ -8,15 +13,22 @@ from prop_ev.quote_table import (
     QUOTE_TABLE_SCHEMA_VERSION,
     canonical_event_props_row,
     canonical_featured_odds_row,
-    canonicalize_event_props_rows,
-    canonicalize_featured_odds_rows,
-    validate_event_props_rows,
-    validate_featured_odds_rows,
+    sort_event_props_rows,
+    sort_featured_odds_rows,
 )
+from prop_ev.util.jsonl import loads
 
 DERIVED_SCHEMA_VERSION = QUOTE_TABLE_SCHEMA_VERSION
 
 
+def _decoded(payload: Any, payload_field: str) -> Any:
+    if isinstance(payload, bytes | bytearray | memoryview):
+        payload = loads(bytes(payload))
+    if payload_field and isinstance(payload, dict):
+        return payload.get(payload_field)
+    return payload
+
+
 def _expect_dict(value: Any, context: str) -> dict[str, Any]:
     if not isinstance(value, dict):
         raise ValueError(f"{context} must be an object")
@@ -30,10 +42,10 @@ def _expect_list(value: Any, context: str) -> list[Any]:
 
 
 def normalize_featured_odds(
-    payload: Any, *, snapshot_id: str, provider: str
+    payload: Any, *, snapshot_id: str, provider: str, payload_field: str = ""
 ) -> list[dict[str, Any]]:
     """Normalize featured odds endpoint response into stable rows."""
-    events = _expect_list(payload, "featured_payload")
+    events = _expect_list(_decoded(payload, payload_field), "featured_payload")
     rows: list[dict[str, Any]] = []
     for event in events:
         event_dict = _expect_dict(event, "featured_event")
@@ -66,14 +78,14 @@ def normalize_featured_odds(
                             last_update=last_update,
                         )
                     )
-    canonical_rows = canonicalize_featured_odds_rows(rows)
-    validate_featured_odds_rows(canonical_rows)
-    return canonical_rows
+    return sort_featured_odds_rows(rows)
 
 
-def normalize_event_odds(payload: Any, *, snapshot_id: str, provider: str) -> list[dict[str, Any]]:
+def normalize_event_odds(
+    payload: Any, *, snapshot_id: str, provider: str, payload_field: str = ""
+) -> list[dict[str, Any]]:
     """Normalize per-event odds response into stable rows."""
-    event = _expect_dict(payload, "event_payload")
+    event = _expect_dict(_decoded(payload, payload_field), "event_payload")
     event_id = str(event.get("id", ""))
     bookmakers = _expect_list(event.get("bookmakers", []), "event_payload.bookmakers")
     rows: list[dict[str, Any]] = []
@@ -104,6 +116,4 @@ def normalize_event_odds(payload: Any, *, snapshot_id: str, provider: str) -> li
                         link=outcome_dict.get("link", ""),
                     )
                 )
-    canonical_rows = canonicalize_event_props_rows(rows)
-    validate_event_props_rows(canonical_rows)
-    return canonical_rows
+    return sort_event_props_rows(rows)
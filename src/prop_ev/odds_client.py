@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from math import ceil
 from time import perf_counter
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
-from tenacity import Retrying, retry_if_exception_type, stop_after_attempt
+from prop_ev.odds_rate import AdaptiveRateController, rate_controller
+from prop_ev.util.jsonl import loads
 
-from prop_ev.settings import Settings
+if TYPE_CHECKING:
+    import httpx
+
+    from prop_ev.settings import Settings
 
 FEATURED_MARKETS = {"h2h", "spreads", "totals", "outrights"}
 CORE_PROP_MARKETS = {
@@ -53,13 +57,21 @@ class RetryableStatusError(RuntimeError):
 
 @dataclass(frozen=True)
 class OddsResponse:
-    """Response data and metadata from an API call."""
+    """Response data and metadata from an API call.
+
+    ``raw`` holds the response body exactly as received and ``sha256`` its digest,
+    computed while the body streamed in. When ``data`` was unwrapped from an envelope
+    (historical endpoints), ``payload_field`` names the envelope key it came from.
+    """
 
     data: Any
     status_code: int
     headers: dict[str, str]
     duration_ms: int
     retry_count: int
+    raw: bytes = b""
+    sha256: str = ""
+    payload_field: str = ""
 
 
 def parse_csv(raw_value: str | None) -> list[str]:
@@ -106,11 +118,30 @@ def _unwrap_historical_data(payload: Any) -> Any:
     return payload
 
 
+def _payload_field(payload: Any, data: Any) -> str:
+    return "data" if data is not payload else ""
+
+
+def _read_body(response: httpx.Response) -> tuple[bytes, str]:
+    """Drain a streamed response, hashing chunks as they arrive."""
+    digest = hashlib.sha256()
+    chunks: list[bytes] = []
+    for chunk in response.iter_bytes():
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
 class OddsAPIClient:
     """Thin HTTP client around The Odds API v4."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, *, controller: AdaptiveRateController | None = None
+    ) -> None:
         self.settings = settings
+        self.controller = controller or rate_controller()
+        import httpx
+
         base_url = settings.odds_api_base_url.rstrip("/")
         self._base_url = base_url
         limits = httpx.Limits(max_connections=8, max_keepalive_connections=4)
@@ -126,6 +157,9 @@ class OddsAPIClient:
         self.close()
 
     def _request(self, *, path: str, params: dict[str, Any]) -> OddsResponse:
+        import httpx
+        from tenacity import Retrying, retry_if_exception_type, stop_after_attempt
+
         api_key = str(self.settings.odds_api_key).strip()
         if not api_key:
             raise OddsAPIError(
@@ -138,6 +172,8 @@ class OddsAPIClient:
         retries = 0
         started = perf_counter()
         response: httpx.Response | None = None
+        body = b""
+        body_sha256 = ""
         try:
             for attempt in Retrying(
                 stop=stop_after_attempt(4),
@@ -147,7 +183,21 @@ class OddsAPIClient:
             ):
                 with attempt:
                     retries = attempt.retry_state.attempt_number - 1
-                    response = self._http.get(url, params=params_with_key)
+                    with self.controller.slot():
+                        attempt_started = perf_counter()
+                        request = self._http.build_request("GET", url, params=params_with_key)
+                        response = self._http.send(request, stream=True)
+                        try:
+                            if response.is_success:
+                                body, body_sha256 = _read_body(response)
+                        finally:
+                            response.close()
+                    self.controller.observe(
+                        path,
+                        status_code=response.status_code,
+                        latency_s=perf_counter() - attempt_started,
+                        headers=dict(response.headers),
+                    )
                     if response.status_code == 429 or 500 <= response.status_code <= 599:
                         raise RetryableStatusError(response)
                     response.raise_for_status()
@@ -157,6 +207,8 @@ class OddsAPIClient:
             ) from exc
         except httpx.HTTPError as exc:
             raise OddsAPIError(f"{path} failed with transport error: {exc}") from exc
+        finally:
+            self.controller.record_request(path, retries=retries)
         if response is None:
             raise OddsAPIError(f"{path} failed without a response")
 
@@ -167,12 +219,18 @@ class OddsAPIClient:
             "x-requests-remaining": response.headers.get("x-requests-remaining", ""),
             "retry-after": response.headers.get("retry-after", ""),
         }
+        try:
+            data = loads(body)
+        except ValueError as exc:
+            raise OddsAPIError(f"{path} returned invalid JSON: {exc}") from exc
         return OddsResponse(
-            data=response.json(),
+            data=data,
             status_code=response.status_code,
             headers=headers,
             duration_ms=duration_ms,
             retry_count=retries,
+            raw=body,
+            sha256=body_sha256,
         )
 
     def list_sports(self) -> OddsResponse:
@@ -198,13 +256,7 @@ class OddsAPIClient:
                     "historical events payload missing list data for "
                     f"sport={sport_key} date={historical_date}"
                 )
-            return OddsResponse(
-                data=data,
-                status_code=raw.status_code,
-                headers=raw.headers,
-                duration_ms=raw.duration_ms,
-                retry_count=raw.retry_count,
-            )
+            return replace(raw, data=data, payload_field=_payload_field(raw.data, data))
 
         params = {"dateFormat": date_format}
         if commence_from:
@@ -223,6 +275,8 @@ class OddsAPIClient:
         commence_from: str | None = None,
         commence_to: str | None = None,
         event_ids: list[str] | None = None,
+        include_links: bool = False,
+        include_sids: bool = False,
         odds_format: str = "american",
         date_format: str = "iso",
     ) -> OddsResponse:
@@ -241,6 +295,10 @@ class OddsAPIClient:
             params["bookmakers"] = bookmakers
         elif regions:
             params["regions"] = regions
+        if include_links:
+            params["includeLinks"] = "true"
+        if include_sids:
+            params["includeSids"] = "true"
         if commence_from:
             params["commenceTimeFrom"] = commence_from
         if commence_to:
@@ -294,12 +352,6 @@ class OddsAPIClient:
                     "historical event odds payload missing object data for "
                     f"event={event_id} date={historical_date}"
                 )
-            return OddsResponse(
-                data=data,
-                status_code=raw.status_code,
-                headers=raw.headers,
-                duration_ms=raw.duration_ms,
-                retry_count=raw.retry_count,
-            )
+            return replace(raw, data=data, payload_field=_payload_field(raw.data, data))
 
         return self._request(path=f"/sports/{sport_key}/events/{event_id}/odds", params=params)
@@ -1,32 +1,47 @@
 """Odds data repository, cache, and backfill helpers."""
 
-from prop_ev.odds_data.backfill import backfill_days
-from prop_ev.odds_data.cache_store import GlobalCacheStore
-from prop_ev.odds_data.day_index import (
-    canonicalize_day_status,
-    compute_day_status_from_cache,
-    dataset_days_dir,
-    dataset_spec_path,
-    load_day_status,
-    primary_incomplete_reason_code,
-    save_dataset_spec,
-    save_day_status,
-    snapshot_id_for_day,
-    with_day_error,
-)
-from prop_ev.odds_data.errors import (
-    CreditBudgetExceeded,
-    OddsDataError,
-    OfflineCacheMiss,
-    SpendBlockedError,
-)
-from prop_ev.odds_data.policy import SpendPolicy, effective_max_credits
-from prop_ev.odds_data.repo import FetchResult, OddsRepository
-from prop_ev.odds_data.request import OddsRequest
-from prop_ev.odds_data.spec import DatasetSpec, canonical_dict, dataset_id
-from prop_ev.odds_data.window import day_window
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+# Exports resolve on first access so importing a light submodule (errors, spec, window)
+# does not drag in the HTTP client and backfill stack.
+_EXPORTS: dict[str, str] = {
+    "BackfillQueue": "prop_ev.odds_data.backfill_queue",
+    "CreditBudgetExceeded": "prop_ev.odds_data.errors",
+    "DatasetSpec": "prop_ev.odds_data.spec",
+    "FetchResult": "prop_ev.odds_data.repo",
+    "GlobalCacheStore": "prop_ev.odds_data.cache_store",
+    "OddsDataError": "prop_ev.odds_data.errors",
+    "OddsRepository": "prop_ev.odds_data.repo",
+    "OddsRequest": "prop_ev.odds_data.request",
+    "OfflineCacheMiss": "prop_ev.odds_data.errors",
+    "PlannedCall": "prop_ev.odds_data.request_plan",
+    "RequestPlan": "prop_ev.odds_data.request_plan",
+    "SpendBlockedError": "prop_ev.odds_data.errors",
+    "SpendPolicy": "prop_ev.odds_data.policy",
+    "backfill_days": "prop_ev.odds_data.backfill",
+    "cached_cells": "prop_ev.odds_data.request_plan",
+    "canonicalize_day_status": "prop_ev.odds_data.day_index",
+    "canonical_dict": "prop_ev.odds_data.spec",
+    "compute_day_status_from_cache": "prop_ev.odds_data.day_index",
+    "dataset_days_dir": "prop_ev.odds_data.day_index",
+    "dataset_id": "prop_ev.odds_data.spec",
+    "dataset_spec_path": "prop_ev.odds_data.day_index",
+    "day_window": "prop_ev.odds_data.window",
+    "effective_max_credits": "prop_ev.odds_data.policy",
+    "load_day_status": "prop_ev.odds_data.day_index",
+    "plan_requests": "prop_ev.odds_data.request_plan",
+    "primary_incomplete_reason_code": "prop_ev.odds_data.day_index",
+    "save_dataset_spec": "prop_ev.odds_data.day_index",
+    "save_day_status": "prop_ev.odds_data.day_index",
+    "snapshot_id_for_day": "prop_ev.odds_data.day_index",
+    "with_day_error": "prop_ev.odds_data.day_index",
+}
 
 __all__ = [
+    "BackfillQueue",
     "CreditBudgetExceeded",
     "DatasetSpec",
     "FetchResult",
@@ -35,9 +50,12 @@ __all__ = [
     "OddsRepository",
     "OddsRequest",
     "OfflineCacheMiss",
+    "PlannedCall",
+    "RequestPlan",
     "SpendBlockedError",
     "SpendPolicy",
     "backfill_days",
+    "cached_cells",
     "canonicalize_day_status",
     "canonical_dict",
     "compute_day_status_from_cache",
@@ -47,9 +65,19 @@ __all__ = [
     "day_window",
     "effective_max_credits",
     "load_day_status",
+    "plan_requests",
     "primary_incomplete_reason_code",
     "save_dataset_spec",
     "save_day_status",
     "snapshot_id_for_day",
     "with_day_error",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
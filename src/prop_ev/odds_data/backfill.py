@@ -3,18 +3,18 @@
 from __future__ import annotations
 
 import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from prop_ev.normalize import normalize_event_odds
-from prop_ev.odds_client import (
-    OddsAPIClient,
-    OddsAPIError,
-    estimate_event_credits,
-    regions_equivalent,
-)
+from prop_ev.odds_client import OddsAPIClient, OddsAPIError
+from prop_ev.odds_data.backfill_queue import BackfillQueue
 from prop_ev.odds_data.cache_store import GlobalCacheStore
 from prop_ev.odds_data.day_index import (
     REASON_BUDGET_EXCEEDED,
@@ -30,16 +30,22 @@ from prop_ev.odds_data.day_index import (
 )
 from prop_ev.odds_data.errors import CreditBudgetExceeded, OfflineCacheMiss, SpendBlockedError
 from prop_ev.odds_data.policy import SpendPolicy, effective_max_credits
-from prop_ev.odds_data.repo import OddsRepository
+from prop_ev.odds_data.repo import FetchResult, OddsRepository
 from prop_ev.odds_data.request import OddsRequest
+from prop_ev.odds_data.request_plan import (
+    ENDPOINT_FEATURED_ODDS,
+    PlannedCall,
+    RequestPlan,
+    cached_cells,
+    event_payload,
+    plan_requests,
+)
 from prop_ev.odds_data.spec import DatasetSpec, dataset_id
 from prop_ev.odds_data.window import day_window
 from prop_ev.settings import Settings
-from prop_ev.storage import SnapshotStore, request_hash
+from prop_ev.storage import SnapshotStore
 from prop_ev.time_utils import parse_iso_z
 
-HISTORICAL_ODDS_CREDIT_MULTIPLIER = 10
-
 
 def _iso_z(dt: datetime) -> str:
     return dt.astimezone(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -121,382 +127,461 @@ def _events_params(
     }
 
 
-def _event_odds_params(spec: DatasetSpec, *, historical_date: str | None = None) -> dict[str, Any]:
-    params: dict[str, Any] = {
-        "markets": ",".join(sorted(set(spec.markets))),
-        "oddsFormat": spec.odds_format,
-        "dateFormat": spec.date_format,
-    }
-    if spec.bookmakers:
-        params["bookmakers"] = spec.bookmakers
-    elif spec.regions:
-        params["regions"] = spec.regions
-    if spec.include_links:
-        params["includeLinks"] = "true"
-    if spec.include_sids:
-        params["includeSids"] = "true"
-    if historical_date:
-        params["date"] = historical_date
-    return params
-
-
-def backfill_days(
+def _event_rows_from_coverage(
     *,
-    data_root: Path,
-    spec: DatasetSpec,
-    days: list[str],
-    tz_name: str,
-    policy: SpendPolicy,
-    dry_run: bool,
+    store: SnapshotStore,
+    cache: GlobalCacheStore,
+    snapshot_id: str,
+    coverage: dict[str, dict[str, str]],
 ) -> list[dict[str, Any]]:
-    store = SnapshotStore(data_root)
-    cache = GlobalCacheStore(data_root)
-    repo = OddsRepository(store=store, cache=cache)
-    save_dataset_spec(data_root, spec)
+    """Normalize each event's markets from the stored response that covers them."""
+    payloads: dict[str, Any] = {}
+    rows: list[dict[str, Any]] = []
+    for event_id, market_keys in coverage.items():
+        for key in dict.fromkeys(market_keys.values()):
+            if key not in payloads:
+                if store.has_response(snapshot_id, key):
+                    payloads[key] = store.load_response(snapshot_id, key)
+                elif cache.has_response(key):
+                    cache.materialize_into_snapshot(store, snapshot_id, key)
+                    payloads[key] = cache.load_response(key)
+                else:
+                    payloads[key] = None
+            event = event_payload(payloads[key], event_id)
+            if event is None:
+                continue
+            rows.extend(
+                row
+                for row in normalize_event_odds(event, snapshot_id=snapshot_id, provider="odds_api")
+                if market_keys.get(str(row.get("market", ""))) == key
+            )
+    return rows
+
+
+@dataclass
+class _DayRun:
+    """In-flight state of one day while its queued calls drain."""
 
-    summaries: list[dict[str, Any]] = []
-    remaining_credits = effective_max_credits(policy)
-    client: OddsAPIClient | None = None
+    day: str
+    snapshot_id: str
+    event_ids: list[str] = field(default_factory=list)
+    historical_dates: dict[str, str] = field(default_factory=dict)
+    outstanding: int = 0
+    estimated_paid_credits: int = 0
+    actual_paid_credits: int = 0
+    executed: bool = False
+    error: str = ""
+    error_code: str = ""
 
-    def _client() -> OddsAPIClient:
-        nonlocal client
-        if client is None:
-            client = OddsAPIClient(Settings.from_runtime())
-        return client
 
+@dataclass(frozen=True)
+class _DayEvents:
+    event_ids: list[str]
+    historical_dates: dict[str, str]
+    coverage: dict[str, dict[str, str]]
+
+
+def _charged_credits(result: FetchResult, call: PlannedCall) -> int:
+    """Credits a call actually cost: zero when served from cache."""
+    if result.status != "ok":
+        return 0
     try:
-        for day in days:
-            commence_from, commence_to = day_window(day, tz_name)
-            snapshot_id = snapshot_id_for_day(spec, day)
-            events_historical_date = (
-                _historical_events_timestamp(day, tz_name, spec.historical_anchor_hour_local)
-                if spec.historical
-                else None
+        return max(0, int(result.headers.get("x-requests-last", "")))
+    except ValueError:
+        return call.credits
+
+
+class _BackfillRun:
+    """Drain a dataset's backfill queue on a thread pool under one credit budget.
+
+    The main thread owns the queue journal and the credit ledger; workers only list
+    events, fetch planned calls and finalize days. Credits are reserved when a day's calls
+    are enqueued and settled from ``x-requests-last`` as each call lands.
+    """
+
+    def __init__(
+        self,
+        *,
+        data_root: Path,
+        spec: DatasetSpec,
+        tz_name: str,
+        policy: SpendPolicy,
+        dry_run: bool,
+        on_plan: Callable[[str, RequestPlan], None] | None,
+        queue: BackfillQueue,
+        pool: ThreadPoolExecutor,
+    ) -> None:
+        self.data_root = data_root
+        self.spec = spec
+        self.tz_name = tz_name
+        self.policy = policy
+        self.dry_run = dry_run
+        self.on_plan = on_plan
+        self.queue = queue
+        self.pool = pool
+        self.store = SnapshotStore(data_root)
+        self.cache = GlobalCacheStore(data_root)
+        self.repo = OddsRepository(store=self.store, cache=self.cache)
+        self.budget = effective_max_credits(policy)
+        self.spent = 0
+        self.reserved = 0
+        self.runs: dict[str, _DayRun] = {}
+        self.summaries: dict[str, dict[str, Any]] = {}
+        self._pending: dict[Future[Any], tuple[str, str, PlannedCall | None]] = {}
+        self._client: OddsAPIClient | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def remaining_credits(self) -> int:
+        return max(0, self.budget - self.spent - self.reserved)
+
+    def client(self) -> OddsAPIClient:
+        with self._client_lock:
+            if self._client is None:
+                self._client = OddsAPIClient(Settings.from_runtime())
+            return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+    def _submit(self, kind: str, day: str, fn, *args, call: PlannedCall | None = None) -> None:
+        self._pending[self.pool.submit(fn, *args)] = (kind, day, call)
+
+    def start(self, day: str) -> None:
+        """Resume the day's unfinished queued calls, or list its events and plan it."""
+        queued = self.queue.days.get(day)
+        if (
+            queued is not None
+            and not queued.finalized
+            and not self.policy.refresh
+            and not self.dry_run
+        ):
+            run = _DayRun(
+                day=day,
+                snapshot_id=queued.snapshot_id,
+                event_ids=list(queued.event_ids),
+                historical_dates=dict(queued.historical_dates),
             )
-            run_config = {
-                "mode": "data_backfill_day",
-                "dataset_id": dataset_id(spec),
-                "day": day,
-                "tz_name": tz_name,
-                "sport_key": spec.sport_key,
-                "historical": bool(spec.historical),
-                "historical_anchor_hour_local": int(spec.historical_anchor_hour_local),
-                "historical_pre_tip_minutes": int(spec.historical_pre_tip_minutes),
-                "historical_events_date": events_historical_date or "",
-                "markets": sorted(set(spec.markets)),
-                "regions": spec.regions or "",
-                "bookmakers": spec.bookmakers or "",
-                "include_links": bool(spec.include_links),
-                "include_sids": bool(spec.include_sids),
-                "commence_from": commence_from,
-                "commence_to": commence_to,
-            }
-
-            day_error = ""
-            day_error_code = ""
-            estimated_paid_credits = 0
-            actual_paid_credits = 0
-            with store.lock_snapshot(snapshot_id):
-                store.ensure_snapshot(snapshot_id, run_config=run_config)
-                events_path = (
-                    f"/historical/sports/{spec.sport_key}/events"
-                    if spec.historical
-                    else f"/sports/{spec.sport_key}/events"
+            self.runs[day] = run
+            self._enqueue(run, tuple(queued.pending), deferred=(), journal=False)
+            return
+        self.runs[day] = _DayRun(day=day, snapshot_id=snapshot_id_for_day(self.spec, day))
+        self._submit("events", day, self._list_events, day)
+
+    def drain(self) -> None:
+        while self._pending:
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, day, call = self._pending.pop(future)
+                if kind == "events":
+                    self._on_events(day, future)
+                elif kind == "call" and call is not None:
+                    self._on_call(day, call, future)
+                else:
+                    run = self.runs[day]
+                    status = future.result()
+                    self.summaries[day] = self._summary(run, status)
+                    if run.executed:
+                        self.queue.record_day(day, complete=bool(status.get("complete", False)))
+
+    def _list_events(self, day: str) -> _DayEvents:
+        spec = self.spec
+        commence_from, commence_to = day_window(day, self.tz_name)
+        snapshot_id = snapshot_id_for_day(spec, day)
+        events_historical_date = (
+            _historical_events_timestamp(day, self.tz_name, spec.historical_anchor_hour_local)
+            if spec.historical
+            else None
+        )
+        run_config = {
+            "mode": "data_backfill_day",
+            "dataset_id": dataset_id(spec),
+            "day": day,
+            "tz_name": self.tz_name,
+            "sport_key": spec.sport_key,
+            "historical": bool(spec.historical),
+            "historical_anchor_hour_local": int(spec.historical_anchor_hour_local),
+            "historical_pre_tip_minutes": int(spec.historical_pre_tip_minutes),
+            "historical_events_date": events_historical_date or "",
+            "markets": sorted(set(spec.markets)),
+            "regions": spec.regions or "",
+            "bookmakers": spec.bookmakers or "",
+            "include_links": bool(spec.include_links),
+            "include_sids": bool(spec.include_sids),
+            "commence_from": commence_from,
+            "commence_to": commence_to,
+        }
+        self.store.ensure_snapshot(snapshot_id, run_config=run_config)
+        events_path = (
+            f"/historical/sports/{spec.sport_key}/events"
+            if spec.historical
+            else f"/sports/{spec.sport_key}/events"
+        )
+        events_req = OddsRequest(
+            method="GET",
+            path=events_path,
+            params=_events_params(
+                commence_from=commence_from,
+                commence_to=commence_to,
+                date_format=spec.date_format,
+                historical_date=events_historical_date,
+            ),
+            label="events_list",
+            is_paid=False,
+        )
+        events_result = self.repo.get_or_fetch(
+            snapshot_id=snapshot_id,
+            req=events_req,
+            fetcher=lambda: self.client().list_events(
+                sport_key=spec.sport_key,
+                commence_from=commence_from,
+                commence_to=commence_to,
+                date_format=spec.date_format,
+                historical_date=events_historical_date,
+            ),
+            policy=self.policy,
+        )
+        event_rows = _parse_event_rows(events_result.data)
+        event_ids = _parse_event_ids(events_result.data)
+        historical_dates: dict[str, str] = {}
+        if spec.historical:
+            fallback = events_historical_date or commence_from
+            for row in event_rows:
+                event_id = str(row.get("id", "")).strip()
+                if not event_id:
+                    continue
+                historical_dates[event_id] = _historical_event_odds_timestamp(
+                    event_row=row,
+                    fallback_timestamp=fallback,
+                    pre_tip_minutes=spec.historical_pre_tip_minutes,
                 )
-                events_params = _events_params(
-                    commence_from=commence_from,
-                    commence_to=commence_to,
-                    date_format=spec.date_format,
-                    historical_date=events_historical_date,
+        coverage = (
+            {}
+            if self.policy.refresh
+            else cached_cells(
+                store=self.store,
+                cache=self.cache,
+                snapshot_id=snapshot_id,
+                spec=spec,
+                event_ids=event_ids,
+                historical_dates=historical_dates,
+            )
+        )
+        return _DayEvents(event_ids=event_ids, historical_dates=historical_dates, coverage=coverage)
+
+    def _on_events(self, day: str, future: Future[Any]) -> None:
+        run = self.runs[day]
+        try:
+            events: _DayEvents = future.result()
+        except (OfflineCacheMiss, SpendBlockedError, OddsAPIError, ValueError) as exc:
+            self._fail(run, exc)
+            self._finalize(run)
+            return
+        run.event_ids = events.event_ids
+        run.historical_dates = events.historical_dates
+        plan = plan_requests(
+            self.spec,
+            event_ids=events.event_ids,
+            coverage=events.coverage,
+            historical_dates=events.historical_dates,
+            budget=None if self.policy.force else self.remaining_credits,
+        )
+        if self.on_plan is not None:
+            self.on_plan(day, plan)
+        self._enqueue(run, plan.calls, deferred=plan.deferred, journal=True)
+
+    def _enqueue(
+        self,
+        run: _DayRun,
+        calls: tuple[PlannedCall, ...],
+        *,
+        deferred: tuple[PlannedCall, ...],
+        journal: bool,
+    ) -> None:
+        """Reserve credits for a day's calls and hand them to the pool."""
+        credits = sum(call.credits for call in calls)
+        run.estimated_paid_credits = credits + sum(call.credits for call in deferred)
+        try:
+            if (calls or deferred) and (
+                self.policy.block_paid or effective_max_credits(self.policy) == 0
+            ):
+                raise SpendBlockedError(
+                    "paid cache miss blocked for "
+                    f"day={run.day} missing={len(calls) + len(deferred)}"
                 )
-                events_req = OddsRequest(
-                    method="GET",
-                    path=events_path,
-                    params=events_params,
-                    label="events_list",
-                    is_paid=False,
+            if deferred or (not self.policy.force and credits > self.remaining_credits):
+                raise CreditBudgetExceeded(
+                    f"estimated credits {run.estimated_paid_credits} exceed "
+                    f"remaining budget {self.remaining_credits} for day {run.day}"
                 )
+        except (SpendBlockedError, CreditBudgetExceeded) as exc:
+            self._fail(run, exc)
+            self._finalize(run)
+            return
+        if self.dry_run:
+            self._finalize(run)
+            return
+        if journal:
+            self.queue.record_plan(
+                run.day,
+                run.snapshot_id,
+                event_ids=run.event_ids,
+                historical_dates=run.historical_dates,
+                calls=calls,
+            )
+        run.executed = True
+        run.outstanding = len(calls)
+        self.reserved += credits
+        for call in calls:
+            self._submit("call", run.day, self._fetch, run.snapshot_id, call, call=call)
+        if not calls:
+            self._finalize(run)
+
+    def _fetch(self, snapshot_id: str, call: PlannedCall) -> FetchResult:
+        spec = self.spec
+
+        def _fetch_call() -> Any:
+            if call.endpoint == ENDPOINT_FEATURED_ODDS:
+                return self.client().get_featured_odds(
+                    sport_key=spec.sport_key,
+                    markets=list(call.markets),
+                    regions=spec.regions,
+                    bookmakers=spec.bookmakers,
+                    event_ids=list(call.event_ids),
+                    include_links=spec.include_links,
+                    include_sids=spec.include_sids,
+                    odds_format=spec.odds_format,
+                    date_format=spec.date_format,
+                )
+            return self.client().get_event_odds(
+                sport_key=spec.sport_key,
+                event_id=call.event_ids[0],
+                markets=list(call.markets),
+                regions=spec.regions,
+                bookmakers=spec.bookmakers,
+                include_links=spec.include_links,
+                include_sids=spec.include_sids,
+                odds_format=spec.odds_format,
+                date_format=spec.date_format,
+                historical_date=call.historical_date or None,
+            )
 
-                def _fetch_events(
-                    commence_from: str = commence_from,
-                    commence_to: str = commence_to,
-                    historical_date: str | None = events_historical_date,
-                ) -> Any:
-                    return _client().list_events(
-                        sport_key=spec.sport_key,
-                        commence_from=commence_from,
-                        commence_to=commence_to,
-                        date_format=spec.date_format,
-                        historical_date=historical_date,
-                    )
-
-                try:
-                    events_result = repo.get_or_fetch(
-                        snapshot_id=snapshot_id,
-                        req=events_req,
-                        fetcher=_fetch_events,
-                        policy=policy,
-                    )
-                except (OfflineCacheMiss, SpendBlockedError, OddsAPIError, ValueError) as exc:
-                    day_error = _sanitize_error_message(str(exc))
-                    day_error_code = _reason_code_for_exception(exc)
-                    status = compute_day_status_from_cache(
-                        data_root=data_root,
-                        store=store,
-                        cache=cache,
-                        spec=spec,
-                        day=day,
-                        tz_name=tz_name,
-                    )
-                    save_day_status(
-                        data_root,
-                        spec,
-                        day,
-                        with_day_error(
-                            status,
-                            error=day_error,
-                            reason_code=day_error_code,
-                        ),
-                    )
-                    summaries.append(
-                        {
-                            "day": day,
-                            "snapshot_id": snapshot_id,
-                            "complete": False,
-                            "missing": int(status.get("missing_count", 0)),
-                            "events": int(status.get("total_events", 0)),
-                            "estimated_paid_credits": estimated_paid_credits,
-                            "actual_paid_credits": actual_paid_credits,
-                            "remaining_credits": remaining_credits,
-                            "error_code": day_error_code,
-                            "error": day_error,
-                        }
-                    )
-                    continue
+        req = OddsRequest(
+            method="GET", path=call.path, params=call.params, label=call.label, is_paid=True
+        )
+        return self.repo.get_or_fetch(
+            snapshot_id=snapshot_id, req=req, fetcher=_fetch_call, policy=self.policy
+        )
+
+    def _on_call(self, day: str, call: PlannedCall, future: Future[Any]) -> None:
+        run = self.runs[day]
+        self.reserved -= call.credits
+        try:
+            result: FetchResult = future.result()
+        except (OfflineCacheMiss, SpendBlockedError, OddsAPIError, ValueError) as exc:
+            self._fail(run, exc)
+        else:
+            self.queue.record_done(day, call)
+            charged = _charged_credits(result, call)
+            run.actual_paid_credits += charged
+            self.spent += charged
+        run.outstanding -= 1
+        if run.outstanding == 0:
+            self._finalize(run)
+
+    def _fail(self, run: _DayRun, exc: Exception) -> None:
+        run.error = _sanitize_error_message(str(exc))
+        run.error_code = _reason_code_for_exception(exc)
+
+    def _finalize(self, run: _DayRun) -> None:
+        self._submit("finalize", run.day, self._write_day, run)
+
+    def _write_day(self, run: _DayRun) -> dict[str, Any]:
+        """Per-day completion trigger: rebuild derived rows and persist the day status."""
+        if run.executed:
+            rows = _event_rows_from_coverage(
+                store=self.store,
+                cache=self.cache,
+                snapshot_id=run.snapshot_id,
+                coverage=cached_cells(
+                    store=self.store,
+                    cache=self.cache,
+                    snapshot_id=run.snapshot_id,
+                    spec=self.spec,
+                    event_ids=run.event_ids,
+                    historical_dates=run.historical_dates,
+                ),
+            )
+            self.store.write_jsonl(
+                self.store.derived_path(run.snapshot_id, "event_props.jsonl"), rows
+            )
+        status = compute_day_status_from_cache(
+            data_root=self.data_root,
+            store=self.store,
+            cache=self.cache,
+            spec=self.spec,
+            day=run.day,
+            tz_name=self.tz_name,
+        )
+        if run.error:
+            status = with_day_error(status, error=run.error, reason_code=run.error_code)
+        save_day_status(self.data_root, self.spec, run.day, status)
+        return status
+
+    def _summary(self, run: _DayRun, status: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "day": run.day,
+            "snapshot_id": run.snapshot_id,
+            "complete": bool(status.get("complete", False)),
+            "missing": int(status.get("missing_count", 0)),
+            "events": int(status.get("total_events", 0)),
+            "estimated_paid_credits": run.estimated_paid_credits,
+            "actual_paid_credits": run.actual_paid_credits,
+            "remaining_credits": self.remaining_credits,
+            "error_code": str(status.get("error_code", run.error_code)),
+            "error": run.error,
+        }
 
-                event_rows = _parse_event_rows(events_result.data)
-                event_ids = _parse_event_ids(events_result.data)
-                event_historical_dates: dict[str, str] = {}
-                if spec.historical:
-                    fallback = events_historical_date or commence_from
-                    for row in event_rows:
-                        event_id = str(row.get("id", "")).strip()
-                        if not event_id:
-                            continue
-                        event_historical_dates[event_id] = _historical_event_odds_timestamp(
-                            event_row=row,
-                            fallback_timestamp=fallback,
-                            pre_tip_minutes=spec.historical_pre_tip_minutes,
-                        )
-                missing_event_ids: list[str] = []
-                for event_id in event_ids:
-                    historical_date = event_historical_dates.get(event_id)
-                    request_path = (
-                        f"/historical/sports/{spec.sport_key}/events/{event_id}/odds"
-                        if historical_date
-                        else f"/sports/{spec.sport_key}/events/{event_id}/odds"
-                    )
-                    request_params = _event_odds_params(
-                        spec,
-                        historical_date=historical_date,
-                    )
-                    request_key = request_hash("GET", request_path, request_params)
-                    if policy.refresh:
-                        missing_event_ids.append(event_id)
-                        continue
-                    if store.has_response(snapshot_id, request_key) or cache.has_response(
-                        request_key
-                    ):
-                        continue
-                    missing_event_ids.append(event_id)
-
-                regions_factor = regions_equivalent(spec.regions, spec.bookmakers)
-                estimated_paid_credits = estimate_event_credits(
-                    sorted(set(spec.markets)),
-                    regions_factor,
-                    len(missing_event_ids),
-                )
-                if spec.historical and estimated_paid_credits > 0:
-                    estimated_paid_credits *= HISTORICAL_ODDS_CREDIT_MULTIPLIER
-
-                try:
-                    if missing_event_ids and (
-                        policy.block_paid or effective_max_credits(policy) == 0
-                    ):
-                        raise SpendBlockedError(
-                            "paid cache miss blocked for "
-                            f"day={day} missing={len(missing_event_ids)}"
-                        )
-                    if (
-                        estimated_paid_credits > remaining_credits
-                        and missing_event_ids
-                        and not policy.force
-                    ):
-                        raise CreditBudgetExceeded(
-                            f"estimated credits {estimated_paid_credits} exceed "
-                            f"remaining budget {remaining_credits} for day {day}"
-                        )
-                except (SpendBlockedError, CreditBudgetExceeded) as exc:
-                    day_error = _sanitize_error_message(str(exc))
-                    day_error_code = _reason_code_for_exception(exc)
-                    status = compute_day_status_from_cache(
-                        data_root=data_root,
-                        store=store,
-                        cache=cache,
-                        spec=spec,
-                        day=day,
-                        tz_name=tz_name,
-                    )
-                    save_day_status(
-                        data_root,
-                        spec,
-                        day,
-                        with_day_error(
-                            status,
-                            error=day_error,
-                            reason_code=day_error_code,
-                        ),
-                    )
-                    summaries.append(
-                        {
-                            "day": day,
-                            "snapshot_id": snapshot_id,
-                            "complete": False,
-                            "missing": int(status.get("missing_count", 0)),
-                            "events": int(status.get("total_events", 0)),
-                            "estimated_paid_credits": estimated_paid_credits,
-                            "actual_paid_credits": actual_paid_credits,
-                            "remaining_credits": remaining_credits,
-                            "error_code": day_error_code,
-                            "error": day_error,
-                        }
-                    )
-                    continue
 
-                if not dry_run:
-                    for event_id in missing_event_ids:
-                        historical_date = event_historical_dates.get(event_id)
-                        request_path = (
-                            f"/historical/sports/{spec.sport_key}/events/{event_id}/odds"
-                            if historical_date
-                            else f"/sports/{spec.sport_key}/events/{event_id}/odds"
-                        )
-                        request_params = _event_odds_params(
-                            spec,
-                            historical_date=historical_date,
-                        )
-                        req = OddsRequest(
-                            method="GET",
-                            path=request_path,
-                            params=request_params,
-                            label=f"event_odds:{event_id}",
-                            is_paid=True,
-                        )
-
-                        def _fetch_event_odds(
-                            event_id: str = event_id,
-                            historical_date: str | None = historical_date,
-                        ) -> Any:
-                            return _client().get_event_odds(
-                                sport_key=spec.sport_key,
-                                event_id=event_id,
-                                markets=spec.markets,
-                                regions=spec.regions,
-                                bookmakers=spec.bookmakers,
-                                include_links=spec.include_links,
-                                include_sids=spec.include_sids,
-                                odds_format=spec.odds_format,
-                                date_format=spec.date_format,
-                                historical_date=historical_date,
-                            )
-
-                        try:
-                            result = repo.get_or_fetch(
-                                snapshot_id=snapshot_id,
-                                req=req,
-                                fetcher=_fetch_event_odds,
-                                policy=policy,
-                            )
-                            try:
-                                actual_paid_credits += int(
-                                    result.headers.get("x-requests-last", "0")
-                                )
-                            except ValueError:
-                                actual_paid_credits += 0
-                        except (
-                            OfflineCacheMiss,
-                            SpendBlockedError,
-                            OddsAPIError,
-                            ValueError,
-                        ) as exc:
-                            day_error = _sanitize_error_message(str(exc))
-                            day_error_code = _reason_code_for_exception(exc)
-
-                    rows: list[dict[str, Any]] = []
-                    for event_id in event_ids:
-                        historical_date = event_historical_dates.get(event_id)
-                        request_path = (
-                            f"/historical/sports/{spec.sport_key}/events/{event_id}/odds"
-                            if historical_date
-                            else f"/sports/{spec.sport_key}/events/{event_id}/odds"
-                        )
-                        request_params = _event_odds_params(
-                            spec,
-                            historical_date=historical_date,
-                        )
-                        request_key = request_hash("GET", request_path, request_params)
-                        payload: Any | None = None
-                        if store.has_response(snapshot_id, request_key):
-                            payload = store.load_response(snapshot_id, request_key)
-                        elif cache.has_response(request_key):
-                            cache.materialize_into_snapshot(store, snapshot_id, request_key)
-                            payload = cache.load_response(request_key)
-                        if isinstance(payload, dict):
-                            rows.extend(
-                                normalize_event_odds(
-                                    payload,
-                                    snapshot_id=snapshot_id,
-                                    provider="odds_api",
-                                )
-                            )
-                    store.write_jsonl(store.derived_path(snapshot_id, "event_props.jsonl"), rows)
-
-                    if actual_paid_credits > 0:
-                        remaining_credits = max(0, remaining_credits - actual_paid_credits)
-                    elif estimated_paid_credits > 0:
-                        remaining_credits = max(0, remaining_credits - estimated_paid_credits)
-
-                status = compute_day_status_from_cache(
-                    data_root=data_root,
-                    store=store,
-                    cache=cache,
-                    spec=spec,
-                    day=day,
-                    tz_name=tz_name,
-                )
-                if day_error:
-                    status = with_day_error(
-                        status,
-                        error=day_error,
-                        reason_code=day_error_code,
-                    )
-                save_day_status(data_root, spec, day, status)
-
-                summaries.append(
-                    {
-                        "day": day,
-                        "snapshot_id": snapshot_id,
-                        "complete": bool(status.get("complete", False)),
-                        "missing": int(status.get("missing_count", 0)),
-                        "events": int(status.get("total_events", 0)),
-                        "estimated_paid_credits": estimated_paid_credits,
-                        "actual_paid_credits": actual_paid_credits,
-                        "remaining_credits": remaining_credits,
-                        "error_code": str(status.get("error_code", day_error_code)),
-                        "error": day_error,
-                    }
-                )
-        return summaries
-    finally:
-        if client is not None:
-            client.close()
+def backfill_days(
+    *,
+    data_root: Path,
+    spec: DatasetSpec,
+    days: list[str],
+    tz_name: str,
+    policy: SpendPolicy,
+    dry_run: bool,
+    on_plan: Callable[[str, RequestPlan], None] | None = None,
+    workers: int = 1,
+) -> list[dict[str, Any]]:
+    """Fill each day's snapshot with the fewest paid calls that cover its missing cells.
+
+    Days are planned into the dataset's backfill queue and their calls drained by
+    ``workers`` threads, so one slow day never holds up the range. An interrupted run
+    resumes from the queue: calls that already landed are not re-planned or re-fetched.
+    ``on_plan`` receives every freshly planned day before any of its paid calls are made.
+    """
+    save_dataset_spec(data_root, spec)
+    queue = BackfillQueue(data_root, spec)
+    with (
+        queue.open(),
+        ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool,
+    ):
+        run = _BackfillRun(
+            data_root=data_root,
+            spec=spec,
+            tz_name=tz_name,
+            policy=policy,
+            dry_run=dry_run,
+            on_plan=on_plan,
+            queue=queue,
+            pool=pool,
+        )
+        try:
+            for day in days:
+                run.start(day)
+            run.drain()
+        finally:
+            run.close()
+    return [run.summaries[day] for day in days if day in run.summaries]
@@ -0,0 +1,203 @@
+"""Resumable work queue for dataset backfills.
+
+Each dataset keeps ``datasets/<dataset_id>/backfill-queue.jsonl``, an append-only journal
+of three row kinds:
+
+- ``plan``: the day's event ids (with historical odds dates) and the paid calls planned
+  for it, one task per call keyed by its request key. A later ``plan`` row for the same
+  day replaces the earlier one.
+- ``task``: a planned call finished (``done``) on the network or from cache.
+- ``day``: a day was finalized, with whether its status came out complete.
+
+Replaying the journal tells an interrupted backfill which days still have calls left and
+which calls already landed, so a restart resumes without re-listing events or re-planning.
+Failed calls are not journaled and are retried by the next run. Writers hold an flock on
+``.backfill-queue.lock`` for the whole run, so two backfills of one dataset never drain
+the same queue; the lock is released by the kernel if the process dies.
+"""
+
+from __future__ import annotations
+
+import fcntl
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from prop_ev.odds_data.day_index import dataset_spec_path
+from prop_ev.odds_data.request_plan import PlannedCall
+from prop_ev.odds_data.spec import DatasetSpec
+from prop_ev.time_utils import utc_now_str
+from prop_ev.util.jsonl import dumps_row, iter_jsonl, write_jsonl
+
+QUEUE_FILENAME = "backfill-queue.jsonl"
+_LOCK_FILENAME = ".backfill-queue.lock"
+
+
+def backfill_queue_path(data_root: Path | str, spec: DatasetSpec) -> Path:
+    return dataset_spec_path(data_root, spec).parent / QUEUE_FILENAME
+
+
+def _call_row(call: PlannedCall) -> dict[str, Any]:
+    return {
+        "task_id": call.key(),
+        "endpoint": call.endpoint,
+        "path": call.path,
+        "params": call.params,
+        "event_ids": list(call.event_ids),
+        "markets": list(call.markets),
+        "credits": call.credits,
+        "historical_date": call.historical_date,
+    }
+
+
+def _call_from_row(row: dict[str, Any]) -> PlannedCall:
+    return PlannedCall(
+        endpoint=str(row.get("endpoint", "")),
+        path=str(row.get("path", "")),
+        params=dict(row.get("params", {})),
+        event_ids=tuple(str(item) for item in row.get("event_ids", [])),
+        markets=tuple(str(item) for item in row.get("markets", [])),
+        credits=int(row.get("credits", 0)),
+        historical_date=str(row.get("historical_date", "")),
+    )
+
+
+@dataclass
+class QueuedDay:
+    """Replayed queue state for one day."""
+
+    day: str
+    snapshot_id: str
+    event_ids: list[str] = field(default_factory=list)
+    historical_dates: dict[str, str] = field(default_factory=dict)
+    calls: dict[str, PlannedCall] = field(default_factory=dict)
+    done: set[str] = field(default_factory=set)
+    planned_at_utc: str = ""
+    finalized: bool = False
+    complete: bool = False
+
+    @property
+    def pending(self) -> list[PlannedCall]:
+        """Planned calls without a ``done`` record, in plan order."""
+        return [call for task_id, call in self.calls.items() if task_id not in self.done]
+
+
+class BackfillQueue:
+    """Journal-backed (day, call) work queue for one dataset."""
+
+    def __init__(self, data_root: Path | str, spec: DatasetSpec) -> None:
+        self.path = backfill_queue_path(data_root, spec)
+        self.days: dict[str, QueuedDay] = {}
+        self._handle: IO[bytes] | None = None
+
+    @contextmanager
+    def open(self) -> Iterator[BackfillQueue]:
+        """Lock the queue, replay and compact its journal, and keep it open for appends."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with (self.path.parent / _LOCK_FILENAME).open("a", encoding="utf-8") as lock:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError as exc:
+                raise RuntimeError(f"backfill queue {self.path} is held by another run") from exc
+            try:
+                self.days = self._replay()
+                write_jsonl(self.path, self._compacted_rows(), compact=True)
+                with self.path.open("ab") as handle:
+                    self._handle = handle
+                    yield self
+            finally:
+                self._handle = None
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _replay(self) -> dict[str, QueuedDay]:
+        days: dict[str, QueuedDay] = {}
+        for row in iter_jsonl(self.path, missing_ok=True):
+            day = str(row.get("day", ""))
+            op = row.get("op")
+            if op == "plan":
+                days[day] = QueuedDay(
+                    day=day,
+                    snapshot_id=str(row.get("snapshot_id", "")),
+                    event_ids=[str(item) for item in row.get("event_ids", [])],
+                    historical_dates={
+                        str(key): str(value)
+                        for key, value in dict(row.get("historical_dates", {})).items()
+                    },
+                    calls={
+                        str(item["task_id"]): _call_from_row(item)
+                        for item in row.get("tasks", [])
+                        if isinstance(item, dict) and item.get("task_id")
+                    },
+                    planned_at_utc=str(row.get("ts", "")),
+                )
+            elif day not in days:
+                continue
+            elif op == "task" and row.get("state") == "done":
+                days[day].done.add(str(row.get("task_id", "")))
+            elif op == "day":
+                days[day].finalized = True
+                days[day].complete = bool(row.get("complete", False))
+        return days
+
+    @staticmethod
+    def _plan_row(queued: QueuedDay) -> dict[str, Any]:
+        return {
+            "op": "plan",
+            "day": queued.day,
+            "snapshot_id": queued.snapshot_id,
+            "ts": queued.planned_at_utc,
+            "event_ids": queued.event_ids,
+            "historical_dates": queued.historical_dates,
+            "tasks": [_call_row(call) for call in queued.calls.values()],
+        }
+
+    def _compacted_rows(self) -> Iterator[dict[str, Any]]:
+        for queued in self.days.values():
+            yield self._plan_row(queued)
+            for task_id in sorted(queued.done & set(queued.calls)):
+                yield {"op": "task", "day": queued.day, "task_id": task_id, "state": "done"}
+            if queued.finalized:
+                yield {"op": "day", "day": queued.day, "complete": queued.complete}
+
+    def _append(self, row: dict[str, Any]) -> None:
+        if self._handle is None:
+            raise RuntimeError("backfill queue is not open")
+        self._handle.write((dumps_row(row, compact=True) + "\n").encode("utf-8"))
+        self._handle.flush()
+
+    def record_plan(
+        self,
+        day: str,
+        snapshot_id: str,
+        *,
+        event_ids: list[str],
+        historical_dates: dict[str, str],
+        calls: tuple[PlannedCall, ...],
+    ) -> QueuedDay:
+        """Enqueue ``calls`` as the day's work, replacing any earlier plan for it."""
+        queued = QueuedDay(
+            day=day,
+            snapshot_id=snapshot_id,
+            event_ids=list(event_ids),
+            historical_dates=dict(historical_dates),
+            calls={call.key(): call for call in calls},
+            planned_at_utc=utc_now_str(),
+        )
+        self._append(self._plan_row(queued))
+        self.days[day] = queued
+        return queued
+
+    def record_done(self, day: str, call: PlannedCall) -> None:
+        task_id = call.key()
+        self._append({"op": "task", "day": day, "task_id": task_id, "state": "done"})
+        self.days[day].done.add(task_id)
+
+    def record_day(self, day: str, *, complete: bool) -> None:
+        queued = self.days.get(day)
+        if queued is None:
+            return
+        self._append({"op": "day", "day": day, "complete": complete})
+        queued.finalized = True
+        queued.complete = complete
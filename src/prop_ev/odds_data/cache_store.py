@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import fcntl
 import json
 import os
 import shutil
 import uuid
-from contextlib import suppress
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from typing import Any
 
 from prop_ev.data_paths import resolve_runtime_root
-from prop_ev.storage import SnapshotStore
+from prop_ev.storage import (
+    RAW_RESPONSE_SUFFIX,
+    SnapshotStore,
+    decode_payload,
+    payload_field_from_meta,
+    read_raw_payload,
+    write_raw_payload,
+)
 
 
 def _atomic_write_json(path: Path, value: Any) -> None:
@@ -37,6 +46,7 @@ class GlobalCacheStore:
         self.requests_dir = self.cache_dir / "requests"
         self.responses_dir = self.cache_dir / "responses"
         self.meta_dir = self.cache_dir / "meta"
+        self.locks_dir = self.cache_dir / "locks"
         self.requests_dir.mkdir(parents=True, exist_ok=True)
         self.responses_dir.mkdir(parents=True, exist_ok=True)
         self.meta_dir.mkdir(parents=True, exist_ok=True)
@@ -47,13 +57,21 @@ class GlobalCacheStore:
     def _response_path(self, key: str) -> Path:
         return self.responses_dir / f"{key}.json"
 
+    def _raw_response_path(self, key: str) -> Path:
+        return self.responses_dir / f"{key}{RAW_RESPONSE_SUFFIX}"
+
     def _meta_path(self, key: str) -> Path:
         return self.meta_dir / f"{key}.json"
 
     def has_response(self, key: str) -> bool:
-        return self._response_path(key).exists()
+        return self._raw_response_path(key).exists() or self._response_path(key).exists()
 
     def load_response(self, key: str) -> Any | None:
+        raw_path = self._raw_response_path(key)
+        if raw_path.exists():
+            return decode_payload(
+                read_raw_payload(raw_path), payload_field_from_meta(self.load_meta(key))
+            )
         path = self._response_path(key)
         if path.exists():
             return json.loads(path.read_text(encoding="utf-8"))
@@ -66,31 +84,89 @@ class GlobalCacheStore:
             return payload if isinstance(payload, dict) else None
         return None
 
+    @contextmanager
+    def fetch_lock(self, key: str) -> Iterator[bool]:
+        """Hold the cross-process single-flight lock for one request key.
+
+        Yields ``True`` when another process held the lock first, i.e. this caller
+        waited on an in-flight fetch and should re-check the cache before fetching.
+        """
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        with (self.locks_dir / f"{key}.lock").open("a", encoding="utf-8") as handle:
+            waited = False
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                waited = True
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield waited
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
     def write_request(self, key: str, request_data: dict[str, Any]) -> None:
         _atomic_write_json(self._request_path(key), request_data)
 
     def write_response(self, key: str, response_data: Any) -> None:
         _atomic_write_json(self._response_path(key), response_data)
+        with suppress(FileNotFoundError):
+            self._raw_response_path(key).unlink()
+
+    def write_raw_response(self, key: str, raw: bytes) -> None:
+        """Store response bytes verbatim (gzip) in place of any decoded copy."""
+        write_raw_payload(self._raw_response_path(key), raw)
+        with suppress(FileNotFoundError):
+            self._response_path(key).unlink()
 
     def write_meta(self, key: str, meta_data: dict[str, Any]) -> None:
         _atomic_write_json(self._meta_path(key), meta_data)
 
     def materialize_into_snapshot(
-        self, snapshot_store: SnapshotStore, snapshot_id: str, key: str
+        self,
+        snapshot_store: SnapshotStore,
+        snapshot_id: str,
+        key: str,
+        *,
+        replace: bool = False,
     ) -> None:
+        """Hard-link (or copy) the cached files for ``key`` into a snapshot.
+
+        Existing snapshot files are kept unless ``replace`` is set, in which case they
+        are swapped atomically and a stale response in the other encoding is removed.
+        """
         snapshot_store.ensure_snapshot(snapshot_id)
         snapshot_root = snapshot_store.snapshot_dir(snapshot_id)
-
-        pairs = [
-            (self._request_path(key), snapshot_root / "requests" / f"{key}.json"),
-            (self._response_path(key), snapshot_root / "responses" / f"{key}.json"),
-            (self._meta_path(key), snapshot_root / "meta" / f"{key}.json"),
+        responses_root = snapshot_root / "responses"
+
+        response_name = f"{key}{RAW_RESPONSE_SUFFIX}"
+        stale_name = f"{key}.json"
+        if not self._raw_response_path(key).exists():
+            response_name, stale_name = stale_name, response_name
+        request_path = snapshot_root / "requests" / f"{key}.json"
+        meta_path = snapshot_root / "meta" / f"{key}.json"
+        triples = [
+            (self._request_path(key), request_path, request_path.exists()),
+            (
+                self.responses_dir / response_name,
+                responses_root / response_name,
+                snapshot_store.has_response(snapshot_id, key),
+            ),
+            (self._meta_path(key), meta_path, meta_path.exists()),
         ]
-        for source, destination in pairs:
-            if not source.exists() or destination.exists():
+        for source, destination, present in triples:
+            if not source.exists() or (present and not replace):
                 continue
             destination.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = destination.with_name(f".tmp-{destination.name}-{uuid.uuid4().hex}")
             try:
-                os.link(source, destination)
-            except OSError:
-                shutil.copy2(source, destination)
+                try:
+                    os.link(source, tmp_path)
+                except OSError:
+                    shutil.copy2(source, tmp_path)
+                os.replace(tmp_path, destination)
+            finally:
+                with suppress(FileNotFoundError):
+                    tmp_path.unlink()
+        if replace:
+            with suppress(FileNotFoundError):
+                (responses_root / stale_name).unlink()
@@ -12,6 +12,7 @@ from typing import Any
 from zoneinfo import ZoneInfo
 
 from prop_ev.odds_data.cache_store import GlobalCacheStore
+from prop_ev.odds_data.request_plan import cached_cells, event_odds_request
 from prop_ev.odds_data.spec import DatasetSpec, canonical_dict, dataset_id
 from prop_ev.odds_data.window import day_window
 from prop_ev.storage import SnapshotStore, request_hash
@@ -158,26 +159,7 @@ def _event_odds_request(
     *,
     historical_date: str | None = None,
 ) -> tuple[str, dict[str, Any]]:
-    if historical_date:
-        path = f"/historical/sports/{spec.sport_key}/events/{event_id}/odds"
-    else:
-        path = f"/sports/{spec.sport_key}/events/{event_id}/odds"
-    params: dict[str, Any] = {
-        "markets": ",".join(sorted(set(spec.markets))),
-        "oddsFormat": spec.odds_format,
-        "dateFormat": spec.date_format,
-    }
-    if spec.bookmakers:
-        params["bookmakers"] = spec.bookmakers
-    elif spec.regions:
-        params["regions"] = spec.regions
-    if spec.include_links:
-        params["includeLinks"] = "true"
-    if spec.include_sids:
-        params["includeSids"] = "true"
-    if historical_date:
-        params["date"] = historical_date
-    return path, params
+    return event_odds_request(spec, event_id, markets=spec.markets, historical_date=historical_date)
 
 
 def _parse_positive_int(value: Any) -> int:
@@ -416,8 +398,6 @@ def compute_day_status_from_cache(
 
     expected_event_odds: dict[str, str] = {}
     event_odds_dates: dict[str, str] = {}
-    missing_event_ids: list[str] = []
-    present_event_odds = 0
     for event_row in event_rows:
         event_id = str(event_row.get("id", "")).strip()
         if not event_id:
@@ -435,9 +415,23 @@ def compute_day_status_from_cache(
             event_id,
             historical_date=historical_date,
         )
-        key = request_hash("GET", request_path, request_params)
-        expected_event_odds[event_id] = key
-        if store.has_response(snapshot_id, key) or cache.has_response(key):
+        expected_event_odds[event_id] = request_hash("GET", request_path, request_params)
+
+    # An event counts as present once every spec market is held by some stored response,
+    # whether the full-spec request or the market-subset calls of a request plan.
+    coverage = cached_cells(
+        store=store,
+        cache=cache,
+        snapshot_id=snapshot_id,
+        spec=spec,
+        event_ids=list(expected_event_odds),
+        historical_dates=event_odds_dates,
+    )
+    wanted_markets = set(spec.markets)
+    missing_event_ids: list[str] = []
+    present_event_odds = 0
+    for event_id in expected_event_odds:
+        if wanted_markets.issubset(coverage.get(event_id, {})):
             present_event_odds += 1
         else:
             missing_event_ids.append(event_id)
@@ -12,6 +12,7 @@ import polars as pl
 
 from prop_ev.data_paths import data_home_from_odds_root
 from prop_ev.time_utils import utc_now_str
+from prop_ev.util.jsonl import read_jsonl
 
 TABLE_FACT_OUTCOMES = "fact_outcomes"
 TABLE_DIM_REQUEST = "dim_request"
@@ -182,7 +183,7 @@ def export_dataset_denorm(
 
     for plan in day_plans:
         try:
-            event_props_rows = _load_jsonl_rows(plan.event_props_path)
+            event_props_rows = read_jsonl(plan.event_props_path, strict=True)
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             skipped_missing_event_props_days += 1
             warnings.append(
@@ -420,19 +421,6 @@ def _load_json_dict(path: Path) -> dict[str, Any]:
     return payload
 
 
-def _load_jsonl_rows(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
-        payload = json.loads(raw)
-        if not isinstance(payload, dict):
-            raise ValueError("expected JSON object in JSONL")
-        rows.append(payload)
-    return rows
-
-
 def _frame_for_schema(rows: list[dict[str, Any]], schema: list[tuple[str, Any]]) -> pl.DataFrame:
     schema_map = {name: dtype for name, dtype in schema}
     columns = [name for name, _ in schema]
@@ -0,0 +1,314 @@
+"""Append-only line-movement history built from repeated event-props snapshots.
+
+Each ``snapshot props`` run contributes only the quotes whose price changed since the
+previous observation in time of the same (event, player, market, book, side, point) key,
+so snapshots may be ingested in any order. Rows are
+stored as zstd-compressed Parquet parts sorted by ``last_update`` next to a ``latest``
+table that holds the current price per key, so opening/current/steam queries never need
+to re-read snapshot JSON.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from prop_ev.time_utils import utc_now_str
+
+LINE_HISTORY_SCHEMA_VERSION = 1
+LINE_KEY_COLUMNS: tuple[str, ...] = ("event_id", "player", "market", "book", "side", "point")
+LINE_HISTORY_SCHEMA: dict[str, Any] = {
+    "event_id": pl.Utf8,
+    "player": pl.Utf8,
+    "market": pl.Utf8,
+    "book": pl.Utf8,
+    "side": pl.Utf8,
+    "point": pl.Float64,
+    "price": pl.Int64,
+    "last_update": pl.Datetime("us", "UTC"),
+    "snapshot_id": pl.Utf8,
+}
+_MOVE_GROUP_COLUMNS: list[str] = ["event_id", "player", "market", "side", "point"]
+
+
+def _implied_prob(price: pl.Expr) -> pl.Expr:
+    return pl.when(price > 0).then(100.0 / (price + 100.0)).otherwise((-price) / ((-price) + 100.0))
+
+
+def _empty_history() -> pl.DataFrame:
+    return pl.DataFrame(schema=LINE_HISTORY_SCHEMA)
+
+
+def _history_frame(rows: list[dict[str, Any]], *, snapshot_id: str) -> pl.DataFrame:
+    records: list[dict[str, Any]] = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        price = row.get("price")
+        point = row.get("point")
+        if price is None or point is None or isinstance(price, bool):
+            continue
+        try:
+            price_value = int(round(float(price)))
+            point_value = round(float(point), 6)
+        except (TypeError, ValueError):
+            continue
+        event_id = str(row.get("event_id", "")).strip()
+        book = str(row.get("book", "")).strip()
+        if not event_id or not book:
+            continue
+        records.append(
+            {
+                "event_id": event_id,
+                "player": str(row.get("player", "")).strip(),
+                "market": str(row.get("market", "")).strip(),
+                "book": book,
+                "side": str(row.get("side", "")).strip(),
+                "point": point_value,
+                "price": price_value,
+                "last_update": str(row.get("last_update", "")).strip(),
+                "snapshot_id": snapshot_id,
+            }
+        )
+    if not records:
+        return _empty_history()
+    frame = pl.DataFrame(
+        records,
+        schema={**LINE_HISTORY_SCHEMA, "last_update": pl.Utf8},
+    )
+    return frame.with_columns(
+        pl.col("last_update").str.to_datetime(time_zone="UTC", strict=False, time_unit="us")
+    ).select(list(LINE_HISTORY_SCHEMA))
+
+
+def _write_parquet_atomic(frame: pl.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".tmp-{path.name}-{uuid.uuid4().hex}")
+    try:
+        frame.write_parquet(tmp_path, compression="zstd", statistics=True)
+        os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+class LineHistoryStore:
+    """Columnar line-movement store for one odds data root."""
+
+    def __init__(self, odds_root: Path | str) -> None:
+        self.root = Path(odds_root) / "line_history" / "event_props"
+        self.parts_dir = self.root / "parts"
+        self.latest_path = self.root / "latest.parquet"
+        self.index_path = self.root / "index.json"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with (self.root / ".lock").open("a", encoding="utf-8") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def load_index(self) -> dict[str, Any]:
+        """Return the per-snapshot ingestion index."""
+        if not self.index_path.exists():
+            return {"schema_version": LINE_HISTORY_SCHEMA_VERSION, "snapshots": {}}
+        payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        if not isinstance(payload, dict) or not isinstance(payload.get("snapshots"), dict):
+            return {"schema_version": LINE_HISTORY_SCHEMA_VERSION, "snapshots": {}}
+        return payload
+
+    def _save_index(self, index: dict[str, Any]) -> None:
+        tmp_path = self.index_path.with_name(f".tmp-{self.index_path.name}-{uuid.uuid4().hex}")
+        try:
+            tmp_path.write_text(json.dumps(index, sort_keys=True, indent=2) + "\n", "utf-8")
+            os.replace(tmp_path, self.index_path)
+        finally:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
+
+    def append_snapshot(self, snapshot_id: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+        """Append quotes whose price changed since the previous observation of their key in time."""
+        with self._locked():
+            index = self.load_index()
+            snapshots = index["snapshots"]
+            existing = snapshots.get(snapshot_id)
+            if isinstance(existing, dict):
+                return {**existing, "snapshot_id": snapshot_id, "status": "already_ingested"}
+
+            incoming = (
+                _history_frame(rows, snapshot_id=snapshot_id)
+                .sort("last_update", nulls_last=False)
+                .unique(subset=list(LINE_KEY_COLUMNS), keep="last", maintain_order=True)
+            )
+            changed = self._fold_incoming(incoming)
+            if changed.height:
+                _write_parquet_atomic(changed, self.parts_dir / f"{snapshot_id}.parquet")
+
+            summary = {
+                "ingested_at_utc": utc_now_str(),
+                "rows_in": incoming.height,
+                "rows_appended": changed.height,
+            }
+            snapshots[snapshot_id] = summary
+            self._save_index(index)
+            return {**summary, "snapshot_id": snapshot_id, "status": "ok"}
+
+    def _fold_incoming(self, incoming: pl.DataFrame) -> pl.DataFrame:
+        """Return the incoming rows that are price changes in ``last_update`` order.
+
+        Each incoming quote is compared with the observation just before it in time, not
+        with the most recently ingested one, so snapshots may arrive out of order. Stored
+        changes that an older snapshot makes redundant are dropped from their parts, and
+        ``latest`` is rebuilt for the touched keys.
+        """
+        if not incoming.height:
+            return incoming
+        keys = list(LINE_KEY_COLUMNS)
+        parts = sorted(self.parts_dir.glob("*.parquet")) if self.parts_dir.exists() else []
+        existing = (
+            pl.scan_parquet(parts).join(incoming.lazy().select(keys), on=keys, how="semi").collect()
+            if parts
+            else _empty_history()
+        )
+        combined = pl.concat(
+            [
+                existing.with_columns(pl.lit(False).alias("_new")),
+                incoming.with_columns(pl.lit(True).alias("_new")),
+            ],
+            how="vertical",
+        ).sort([*keys, "last_update", "_new"], nulls_last=False)
+        previous = pl.col("price").shift(1).over(keys)
+        folded = combined.filter(
+            ~pl.col("_new") | previous.is_null() | (previous != pl.col("price"))
+        )
+        redundant = folded.filter(
+            ~pl.col("_new") & (pl.col("price").shift(1).over(keys) == pl.col("price"))
+        )
+        folded = folded.join(redundant, on=[*keys, "last_update", "snapshot_id"], how="anti")
+        self._drop_part_rows(redundant.drop("_new"))
+
+        touched_latest = folded.drop("_new").group_by(keys, maintain_order=True).last()
+        latest = self.current().join(incoming.select(keys), on=keys, how="anti")
+        updated_latest = pl.concat([latest, touched_latest], how="vertical").sort(
+            "last_update", nulls_last=False
+        )
+        _write_parquet_atomic(updated_latest, self.latest_path)
+        return folded.filter(pl.col("_new")).drop("_new").sort("last_update", nulls_last=False)
+
+    def _drop_part_rows(self, rows: pl.DataFrame) -> None:
+        columns = [*LINE_KEY_COLUMNS, "last_update"]
+        for (snapshot_id,), part_rows in rows.group_by(["snapshot_id"]):
+            path = self.parts_dir / f"{snapshot_id}.parquet"
+            kept = pl.read_parquet(path).join(part_rows.select(columns), on=columns, how="anti")
+            if kept.height:
+                _write_parquet_atomic(kept, path)
+            else:
+                path.unlink()
+
+    def history(
+        self,
+        *,
+        event_id: str = "",
+        player: str = "",
+        market: str = "",
+        book: str = "",
+    ) -> pl.DataFrame:
+        """Return price changes, filtered and ordered by line key then ``last_update``."""
+        parts = sorted(self.parts_dir.glob("*.parquet")) if self.parts_dir.exists() else []
+        if not parts:
+            return _empty_history()
+        lazy = pl.scan_parquet(parts)
+        for column, value in (
+            ("event_id", event_id),
+            ("player", player),
+            ("market", market),
+            ("book", book),
+        ):
+            if value:
+                lazy = lazy.filter(pl.col(column) == value)
+        return lazy.sort([*LINE_KEY_COLUMNS, "last_update"], nulls_last=False).collect()
+
+    def current(self) -> pl.DataFrame:
+        """Return the price per line key as of its largest ``last_update``."""
+        if not self.latest_path.exists():
+            return _empty_history()
+        return pl.read_parquet(self.latest_path)
+
+    def opening(self, **filters: str) -> pl.DataFrame:
+        """Return the first observed price per line key."""
+        history = self.history(**filters)
+        return history.group_by(list(LINE_KEY_COLUMNS), maintain_order=True).first()
+
+    def line_moves(self, *, since: str = "", **filters: str) -> pl.DataFrame:
+        """Return opening (or as-of ``since``) vs current price per line key.
+
+        ``prob_delta`` is the change in implied probability; positive values mean the
+        side became more expensive.
+        """
+        history = self.history(**filters)
+        if since:
+            cutoff = pl.lit(since).str.to_datetime(time_zone="UTC", time_unit="us")
+            baseline_rows = history.filter(pl.col("last_update") <= cutoff)
+            later_keys = history.filter(pl.col("last_update") > cutoff).select(
+                list(LINE_KEY_COLUMNS)
+            )
+            history = pl.concat(
+                [
+                    baseline_rows.group_by(list(LINE_KEY_COLUMNS), maintain_order=True).last(),
+                    history.filter(pl.col("last_update") > cutoff),
+                ],
+                how="vertical",
+            ).join(later_keys.unique(), on=list(LINE_KEY_COLUMNS), how="semi")
+            history = history.sort([*LINE_KEY_COLUMNS, "last_update"], nulls_last=False)
+        grouped = history.group_by(list(LINE_KEY_COLUMNS), maintain_order=True).agg(
+            pl.col("price").first().alias("open_price"),
+            pl.col("last_update").first().alias("open_last_update"),
+            pl.col("price").last().alias("current_price"),
+            pl.col("last_update").last().alias("current_last_update"),
+            pl.len().alias("observations"),
+        )
+        return grouped.with_columns(
+            (_implied_prob(pl.col("current_price")) - _implied_prob(pl.col("open_price")))
+            .round(6)
+            .alias("prob_delta")
+        )
+
+    def steam_moves(
+        self,
+        *,
+        since: str = "",
+        min_books: int = 2,
+        min_prob_delta: float = 0.02,
+        **filters: str,
+    ) -> pl.DataFrame:
+        """Return lines that moved the same direction at ``min_books`` or more books."""
+        moves = self.line_moves(since=since, **filters).filter(
+            pl.col("prob_delta").abs() >= float(min_prob_delta)
+        )
+        return (
+            moves.with_columns(
+                pl.when(pl.col("prob_delta") > 0)
+                .then(pl.lit("steam_up"))
+                .otherwise(pl.lit("steam_down"))
+                .alias("direction")
+            )
+            .group_by([*_MOVE_GROUP_COLUMNS, "direction"], maintain_order=True)
+            .agg(
+                pl.len().alias("books"),
+                pl.col("prob_delta").mean().round(6).alias("mean_prob_delta"),
+                pl.col("book").sort().alias("book_list"),
+            )
+            .filter(pl.col("books") >= int(min_books))
+            .sort("mean_prob_delta", descending=True)
+        )
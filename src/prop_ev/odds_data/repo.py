@@ -109,26 +109,7 @@ class OddsRepository:
             )
 
         if not policy.refresh and self.cache.has_response(key):
-            self.cache.materialize_into_snapshot(self.store, snapshot_id, key)
-            data = self.store.load_response(snapshot_id, key)
-            meta = self.store.load_meta(snapshot_id, key) or {}
-            headers = _normalize_headers(meta.get("headers"))
-            self.store.mark_request(
-                snapshot_id,
-                key,
-                label=req.label,
-                path=req.path,
-                params=req.params,
-                status="cached",
-                quota=_quota_from_headers(headers),
-            )
-            return FetchResult(
-                data=data,
-                headers=headers,
-                status="cached",
-                key=key,
-                cache_level="global",
-            )
+            return self._serve_global(snapshot_id=snapshot_id, req=req, key=key)
 
         if policy.offline:
             self.store.mark_request(
@@ -155,6 +136,49 @@ class OddsRepository:
             )
             raise SpendBlockedError(f"paid cache miss blocked for {req.label}")
 
+        requested_at_utc = utc_now_str()
+        with self.cache.fetch_lock(key) as waited:
+            # Single flight: a concurrent process may have fetched this key while we
+            # were checking or waiting; reuse its payload instead of paying again.
+            if self.cache.has_response(key) and (
+                not policy.refresh or (waited and self._fetched_since(key, requested_at_utc))
+            ):
+                return self._serve_global(
+                    snapshot_id=snapshot_id, req=req, key=key, replace=policy.refresh
+                )
+            return self._fetch_network(snapshot_id=snapshot_id, req=req, key=key, fetcher=fetcher)
+
+    def _fetched_since(self, key: str, requested_at_utc: str) -> bool:
+        meta = self.cache.load_meta(key) or {}
+        return str(meta.get("fetched_at_utc", "")) >= requested_at_utc
+
+    def _serve_global(
+        self, *, snapshot_id: str, req: OddsRequest, key: str, replace: bool = False
+    ) -> FetchResult:
+        self.cache.materialize_into_snapshot(self.store, snapshot_id, key, replace=replace)
+        data = self.store.load_response(snapshot_id, key)
+        meta = self.store.load_meta(snapshot_id, key) or {}
+        headers = _normalize_headers(meta.get("headers"))
+        self.store.mark_request(
+            snapshot_id,
+            key,
+            label=req.label,
+            path=req.path,
+            params=req.params,
+            status="cached",
+            quota=_quota_from_headers(headers),
+        )
+        return FetchResult(
+            data=data,
+            headers=headers,
+            status="cached",
+            key=key,
+            cache_level="global",
+        )
+
+    def _fetch_network(
+        self, *, snapshot_id: str, req: OddsRequest, key: str, fetcher
+    ) -> FetchResult:
         response: OddsResponse = fetcher()
         headers = _normalize_headers(response.headers)
         meta = {
@@ -165,13 +189,24 @@ class OddsRepository:
             "headers": headers,
             "fetched_at_utc": utc_now_str(),
         }
-        self.store.write_response(snapshot_id, key, response.data)
-        self.store.write_meta(snapshot_id, key, meta)
         self.cache.write_request(
             key, {"method": req.method, "path": req.path, "params": req.params}
         )
-        self.cache.write_response(key, response.data)
-        self.cache.write_meta(key, meta)
+        if response.raw:
+            # Keep the body verbatim: compress it once into the global cache and link
+            # it into the snapshot instead of re-encoding the decoded payload twice.
+            meta["response_sha256"] = response.sha256
+            meta["response_bytes"] = len(response.raw)
+            if response.payload_field:
+                meta["payload_field"] = response.payload_field
+            self.cache.write_raw_response(key, response.raw)
+            self.cache.write_meta(key, meta)
+            self.cache.materialize_into_snapshot(self.store, snapshot_id, key, replace=True)
+        else:
+            self.store.write_response(snapshot_id, key, response.data)
+            self.store.write_meta(snapshot_id, key, meta)
+            self.cache.write_response(key, response.data)
+            self.cache.write_meta(key, meta)
         self.store.append_usage(
             endpoint=req.path,
             request_key=key,
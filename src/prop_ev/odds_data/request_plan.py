@@ -0,0 +1,327 @@
+"""Credit-aware request planning for missing (event, market) odds cells.
+
+The Odds API bills ``markets x region-equivalents`` per call: the per-event endpoint
+charges that per event, while the featured endpoint charges it once for every event
+named in ``eventIds``. Given a dataset spec, the cells already held by cached responses
+and a credit budget, ``plan_requests`` picks the calls that cover every missing cell:
+
+- each event gets at most one per-event call, restricted to the markets it is missing,
+  so a partially cached event is never re-bought in full;
+- featured markets (h2h/spreads/totals) missing on any event are merged into a single
+  featured-endpoint call over all of those event IDs (live datasets only, because the
+  historical featured endpoint snapshots every event at one timestamp rather than at
+  each event's pre-tip time);
+- historical calls carry the 10x historical multiplier.
+
+Calls are ordered by cells covered per credit, and the plan keeps the longest prefix that
+fits the budget; the remainder is reported as deferred.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from prop_ev.odds_client import FEATURED_MARKETS, regions_equivalent
+from prop_ev.odds_data.cache_store import GlobalCacheStore
+from prop_ev.odds_data.spec import DatasetSpec
+from prop_ev.storage import SnapshotStore, request_hash
+
+HISTORICAL_ODDS_CREDIT_MULTIPLIER = 10
+ENDPOINT_EVENT_ODDS = "event_odds"
+ENDPOINT_FEATURED_ODDS = "featured_odds"
+
+
+def _region_params(spec: DatasetSpec) -> dict[str, Any]:
+    if spec.bookmakers:
+        return {"bookmakers": spec.bookmakers}
+    if spec.regions:
+        return {"regions": spec.regions}
+    return {}
+
+
+def event_odds_request(
+    spec: DatasetSpec,
+    event_id: str,
+    *,
+    markets: list[str] | tuple[str, ...],
+    historical_date: str | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """Return the path and params of a per-event odds call for ``markets``."""
+    if historical_date:
+        path = f"/historical/sports/{spec.sport_key}/events/{event_id}/odds"
+    else:
+        path = f"/sports/{spec.sport_key}/events/{event_id}/odds"
+    params: dict[str, Any] = {
+        "markets": ",".join(sorted(set(markets))),
+        "oddsFormat": spec.odds_format,
+        "dateFormat": spec.date_format,
+    }
+    params.update(_region_params(spec))
+    if spec.include_links:
+        params["includeLinks"] = "true"
+    if spec.include_sids:
+        params["includeSids"] = "true"
+    if historical_date:
+        params["date"] = historical_date
+    return path, params
+
+
+def featured_odds_request(
+    spec: DatasetSpec,
+    event_ids: list[str] | tuple[str, ...],
+    *,
+    markets: list[str] | tuple[str, ...],
+) -> tuple[str, dict[str, Any]]:
+    """Return the path and params of one featured odds call over ``event_ids``."""
+    params: dict[str, Any] = {
+        "markets": ",".join(sorted(set(markets))),
+        "oddsFormat": spec.odds_format,
+        "dateFormat": spec.date_format,
+    }
+    params.update(_region_params(spec))
+    if spec.include_links:
+        params["includeLinks"] = "true"
+    if spec.include_sids:
+        params["includeSids"] = "true"
+    params["eventIds"] = ",".join(sorted(set(event_ids)))
+    return f"/sports/{spec.sport_key}/odds", params
+
+
+@dataclass(frozen=True)
+class PlannedCall:
+    """One paid request and the (event, market) cells it fills."""
+
+    endpoint: str
+    path: str
+    params: dict[str, Any]
+    event_ids: tuple[str, ...]
+    markets: tuple[str, ...]
+    credits: int
+    historical_date: str = ""
+
+    @property
+    def cells(self) -> int:
+        return len(self.event_ids) * len(self.markets)
+
+    @property
+    def label(self) -> str:
+        if self.endpoint == ENDPOINT_FEATURED_ODDS:
+            return f"featured_odds:{len(self.event_ids)}"
+        return f"event_odds:{self.event_ids[0]}"
+
+    def key(self) -> str:
+        return request_hash("GET", self.path, self.params)
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """Calls that fit the budget, in execution order, plus the ones deferred past it."""
+
+    calls: tuple[PlannedCall, ...]
+    deferred: tuple[PlannedCall, ...]
+    missing_cells: int
+    cached_cells: int
+    budget: int | None
+
+    @property
+    def credits(self) -> int:
+        return sum(call.credits for call in self.calls)
+
+    @property
+    def total_credits(self) -> int:
+        """Credits needed to cover every missing cell, deferred calls included."""
+        return self.credits + sum(call.credits for call in self.deferred)
+
+    @property
+    def event_ids(self) -> list[str]:
+        """Events with at least one missing cell, in plan order."""
+        out: list[str] = []
+        for call in (*self.calls, *self.deferred):
+            out.extend(event_id for event_id in call.event_ids if event_id not in out)
+        return out
+
+    def describe(self) -> list[str]:
+        """Return printable plan lines: one summary line, then one line per call."""
+        budget = "none" if self.budget is None else str(self.budget)
+        lines = [
+            f"plan calls={len(self.calls)} deferred={len(self.deferred)} "
+            f"missing_cells={self.missing_cells} cached_cells={self.cached_cells} "
+            f"credits={self.credits} total_credits={self.total_credits} budget={budget}"
+        ]
+        for state, calls in (("planned", self.calls), ("deferred", self.deferred)):
+            for call in calls:
+                lines.append(
+                    "call state={} endpoint={} events={} markets={} credits={}{}".format(
+                        state,
+                        call.endpoint,
+                        ",".join(call.event_ids),
+                        ",".join(call.markets),
+                        call.credits,
+                        f" date={call.historical_date}" if call.historical_date else "",
+                    )
+                )
+        return lines
+
+
+def event_payload(payload: Any, event_id: str) -> dict[str, Any] | None:
+    """Return the event object for ``event_id`` from a per-event or featured payload."""
+    if isinstance(payload, dict):
+        return payload
+    if isinstance(payload, list):
+        for item in payload:
+            if isinstance(item, dict) and str(item.get("id", "")) == event_id:
+                return item
+    return None
+
+
+def cached_cells(
+    *,
+    store: SnapshotStore,
+    cache: GlobalCacheStore,
+    snapshot_id: str,
+    spec: DatasetSpec,
+    event_ids: list[str],
+    historical_dates: dict[str, str] | None = None,
+) -> dict[str, dict[str, str]]:
+    """Map event id -> market -> request key of a stored response that covers the cell.
+
+    The full-spec request for each event is checked first, then every request recorded in
+    the snapshot manifest whose path and non-market params match a planned call shape, so
+    cells filled by earlier market-subset or featured calls count as covered.
+    """
+    dates = historical_dates or {}
+    wanted = set(spec.markets)
+
+    def _present(key: str) -> bool:
+        return store.has_response(snapshot_id, key) or cache.has_response(key)
+
+    coverage: dict[str, dict[str, str]] = {event_id: {} for event_id in event_ids}
+    base_by_path: dict[str, tuple[str, dict[str, Any]]] = {}
+    for event_id in event_ids:
+        path, params = event_odds_request(
+            spec, event_id, markets=spec.markets, historical_date=dates.get(event_id)
+        )
+        key = request_hash("GET", path, params)
+        if _present(key):
+            coverage[event_id] = dict.fromkeys(sorted(wanted), key)
+        params.pop("markets")
+        base_by_path[path] = (event_id, params)
+
+    try:
+        manifest = store.load_manifest(snapshot_id)
+    except FileNotFoundError:
+        manifest = {}
+    requests = manifest.get("requests", {})
+    if not isinstance(requests, dict):
+        return coverage
+    featured_path, featured_base = featured_odds_request(spec, [], markets=[])
+    featured_base.pop("markets")
+    featured_base.pop("eventIds")
+    for key in sorted(requests):
+        row = requests[key]
+        if not isinstance(row, dict) or not isinstance(row.get("params"), dict):
+            continue
+        params = dict(row["params"])
+        markets = {item for item in str(params.pop("markets", "")).split(",") if item} & wanted
+        if not markets:
+            continue
+        path = str(row.get("path", ""))
+        if path in base_by_path:
+            event_id, base = base_by_path[path]
+            covered_events = [event_id] if params == base else []
+        elif path == featured_path and not spec.historical:
+            requested = str(params.pop("eventIds", "")).split(",")
+            covered_events = [item for item in requested if item in coverage]
+            if params != featured_base:
+                covered_events = []
+        else:
+            covered_events = []
+        if not covered_events or not _present(key):
+            continue
+        for event_id in covered_events:
+            for market in sorted(markets):
+                coverage[event_id].setdefault(market, key)
+    return coverage
+
+
+def plan_requests(
+    spec: DatasetSpec,
+    *,
+    event_ids: list[str],
+    coverage: dict[str, dict[str, str]] | None = None,
+    historical_dates: dict[str, str] | None = None,
+    budget: int | None = None,
+) -> RequestPlan:
+    """Choose the calls that cover every missing (event, market) cell of ``spec``."""
+    covered = coverage or {}
+    dates = historical_dates or {}
+    regions_factor = regions_equivalent(spec.regions, spec.bookmakers)
+    multiplier = HISTORICAL_ODDS_CREDIT_MULTIPLIER if spec.historical else 1
+    markets = sorted(set(spec.markets))
+    featured_markets = [] if spec.historical else [m for m in markets if m in FEATURED_MARKETS]
+
+    missing: dict[str, list[str]] = {}
+    cached = 0
+    for event_id in event_ids:
+        have = covered.get(event_id, {})
+        cached += sum(1 for market in markets if market in have)
+        missing[event_id] = [market for market in markets if market not in have]
+
+    calls: list[PlannedCall] = []
+    featured_events = [
+        event_id
+        for event_id in event_ids
+        if any(market in featured_markets for market in missing[event_id])
+    ]
+    if featured_events:
+        merged = sorted(
+            {m for event_id in featured_events for m in missing[event_id] if m in featured_markets}
+        )
+        path, params = featured_odds_request(spec, featured_events, markets=merged)
+        calls.append(
+            PlannedCall(
+                endpoint=ENDPOINT_FEATURED_ODDS,
+                path=path,
+                params=params,
+                event_ids=tuple(sorted(featured_events)),
+                markets=tuple(merged),
+                credits=len(merged) * regions_factor,
+            )
+        )
+    for event_id in event_ids:
+        event_markets = [m for m in missing[event_id] if m not in featured_markets]
+        if not event_markets:
+            continue
+        historical_date = dates.get(event_id, "")
+        path, params = event_odds_request(
+            spec, event_id, markets=event_markets, historical_date=historical_date or None
+        )
+        calls.append(
+            PlannedCall(
+                endpoint=ENDPOINT_EVENT_ODDS,
+                path=path,
+                params=params,
+                event_ids=(event_id,),
+                markets=tuple(event_markets),
+                credits=len(event_markets) * regions_factor * multiplier,
+                historical_date=historical_date,
+            )
+        )
+
+    # Stable sort: cheapest cells first, featured merges ahead of per-event calls.
+    calls.sort(key=lambda call: -call.cells / max(call.credits, 1))
+    fits = len(calls)
+    spent = 0
+    for idx, call in enumerate(calls):
+        if budget is not None and spent + call.credits > budget:
+            fits = idx
+            break
+        spent += call.credits
+    return RequestPlan(
+        calls=tuple(calls[:fits]),
+        deferred=tuple(calls[fits:]),
+        missing_cells=sum(len(items) for items in missing.values()),
+        cached_cells=cached,
+        budget=budget,
+    )
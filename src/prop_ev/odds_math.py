@@ -51,3 +51,18 @@ def ev_from_prob_and_price(probability: float | None, price: int | None) -> floa
     if decimal_odds is None or decimal_odds <= 1.0:
         return None
     return (probability * (decimal_odds - 1.0)) - (1.0 - probability)
+
+
+def ev_and_kelly(probability: float | None, price: int | None) -> tuple[float | None, float | None]:
+    """Return rounded 1-unit EV and full-Kelly stake fraction for one price."""
+    ev = ev_from_prob_and_price(probability, price)
+    if ev is None:
+        return None, None
+    decimal_odds = american_to_decimal(price)
+    if decimal_odds is None:
+        return None, None
+    profit_if_win = decimal_odds - 1.0
+    if profit_if_win <= 0:
+        return None, None
+    kelly = ev / profit_if_win
+    return round(ev, 6), round(kelly, 6)
@@ -0,0 +1,216 @@
+"""Process-wide adaptive pacing for Odds API requests.
+
+Every ``OddsAPIClient`` in a process shares one ``AdaptiveRateController``. Each HTTP
+attempt takes a slot from it, which enforces two AIMD-controlled limits:
+
+- a request rate (requests per second): raised additively after each success and cut
+  multiplicatively on a 429 (hard) or a 5xx (soft);
+- a concurrency window: grown by ``1/window`` per success (about one slot per round
+  trip) and halved on a 429.
+
+A ``Retry-After`` on a 429 holds every slot until it expires, and once
+``x-requests-remaining`` drops below ``low_quota_credits`` the window is clamped to one
+request so in-flight calls cannot overshoot the remaining quota. Per-endpoint latency and
+retry histograms are kept for ``stats()``.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def endpoint_label(path: str) -> str:
+    """Collapse per-event paths so histograms group by endpoint, not by event id."""
+    return re.sub(r"/events/[^/]+/", "/events/{event_id}/", "/" + path.lstrip("/"))
+
+
+def _parse_float(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@dataclass
+class _EndpointStats:
+    requests: int = 0
+    attempts: int = 0
+    throttled: int = 0
+    server_errors: int = 0
+    latency_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    retry_counts: dict[int, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        latency = {
+            f"le_{bound}": self.latency_counts[idx] for idx, bound in enumerate(LATENCY_BUCKETS_MS)
+        }
+        latency[f"gt_{LATENCY_BUCKETS_MS[-1]}"] = self.latency_counts[-1]
+        return {
+            "requests": self.requests,
+            "attempts": self.attempts,
+            "throttled": self.throttled,
+            "server_errors": self.server_errors,
+            "latency_ms": latency,
+            "retries": {str(key): self.retry_counts[key] for key in sorted(self.retry_counts)},
+        }
+
+
+class AdaptiveRateController:
+    """AIMD rate and concurrency limits shared by all Odds API requests in a process."""
+
+    def __init__(
+        self,
+        *,
+        initial_rate: float = 4.0,
+        min_rate: float = 0.25,
+        max_rate: float = 20.0,
+        rate_increase: float = 0.5,
+        initial_concurrency: float = 2.0,
+        max_concurrency: int = 8,
+        throttle_factor: float = 0.5,
+        error_factor: float = 0.8,
+        low_quota_credits: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_increase = rate_increase
+        self.max_concurrency = max_concurrency
+        self.throttle_factor = throttle_factor
+        self.error_factor = error_factor
+        self.low_quota_credits = low_quota_credits
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self._rate = max(min_rate, min(initial_rate, max_rate))
+        self._window = max(1.0, min(initial_concurrency, float(max_concurrency)))
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._hold_until = 0.0
+        self._remaining: float | None = None
+        self._stats: dict[str, _EndpointStats] = {}
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def concurrency(self) -> int:
+        if self._remaining is not None and self._remaining < self.low_quota_credits:
+            return 1
+        return int(self._window)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait for a free concurrency slot and the next paced start time."""
+        with self._cond:
+            while self._in_flight >= self.concurrency:
+                self._cond.wait()
+            self._in_flight += 1
+            now = self._clock()
+            start = max(now, self._next_start, self._hold_until)
+            self._next_start = start + 1.0 / self._rate
+        try:
+            if start > now:
+                self._sleep(start - now)
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def observe(
+        self,
+        path: str,
+        *,
+        status_code: int,
+        latency_s: float,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Feed one HTTP attempt back into the limits and the endpoint histograms."""
+        values = {str(key).lower(): str(value) for key, value in (headers or {}).items()}
+        with self._cond:
+            stats = self._stats.setdefault(endpoint_label(path), _EndpointStats())
+            stats.attempts += 1
+            latency_ms = max(0.0, latency_s * 1000.0)
+            bucket = next(
+                (idx for idx, bound in enumerate(LATENCY_BUCKETS_MS) if latency_ms <= bound),
+                len(LATENCY_BUCKETS_MS),
+            )
+            stats.latency_counts[bucket] += 1
+
+            remaining = _parse_float(values.get("x-requests-remaining"))
+            if remaining is not None:
+                self._remaining = remaining
+            if status_code == 429:
+                stats.throttled += 1
+                self._rate = max(self.min_rate, self._rate * self.throttle_factor)
+                self._window = max(1.0, self._window * self.throttle_factor)
+                retry_after = _parse_float(values.get("retry-after"))
+                if retry_after is not None and retry_after > 0:
+                    self._hold_until = max(self._hold_until, self._clock() + min(retry_after, 60.0))
+            elif status_code >= 500:
+                stats.server_errors += 1
+                self._rate = max(self.min_rate, self._rate * self.error_factor)
+            elif status_code < 400:
+                self._rate = min(self.max_rate, self._rate + self.rate_increase)
+                self._window = min(float(self.max_concurrency), self._window + 1.0 / self._window)
+            self._cond.notify_all()
+
+    def record_request(self, path: str, *, retries: int) -> None:
+        """Count one finished logical request and the retries it took."""
+        with self._cond:
+            stats = self._stats.setdefault(endpoint_label(path), _EndpointStats())
+            stats.requests += 1
+            stats.retry_counts[retries] = stats.retry_counts.get(retries, 0) + 1
+
+    def describe(self) -> list[str]:
+        """Return one printable line per endpoint with its non-empty histogram buckets."""
+        snapshot = self.stats()
+        lines: list[str] = []
+        for label, row in snapshot["endpoints"].items():
+            latency = ",".join(
+                f"{key}:{count}" for key, count in row["latency_ms"].items() if count
+            )
+            retries = ",".join(f"{key}:{count}" for key, count in row["retries"].items())
+            lines.append(
+                f"odds_rate endpoint={label} requests={row['requests']} "
+                f"attempts={row['attempts']} throttled={row['throttled']} "
+                f"server_errors={row['server_errors']} latency_ms={latency} retries={retries} "
+                f"rate_per_s={snapshot['rate_per_s']} concurrency={snapshot['concurrency']}"
+            )
+        return lines
+
+    def stats(self) -> dict[str, Any]:
+        """Return current limits plus latency and retry histograms per endpoint."""
+        with self._cond:
+            return {
+                "rate_per_s": round(self._rate, 3),
+                "concurrency": self.concurrency,
+                "remaining_credits": self._remaining,
+                "endpoints": {label: self._stats[label].as_dict() for label in sorted(self._stats)},
+            }
+
+
+_RATE_CONTROLLER: AdaptiveRateController | None = None
+_RATE_CONTROLLER_LOCK = threading.Lock()
+
+
+def rate_controller() -> AdaptiveRateController:
+    """Return the controller shared by every Odds API client in this process."""
+    global _RATE_CONTROLLER
+    with _RATE_CONTROLLER_LOCK:
+        if _RATE_CONTROLLER is None:
+            _RATE_CONTROLLER = AdaptiveRateController()
+        return _RATE_CONTROLLER
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
 from shutil import copy2
@@ -10,37 +12,30 @@ from typing import Any
 from zoneinfo import ZoneInfo
 
 from prop_ev.brief_builder import (
-    append_game_cards_section,
     build_analyst_synthesis_prompt,
     build_analyst_web_prompt,
+    build_brief_document,
     build_brief_input,
     build_pass1_prompt,
     build_pass2_prompt,
     default_analyst_take,
     default_pass1,
-    enforce_p_hit_notes,
-    enforce_readability_labels,
-    enforce_snapshot_dates_et,
-    enforce_snapshot_mode_labels,
-    ensure_pagebreak_before_action_plan,
     extract_json_object,
     merge_analyst_take_sources,
-    move_disclosures_to_end,
     normalize_pass2_markdown,
     render_analyst_take_section,
     render_fallback_markdown,
     sanitize_analyst_take,
     sanitize_pass1,
-    strip_empty_go_placeholder_rows,
-    strip_risks_and_watchouts_section,
-    strip_tier_b_view_section,
-    upsert_action_plan_table,
-    upsert_analyst_take_section,
-    upsert_best_available_section,
 )
 from prop_ev.budget import current_month_utc, llm_budget_status, odds_budget_status
 from prop_ev.calibration_map import annotate_strategy_report_with_calibration_map
-from prop_ev.latex_renderer import cleanup_latex_artifacts, render_pdf_from_markdown
+from prop_ev.data_paths import resolve_runtime_root
+from prop_ev.latex_renderer import (
+    cleanup_latex_artifacts,
+    render_cache_dir,
+    render_pdf_from_markdown,
+)
 from prop_ev.llm_client import (
     LLMBudgetExceededError,
     LLMClient,
@@ -264,69 +259,45 @@ def _publish_latest(
     return published
 
 
-def generate_brief_for_snapshot(
+_BriefTask = tuple[tuple[str, ...], Callable[[dict[str, Any]], Any]]
+
+
+def _run_task_graph(tasks: dict[str, _BriefTask]) -> dict[str, Any]:
+    """Run each task as soon as its dependencies finish; independent tasks run together.
+
+    A task is ``(dependencies, fn)``; ``fn`` receives the results finished so far, keyed by
+    task name. Model calls are I/O bound, so threads are enough to overlap them.
+    """
+    results: dict[str, Any] = {}
+    pending = dict(tasks)
+    with ThreadPoolExecutor(max_workers=max(1, len(tasks))) as pool:
+        running: dict[Future[Any], str] = {}
+        while pending or running:
+            ready = [
+                name for name, (deps, _) in pending.items() if all(dep in results for dep in deps)
+            ]
+            for name in ready:
+                _, fn = pending.pop(name)
+                running[pool.submit(fn, dict(results))] = name
+            if not running:
+                raise ValueError(f"unsatisfiable brief task dependencies: {sorted(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    return results
+
+
+def _run_pass1(
+    llm: LLMClient,
     *,
-    store: SnapshotStore,
-    settings: Settings,
+    brief_input: dict[str, Any],
     snapshot_id: str,
-    top_n: int,
+    model: str,
     llm_refresh: bool,
     llm_offline: bool,
-    per_game_top_n: int = 5,
-    game_card_min_ev: float = 0.01,
-    month: str | None = None,
-    strategy_report_path: Path | None = None,
-    calibration_map_path: Path | None = None,
-    write_markdown: bool = False,
-    keep_tex: bool = False,
-) -> dict[str, Any]:
-    """Generate optional markdown plus PDF brief artifacts for one snapshot."""
-    reports_dir = snapshot_reports_dir(store, snapshot_id)
-    reports_dir.mkdir(parents=True, exist_ok=True)
-
-    strategy_json_path = (
-        Path(strategy_report_path).expanduser()
-        if strategy_report_path is not None
-        else (reports_dir / "strategy-report.json")
-    )
-    if not strategy_json_path.exists():
-        raise FileNotFoundError(f"missing strategy report: {strategy_json_path}")
-
-    strategy_report = _load_json(strategy_json_path)
-    calibration_map_applied = False
-    resolved_calibration_map_path = (
-        Path(calibration_map_path).expanduser()
-        if calibration_map_path is not None
-        else (reports_dir / "backtest-calibration-map.json")
-    )
-    if resolved_calibration_map_path.exists():
-        try:
-            calibration_map_payload = _load_json(resolved_calibration_map_path)
-        except (OSError, ValueError, json.JSONDecodeError):
-            calibration_map_payload = {}
-        if calibration_map_payload:
-            strategy_report = annotate_strategy_report_with_calibration_map(
-                report=strategy_report,
-                calibration_map=calibration_map_payload,
-            )
-            calibration_map_applied = True
-    brief_input = build_brief_input(
-        strategy_report,
-        top_n=top_n,
-        per_game_top_n=per_game_top_n,
-        game_card_min_ev=game_card_min_ev,
-    )
-    brief_input_path = _write_json(reports_dir / "brief-input.json", brief_input)
-
-    llm = LLMClient(settings=settings, data_root=store.root)
-    model = settings.openai_model
-    month_key = month or current_month_utc()
-
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Structured pass1 JSON with retries; deterministic default when every attempt fails."""
     pass1 = default_pass1(brief_input)
-    pass1_meta: dict[str, Any] = {"status": "fallback", "reason": "deterministic_default"}
-    pass2_text = ""
-    pass2_meta: dict[str, Any] = {"status": "fallback", "reason": "deterministic_default"}
-
     pass1_prompt = build_pass1_prompt(brief_input)
     pass1_payload = {
         "brief_input": brief_input,
@@ -394,6 +365,7 @@ def generate_brief_for_snapshot(
             pass1_errors.append(f"attempt_{idx + 1}:{exc}")
             continue
 
+    pass1_meta: dict[str, Any]
     if pass1_result is not None:
         pass1_meta = {
             "status": "ok",
@@ -410,9 +382,21 @@ def generate_brief_for_snapshot(
             "attempts": pass1_attempts_run,
             "errors": pass1_errors,
         }
+    return pass1, pass1_meta
 
-    pass1_path = _write_json(reports_dir / "brief-pass1.json", pass1)
 
+def _run_pass2(
+    llm: LLMClient,
+    *,
+    brief_input: dict[str, Any],
+    pass1: dict[str, Any],
+    snapshot_id: str,
+    model: str,
+    llm_refresh: bool,
+    llm_offline: bool,
+) -> tuple[str, dict[str, Any]]:
+    """Markdown pass2 text with retries; empty text means the fallback renderer is used."""
+    pass2_text = ""
     pass2_prompt = build_pass2_prompt(brief_input, pass1)
     pass2_payload = {
         "brief_input": brief_input,
@@ -467,6 +451,7 @@ def generate_brief_for_snapshot(
             pass2_errors.append(f"attempt_{idx + 1}:{exc}")
             continue
 
+    pass2_meta: dict[str, Any]
     if pass2_result is not None:
         pass2_meta = {
             "status": "ok",
@@ -483,10 +468,22 @@ def generate_brief_for_snapshot(
             "attempts": pass2_attempts_run,
             "errors": pass2_errors,
         }
+    return pass2_text, pass2_meta
+
 
+def _run_analyst(
+    llm: LLMClient,
+    *,
+    brief_input: dict[str, Any],
+    pass1: dict[str, Any],
+    snapshot_id: str,
+    model: str,
+    llm_refresh: bool,
+    llm_offline: bool,
+) -> tuple[dict[str, Any], str, dict[str, Any]]:
+    """Web-search analyst take, with a synthesis call when the web pass returns no JSON."""
     analyst_take = default_analyst_take(brief_input, pass1)
     analyst_mode = "deterministic_fallback"
-    analyst_meta: dict[str, Any] = {"status": "fallback", "reason": "deterministic_default"}
     analyst_prompt = build_analyst_web_prompt(brief_input, pass1)
     analyst_payload = {
         "brief_input": brief_input,
@@ -592,6 +589,7 @@ def generate_brief_for_snapshot(
             analyst_errors.append(f"attempt_{idx + 1}:{exc}")
             continue
 
+    analyst_meta: dict[str, Any]
     if analyst_result is not None:
         analyst_meta = {
             "status": "ok",
@@ -611,7 +609,92 @@ def generate_brief_for_snapshot(
             "attempts": analyst_attempts_run,
             "errors": analyst_errors,
         }
+    return analyst_take, analyst_mode, analyst_meta
 
+
+def generate_brief_for_snapshot(
+    *,
+    store: SnapshotStore,
+    settings: Settings,
+    snapshot_id: str,
+    top_n: int,
+    llm_refresh: bool,
+    llm_offline: bool,
+    per_game_top_n: int = 5,
+    game_card_min_ev: float = 0.01,
+    month: str | None = None,
+    strategy_report_path: Path | None = None,
+    calibration_map_path: Path | None = None,
+    write_markdown: bool = False,
+    keep_tex: bool = False,
+) -> dict[str, Any]:
+    """Generate optional markdown plus PDF brief artifacts for one snapshot."""
+    reports_dir = snapshot_reports_dir(store, snapshot_id)
+    reports_dir.mkdir(parents=True, exist_ok=True)
+
+    strategy_json_path = (
+        Path(strategy_report_path).expanduser()
+        if strategy_report_path is not None
+        else (reports_dir / "strategy-report.json")
+    )
+    if not strategy_json_path.exists():
+        raise FileNotFoundError(f"missing strategy report: {strategy_json_path}")
+
+    strategy_report = _load_json(strategy_json_path)
+    calibration_map_applied = False
+    resolved_calibration_map_path = (
+        Path(calibration_map_path).expanduser()
+        if calibration_map_path is not None
+        else (reports_dir / "backtest-calibration-map.json")
+    )
+    if resolved_calibration_map_path.exists():
+        try:
+            calibration_map_payload = _load_json(resolved_calibration_map_path)
+        except (OSError, ValueError, json.JSONDecodeError):
+            calibration_map_payload = {}
+        if calibration_map_payload:
+            strategy_report = annotate_strategy_report_with_calibration_map(
+                report=strategy_report,
+                calibration_map=calibration_map_payload,
+            )
+            calibration_map_applied = True
+    brief_input = build_brief_input(
+        strategy_report,
+        top_n=top_n,
+        per_game_top_n=per_game_top_n,
+        game_card_min_ev=game_card_min_ev,
+    )
+    brief_input_path = _write_json(reports_dir / "brief-input.json", brief_input)
+
+    llm = LLMClient(settings=settings, data_root=store.root)
+    model = settings.openai_model
+    month_key = month or current_month_utc()
+
+    llm_args: dict[str, Any] = {
+        "brief_input": brief_input,
+        "snapshot_id": snapshot_id,
+        "model": model,
+        "llm_refresh": llm_refresh,
+        "llm_offline": llm_offline,
+    }
+    # pass2 and the analyst pass only depend on pass1, so they run concurrently.
+    stages = _run_task_graph(
+        {
+            "pass1": ((), lambda done: _run_pass1(llm, **llm_args)),
+            "pass2": (
+                ("pass1",),
+                lambda done: _run_pass2(llm, pass1=done["pass1"][0], **llm_args),
+            ),
+            "analyst": (
+                ("pass1",),
+                lambda done: _run_analyst(llm, pass1=done["pass1"][0], **llm_args),
+            ),
+        }
+    )
+    pass1, pass1_meta = stages["pass1"]
+    pass2_text, pass2_meta = stages["pass2"]
+    analyst_take, analyst_mode, analyst_meta = stages["analyst"]
+    pass1_path = _write_json(reports_dir / "brief-pass1.json", pass1)
     analyst_path = _write_json(reports_dir / "brief-analyst.json", analyst_take)
 
     fallback_md = render_fallback_markdown(
@@ -619,29 +702,20 @@ def generate_brief_for_snapshot(
         pass1=pass1,
         source_label="deterministic" if pass2_meta.get("status") != "ok" else "llm",
     )
-    markdown = normalize_pass2_markdown(pass2_text, fallback_md)
-    markdown = strip_risks_and_watchouts_section(markdown)
-    markdown = strip_tier_b_view_section(markdown)
-    markdown = strip_empty_go_placeholder_rows(markdown)
-    markdown = enforce_readability_labels(markdown, top_n=top_n)
-    markdown = upsert_action_plan_table(markdown, brief_input=brief_input, top_n=top_n)
     analyst_section = render_analyst_take_section(
         analyst_take,
         mode=analyst_mode,
         brief_input=brief_input,
     )
-    markdown = upsert_analyst_take_section(markdown, analyst_section)
-    markdown = upsert_best_available_section(markdown, brief_input=brief_input)
-    markdown = ensure_pagebreak_before_action_plan(markdown)
-    markdown = append_game_cards_section(markdown, brief_input=brief_input)
-    markdown = move_disclosures_to_end(markdown)
-    markdown = enforce_p_hit_notes(markdown)
-    markdown = enforce_snapshot_mode_labels(
-        markdown,
+    document = build_brief_document(
+        normalize_pass2_markdown(pass2_text, fallback_md),
+        brief_input=brief_input,
+        top_n=top_n,
+        analyst_section_markdown=analyst_section,
         llm_pass1_status=str(pass1_meta.get("status", "")),
         llm_pass2_status=str(pass2_meta.get("status", "")),
     )
-    markdown = enforce_snapshot_dates_et(markdown, brief_input=brief_input)
+    markdown = document.to_markdown()
     markdown_path: Path | None = None
     if write_markdown:
         markdown_path = reports_dir / "strategy-brief.md"
@@ -650,11 +724,12 @@ def generate_brief_for_snapshot(
     tex_path = reports_dir / "strategy-brief.tex"
     pdf_path = reports_dir / "strategy-brief.pdf"
     pdf_result = render_pdf_from_markdown(
-        markdown,
+        document,
         tex_path=tex_path,
         pdf_path=pdf_path,
         title="NBA Strategy Brief",
         landscape=True,
+        cache_dir=render_cache_dir(resolve_runtime_root(store.root)),
     )
     cleanup_latex_artifacts(tex_path=tex_path, keep_tex=keep_tex)
 
@@ -60,6 +60,9 @@ FEATURED_ODDS_SORT_COLUMNS: tuple[str, ...] = (
 )
 
 
+_FLOAT_SORT_COLUMNS = frozenset({"point", "price"})
+
+
 class QuoteTableContractError(ValueError):
     """Raised when rows fail canonical quote-table validation."""
 
@@ -86,11 +89,6 @@ def _float_or_none(value: Any) -> float | None:
     return parsed
 
 
-def _float_sort_token(value: Any) -> str:
-    parsed = _float_or_none(value)
-    return "" if parsed is None else f"{parsed:.12g}"
-
-
 def _schema_version_value(value: Any) -> int:
     try:
         parsed = int(value)
@@ -99,29 +97,24 @@ def _schema_version_value(value: Any) -> int:
     return parsed if parsed > 0 else QUOTE_TABLE_SCHEMA_VERSION
 
 
-def _event_props_sort_key(row: Mapping[str, Any]) -> tuple[str, ...]:
-    return (
-        _text(row.get("event_id", "")),
-        _text(row.get("player", "")),
-        _text(row.get("market", "")),
-        _float_sort_token(row.get("point")),
-        _text(row.get("side", "")),
-        _text(row.get("book", "")),
-        _float_sort_token(row.get("price")),
-        _text(row.get("last_update", "")),
-    )
-
+def _typed_sort(rows: list[dict[str, Any]], columns: tuple[str, ...]) -> list[dict[str, Any]]:
+    """Stable sort of canonical rows on typed columns (text, or float with nulls first)."""
+    if len(rows) < 2:
+        return rows
+    import polars as pl
 
-def _featured_odds_sort_key(row: Mapping[str, Any]) -> tuple[str, ...]:
-    return (
-        _text(row.get("game_id", "")),
-        _text(row.get("market", "")),
-        _float_sort_token(row.get("point")),
-        _text(row.get("side", "")),
-        _text(row.get("book", "")),
-        _float_sort_token(row.get("price")),
-        _text(row.get("last_update", "")),
-    )
+    frame = pl.DataFrame(
+        {
+            column: pl.Series(
+                column,
+                [row[column] for row in rows],
+                dtype=pl.Float64 if column in _FLOAT_SORT_COLUMNS else pl.Utf8,
+            )
+            for column in columns
+        }
+    ).with_row_index("_row")
+    order = frame.sort(list(columns), nulls_last=False, maintain_order=True)["_row"]
+    return [rows[index] for index in order.to_list()]
 
 
 def canonical_event_props_row(
@@ -200,8 +193,12 @@ def canonicalize_event_props_rows(rows: list[dict[str, Any]]) -> list[dict[str,
         )
         for row in rows
     ]
-    canonical.sort(key=_event_props_sort_key)
-    return canonical
+    return _typed_sort(canonical, EVENT_PROPS_SORT_COLUMNS)
+
+
+def sort_event_props_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order rows already built by ``canonical_event_props_row`` canonically."""
+    return _typed_sort(rows, EVENT_PROPS_SORT_COLUMNS)
 
 
 def canonicalize_featured_odds_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -220,8 +217,12 @@ def canonicalize_featured_odds_rows(rows: list[dict[str, Any]]) -> list[dict[str
         )
         for row in rows
     ]
-    canonical.sort(key=_featured_odds_sort_key)
-    return canonical
+    return _typed_sort(canonical, FEATURED_ODDS_SORT_COLUMNS)
+
+
+def sort_featured_odds_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order rows already built by ``canonical_featured_odds_row`` canonically."""
+    return _typed_sort(rows, FEATURED_ODDS_SORT_COLUMNS)
 
 
 def _require_columns(
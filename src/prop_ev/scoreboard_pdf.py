@@ -283,12 +283,13 @@ def render_aggregate_scoreboard_pdf(
     tex_path: Path,
     pdf_path: Path,
     keep_tex: bool,
+    cache_dir: Path | None = None,
 ) -> dict[str, Any]:
     """Write scoreboard TeX and compile PDF with best-effort cleanup."""
     tex_path.parent.mkdir(parents=True, exist_ok=True)
     tex_path.write_text(render_aggregate_scoreboard_latex(analysis_payload), encoding="utf-8")
 
-    compile_result = compile_pdf(tex_path=tex_path, pdf_path=pdf_path)
+    compile_result = compile_pdf(tex_path=tex_path, pdf_path=pdf_path, cache_dir=cache_dir)
     status = str(compile_result.get("status", "")).strip() or "failed"
     retain_tex = bool(keep_tex) or status != "ok"
     cleanup_latex_artifacts(tex_path=tex_path, keep_tex=retain_tex)
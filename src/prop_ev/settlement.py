@@ -15,6 +15,7 @@ from prop_ev.nba_data.context_cache import now_utc
 from prop_ev.nba_data.normalize import canonical_team_name, normalize_person_name
 from prop_ev.nba_data.repo import NBARepository
 from prop_ev.nba_data.source_policy import ResultsSourceMode, normalize_results_source_mode
+from prop_ev.util.jsonl import read_jsonl
 from prop_ev.util.parsing import safe_float as _safe_float
 
 RESULTS_SOURCE = "nba_results"
@@ -77,16 +78,7 @@ def _safe_int(value: Any) -> int | None:
 def _load_jsonl(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"missing backtest seed file: {path}")
-    rows: list[dict[str, Any]] = []
-    for idx, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        raw = line.strip()
-        if not raw:
-            continue
-        payload = json.loads(raw)
-        if not isinstance(payload, dict):
-            raise ValueError(f"invalid jsonl row in {path}:{idx}")
-        rows.append(payload)
-    return rows
+    return read_jsonl(path, strict=True)
 
 
 def _row_teams(row: dict[str, Any]) -> tuple[str, str]:
@@ -728,6 +720,7 @@ def settle_snapshot(
     output_suffix: str = "",
     seed_rows_override: list[dict[str, Any]] | None = None,
     strategy_report_path: str = "",
+    render_cache_dir: Path | None = None,
 ) -> dict[str, Any]:
     """Settle snapshot seed tickets and write report artifacts."""
     seed_rows = seed_rows_override if seed_rows_override is not None else _load_jsonl(seed_path)
@@ -827,6 +820,7 @@ def settle_snapshot(
             pdf_path=pdf_path,
             title="Settlement",
             landscape=True,
+            cache_dir=render_cache_dir,
         )
         cleanup_latex_artifacts(tex_path=tex_path, keep_tex=keep_tex)
     if write_csv:
@@ -0,0 +1,309 @@
+"""Vectorized same-game parlay (SGP) candidate scoring.
+
+Legs are grouped by event, the best legs per event are kept with a bounded top-k, and
+every same-game pair (or triple) is scored at once with NumPy. The correlation haircut
+comes from an ``SGPCorrelationModel``: structural rules for same-player and same-team
+stacked overs, then a matrix keyed by ``(market, side)`` pairs. The default model
+reproduces the original fixed haircut table.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import TYPE_CHECKING, Any
+
+from prop_ev.odds_math import american_to_decimal, decimal_to_american, ev_and_kelly
+from prop_ev.util.parsing import safe_float as _safe_float
+from prop_ev.util.parsing import to_price as _to_price
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MarketSide = tuple[str, str]
+
+DEFAULT_SGP_MAX_LEGS_PER_EVENT = 8
+DEFAULT_VOLATILE_MARKETS: frozenset[str] = frozenset(
+    {"player_points", "player_assists", "player_points_rebounds_assists"}
+)
+
+
+@dataclass(frozen=True)
+class SGPCorrelationModel:
+    """Correlation haircuts applied to the independence joint probability.
+
+    ``pair_haircuts`` overrides the matrix entry for specific ``(market, side)`` pairs;
+    keys are unordered, so ``(a, b)`` and ``(b, a)`` are the same entry.
+    """
+
+    same_player: float = 0.15
+    same_team_overs: float = 0.12
+    volatile_market: float = 0.08
+    default: float = 0.05
+    volatile_markets: frozenset[str] = DEFAULT_VOLATILE_MARKETS
+    pair_haircuts: Mapping[tuple[MarketSide, MarketSide], float] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> SGPCorrelationModel:
+        """Build a model from a JSON-style mapping.
+
+        ``pairs`` is a list of ``{"a": [market, side], "b": [market, side], "haircut": x}``.
+        """
+        pairs: dict[tuple[MarketSide, MarketSide], float] = {}
+        raw_pairs = payload.get("pairs", [])
+        for item in raw_pairs if isinstance(raw_pairs, list) else []:
+            if not isinstance(item, Mapping):
+                continue
+            a = item.get("a")
+            b = item.get("b")
+            haircut = _safe_float(item.get("haircut"))
+            if not (isinstance(a, list | tuple) and isinstance(b, list | tuple)) or haircut is None:
+                continue
+            if len(a) != 2 or len(b) != 2:
+                continue
+            key_a = (str(a[0]), str(a[1]))
+            key_b = (str(b[0]), str(b[1]))
+            pairs[_pair_key(key_a, key_b)] = haircut
+        defaults = cls()
+        volatile = payload.get("volatile_markets")
+        return cls(
+            same_player=_payload_float(payload, "same_player", defaults.same_player),
+            same_team_overs=_payload_float(payload, "same_team_overs", defaults.same_team_overs),
+            volatile_market=_payload_float(payload, "volatile_market", defaults.volatile_market),
+            default=_payload_float(payload, "default", defaults.default),
+            volatile_markets=(
+                frozenset(str(item) for item in volatile)
+                if isinstance(volatile, list)
+                else defaults.volatile_markets
+            ),
+            pair_haircuts=pairs,
+        )
+
+    def pair_haircut(self, a: MarketSide, b: MarketSide) -> float:
+        """Return the matrix entry for two ``(market, side)`` legs."""
+        override = self.pair_haircuts.get(_pair_key(a, b))
+        if override is not None:
+            return float(override)
+        if a[0] in self.volatile_markets or b[0] in self.volatile_markets:
+            return self.volatile_market
+        return self.default
+
+    def matrix(self, keys: list[MarketSide]) -> np.ndarray:
+        """Return the symmetric haircut matrix over ``keys``."""
+        import numpy as np
+
+        size = len(keys)
+        out = np.empty((size, size), dtype=np.float64)
+        for i in range(size):
+            for j in range(i, size):
+                out[i, j] = out[j, i] = self.pair_haircut(keys[i], keys[j])
+        return out
+
+    def haircut(self, legs: list[dict[str, Any]]) -> float:
+        """Return the haircut for one combination of leg rows."""
+        if not legs:
+            return 0.0
+        players = [str(leg.get("player", "")) for leg in legs]
+        teams = [str(leg.get("player_team", "")) for leg in legs]
+        sides = [str(leg.get("recommended_side", "")) for leg in legs]
+        if len(set(players)) < len(players):
+            return self.same_player
+        if len(set(teams)) == 1 and all(side == "over" for side in sides):
+            return self.same_team_overs
+        keys = [(str(leg.get("market", "")), side) for leg, side in zip(legs, sides, strict=True)]
+        if len(keys) == 1:
+            return self.pair_haircut(keys[0], keys[0])
+        return max(self.pair_haircut(a, b) for a, b in combinations(keys, 2))
+
+
+DEFAULT_SGP_CORRELATION = SGPCorrelationModel()
+
+
+def _pair_key(a: MarketSide, b: MarketSide) -> tuple[MarketSide, MarketSide]:
+    return (a, b) if a <= b else (b, a)
+
+
+def _payload_float(payload: Mapping[str, Any], key: str, default: float) -> float:
+    value = _safe_float(payload.get(key))
+    return default if value is None else value
+
+
+def _codes(values: list[str]) -> np.ndarray:
+    import numpy as np
+
+    lookup: dict[str, int] = {}
+    return np.array([lookup.setdefault(value, len(lookup)) for value in values], dtype=np.int64)
+
+
+def _top_legs(rows: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    # nsmallest is stable, so ties keep input order exactly like sorted(...)[:limit].
+    return heapq.nsmallest(limit, rows, key=lambda row: -(row.get("best_ev") or -999.0))
+
+
+def _combo_indices(size: int, legs_per_combo: int) -> np.ndarray:
+    import numpy as np
+
+    if legs_per_combo == 2:
+        first, second = np.triu_indices(size, k=1)
+        return np.stack([first, second], axis=1)
+    combos = list(combinations(range(size), legs_per_combo))
+    if not combos:
+        return np.empty((0, legs_per_combo), dtype=np.int64)
+    return np.array(combos, dtype=np.int64)
+
+
+def _score_event(
+    rows: list[dict[str, Any]],
+    *,
+    legs_per_combo: int,
+    correlation: SGPCorrelationModel,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Score every combination in one event; returns (combos, indep, haircut, adj, decimal)."""
+    import numpy as np
+
+    p_hit = np.array(
+        [np.nan if (p := _safe_float(row.get("model_p_hit"))) is None else p for row in rows],
+        dtype=np.float64,
+    )
+    prices = [american_to_decimal(_to_price(row.get("selected_price"))) for row in rows]
+    decimal = np.array([np.nan if d is None else d for d in prices], dtype=np.float64)
+    combos = _combo_indices(len(rows), legs_per_combo)
+    if not combos.size:
+        return None
+    valid = ~(np.isnan(p_hit) | np.isnan(decimal))
+    combos = combos[valid[combos].all(axis=1)]
+    if not combos.size:
+        return None
+
+    sides = [str(row.get("recommended_side", "")) for row in rows]
+    keys = [(str(row.get("market", "")), side) for row, side in zip(rows, sides, strict=True)]
+    key_codes = _codes([f"{market}\x1f{side}" for market, side in keys])
+    unique_keys: dict[int, MarketSide] = {}
+    for code, key in zip(key_codes.tolist(), keys, strict=True):
+        unique_keys.setdefault(code, key)
+    matrix = correlation.matrix([unique_keys[code] for code in range(len(unique_keys))])
+    player_codes = _codes([str(row.get("player", "")) for row in rows])
+    team_codes = _codes([str(row.get("player_team", "")) for row in rows])
+    is_over = np.array([side == "over" for side in sides], dtype=bool)
+
+    combo_keys = key_codes[combos]
+    combo_players = player_codes[combos]
+    combo_teams = team_codes[combos]
+    pair_cols = list(combinations(range(legs_per_combo), 2))
+    haircut = np.max(
+        np.stack([matrix[combo_keys[:, a], combo_keys[:, b]] for a, b in pair_cols], axis=1),
+        axis=1,
+    )
+    same_player = np.zeros(len(combos), dtype=bool)
+    for a, b in pair_cols:
+        same_player |= combo_players[:, a] == combo_players[:, b]
+    same_team_overs = (combo_teams == combo_teams[:, :1]).all(axis=1) & is_over[combos].all(axis=1)
+    haircut = np.where(
+        same_player,
+        correlation.same_player,
+        np.where(same_team_overs, correlation.same_team_overs, haircut),
+    )
+
+    indep = np.prod(p_hit[combos], axis=1)
+    adjusted = indep * (1.0 - haircut)
+    decimal_combo = np.prod(decimal[combos], axis=1)
+    return combos, indep, haircut, adjusted, decimal_combo
+
+
+def _bounded_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, ordered descending with ties in input order."""
+    import numpy as np
+
+    if k <= 0 or not scores.size:
+        return np.empty(0, dtype=np.int64)
+    if k < scores.size:
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[: k - above.size]
+        chosen = np.concatenate([above, ties])
+    else:
+        chosen = np.arange(scores.size)
+    return chosen[np.lexsort((chosen, -scores[chosen]))]
+
+
+def build_sgp_candidates(
+    eligible_rows: list[dict[str, Any]],
+    top_n: int,
+    *,
+    max_legs_per_event: int = DEFAULT_SGP_MAX_LEGS_PER_EVENT,
+    legs_per_combo: int = 2,
+    correlation: SGPCorrelationModel | None = None,
+) -> list[dict[str, Any]]:
+    """Return the ``top_n`` same-game combinations ranked by EV per 100."""
+    import numpy as np
+
+    if legs_per_combo not in {2, 3}:
+        raise ValueError("legs_per_combo must be 2 or 3")
+    model = correlation or DEFAULT_SGP_CORRELATION
+    by_event: dict[str, list[dict[str, Any]]] = {}
+    for row in eligible_rows:
+        if not isinstance(row, dict):
+            continue
+        event_id = str(row.get("event_id", ""))
+        if not event_id:
+            continue
+        by_event.setdefault(event_id, []).append(row)
+
+    event_legs: list[list[dict[str, Any]]] = []
+    parts: list[tuple[np.ndarray, ...]] = []
+    for rows in by_event.values():
+        legs = _top_legs(rows, max(0, max_legs_per_event))
+        scored = _score_event(legs, legs_per_combo=legs_per_combo, correlation=model)
+        if scored is None:
+            continue
+        combos = scored[0]
+        event_index = np.full(len(combos), len(event_legs), dtype=np.int64)
+        event_legs.append(legs)
+        parts.append((event_index, *scored))
+    if not parts:
+        return []
+
+    event_index = np.concatenate([part[0] for part in parts])
+    combos = np.concatenate([part[1] for part in parts])
+    indep = np.concatenate([part[2] for part in parts])
+    haircut = np.concatenate([part[3] for part in parts])
+    adjusted = np.concatenate([part[4] for part in parts])
+    decimal_combo = np.concatenate([part[5] for part in parts])
+    ev = adjusted * (decimal_combo - 1.0) - (1.0 - adjusted)
+
+    candidates: list[dict[str, Any]] = []
+    for idx in _bounded_top_k(np.round(ev * 100.0, 3), top_n).tolist():
+        legs = [event_legs[int(event_index[idx])][int(i)] for i in combos[idx].tolist()]
+        adj_p = float(adjusted[idx])
+        combo_decimal = float(decimal_combo[idx])
+        american_combo = decimal_to_american(combo_decimal)
+        _, quarter_kelly = ev_and_kelly(adj_p, american_combo)
+        candidates.append(
+            {
+                "event_id": str(legs[0].get("event_id", "")),
+                "game": str(legs[0].get("game", "")),
+                "legs": [
+                    {
+                        "player": str(leg.get("player", "")),
+                        "market": str(leg.get("market", "")),
+                        "point": leg.get("point"),
+                        "side": str(leg.get("recommended_side", "")),
+                        "price": leg.get("selected_price"),
+                        "p_hit": _safe_float(leg.get("model_p_hit")),
+                    }
+                    for leg in legs
+                ],
+                "independence_joint_p": round(float(indep[idx]), 6),
+                "haircut": round(float(haircut[idx]), 4),
+                "adjusted_joint_p": round(adj_p, 6),
+                "unboosted_decimal": round(combo_decimal, 6),
+                "unboosted_american": american_combo,
+                "ev_per_100": round(float(ev[idx]) * 100.0, 3),
+                "recommended_fractional_kelly": (
+                    round((quarter_kelly / 2.0), 6) if quarter_kelly is not None else None
+                ),
+            }
+        )
+    return candidates
@@ -0,0 +1,142 @@
+"""Per-event slate line summary derived once per snapshot.
+
+``snapshot slate`` writes ``derived/slate_lines.jsonl`` next to ``featured_odds.jsonl``:
+one row per event with the teams, tip time, consensus (median) home spread and total.
+Strategy runs, health checks and the briefs built from their reports read this table
+instead of re-aggregating raw featured-odds rows on every run.
+"""
+
+from __future__ import annotations
+
+from statistics import median
+from typing import Any
+
+from prop_ev.nba_data.normalize import canonical_team_name
+from prop_ev.storage import SnapshotStore
+from prop_ev.util.jsonl import read_jsonl
+from prop_ev.util.parsing import safe_float as _safe_float
+
+SLATE_LINES_FILENAME = "slate_lines.jsonl"
+FEATURED_ODDS_FILENAME = "featured_odds.jsonl"
+
+
+def event_context_from_featured(payload: Any) -> dict[str, dict[str, str]]:
+    """Extract teams and tip time per event from a featured-odds payload."""
+    context: dict[str, dict[str, str]] = {}
+    if not isinstance(payload, list):
+        return context
+    for event in payload:
+        if not isinstance(event, dict):
+            continue
+        event_id = str(event.get("id", "")).strip()
+        if not event_id:
+            continue
+        context[event_id] = {
+            "home_team": str(event.get("home_team", "")),
+            "away_team": str(event.get("away_team", "")),
+            "commence_time": str(event.get("commence_time", "")),
+        }
+    return context
+
+
+def summarize_slate_lines(
+    slate_rows: list[dict[str, Any]],
+    event_context: dict[str, dict[str, str]] | None,
+    *,
+    snapshot_id: str = "",
+) -> list[dict[str, Any]]:
+    """Aggregate featured-odds rows into one consensus line row per event."""
+    rows_by_event: dict[str, dict[str, list[float]]] = {}
+    for row in slate_rows:
+        if not isinstance(row, dict):
+            continue
+        event_id = str(row.get("event_id", row.get("game_id", "")))
+        if not event_id:
+            continue
+        market = str(row.get("market", ""))
+        point = _safe_float(row.get("point"))
+        if point is None:
+            continue
+        bucket = rows_by_event.setdefault(event_id, {"totals": [], "home_spreads": []})
+        if market == "totals":
+            bucket["totals"].append(point)
+            continue
+        if market != "spreads":
+            continue
+
+        ctx = event_context.get(event_id, {}) if isinstance(event_context, dict) else {}
+        home_team = canonical_team_name(str(ctx.get("home_team", "")))
+        away_team = canonical_team_name(str(ctx.get("away_team", "")))
+        side = canonical_team_name(str(row.get("side", "")))
+        if side and side == home_team:
+            bucket["home_spreads"].append(point)
+        elif side and side == away_team:
+            bucket["home_spreads"].append(-point)
+
+    summary: list[dict[str, Any]] = []
+    for event_id in sorted(rows_by_event):
+        ctx = event_context.get(event_id, {}) if isinstance(event_context, dict) else {}
+        totals = rows_by_event[event_id]["totals"]
+        home_spreads = rows_by_event[event_id]["home_spreads"]
+        summary.append(
+            {
+                "snapshot_id": snapshot_id,
+                "event_id": event_id,
+                "home_team": str(ctx.get("home_team", "")),
+                "away_team": str(ctx.get("away_team", "")),
+                "commence_time": str(ctx.get("commence_time", "")),
+                "home_spread": round(median(home_spreads), 1) if home_spreads else None,
+                "total": round(median(totals), 1) if totals else None,
+                "spread_quotes": len(home_spreads),
+                "total_quotes": len(totals),
+            }
+        )
+    return summary
+
+
+def write_slate_lines(store: SnapshotStore, snapshot_id: str, rows: list[dict[str, Any]]) -> None:
+    """Write the derived slate line table for one snapshot."""
+    store.write_jsonl(store.derived_path(snapshot_id, SLATE_LINES_FILENAME), rows)
+
+
+def load_slate_lines(
+    store: SnapshotStore,
+    snapshot_id: str,
+    *,
+    event_context: dict[str, dict[str, str]] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the slate line table, materializing it from featured odds when missing.
+
+    Snapshots written before the table existed are summarized from
+    ``featured_odds.jsonl`` once, using the stored slate payload for teams, and the
+    result is written back so later readers skip the aggregation.
+    """
+    path = store.derived_path(snapshot_id, SLATE_LINES_FILENAME)
+    if path.exists():
+        return read_jsonl(path)
+    featured_path = store.derived_path(snapshot_id, FEATURED_ODDS_FILENAME)
+    if not featured_path.exists():
+        return []
+    context = dict(_slate_payload_context(store, snapshot_id))
+    if isinstance(event_context, dict):
+        context.update(event_context)
+    rows = summarize_slate_lines(read_jsonl(featured_path), context, snapshot_id=snapshot_id)
+    write_slate_lines(store, snapshot_id, rows)
+    return rows
+
+
+def _slate_payload_context(store: SnapshotStore, snapshot_id: str) -> dict[str, dict[str, str]]:
+    try:
+        manifest = store.load_manifest(snapshot_id)
+    except (OSError, ValueError):
+        return {}
+    requests = manifest.get("requests", {})
+    if not isinstance(requests, dict):
+        return {}
+    context: dict[str, dict[str, str]] = {}
+    for request_key, row in requests.items():
+        if not isinstance(row, dict) or str(row.get("label", "")) != "slate_odds":
+            continue
+        payload = store.load_response(snapshot_id, str(request_key))
+        context.update(event_context_from_featured(payload))
+    return context
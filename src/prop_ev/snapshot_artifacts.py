@@ -3,19 +3,25 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import suppress
 from datetime import UTC, datetime
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any
 
 import polars as pl
 
 from prop_ev.archive_utils import (
-    compress_tar_zst,
-    decompress_zst_to_tar,
-    safe_extract_tar,
+    DEFAULT_ZSTD_LEVEL,
+    extract_tar_zst,
     sha256_file,
-    write_tar,
+    write_tar_zst,
 )
 from prop_ev.quote_table import (
     EVENT_PROPS_SORT_COLUMNS,
@@ -27,6 +33,12 @@ from prop_ev.quote_table import (
     validate_event_props_rows,
     validate_featured_odds_rows,
 )
+from prop_ev.util.fingerprint import file_fingerprint, fingerprint_unchanged
+from prop_ev.util.jsonl import read_jsonl, write_jsonl
+
+VERIFIED_MARKER_FILENAME = ".contracts-verified.json"
+# Bump when canonical ordering or contract checks change so old markers stop matching.
+CONTRACT_CHECK_VERSION = 2
 
 _TABLE_SCHEMAS: dict[str, list[tuple[str, Any]]] = {
     EVENT_PROPS_TABLE: [
@@ -67,24 +79,6 @@ def _now_utc() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
-        payload = json.loads(raw)
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
-
-
-def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
-    lines = [f"{json.dumps(row, sort_keys=True, ensure_ascii=True)}\n" for row in rows]
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("".join(lines), encoding="utf-8")
-
-
 def _enforce_schema(table_name: str, frame: pl.DataFrame) -> pl.DataFrame:
     schema = _TABLE_SCHEMAS[table_name]
     columns = [name for name, _ in schema]
@@ -175,7 +169,7 @@ def verify_snapshot_derived_contracts(
             continue
 
         try:
-            rows = _load_jsonl(jsonl_path)
+            rows = read_jsonl(jsonl_path)
         except json.JSONDecodeError as exc:
             issues.append(
                 {
@@ -233,6 +227,185 @@ def verify_snapshot_derived_contracts(
     return issues
 
 
+def _verified_marker_path(snapshot_dir: Path) -> Path:
+    return snapshot_dir / "derived" / VERIFIED_MARKER_FILENAME
+
+
+def _verification_sources(snapshot_dir: Path) -> dict[str, Path]:
+    derived_dir = snapshot_dir / "derived"
+    sources: dict[str, Path] = {}
+    for table_name in sorted(_TABLE_SCHEMAS):
+        for suffix in (".jsonl", ".parquet"):
+            sources[f"{table_name}{suffix}"] = derived_dir / f"{table_name}{suffix}"
+    return sources
+
+
+def _verification_options_key(
+    *, require_parquet: bool, require_canonical_jsonl: bool, required_tables: tuple[str, ...]
+) -> str:
+    return json.dumps(
+        {
+            "version": CONTRACT_CHECK_VERSION,
+            "require_parquet": require_parquet,
+            "require_canonical_jsonl": require_canonical_jsonl,
+            "required_tables": sorted(required_tables),
+        },
+        sort_keys=True,
+    )
+
+
+def _load_verified_marker(snapshot_dir: Path) -> dict[str, Any]:
+    path = _verified_marker_path(snapshot_dir)
+    if not path.exists():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _is_verified(snapshot_dir: Path, options_key: str) -> bool:
+    recorded = _load_verified_marker(snapshot_dir).get(options_key)
+    if not isinstance(recorded, dict):
+        return False
+    sources = _verification_sources(snapshot_dir)
+    if set(recorded) != set(sources):
+        return False
+    return all(fingerprint_unchanged(recorded[name], path) for name, path in sources.items())
+
+
+def _record_verified(snapshot_dir: Path, options_key: str) -> None:
+    marker = _load_verified_marker(snapshot_dir)
+    marker[options_key] = {
+        name: file_fingerprint(path) for name, path in _verification_sources(snapshot_dir).items()
+    }
+    path = _verified_marker_path(snapshot_dir)
+    tmp_path = path.with_name(f".tmp-{path.name}-{uuid.uuid4().hex}")
+    try:
+        tmp_path.write_text(json.dumps(marker, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+def verify_snapshot_derived_contracts_cached(
+    *,
+    snapshot_dir: Path,
+    require_parquet: bool = False,
+    require_canonical_jsonl: bool = True,
+    required_tables: tuple[str, ...] = (),
+    force: bool = False,
+) -> tuple[list[dict[str, str]], bool]:
+    """Verify like ``verify_snapshot_derived_contracts``, skipping unchanged clean snapshots.
+
+    A clean result is recorded in ``derived/.contracts-verified.json`` with the content
+    hash of every table file; while those hashes still match, the same verification is
+    skipped. Returns ``(issues, skipped)``.
+    """
+    options_key = _verification_options_key(
+        require_parquet=require_parquet,
+        require_canonical_jsonl=require_canonical_jsonl,
+        required_tables=required_tables,
+    )
+    if not force and _is_verified(snapshot_dir, options_key):
+        return [], True
+    issues = verify_snapshot_derived_contracts(
+        snapshot_dir=snapshot_dir,
+        require_parquet=require_parquet,
+        require_canonical_jsonl=require_canonical_jsonl,
+        required_tables=required_tables,
+    )
+    if not issues:
+        _record_verified(snapshot_dir, options_key)
+    return issues, False
+
+
+def verify_snapshot_job(job: dict[str, Any]) -> dict[str, Any]:
+    """Process-pool entry point: verify one snapshot described by ``job``."""
+    issues, skipped = verify_snapshot_derived_contracts_cached(
+        snapshot_dir=Path(job["snapshot_dir"]),
+        require_parquet=bool(job.get("require_parquet", False)),
+        require_canonical_jsonl=bool(job.get("require_canonical_jsonl", True)),
+        required_tables=tuple(job.get("required_tables", ())),
+        force=bool(job.get("force", False)),
+    )
+    return {"issues": issues, "skipped": skipped}
+
+
+def repair_snapshot_job(job: dict[str, Any]) -> dict[str, Any]:
+    """Process-pool entry point: repair then strictly verify one snapshot."""
+    snapshot_dir = Path(job["snapshot_dir"])
+    required_tables = tuple(job.get("required_tables", ()))
+    options_key = _verification_options_key(
+        require_parquet=True, require_canonical_jsonl=True, required_tables=required_tables
+    )
+    if not bool(job.get("force", False)) and _is_verified(snapshot_dir, options_key):
+        return {"status": "skipped_verified", "jsonl_rewritten": 0, "parquet_written": 0}
+    try:
+        report = repair_snapshot_derived_contracts(snapshot_dir)
+    except (FileNotFoundError, ValueError) as exc:
+        return {"status": "error", "issues": [{"code": "repair_failed", "detail": str(exc)}]}
+    issues, _ = verify_snapshot_derived_contracts_cached(
+        snapshot_dir=snapshot_dir,
+        require_parquet=True,
+        require_canonical_jsonl=True,
+        required_tables=required_tables,
+        force=True,
+    )
+    return {
+        "status": "repaired" if not issues else "repaired_with_issues",
+        "jsonl_rewritten": len(report.get("jsonl_rewritten", [])),
+        "parquet_written": len(report.get("parquet_written", [])),
+        "issues": issues,
+    }
+
+
+def default_snapshot_workers() -> int:
+    """Default process count for lake-wide snapshot jobs."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def run_snapshot_jobs(
+    func: Callable[[dict[str, Any]], dict[str, Any]],
+    jobs: Iterable[tuple[str, dict[str, Any]]],
+    *,
+    workers: int,
+    label: str,
+    progress: bool = True,
+) -> dict[str, dict[str, Any]]:
+    """Run ``func`` over keyed jobs, in a spawn-based process pool when ``workers > 1``.
+
+    Progress lines go to stderr so ``--json`` output on stdout stays parseable.
+    """
+    pending = list(jobs)
+    results: dict[str, dict[str, Any]] = {}
+    total = len(pending)
+    started = time.monotonic()
+    step = max(1, total // 10)
+
+    def _report(done: int) -> None:
+        if progress and total and (done == total or done % step == 0):
+            elapsed = time.monotonic() - started
+            print(f"{label} progress={done}/{total} elapsed_s={elapsed:.1f}", file=sys.stderr)
+
+    if workers <= 1 or total <= 1:
+        for done, (key, job) in enumerate(pending, start=1):
+            results[key] = func(job)
+            _report(done)
+        return results
+
+    # Spawn rather than fork: Polars keeps a thread pool that is not fork-safe.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, total), mp_context=context) as executor:
+        futures = {executor.submit(func, job): key for key, job in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            _report(done)
+    return results
+
+
 def repair_snapshot_derived_contracts(snapshot_dir: Path) -> dict[str, list[Path]]:
     """Repair known derived JSONL tables to canonical order and regenerate parquet mirrors."""
     derived_dir = snapshot_dir / "derived"
@@ -244,10 +417,10 @@ def repair_snapshot_derived_contracts(snapshot_dir: Path) -> dict[str, list[Path
         jsonl_path = derived_dir / f"{table_name}.jsonl"
         if not jsonl_path.exists():
             continue
-        rows = _load_jsonl(jsonl_path)
+        rows = read_jsonl(jsonl_path)
         canonical_rows = _canonical_rows_for_table(table_name, rows)
         if rows != canonical_rows:
-            _write_jsonl(jsonl_path, canonical_rows)
+            write_jsonl(jsonl_path, canonical_rows)
             rewritten_jsonl.append(jsonl_path)
 
     parquet_written = lake_snapshot_derived(snapshot_dir)
@@ -265,7 +438,7 @@ def lake_snapshot_derived(snapshot_dir: Path) -> list[Path]:
 
     written: list[Path] = []
     for jsonl_path in sorted(derived_dir.glob("*.jsonl")):
-        rows = _load_jsonl(jsonl_path)
+        rows = read_jsonl(jsonl_path)
         table_name = jsonl_path.stem
         if table_name in _TABLE_SCHEMAS:
             if table_name == EVENT_PROPS_TABLE:
@@ -312,7 +485,12 @@ def _snapshot_files(snapshot_dir: Path) -> list[Path]:
 
 
 def pack_snapshot(
-    *, data_root: Path, snapshot_id: str, out_path: Path | None = None
+    *,
+    data_root: Path,
+    snapshot_id: str,
+    out_path: Path | None = None,
+    level: int = DEFAULT_ZSTD_LEVEL,
+    threads: int = 0,
 ) -> tuple[Path, Path]:
     """Pack one snapshot into `tar.zst` plus sidecar metadata."""
     snapshot_dir = data_root / "snapshots" / snapshot_id
@@ -328,10 +506,7 @@ def pack_snapshot(
     bundle_path.parent.mkdir(parents=True, exist_ok=True)
     sidecar_path = _bundle_metadata_path(bundle_path)
 
-    with TemporaryDirectory(prefix=f"{snapshot_id}-bundle-") as tmp_dir:
-        tmp_tar = Path(tmp_dir) / f"{snapshot_id}.tar"
-        write_tar(tar_path=tmp_tar, root=data_root, files=files)
-        compress_tar_zst(tar_path=tmp_tar, out_path=bundle_path, level=19)
+    write_tar_zst(out_path=bundle_path, root=data_root, files=files, level=level, threads=threads)
 
     file_list = [path.relative_to(data_root).as_posix() for path in files]
     metadata = {
@@ -352,10 +527,7 @@ def unpack_snapshot(*, data_root: Path, bundle_path: Path) -> dict[str, Any]:
     if not bundle_path.exists():
         raise FileNotFoundError(f"bundle not found: {bundle_path}")
 
-    with TemporaryDirectory(prefix="snapshot-unpack-") as tmp_dir:
-        tmp_tar = Path(tmp_dir) / "snapshot.tar"
-        decompress_zst_to_tar(zst_path=bundle_path, tar_path=tmp_tar)
-        extracted_names = safe_extract_tar(tar_path=tmp_tar, destination=data_root)
+    extracted_names = extract_tar_zst(zst_path=bundle_path, destination=data_root)
 
     snapshot_ids = sorted(
         {
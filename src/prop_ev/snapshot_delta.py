@@ -0,0 +1,187 @@
+"""Delta planning for live `snapshot props` refreshes.
+
+A delta refresh probes the featured odds endpoint with one cheap market to learn each
+bookmaker's ``last_update`` per event, compares that against the probe stored with the
+previous props snapshot, and only re-fetches per-event prop odds for events whose books
+changed (or that are close to tip). Unchanged events reuse the prior snapshot's rows.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from prop_ev.storage import SnapshotStore
+from prop_ev.time_utils import parse_iso_z
+from prop_ev.util.jsonl import iter_jsonl, read_jsonl
+
+EVENT_BOOK_UPDATES_FILENAME = "event_book_updates.jsonl"
+DELTA_PROBE_MARKETS: tuple[str, ...] = ("h2h",)
+DEFAULT_DELTA_PRE_TIP_MINUTES = 60
+
+
+@dataclass(frozen=True)
+class DeltaPlan:
+    """Which events to re-fetch and which to reuse from a previous snapshot."""
+
+    source_snapshot_id: str
+    refresh: list[str]
+    reuse: list[str]
+    reasons: dict[str, str] = field(default_factory=dict)
+
+
+def event_book_updates_from_featured(payload: Any) -> list[dict[str, str]]:
+    """Flatten a featured-odds payload into one row per (event, bookmaker)."""
+    rows: list[dict[str, str]] = []
+    if not isinstance(payload, list):
+        return rows
+    for event in payload:
+        if not isinstance(event, dict):
+            continue
+        event_id = str(event.get("id", "")).strip()
+        if not event_id:
+            continue
+        commence_time = str(event.get("commence_time", "")).strip()
+        bookmakers = event.get("bookmakers", [])
+        for bookmaker in bookmakers if isinstance(bookmakers, list) else []:
+            if not isinstance(bookmaker, dict):
+                continue
+            book = str(bookmaker.get("key", "")).strip()
+            if not book:
+                continue
+            rows.append(
+                {
+                    "event_id": event_id,
+                    "book": book,
+                    "last_update": str(bookmaker.get("last_update", "")).strip(),
+                    "commence_time": commence_time,
+                }
+            )
+    rows.sort(key=lambda row: (row["event_id"], row["book"]))
+    return rows
+
+
+def index_event_book_updates(rows: list[dict[str, Any]]) -> dict[str, dict[str, str]]:
+    """Map event id to ``{book: last_update}``."""
+    index: dict[str, dict[str, str]] = {}
+    for row in rows:
+        event_id = str(row.get("event_id", "")).strip()
+        book = str(row.get("book", "")).strip()
+        if not event_id or not book:
+            continue
+        index.setdefault(event_id, {})[book] = str(row.get("last_update", "")).strip()
+    return index
+
+
+def load_event_book_updates(path: Path) -> list[dict[str, Any]]:
+    """Load a stored probe table; missing files yield no rows."""
+    return read_jsonl(path, missing_ok=True)
+
+
+def load_reusable_event_rows(
+    store: SnapshotStore,
+    *,
+    source_snapshot_id: str,
+    snapshot_id: str,
+) -> dict[str, list[dict[str, Any]]]:
+    """Group a previous snapshot's ``event_props`` rows by event, re-stamped for ``snapshot_id``."""
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    if not source_snapshot_id:
+        return grouped
+    for row in iter_jsonl(
+        store.derived_path(source_snapshot_id, "event_props.jsonl"), missing_ok=True
+    ):
+        event_id = str(row.get("event_id", "")).strip()
+        if not event_id:
+            continue
+        grouped.setdefault(event_id, []).append({**row, "snapshot_id": snapshot_id})
+    return grouped
+
+
+def find_previous_props_snapshot(
+    store: SnapshotStore,
+    *,
+    snapshot_id: str,
+    markets: list[str],
+    bookmakers: str,
+) -> str:
+    """Return the newest earlier props snapshot with the same markets and bookmakers."""
+    if not store.snapshots_dir.exists():
+        return ""
+    wanted_markets = sorted(set(markets))
+    candidates = sorted(
+        (path for path in store.snapshots_dir.iterdir() if path.is_dir()),
+        key=lambda path: path.name,
+        reverse=True,
+    )
+    for path in candidates:
+        if path.name >= snapshot_id:
+            continue
+        if not store.derived_path(path.name, "event_props.jsonl").exists():
+            continue
+        if not store.derived_path(path.name, EVENT_BOOK_UPDATES_FILENAME).exists():
+            continue
+        try:
+            manifest = store.load_manifest(path.name)
+        except (OSError, json.JSONDecodeError):
+            continue
+        run_config = manifest.get("run_config", {})
+        if not isinstance(run_config, dict):
+            continue
+        if str(run_config.get("mode", "")) != "snapshot_props":
+            continue
+        previous_markets = run_config.get("markets", [])
+        if not isinstance(previous_markets, list):
+            continue
+        if sorted({str(item) for item in previous_markets}) != wanted_markets:
+            continue
+        if str(run_config.get("bookmakers", "")) != bookmakers:
+            continue
+        return path.name
+    return ""
+
+
+def plan_delta_refresh(
+    *,
+    event_ids: list[str],
+    current: dict[str, dict[str, str]],
+    previous: dict[str, dict[str, str]],
+    previous_event_ids: set[str],
+    commence_times: dict[str, str],
+    now: datetime,
+    pre_tip_minutes: int,
+    source_snapshot_id: str,
+) -> DeltaPlan:
+    """Split events into re-fetch and reuse sets."""
+    window = timedelta(minutes=max(0, int(pre_tip_minutes)))
+    refresh: list[str] = []
+    reuse: list[str] = []
+    reasons: dict[str, str] = {}
+    for event_id in event_ids:
+        reason = ""
+        commence = parse_iso_z(commence_times.get(event_id, ""))
+        if not source_snapshot_id:
+            reason = "no_previous_snapshot"
+        elif event_id not in previous_event_ids:
+            reason = "no_previous_rows"
+        elif commence is not None and commence - now <= window:
+            reason = "inside_pre_tip_window"
+        elif not current.get(event_id):
+            reason = "no_book_updates"
+        elif current.get(event_id) != previous.get(event_id):
+            reason = "books_changed"
+        if reason:
+            refresh.append(event_id)
+            reasons[event_id] = reason
+        else:
+            reuse.append(event_id)
+            reasons[event_id] = "unchanged"
+    return DeltaPlan(
+        source_snapshot_id=source_snapshot_id,
+        refresh=refresh,
+        reuse=reuse,
+        reasons=reasons,
+    )
@@ -1,10 +1,17 @@
-"""Snapshot and cache storage for Odds API payloads."""
+"""Snapshot and cache storage for Odds API payloads.
+
+Network responses are kept as the raw body bytes, gzip-compressed, under
+``responses/<key>.json.gz``; payloads written from decoded values (and older
+snapshots) use pretty-printed ``responses/<key>.json``. Readers accept either.
+"""
 
 from __future__ import annotations
 
+import gzip
 import hashlib
 import json
 import os
+import threading
 import uuid
 from contextlib import contextmanager, suppress
 from datetime import UTC, datetime
@@ -13,8 +20,22 @@ from typing import Any
 
 from prop_ev import __version__
 from prop_ev.time_utils import et_snapshot_id_now, utc_now_str
+from prop_ev.usage_ledger import append_usage_row
+from prop_ev.util.jsonl import loads, write_jsonl
 
 SCHEMA_VERSION = 1
+RAW_RESPONSE_SUFFIX = ".json.gz"
+RAW_RESPONSE_GZIP_LEVEL = 6
+
+_MANIFEST_LOCKS: dict[Path, threading.Lock] = {}
+_MANIFEST_LOCKS_GUARD = threading.Lock()
+
+
+def _manifest_lock(path: Path) -> threading.Lock:
+    # Threads of one process may record requests into the same snapshot concurrently;
+    # the manifest update is a read-modify-write, so it is serialized per manifest.
+    with _MANIFEST_LOCKS_GUARD:
+        return _MANIFEST_LOCKS.setdefault(path.resolve(), threading.Lock())
 
 
 def now_utc() -> str:
@@ -65,6 +86,39 @@ def _atomic_write_json(path: Path, value: Any) -> None:
     _atomic_write_text(path, payload)
 
 
+def write_raw_payload(path: Path, raw: bytes) -> None:
+    """Atomically write response bytes gzip-compressed to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".tmp-{path.name}-{uuid.uuid4().hex}")
+    try:
+        with gzip.open(tmp_path, "wb", compresslevel=RAW_RESPONSE_GZIP_LEVEL) as handle:
+            handle.write(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+        raise
+
+
+def read_raw_payload(path: Path) -> bytes:
+    """Return the decompressed response bytes stored at ``path``."""
+    with gzip.open(path, "rb") as handle:
+        return handle.read()
+
+
+def decode_payload(raw: bytes, payload_field: str = "") -> Any:
+    """Decode stored response bytes, unwrapping ``payload_field`` from an envelope."""
+    payload = loads(raw)
+    if payload_field and isinstance(payload, dict):
+        return payload.get(payload_field)
+    return payload
+
+
+def payload_field_from_meta(meta: dict[str, Any] | None) -> str:
+    """Return the envelope key recorded for a raw response, if any."""
+    return str((meta or {}).get("payload_field", "") or "")
+
+
 class SnapshotStore:
     """Manage snapshot artifacts and manifests."""
 
@@ -87,6 +141,9 @@ class SnapshotStore:
     def _response_path(self, snapshot_id: str, key: str) -> Path:
         return self.snapshot_dir(snapshot_id) / "responses" / f"{key}.json"
 
+    def _raw_response_path(self, snapshot_id: str, key: str) -> Path:
+        return self.snapshot_dir(snapshot_id) / "responses" / f"{key}{RAW_RESPONSE_SUFFIX}"
+
     def _meta_path(self, snapshot_id: str, key: str) -> Path:
         return self.snapshot_dir(snapshot_id) / "meta" / f"{key}.json"
 
@@ -120,18 +177,19 @@ class SnapshotStore:
         self._derived_dir(snapshot_id).mkdir(parents=True, exist_ok=True)
 
         manifest_path = self._manifest_path(snapshot_id)
-        if not manifest_path.exists():
-            manifest = {
-                "schema_version": SCHEMA_VERSION,
-                "snapshot_id": snapshot_id,
-                "created_at_utc": now_utc(),
-                "client_version": __version__,
-                "git_sha": os.environ.get("GIT_SHA", ""),
-                "run_config": run_config or {},
-                "quota": {},
-                "requests": {},
-            }
-            _atomic_write_json(manifest_path, manifest)
+        with _manifest_lock(manifest_path):
+            if not manifest_path.exists():
+                manifest = {
+                    "schema_version": SCHEMA_VERSION,
+                    "snapshot_id": snapshot_id,
+                    "created_at_utc": now_utc(),
+                    "client_version": __version__,
+                    "git_sha": os.environ.get("GIT_SHA", ""),
+                    "run_config": run_config or {},
+                    "quota": {},
+                    "requests": {},
+                }
+                _atomic_write_json(manifest_path, manifest)
         return root
 
     def load_manifest(self, snapshot_id: str) -> dict[str, Any]:
@@ -140,14 +198,35 @@ class SnapshotStore:
     def save_manifest(self, snapshot_id: str, manifest: dict[str, Any]) -> None:
         _atomic_write_json(self._manifest_path(snapshot_id), manifest)
 
+    def response_file(self, snapshot_id: str, key: str) -> Path | None:
+        """Return the stored response file for ``key``, raw or decoded."""
+        for path in (
+            self._raw_response_path(snapshot_id, key),
+            self._response_path(snapshot_id, key),
+        ):
+            if path.exists():
+                return path
+        return None
+
     def has_response(self, snapshot_id: str, key: str) -> bool:
-        return self._response_path(snapshot_id, key).exists()
+        return self.response_file(snapshot_id, key) is not None
+
+    def load_response_bytes(self, snapshot_id: str, key: str) -> tuple[bytes, str] | None:
+        """Return ``(body, payload_field)`` for a stored response without decoding it."""
+        raw_path = self._raw_response_path(snapshot_id, key)
+        if raw_path.exists():
+            meta = self.load_meta(snapshot_id, key)
+            return read_raw_payload(raw_path), payload_field_from_meta(meta)
+        response_path = self._response_path(snapshot_id, key)
+        if response_path.exists():
+            return response_path.read_bytes(), ""
+        return None
 
     def load_response(self, snapshot_id: str, key: str) -> Any | None:
-        response_path = self._response_path(snapshot_id, key)
-        if not response_path.exists():
+        stored = self.load_response_bytes(snapshot_id, key)
+        if stored is None:
             return None
-        return json.loads(response_path.read_text(encoding="utf-8"))
+        return decode_payload(*stored)
 
     def load_meta(self, snapshot_id: str, key: str) -> dict[str, Any] | None:
         meta_path = self._meta_path(snapshot_id, key)
@@ -160,6 +239,8 @@ class SnapshotStore:
 
     def write_response(self, snapshot_id: str, key: str, response_data: Any) -> None:
         _atomic_write_json(self._response_path(snapshot_id, key), response_data)
+        with suppress(FileNotFoundError):
+            self._raw_response_path(snapshot_id, key).unlink()
 
     def write_meta(self, snapshot_id: str, key: str, meta_data: dict[str, Any]) -> None:
         _atomic_write_json(self._meta_path(snapshot_id, key), meta_data)
@@ -176,19 +257,20 @@ class SnapshotStore:
         quota: dict[str, Any] | None = None,
         error: str | None = None,
     ) -> None:
-        manifest = self.load_manifest(snapshot_id)
-        manifest.setdefault("requests", {})
-        manifest["requests"][key] = {
-            "label": label,
-            "path": path,
-            "params": sanitize_params(params),
-            "status": status,
-            "updated_at_utc": now_utc(),
-            "error": error or "",
-        }
-        if quota:
-            manifest["quota"] = quota
-        self.save_manifest(snapshot_id, manifest)
+        with _manifest_lock(self._manifest_path(snapshot_id)):
+            manifest = self.load_manifest(snapshot_id)
+            manifest.setdefault("requests", {})
+            manifest["requests"][key] = {
+                "label": label,
+                "path": path,
+                "params": sanitize_params(params),
+                "status": status,
+                "updated_at_utc": now_utc(),
+                "error": error or "",
+            }
+            if quota:
+                manifest["quota"] = quota
+            self.save_manifest(snapshot_id, manifest)
 
     def request_status(self, snapshot_id: str, key: str) -> str | None:
         manifest = self.load_manifest(snapshot_id)
@@ -201,8 +283,7 @@ class SnapshotStore:
         return None
 
     def write_jsonl(self, path: Path, rows: list[dict[str, Any]]) -> None:
-        lines = [f"{json.dumps(row, sort_keys=True, ensure_ascii=True)}\n" for row in rows]
-        _atomic_write_text(path, "".join(lines))
+        write_jsonl(path, rows)
 
     def derived_path(self, snapshot_id: str, filename: str) -> Path:
         return self._derived_dir(snapshot_id) / filename
@@ -234,6 +315,4 @@ class SnapshotStore:
             "x_requests_used": headers.get("x-requests-used", ""),
             "x_requests_remaining": headers.get("x-requests-remaining", ""),
         }
-        usage_path.parent.mkdir(parents=True, exist_ok=True)
-        with usage_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(row, sort_keys=True, ensure_ascii=True) + "\n")
+        append_usage_row(usage_path, row, kind="odds")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass, replace
 from typing import Any, Protocol
 
@@ -40,6 +41,7 @@ class StrategyInputs:
     player_identity_map: dict[str, Any] | None
     rolling_priors: dict[str, Any] | None = None
     minutes_probabilities: dict[str, Any] | None = None
+    slate_lines: list[dict[str, Any]] | None = None
 
 
 @dataclass(frozen=True)
@@ -80,6 +82,9 @@ class StrategyRecipe:
     probabilistic_profile: str | None = None
     min_prob_confidence: float | None = None
     max_minutes_band: float | None = None
+    sgp_max_legs_per_event: int | None = None
+    sgp_legs_per_combo: int | None = None
+    sgp_correlation: Mapping[str, Any] | None = None
 
 
 class StrategyPlugin(Protocol):
@@ -161,6 +166,21 @@ def compose_strategy_recipes(*recipes: StrategyRecipe) -> StrategyRecipe:
                 if recipe.max_minutes_band is not None
                 else merged.max_minutes_band
             ),
+            sgp_max_legs_per_event=(
+                recipe.sgp_max_legs_per_event
+                if recipe.sgp_max_legs_per_event is not None
+                else merged.sgp_max_legs_per_event
+            ),
+            sgp_legs_per_combo=(
+                recipe.sgp_legs_per_combo
+                if recipe.sgp_legs_per_combo is not None
+                else merged.sgp_legs_per_combo
+            ),
+            sgp_correlation=(
+                recipe.sgp_correlation
+                if recipe.sgp_correlation is not None
+                else merged.sgp_correlation
+            ),
         )
     return merged
 
@@ -186,6 +206,7 @@ def run_strategy_recipe(
         roster=inputs.roster,
         event_context=inputs.event_context,
         slate_rows=inputs.slate_rows,
+        slate_lines=inputs.slate_lines,
         player_identity_map=inputs.player_identity_map,
         rolling_priors=inputs.rolling_priors if recipe.use_rolling_priors else None,
         minutes_probabilities=inputs.minutes_probabilities,
@@ -212,6 +233,9 @@ def run_strategy_recipe(
         ),
         min_prob_confidence=recipe.min_prob_confidence,
         max_minutes_band=recipe.max_minutes_band,
+        sgp_max_legs_per_event=recipe.sgp_max_legs_per_event,
+        sgp_legs_per_combo=recipe.sgp_legs_per_combo,
+        sgp_correlation=recipe.sgp_correlation,
         quote_now_utc=effective_config.quote_now_utc,
     )
     return StrategyResult(report=report, config=effective_config)
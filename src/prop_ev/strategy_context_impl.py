@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from prop_ev.identity_map import name_aliases
@@ -231,6 +232,222 @@ def resolve_player_team(
     return ""
 
 
+_ROSTER_ALL = 1
+_ROSTER_ACTIVE = 2
+_ROSTER_INACTIVE = 4
+
+
+@dataclass(frozen=True)
+class PlayerAvailability:
+    """Resolved roster status, team and injury row for one player in one event."""
+
+    roster_status: str
+    team: str
+    injury_row: dict[str, Any]
+
+
+class AvailabilityIndex:
+    """Per-snapshot player availability index.
+
+    Compiles the roster, injury index and identity map once so that
+    `roster_status`/`resolve_player_team` lookups inside the line-group loop are dict
+    probes instead of rebuilding roster sets and alias lists for every group. Results match
+    the module-level functions of the same name.
+    """
+
+    def __init__(
+        self,
+        *,
+        event_context: dict[str, dict[str, str]] | None,
+        roster: dict[str, Any] | None,
+        injuries_by_player: dict[str, dict[str, Any]] | None = None,
+        player_identity_map: dict[str, Any] | None = None,
+    ) -> None:
+        self._event_context = event_context if isinstance(event_context, dict) else None
+        self._injuries = injuries_by_player if isinstance(injuries_by_player, dict) else {}
+        identity_players = (
+            player_identity_map.get("players", {})
+            if isinstance(player_identity_map, dict)
+            else None
+        )
+        self._identity_players = identity_players if isinstance(identity_players, dict) else None
+        teams = roster.get("teams", {}) if isinstance(roster, dict) else None
+        self._roster_ok = isinstance(roster, dict)
+        self._teams = teams if isinstance(teams, dict) else None
+        # alias -> team_norm -> bitmask of roster lists the alias appears in.
+        self._membership: dict[str, dict[str, int]] = {}
+        for team_norm, row in (self._teams or {}).items():
+            if not isinstance(row, dict):
+                continue
+            for field, flag in (
+                ("all", _ROSTER_ALL),
+                ("active", _ROSTER_ACTIVE),
+                ("inactive", _ROSTER_INACTIVE),
+            ):
+                for name in row.get(field, []):
+                    if isinstance(name, str):
+                        teams_for_name = self._membership.setdefault(name, {})
+                        teams_for_name[team_norm] = teams_for_name.get(team_norm, 0) | flag
+        self._events: dict[str, tuple[str, str]] = {}
+        self._aliases: dict[str, frozenset[str]] = {}
+        self._identity_teams: dict[str, tuple[str, ...]] = {}
+        self._player_norms: dict[str, str] = {}
+        self._status_cache: dict[tuple[str, str], str] = {}
+        self._roster_team_cache: dict[tuple[str, str], str] = {}
+
+    def _event_teams(self, event_id: str) -> tuple[str, str]:
+        cached = self._events.get(event_id)
+        if cached is None:
+            ctx = self._event_context.get(event_id, {}) if self._event_context else {}
+            if not isinstance(ctx, dict):
+                ctx = {}
+            cached = (
+                canonical_team_name(str(ctx.get("home_team", ""))),
+                canonical_team_name(str(ctx.get("away_team", ""))),
+            )
+            self._events[event_id] = cached
+        return cached
+
+    def player_norm(self, player_name: str) -> str:
+        cached = self._player_norms.get(player_name)
+        if cached is None:
+            cached = normalize_person_name(player_name)
+            self._player_norms[player_name] = cached
+        return cached
+
+    def _player_aliases(self, player_name: str) -> frozenset[str]:
+        cached = self._aliases.get(player_name)
+        if cached is None:
+            aliases = set(name_aliases(player_name)) | {self.player_norm(player_name)}
+            if self._identity_players is not None:
+                for alias in list(aliases):
+                    row = self._identity_players.get(alias)
+                    if isinstance(row, dict):
+                        alias_rows = row.get("aliases", [])
+                        if isinstance(alias_rows, list):
+                            aliases.update(item for item in alias_rows if isinstance(item, str))
+            cached = frozenset(aliases)
+            self._aliases[player_name] = cached
+        return cached
+
+    def _team_flags(self, player_name: str, team_norm: str) -> int:
+        flags = 0
+        for alias in self._player_aliases(player_name):
+            teams = self._membership.get(alias)
+            if teams:
+                flags |= teams.get(team_norm, 0)
+        return flags
+
+    def _teams_row_ok(self, home: str, away: str) -> bool:
+        teams = self._teams or {}
+        return isinstance(teams.get(home), dict) and isinstance(teams.get(away), dict)
+
+    def roster_status(self, *, player_name: str, event_id: str) -> str:
+        key = (player_name, event_id)
+        cached = self._status_cache.get(key)
+        if cached is not None:
+            return cached
+        status = self._compute_roster_status(player_name=player_name, event_id=event_id)
+        self._status_cache[key] = status
+        return status
+
+    def _compute_roster_status(self, *, player_name: str, event_id: str) -> str:
+        if self._event_context is None:
+            return "unknown_event"
+        if not isinstance(self._event_context.get(event_id), dict):
+            return "unknown_event"
+        if not self._roster_ok or self._teams is None:
+            return "unknown_roster"
+        home, away = self._event_teams(event_id)
+        if not home or not away:
+            return "unknown_event"
+        if not self._teams_row_ok(home, away):
+            return "unknown_roster"
+        flags = self._team_flags(player_name, home) | self._team_flags(player_name, away)
+        if flags & _ROSTER_INACTIVE:
+            return "inactive"
+        if flags & _ROSTER_ACTIVE:
+            return "active"
+        if flags & _ROSTER_ALL:
+            return "rostered"
+        return "not_on_roster"
+
+    def _roster_team(self, *, player_name: str, event_id: str) -> str:
+        key = (player_name, event_id)
+        cached = self._roster_team_cache.get(key)
+        if cached is not None:
+            return cached
+        team = ""
+        home, away = self._event_teams(event_id)
+        if (
+            self._teams is not None
+            and home
+            and away
+            and isinstance(self._teams.get(home, {}), dict)
+            and isinstance(self._teams.get(away, {}), dict)
+        ):
+            on_home = bool(self._team_flags(player_name, home) & _ROSTER_ALL)
+            on_away = bool(self._team_flags(player_name, away) & _ROSTER_ALL)
+            if on_home and not on_away:
+                team = home
+            elif on_away and not on_home:
+                team = away
+        self._roster_team_cache[key] = team
+        return team
+
+    def _identity_team_candidates(self, player_name: str) -> tuple[str, ...]:
+        cached = self._identity_teams.get(player_name)
+        if cached is None:
+            candidates: list[str] = []
+            if self._identity_players is not None:
+                for alias in name_aliases(player_name):
+                    row = self._identity_players.get(alias)
+                    if not isinstance(row, dict):
+                        continue
+                    teams = row.get("teams", [])
+                    if not isinstance(teams, list):
+                        continue
+                    candidates.extend(canonical_team_name(str(team)) for team in teams)
+            cached = tuple(candidates)
+            self._identity_teams[player_name] = cached
+        return cached
+
+    def resolve_player_team(
+        self,
+        *,
+        player_name: str,
+        event_id: str,
+        injury_row: dict[str, Any],
+    ) -> str:
+        roster_team = self._roster_team(player_name=player_name, event_id=event_id)
+        if roster_team:
+            return roster_team
+        home, away = self._event_teams(event_id)
+        injury_team = canonical_team_name(str(injury_row.get("team_norm", "")))
+        if injury_team and injury_team in {home, away}:
+            return injury_team
+        for team_norm in self._identity_team_candidates(player_name):
+            if team_norm in {home, away}:
+                return team_norm
+        return ""
+
+    def injury_row(self, player_name: str) -> dict[str, Any]:
+        return self._injuries.get(self.player_norm(player_name), {})
+
+    def lookup(self, *, player_name: str, event_id: str) -> PlayerAvailability:
+        """Return roster status, team and injury row for ``player_name`` in ``event_id``."""
+        injury_row = self.injury_row(player_name)
+        return PlayerAvailability(
+            roster_status=self.roster_status(player_name=player_name, event_id=event_id),
+            team=self.resolve_player_team(
+                player_name=player_name,
+                event_id=event_id,
+                injury_row=injury_row,
+            ),
+            injury_row=injury_row,
+        )
+
+
 def count_team_status(rows: list[dict[str, Any]], exclude_player_norm: str) -> dict[str, int]:
     counts = {
         "out": 0,
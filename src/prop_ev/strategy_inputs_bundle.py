@@ -0,0 +1,97 @@
+"""Content-hashed, serialized strategy inputs per snapshot.
+
+``strategy run``/``compare``/``health`` (and the playbook, through ``strategy run``)
+resolve the same snapshot inputs on every invocation: parsing ``event_props.jsonl``,
+collecting event context from every stored response, refreshing the player identity
+map, and indexing execution quotes from those props. The bundle keeps those resolved
+values in one pickle under the runtime dir, split into named sections. Each section
+records the SHA-256 of the files it was built from; a section is reused only while every
+source still hashes the same, so any upstream change invalidates it without bookkeeping.
+File size and mtime are checked first so an unchanged source is not re-hashed.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import uuid
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from prop_ev.util.fingerprint import file_fingerprint, fingerprint_unchanged
+
+BUNDLE_SCHEMA_VERSION = 1
+BUNDLE_DIRNAME = "strategy_inputs"
+
+
+def bundle_path_for(runtime_dir: Path | str, snapshot_id: str) -> Path:
+    """Return the inputs bundle path for one snapshot."""
+    return Path(runtime_dir) / BUNDLE_DIRNAME / f"{snapshot_id}.pkl"
+
+
+class StrategyInputsBundle:
+    """Named, source-hashed sections of resolved strategy inputs for one snapshot."""
+
+    def __init__(self, path: Path, *, enabled: bool = True) -> None:
+        self.path = path
+        self.enabled = enabled
+        self._sections: dict[str, Any] | None = None
+
+    def _load_sections(self) -> dict[str, Any]:
+        if self._sections is not None:
+            return self._sections
+        sections: dict[str, Any] = {}
+        if self.enabled and self.path.exists():
+            try:
+                with self.path.open("rb") as handle:
+                    payload = pickle.load(handle)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+                payload = None
+            if (
+                isinstance(payload, dict)
+                and payload.get("schema_version") == BUNDLE_SCHEMA_VERSION
+                and isinstance(payload.get("sections"), dict)
+            ):
+                sections = payload["sections"]
+        self._sections = sections
+        return sections
+
+    def get(self, name: str, sources: dict[str, Path]) -> dict[str, Any] | None:
+        """Return a cached section when all of its sources are unchanged."""
+        if not self.enabled:
+            return None
+        section = self._load_sections().get(name)
+        if not isinstance(section, dict):
+            return None
+        recorded = section.get("sources")
+        if not isinstance(recorded, dict) or set(recorded) != set(sources):
+            return None
+        for key, path in sources.items():
+            if not fingerprint_unchanged(recorded[key], path):
+                return None
+        payload = section.get("payload")
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, name: str, sources: dict[str, Path], payload: dict[str, Any]) -> None:
+        """Store a section fingerprinted against the current state of ``sources``."""
+        if not self.enabled:
+            return
+        sections = self._load_sections()
+        sections[name] = {
+            "sources": {key: file_fingerprint(path) for key, path in sources.items()},
+            "payload": payload,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".tmp-{self.path.name}-{uuid.uuid4().hex}")
+        try:
+            with tmp_path.open("wb") as handle:
+                pickle.dump(
+                    {"schema_version": BUNDLE_SCHEMA_VERSION, "sections": sections},
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.path)
+        finally:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
@@ -59,18 +59,29 @@ def market_minutes_weight(market: str) -> float:
     }.get(market, 0.007)
 
 
+def _minutes_prob_index(minutes_probabilities: dict[str, Any]) -> Any:
+    from prop_ev.nba_data.minutes_prob.artifacts import MinutesProbIndex
+
+    index = minutes_probabilities.get("index")
+    return index if isinstance(index, MinutesProbIndex) else None
+
+
 def minutes_prob_lookup(
     minutes_probabilities: dict[str, Any] | None,
     *,
     event_id: str,
     player: str,
     market: str,
+    player_norm: str = "",
 ) -> dict[str, Any]:
     if not isinstance(minutes_probabilities, dict):
         return {}
-    player_norm = normalize_person_name(player)
+    player_norm = player_norm or normalize_person_name(player)
     if not player_norm:
         return {}
+    index = _minutes_prob_index(minutes_probabilities)
+    if index is not None:
+        return index.lookup(event_id=event_id, player_norm=player_norm, market=market)
     exact = minutes_probabilities.get("exact", {})
     if isinstance(exact, dict):
         key = f"{event_id}|{player_norm}|{market.strip().lower()}"
@@ -85,6 +96,37 @@ def minutes_prob_lookup(
     return {}
 
 
+def minutes_prob_rows(
+    minutes_probabilities: dict[str, Any] | None,
+    keys: list[tuple[str, str, str]],
+) -> dict[tuple[str, str, str], dict[str, Any]]:
+    """Resolve ``(event_id, player, market)`` line-group keys to minutes predictions at once.
+
+    Player names are normalized once per distinct name; indexed predictions are joined in
+    a single vectorized pass.
+    """
+    if not isinstance(minutes_probabilities, dict) or not keys:
+        return {}
+    unique_keys = list(dict.fromkeys(keys))
+    norms = {player: normalize_person_name(player) for _, player, _ in unique_keys}
+    index = _minutes_prob_index(minutes_probabilities)
+    if index is not None:
+        payloads = index.join(
+            [(event_id, norms[player], market) for event_id, player, market in unique_keys]
+        )
+        return dict(zip(unique_keys, payloads, strict=True))
+    return {
+        key: minutes_prob_lookup(
+            minutes_probabilities,
+            event_id=key[0],
+            player=key[1],
+            market=key[2],
+            player_norm=norms[key[1]],
+        )
+        for key in unique_keys
+    }
+
+
 def minutes_prob_adjustment_over(
     *,
     market: str,
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+from prop_ev.sgp_engine import DEFAULT_SGP_MAX_LEGS_PER_EVENT, SGPCorrelationModel
 from prop_ev.strategy_report.helpers import *  # noqa: F403
 
 
@@ -17,6 +20,7 @@ def build_strategy_report(
     roster: dict[str, Any] | None = None,
     event_context: dict[str, dict[str, str]] | None = None,
     slate_rows: list[dict[str, Any]] | None = None,
+    slate_lines: list[dict[str, Any]] | None = None,
     player_identity_map: dict[str, Any] | None = None,
     rolling_priors: dict[str, Any] | None = None,
     minutes_probabilities: dict[str, Any] | None = None,
@@ -39,6 +43,9 @@ def build_strategy_report(
     probabilistic_profile: str = "off",
     min_prob_confidence: float | None = None,
     max_minutes_band: float | None = None,
+    sgp_max_legs_per_event: int | None = None,
+    sgp_legs_per_combo: int | None = None,
+    sgp_correlation: Mapping[str, Any] | None = None,
     quote_now_utc: str | datetime | None = None,
 ) -> dict[str, Any]:
     """Create an audit-ready, deterministic NBA prop strategy report."""
@@ -71,6 +78,19 @@ def build_strategy_report(
         raise ValueError("min_prob_confidence must be in [0, 1]")
     if max_minutes_band is not None and max_minutes_band < 0:
         raise ValueError("max_minutes_band must be >= 0")
+    sgp_legs_per_combo = 2 if sgp_legs_per_combo is None else int(sgp_legs_per_combo)
+    if sgp_legs_per_combo not in {2, 3}:
+        raise ValueError("sgp_legs_per_combo must be 2 or 3")
+    sgp_max_legs_per_event = (
+        DEFAULT_SGP_MAX_LEGS_PER_EVENT
+        if sgp_max_legs_per_event is None
+        else int(sgp_max_legs_per_event)
+    )
+    if sgp_max_legs_per_event < sgp_legs_per_combo:
+        raise ValueError("sgp_max_legs_per_event must be >= sgp_legs_per_combo")
+    sgp_correlation_model = (
+        SGPCorrelationModel.from_payload(sgp_correlation) if sgp_correlation else None
+    )
     if int(max_picks) < 0:
         raise ValueError("max_picks must be >= 0")
     probabilistic_profile = probabilistic_profile.strip().lower() or "off"
@@ -170,7 +190,7 @@ def build_strategy_report(
         return resolved
 
     slate_rows = slate_rows or []
-    slate_snapshot, event_lines = _event_line_index(slate_rows, event_context)
+    slate_snapshot, event_lines = _event_line_index(slate_rows, event_context, slate_lines)
     teams_in_scope = {
         canonical_team_name(str(line.get("home_team", "")))
         for line in event_lines.values()
@@ -183,6 +203,12 @@ def build_strategy_report(
 
     injuries_by_player = _injury_index(injuries)
     injuries_by_team = _injuries_by_team(injuries)
+    availability = _availability_index(
+        event_context=event_context,
+        roster=roster,
+        injuries_by_player=injuries_by_player,
+        player_identity_map=player_identity_map,
+    )
     official = injuries.get("official", {}) if isinstance(injuries, dict) else {}
     secondary = injuries.get("secondary", {}) if isinstance(injuries, dict) else {}
     official_rows_count = _official_rows_count(official if isinstance(official, dict) else None)
@@ -215,6 +241,14 @@ def build_strategy_report(
 
     tier_a_min_ev = max(min_ev, 0.03)
     tier_b_min_ev = max(min_ev, 0.05)
+    minutes_prob_rows = (
+        _minutes_prob_rows(
+            minutes_probabilities,
+            [(event_id, player, market) for event_id, market, player, _ in grouped],
+        )
+        if probabilistic_profile == "minutes_v1"
+        else {}
+    )
 
     for key, group_rows in grouped.items():
         event_id, market, player, point = key
@@ -325,17 +359,12 @@ def build_strategy_report(
         baseline_is_independent_of_selected_book = False
         baseline_insufficient_after_exclusion = False
 
-        player_norm = normalize_person_name(player)
-        injury_row = injuries_by_player.get(player_norm, {})
+        player_norm = availability.player_norm(player)
+        player_availability = availability.lookup(player_name=player, event_id=event_id)
+        injury_row = player_availability.injury_row
         injury_status = str(injury_row.get("status", "unknown"))
         injury_note = str(injury_row.get("note", ""))
-        roster_status = _roster_status(
-            player_name=player,
-            event_id=event_id,
-            event_context=event_context,
-            roster=roster,
-            player_identity_map=player_identity_map,
-        )
+        roster_status = player_availability.roster_status
         if (
             official_ready
             and player_norm not in official_player_norms
@@ -344,14 +373,7 @@ def build_strategy_report(
             injury_status = "available_unlisted"
             if not injury_note:
                 injury_note = "Not listed on official NBA injury report."
-        player_team = _resolve_player_team(
-            player_name=player,
-            event_id=event_id,
-            event_context=event_context,
-            roster=roster,
-            injury_row=injury_row,
-            player_identity_map=player_identity_map,
-        )
+        player_team = player_availability.team
         line_meta = event_lines.get(event_id, {})
         home_team = str(line_meta.get("home_team", ""))
         away_team = str(line_meta.get("away_team", ""))
@@ -367,9 +389,7 @@ def build_strategy_report(
         else:
             opponent_team = ""
 
-        teammate_counts = _count_team_status(
-            injuries_by_team.get(player_team, []), normalize_person_name(player)
-        )
+        teammate_counts = _count_team_status(injuries_by_team.get(player_team, []), player_norm)
         opponent_counts = _count_team_status(injuries_by_team.get(opponent_team, []), "")
         spread_abs = _safe_float(line_meta.get("spread_abs"))
         total = _safe_float(line_meta.get("total"))
@@ -428,12 +448,7 @@ def build_strategy_report(
             p_over_model = _clamp(p_over_fair + adjustment + market_delta, 0.01, 0.99)
             p_under_model = 1.0 - p_over_model
             if probabilistic_profile == "minutes_v1":
-                minutes_prob_row = _minutes_prob_lookup(
-                    minutes_probabilities,
-                    event_id=event_id,
-                    player=player,
-                    market=market,
-                )
+                minutes_prob_row = minutes_prob_rows.get((event_id, player, market), {})
                 minutes_p10 = _safe_float(minutes_prob_row.get("minutes_p10"))
                 minutes_p50 = _safe_float(minutes_prob_row.get("minutes_p50"))
                 minutes_p90 = _safe_float(minutes_prob_row.get("minutes_p90"))
@@ -1177,7 +1192,13 @@ def build_strategy_report(
     portfolio_watchlist = portfolio_exclusions[: max(0, top_n)]
     top_ev_plays = [item for item in ranked if item.get("tier") == "A"][: max(0, top_n)]
     one_source_edges = [item for item in ranked if item.get("tier") == "B"][: max(0, top_n)]
-    sgp_candidates = _build_sgp_candidates(eligible_rows, top_n=min(10, max(top_n, 5)))
+    sgp_candidates = _build_sgp_candidates(
+        eligible_rows,
+        top_n=min(10, max(top_n, 5)),
+        max_legs_per_event=sgp_max_legs_per_event,
+        legs_per_combo=sgp_legs_per_combo,
+        correlation=sgp_correlation_model,
+    )
 
     qualified_unders = [item for item in eligible_rows if item.get("recommended_side") == "under"]
     closest_under_misses = [
@@ -1284,7 +1305,7 @@ def build_strategy_report(
         gaps.append("Roster verification feed was not available.")
     elif roster_count == 0:
         gaps.append("Roster feed returned no team/player rows for these events.")
-    if not slate_rows:
+    if not slate_rows and not slate_lines:
         gaps.append("Slate spreads/totals were unavailable in this snapshot.")
     if injuries_stale:
         gaps.append("Injury context cache is stale (TTL exceeded).")
@@ -1525,6 +1546,9 @@ def build_strategy_report(
             "probabilistic_profile": probabilistic_profile,
             "min_prob_confidence": min_prob_confidence,
             "max_minutes_band": max_minutes_band,
+            "sgp_max_legs_per_event": sgp_max_legs_per_event,
+            "sgp_legs_per_combo": sgp_legs_per_combo,
+            "sgp_correlation": dict(sgp_correlation) if sgp_correlation else None,
             "probabilistic_rows_used": probabilistic_rows_used,
             "rolling_priors_window_days": rolling_priors_window_days,
             "rolling_priors_rows_used": rolling_priors_rows_used,
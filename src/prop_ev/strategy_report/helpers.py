@@ -20,6 +20,7 @@ from prop_ev.nba_data.normalize import canonical_team_name, normalize_person_nam
 from prop_ev.odds_math import (
     american_to_decimal,
     decimal_to_american,
+    ev_and_kelly,
     ev_from_prob_and_price,
     implied_prob_from_american,
     normalize_prob_pair,
@@ -32,7 +33,15 @@ from prop_ev.pricing_core import (
 )
 from prop_ev.pricing_reference import ReferencePoint, estimate_reference_probability
 from prop_ev.rolling_priors import calibration_feedback
+from prop_ev.sgp_engine import (
+    DEFAULT_SGP_CORRELATION,
+    DEFAULT_SGP_MAX_LEGS_PER_EVENT,
+    SGPCorrelationModel,
+    build_sgp_candidates,
+)
+from prop_ev.slate_lines import summarize_slate_lines
 from prop_ev.state_keys import strategy_report_state_key
+from prop_ev.strategy_context_impl import AvailabilityIndex
 from prop_ev.strategy_context_impl import count_team_status as _count_team_status_impl
 from prop_ev.strategy_context_impl import injuries_by_team as _injuries_by_team_impl
 from prop_ev.strategy_context_impl import injury_index as _injury_index_impl
@@ -46,9 +55,11 @@ from prop_ev.strategy_minutes_impl import (
     minutes_prob_adjustment_over as _minutes_prob_adjustment_over_impl,
 )
 from prop_ev.strategy_minutes_impl import minutes_prob_lookup as _minutes_prob_lookup_impl
+from prop_ev.strategy_minutes_impl import minutes_prob_rows as _minutes_prob_rows_impl
 from prop_ev.strategy_minutes_impl import minutes_usage as _minutes_usage_impl
 from prop_ev.strategy_minutes_impl import probability_adjustment as _probability_adjustment_impl
 from prop_ev.time_utils import parse_iso_z, utc_now_str
+from prop_ev.util.jsonl import read_jsonl
 from prop_ev.util.parsing import safe_float as _safe_float
 from prop_ev.util.parsing import to_price as _to_price
 
@@ -119,6 +130,7 @@ __all__ = [
     "UTC",
     "_american_to_decimal",
     "_audit_entries",
+    "_availability_index",
     "_availability_notes",
     "_best_side",
     "_bool",
@@ -148,6 +160,7 @@ __all__ = [
     "_merged_injury_rows",
     "_minutes_prob_adjustment_over",
     "_minutes_prob_lookup",
+    "_minutes_prob_rows",
     "_minutes_usage_core",
     "_nba_roster_link",
     "_normalize_prob_pair",
@@ -210,14 +223,7 @@ def _et_date_label(event_context: dict[str, dict[str, str]] | None) -> str:
 
 def load_jsonl(path: Path) -> list[dict[str, Any]]:
     """Load JSONL rows from disk."""
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        row = json.loads(line)
-        if isinstance(row, dict):
-            rows.append(row)
-    return rows
+    return read_jsonl(path)
 
 
 def _fmt_point(value: Any) -> str:
@@ -411,6 +417,21 @@ def _injuries_by_team(injuries: dict[str, Any] | None) -> dict[str, list[dict[st
     return _injuries_by_team_impl(injuries)
 
 
+def _availability_index(
+    *,
+    event_context: dict[str, dict[str, str]] | None,
+    roster: dict[str, Any] | None,
+    injuries_by_player: dict[str, dict[str, Any]] | None,
+    player_identity_map: dict[str, Any] | None = None,
+) -> AvailabilityIndex:
+    return AvailabilityIndex(
+        event_context=event_context,
+        roster=roster,
+        injuries_by_player=injuries_by_player,
+        player_identity_map=player_identity_map,
+    )
+
+
 def _roster_status(
     *,
     player_name: str,
@@ -500,6 +521,13 @@ def _minutes_prob_lookup(
     )
 
 
+def _minutes_prob_rows(
+    minutes_probabilities: dict[str, Any] | None,
+    keys: list[tuple[str, str, str]],
+) -> dict[tuple[str, str, str], dict[str, Any]]:
+    return _minutes_prob_rows_impl(minutes_probabilities, keys)
+
+
 def _minutes_prob_adjustment_over(
     *,
     market: str,
@@ -537,107 +565,30 @@ def _probability_adjustment(
 def _ev_and_kelly(
     probability: float | None, american_price: int | None
 ) -> tuple[float | None, float | None]:
-    ev = ev_from_prob_and_price(probability, american_price)
-    if ev is None:
-        return None, None
-    decimal_odds = _american_to_decimal(american_price)
-    if decimal_odds is None:
-        return None, None
-    profit_if_win = decimal_odds - 1.0
-    if profit_if_win <= 0:
-        return None, None
-    kelly = ev / profit_if_win
-    return round(ev, 6), round(kelly, 6)
+    return ev_and_kelly(probability, american_price)
 
 
 def _sgp_haircut(legs: list[dict[str, Any]]) -> float:
     """Apply a conservative correlation haircut for same-game combinations."""
-    if not legs:
-        return 0.0
-    players = [str(leg.get("player", "")) for leg in legs]
-    markets = [str(leg.get("market", "")) for leg in legs]
-    sides = [str(leg.get("recommended_side", "")) for leg in legs]
-    teams = [str(leg.get("player_team", "")) for leg in legs]
-
-    if len(set(players)) < len(players):
-        return 0.15
-    if len(set(teams)) == 1 and all(side == "over" for side in sides):
-        return 0.12
-    if any(
-        market in {"player_points", "player_assists", "player_points_rebounds_assists"}
-        for market in markets
-    ):
-        return 0.08
-    return 0.05
-
-
-def _build_sgp_candidates(eligible_rows: list[dict[str, Any]], top_n: int) -> list[dict[str, Any]]:
-    """Build simple 2-leg SGP candidates with correlation haircut."""
-    by_event: dict[str, list[dict[str, Any]]] = {}
-    for row in eligible_rows:
-        if not isinstance(row, dict):
-            continue
-        event_id = str(row.get("event_id", ""))
-        if not event_id:
-            continue
-        by_event.setdefault(event_id, []).append(row)
-
-    candidates: list[dict[str, Any]] = []
-    for event_rows in by_event.values():
-        sorted_rows = sorted(event_rows, key=lambda row: -(row.get("best_ev") or -999.0))
-        for i in range(min(len(sorted_rows), 8)):
-            for j in range(i + 1, min(len(sorted_rows), 8)):
-                leg_a = sorted_rows[i]
-                leg_b = sorted_rows[j]
-                p_a = _safe_float(leg_a.get("model_p_hit"))
-                p_b = _safe_float(leg_b.get("model_p_hit"))
-                d_a = _american_to_decimal(_to_price(leg_a.get("selected_price")))
-                d_b = _american_to_decimal(_to_price(leg_b.get("selected_price")))
-                if p_a is None or p_b is None or d_a is None or d_b is None:
-                    continue
-                indep_p = p_a * p_b
-                haircut = _sgp_haircut([leg_a, leg_b])
-                adj_p = indep_p * (1.0 - haircut)
-                decimal_combo = d_a * d_b
-                ev = (adj_p * (decimal_combo - 1.0)) - (1.0 - adj_p)
-                american_combo = _decimal_to_american(decimal_combo)
-                _, quarter_kelly = _ev_and_kelly(adj_p, american_combo)
-                candidates.append(
-                    {
-                        "event_id": str(leg_a.get("event_id", "")),
-                        "game": str(leg_a.get("game", "")),
-                        "legs": [
-                            {
-                                "player": str(leg_a.get("player", "")),
-                                "market": str(leg_a.get("market", "")),
-                                "point": leg_a.get("point"),
-                                "side": str(leg_a.get("recommended_side", "")),
-                                "price": leg_a.get("selected_price"),
-                                "p_hit": p_a,
-                            },
-                            {
-                                "player": str(leg_b.get("player", "")),
-                                "market": str(leg_b.get("market", "")),
-                                "point": leg_b.get("point"),
-                                "side": str(leg_b.get("recommended_side", "")),
-                                "price": leg_b.get("selected_price"),
-                                "p_hit": p_b,
-                            },
-                        ],
-                        "independence_joint_p": round(indep_p, 6),
-                        "haircut": round(haircut, 4),
-                        "adjusted_joint_p": round(adj_p, 6),
-                        "unboosted_decimal": round(decimal_combo, 6),
-                        "unboosted_american": american_combo,
-                        "ev_per_100": round(ev * 100.0, 3),
-                        "recommended_fractional_kelly": (
-                            round((quarter_kelly / 2.0), 6) if quarter_kelly is not None else None
-                        ),
-                    }
-                )
-
-    candidates.sort(key=lambda row: -(row.get("ev_per_100") or -999.0))
-    return candidates[: max(0, top_n)]
+    return DEFAULT_SGP_CORRELATION.haircut(legs)
+
+
+def _build_sgp_candidates(
+    eligible_rows: list[dict[str, Any]],
+    top_n: int,
+    *,
+    max_legs_per_event: int = DEFAULT_SGP_MAX_LEGS_PER_EVENT,
+    legs_per_combo: int = 2,
+    correlation: SGPCorrelationModel | None = None,
+) -> list[dict[str, Any]]:
+    """Build same-game SGP candidates with correlation haircut."""
+    return build_sgp_candidates(
+        eligible_rows,
+        top_n,
+        max_legs_per_event=max_legs_per_event,
+        legs_per_combo=legs_per_combo,
+        correlation=correlation,
+    )
 
 
 def _play_to(probability: float | None, target_roi: float) -> tuple[float | None, int | None]:
@@ -806,59 +757,43 @@ def _spread_display(home_team: str, home_spread: float | None) -> str:
 
 
 def _event_line_index(
-    slate_rows: list[dict[str, Any]], event_context: dict[str, dict[str, str]] | None
+    slate_rows: list[dict[str, Any]],
+    event_context: dict[str, dict[str, str]] | None,
+    slate_lines: list[dict[str, Any]] | None = None,
 ) -> tuple[list[dict[str, str]], dict[str, dict[str, Any]]]:
-    rows_by_event: dict[str, dict[str, list[float]]] = {}
-    for row in slate_rows:
-        if not isinstance(row, dict):
-            continue
-        event_id = str(row.get("event_id", row.get("game_id", "")))
-        if not event_id:
-            continue
-        market = str(row.get("market", ""))
-        point = _safe_float(row.get("point"))
-        if point is None:
-            continue
-        bucket = rows_by_event.setdefault(event_id, {"totals": [], "home_spreads": []})
-        if market == "totals":
-            bucket["totals"].append(point)
-            continue
-        if market != "spreads":
+    if slate_lines is None:
+        slate_lines = summarize_slate_lines(slate_rows, event_context)
+    lines_by_event: dict[str, dict[str, Any]] = {}
+    for line in slate_lines:
+        if not isinstance(line, dict):
             continue
-
-        ctx = event_context.get(event_id, {}) if isinstance(event_context, dict) else {}
-        home_team = canonical_team_name(str(ctx.get("home_team", "")))
-        away_team = canonical_team_name(str(ctx.get("away_team", "")))
-        side = canonical_team_name(str(row.get("side", "")))
-        if side and side == home_team:
-            bucket["home_spreads"].append(point)
-        elif side and side == away_team:
-            bucket["home_spreads"].append(-point)
+        event_id = str(line.get("event_id", ""))
+        if event_id:
+            lines_by_event[event_id] = line
 
     slate_snapshot: list[dict[str, str]] = []
     event_lines: dict[str, dict[str, Any]] = {}
-    event_ids: set[str] = set(rows_by_event)
+    event_ids: set[str] = set(lines_by_event)
     if isinstance(event_context, dict):
         event_ids.update(event_context.keys())
 
+    def _context(event_id: str) -> dict[str, Any]:
+        ctx = event_context.get(event_id, {}) if isinstance(event_context, dict) else {}
+        return ctx if ctx else lines_by_event.get(event_id, {})
+
     def _sort_key(event_id: str) -> tuple[int, str]:
-        commence = ""
-        if isinstance(event_context, dict):
-            commence = str(event_context.get(event_id, {}).get("commence_time", ""))
-        parsed = parse_iso_z(commence)
+        parsed = parse_iso_z(str(_context(event_id).get("commence_time", "")))
         if parsed is None:
             return (2, event_id)
         return (1, parsed.isoformat())
 
     for event_id in sorted(event_ids, key=_sort_key):
-        ctx = event_context.get(event_id, {}) if isinstance(event_context, dict) else {}
+        ctx = _context(event_id)
         home_team = str(ctx.get("home_team", ""))
         away_team = str(ctx.get("away_team", ""))
-        line_rows = rows_by_event.get(event_id, {})
-        totals = line_rows.get("totals", [])
-        home_spreads = line_rows.get("home_spreads", [])
-        total = round(median(totals), 1) if totals else None
-        home_spread = round(median(home_spreads), 1) if home_spreads else None
+        line = lines_by_event.get(event_id, {})
+        total = _safe_float(line.get("total"))
+        home_spread = _safe_float(line.get("home_spread"))
         tip_et = _tip_et(str(ctx.get("commence_time", "")))
         game = f"{away_team} @ {home_team}".strip()
         slate_snapshot.append(
@@ -0,0 +1,199 @@
+"""Append-only usage ledgers with incremental rollup sidecars.
+
+Each monthly ledger ``usage-YYYY-MM.jsonl`` gets a ``usage-YYYY-MM.rollup.json`` sidecar
+holding running totals overall and sliced by day, snapshot and a ledger-specific
+dimension (endpoint for Odds API, task for LLM). The sidecar records the byte offset
+of the ledger it has folded in, so refreshing it only parses rows appended since the
+last checkpoint. Budget checks and credit reports read the sidecar instead of
+re-scanning the month.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any, Literal
+
+from prop_ev.util.jsonl import dumps_row
+from prop_ev.util.parsing import safe_float as _safe_float_impl
+from prop_ev.util.parsing import safe_int as _safe_int_impl
+
+ROLLUP_SCHEMA_VERSION = 1
+LedgerKind = Literal["odds", "llm"]
+
+_SLICE_FIELDS: dict[LedgerKind, dict[str, str]] = {
+    "odds": {"by_endpoint": "endpoint", "by_snapshot": "snapshot_id"},
+    "llm": {"by_task": "task", "by_model": "model", "by_snapshot": "snapshot_id"},
+}
+_METRIC_NAMES: dict[LedgerKind, tuple[str, ...]] = {
+    "odds": ("rows", "credits", "cached_rows"),
+    "llm": ("rows", "cost_usd", "input_tokens", "output_tokens", "cached_rows"),
+}
+
+
+def _safe_int(value: Any) -> int:
+    parsed = _safe_int_impl(value)
+    return parsed if parsed is not None else 0
+
+
+def _safe_float(value: Any) -> float:
+    parsed = _safe_float_impl(value)
+    return parsed if parsed is not None else 0.0
+
+
+def rollup_path_for(ledger_path: Path) -> Path:
+    """Return the rollup sidecar path for one ledger file."""
+    return ledger_path.with_name(f"{ledger_path.stem}.rollup.json")
+
+
+def _lock_path_for(ledger_path: Path) -> Path:
+    return ledger_path.with_name(f".{ledger_path.stem}.lock")
+
+
+@contextmanager
+def _locked(ledger_path: Path) -> Iterator[None]:
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    with _lock_path_for(ledger_path).open("a", encoding="utf-8") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _empty_rollup(kind: LedgerKind, ledger_path: Path) -> dict[str, Any]:
+    return {
+        "schema_version": ROLLUP_SCHEMA_VERSION,
+        "kind": kind,
+        "ledger": ledger_path.name,
+        "offset": 0,
+        "totals": dict.fromkeys(_METRIC_NAMES[kind], 0),
+        "by_day": {},
+        **{name: {} for name in _SLICE_FIELDS[kind]},
+        **({"by_day_endpoint": {}} if kind == "odds" else {}),
+        "last": {},
+    }
+
+
+def _row_metrics(kind: LedgerKind, row: dict[str, Any]) -> dict[str, int | float]:
+    cached = 1 if bool(row.get("cached", False)) else 0
+    if kind == "odds":
+        return {
+            "rows": 1,
+            "credits": _safe_int(row.get("x_requests_last", 0)),
+            "cached_rows": cached,
+        }
+    return {
+        "rows": 1,
+        "cost_usd": _safe_float(row.get("cost_usd", 0.0)),
+        "input_tokens": _safe_int(row.get("input_tokens", 0)),
+        "output_tokens": _safe_int(row.get("output_tokens", 0)),
+        "cached_rows": cached,
+    }
+
+
+def _add(bucket: dict[str, Any], metrics: dict[str, int | float]) -> None:
+    for name, value in metrics.items():
+        bucket[name] = bucket.get(name, 0) + value
+
+
+def _fold_row(rollup: dict[str, Any], kind: LedgerKind, row: dict[str, Any]) -> None:
+    metrics = _row_metrics(kind, row)
+    _add(rollup["totals"], metrics)
+    day = str(row.get("timestamp_utc", ""))[:10]
+    _add(rollup["by_day"].setdefault(day, {}), metrics)
+    for slice_name, field_name in _SLICE_FIELDS[kind].items():
+        key = str(row.get(field_name, ""))
+        _add(rollup[slice_name].setdefault(key, {}), metrics)
+    if kind == "odds":
+        endpoint = str(row.get("endpoint", ""))
+        _add(rollup["by_day_endpoint"].setdefault(day, {}).setdefault(endpoint, {}), metrics)
+        remaining = row.get("x_requests_remaining")
+        if remaining is not None:
+            rollup["last"]["provider_remaining"] = str(remaining)
+    rollup["last"]["timestamp_utc"] = str(row.get("timestamp_utc", ""))
+
+
+def _load_sidecar(kind: LedgerKind, ledger_path: Path) -> dict[str, Any]:
+    path = rollup_path_for(ledger_path)
+    if not path.exists():
+        return _empty_rollup(kind, ledger_path)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return _empty_rollup(kind, ledger_path)
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema_version") != ROLLUP_SCHEMA_VERSION
+        or payload.get("kind") != kind
+    ):
+        return _empty_rollup(kind, ledger_path)
+    return payload
+
+
+def _save_sidecar(ledger_path: Path, rollup: dict[str, Any]) -> None:
+    path = rollup_path_for(ledger_path)
+    tmp_path = path.with_name(f".tmp-{path.name}-{uuid.uuid4().hex}")
+    try:
+        tmp_path.write_text(json.dumps(rollup, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+
+
+def _catch_up(kind: LedgerKind, ledger_path: Path) -> dict[str, Any]:
+    """Fold rows past the checkpoint into the rollup; caller holds the lock."""
+    rollup = _load_sidecar(kind, ledger_path)
+    if not ledger_path.exists():
+        return rollup if int(rollup.get("offset", 0)) == 0 else _empty_rollup(kind, ledger_path)
+    size = ledger_path.stat().st_size
+    offset = int(rollup.get("offset", 0))
+    if offset > size:
+        # Ledger was truncated or replaced; rebuild from the start.
+        rollup = _empty_rollup(kind, ledger_path)
+        offset = 0
+    if offset == size:
+        return rollup
+    with ledger_path.open("rb") as handle:
+        handle.seek(offset)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                # Partial trailing write; pick it up once the line is complete.
+                break
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(row, dict):
+                _fold_row(rollup, kind, row)
+    rollup["offset"] = offset
+    _save_sidecar(ledger_path, rollup)
+    return rollup
+
+
+def append_usage_row(ledger_path: Path, row: dict[str, Any], *, kind: LedgerKind) -> None:
+    """Append one ledger row and advance the rollup sidecar past it."""
+    with _locked(ledger_path):
+        with ledger_path.open("a", encoding="utf-8") as handle:
+            handle.write(dumps_row(row) + "\n")
+        _catch_up(kind, ledger_path)
+
+
+def load_usage_rollup(ledger_path: Path, *, kind: LedgerKind) -> dict[str, Any]:
+    """Return the up-to-date rollup for one ledger, folding in any unseen rows."""
+    rollup = _load_sidecar(kind, ledger_path)
+    if ledger_path.exists() and int(rollup.get("offset", -1)) == ledger_path.stat().st_size:
+        return rollup
+    if not ledger_path.exists() and not rollup_path_for(ledger_path).exists():
+        return rollup
+    with _locked(ledger_path):
+        return _catch_up(kind, ledger_path)
@@ -0,0 +1,46 @@
+"""File content fingerprints with a size/mtime fast path."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of ``path``."""
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def file_fingerprint(path: Path) -> dict[str, Any]:
+    """Return the size, mtime and content hash of ``path`` (empty hash when missing)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {"path": str(path), "size": -1, "mtime_ns": 0, "sha256": ""}
+    return {
+        "path": str(path),
+        "size": int(stat.st_size),
+        "mtime_ns": int(stat.st_mtime_ns),
+        "sha256": file_sha256(path),
+    }
+
+
+def fingerprint_unchanged(recorded: Any, path: Path) -> bool:
+    """Return whether ``path`` still has the content captured by ``file_fingerprint``.
+
+    Matching size and mtime are trusted without reading the file; otherwise the
+    content is re-hashed, so a touched-but-identical file still matches.
+    """
+    if not isinstance(recorded, dict) or recorded.get("path") != str(path):
+        return False
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return recorded.get("sha256") == ""
+    if stat.st_size != recorded.get("size"):
+        return False
+    if stat.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    return file_sha256(path) == recorded.get("sha256")
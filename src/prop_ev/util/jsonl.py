@@ -0,0 +1,254 @@
+"""Streaming JSONL reader/writer shared across the lake.
+
+Rows are parsed one line at a time from a binary handle, so callers that only aggregate
+never hold the whole file. ``orjson`` is used for parsing when it is installed and the
+stdlib ``json`` module otherwise. Writes always go through the stdlib encoder so the
+bytes on disk stay identical regardless of backend, are flushed in batches, and land
+atomically via tmp file + ``os.replace``. Paths ending in ``.zst`` are compressed and
+decompressed on the fly with ``zstandard`` when installed, else the ``zstd`` CLI.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import IO, Any
+
+ZSTD_SUFFIX = ".zst"
+DEFAULT_WRITE_BATCH_ROWS = 1024
+_READ_BUFFER_BYTES = 1024 * 1024
+
+try:  # pragma: no cover - depends on the environment
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+
+def _stdlib_loads(raw: bytes) -> Any:
+    return json.loads(raw)
+
+
+def _orjson_loads(raw: bytes) -> Any:
+    try:
+        return _orjson.loads(raw)  # type: ignore[union-attr]
+    except _orjson.JSONDecodeError:  # type: ignore[union-attr]
+        # orjson rejects NaN/Infinity literals that the stdlib encoder can emit.
+        return json.loads(raw)
+
+
+PARSER_BACKENDS: dict[str, Callable[[bytes], Any]] = {"json": _stdlib_loads}
+if _orjson is not None:  # pragma: no cover - depends on the environment
+    PARSER_BACKENDS["orjson"] = _orjson_loads
+
+
+def parser_backend() -> str:
+    """Return the name of the parser used by default."""
+    return "orjson" if "orjson" in PARSER_BACKENDS else "json"
+
+
+def loads(raw: bytes) -> Any:
+    """Decode one JSON document from bytes with the default parser backend."""
+    return PARSER_BACKENDS[parser_backend()](raw)
+
+
+class JsonlRowError(ValueError):
+    """Raised in strict mode when a line does not decode to a JSON object."""
+
+
+def _zstd_bin() -> str:
+    binary = shutil.which("zstd")
+    if not binary:
+        raise RuntimeError("reading/writing .zst JSONL requires zstandard or the zstd binary")
+    return binary
+
+
+@contextmanager
+def _open_read(path: Path) -> Iterator[IO[bytes]]:
+    if path.suffix != ZSTD_SUFFIX:
+        with path.open("rb", buffering=_READ_BUFFER_BYTES) as handle:
+            yield handle
+        return
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+    if zstandard is not None:
+        with path.open("rb") as raw:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+            with io.BufferedReader(reader, buffer_size=_READ_BUFFER_BYTES) as handle:
+                yield handle
+        return
+    process = subprocess.Popen(
+        [_zstd_bin(), "-dc", "-q", str(path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    try:
+        yield process.stdout
+    except BaseException:
+        process.kill()
+        process.communicate()
+        raise
+    _, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError(f"zstd decompression failed: {stderr.decode().strip()}")
+
+
+def iter_jsonl(
+    path: Path | str,
+    *,
+    missing_ok: bool = False,
+    strict: bool = False,
+    skip_invalid: bool = False,
+    backend: str = "",
+) -> Iterator[dict[str, Any]]:
+    """Yield JSON objects from ``path`` one line at a time.
+
+    Blank lines are skipped. Non-object rows are skipped unless ``strict`` is set, in
+    which case ``JsonlRowError`` names the offending line. Lines that fail to decode raise
+    unless ``skip_invalid`` is set.
+    """
+    target = Path(path)
+    if missing_ok and not target.exists():
+        return
+    loads = PARSER_BACKENDS[backend or parser_backend()]
+    with _open_read(target) as handle:
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = loads(line)
+            except ValueError:
+                if skip_invalid:
+                    continue
+                raise
+            if isinstance(row, dict):
+                yield row
+            elif strict:
+                raise JsonlRowError(f"invalid jsonl row in {target}:{line_no}")
+
+
+def read_jsonl(
+    path: Path | str,
+    *,
+    missing_ok: bool = False,
+    strict: bool = False,
+) -> list[dict[str, Any]]:
+    """Return all JSON objects in ``path``; see ``iter_jsonl``."""
+    return list(iter_jsonl(path, missing_ok=missing_ok, strict=strict))
+
+
+def dumps_row(
+    row: Mapping[str, Any],
+    *,
+    compact: bool = False,
+) -> str:
+    """Encode one row the way the lake stores it (sorted keys, ASCII only)."""
+    if compact:
+        return json.dumps(row, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return json.dumps(row, sort_keys=True, ensure_ascii=True)
+
+
+@contextmanager
+def _open_write(path: Path) -> Iterator[IO[bytes]]:
+    if path.suffix != ZSTD_SUFFIX:
+        with path.open("wb") as handle:
+            yield handle
+        return
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+    if zstandard is not None:
+        with (
+            path.open("wb") as raw,
+            zstandard.ZstdCompressor(level=3).stream_writer(raw) as handle,
+        ):
+            yield handle
+        return
+    process = subprocess.Popen(
+        [_zstd_bin(), "-q", "-3", "-f", "-o", str(path)],
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdin is not None
+    try:
+        yield process.stdin
+    except BaseException:
+        process.kill()
+        process.communicate()
+        raise
+    _, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError(f"zstd compression failed: {stderr.decode().strip()}")
+
+
+def write_jsonl(
+    path: Path | str,
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    compact: bool = False,
+    batch_rows: int = DEFAULT_WRITE_BATCH_ROWS,
+) -> int:
+    """Atomically write ``rows`` to ``path`` in batches; returns the row count."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".tmp-{target.name}-{uuid.uuid4().hex}")
+    if target.suffix == ZSTD_SUFFIX:
+        tmp_path = tmp_path.with_name(f"{tmp_path.name}{ZSTD_SUFFIX}")
+    batch_size = max(1, int(batch_rows))
+    count = 0
+    try:
+        with _open_write(tmp_path) as handle:
+            batch: list[str] = []
+            for row in rows:
+                batch.append(dumps_row(row, compact=compact))
+                if len(batch) >= batch_size:
+                    handle.write(("\n".join(batch) + "\n").encode("utf-8"))
+                    count += len(batch)
+                    batch = []
+            if batch:
+                handle.write(("\n".join(batch) + "\n").encode("utf-8"))
+                count += len(batch)
+        os.replace(tmp_path, target)
+    finally:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+    return count
+
+
+def benchmark_parse(path: Path | str, *, repeat: int = 3) -> dict[str, Any]:
+    """Time a full streaming parse of ``path`` with each available backend."""
+    target = Path(path)
+    results: list[dict[str, Any]] = []
+    for name in PARSER_BACKENDS:
+        best = float("inf")
+        rows = 0
+        for _ in range(max(1, int(repeat))):
+            started = time.perf_counter()
+            rows = sum(1 for _ in iter_jsonl(target, backend=name))
+            best = min(best, time.perf_counter() - started)
+        results.append(
+            {
+                "backend": name,
+                "rows": rows,
+                "best_s": round(best, 6),
+                "rows_per_s": round(rows / best, 1) if best > 0 else 0.0,
+            }
+        )
+    return {
+        "path": str(target),
+        "bytes": target.stat().st_size,
+        "repeat": max(1, int(repeat)),
+        "default_backend": parser_backend(),
+        "results": results,
+    }
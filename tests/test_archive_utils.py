@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import io
+import shutil
+import subprocess
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from prop_ev.archive_utils import ArchiveError, extract_tar_zst
+from prop_ev.snapshot_artifacts import pack_snapshot, unpack_snapshot
+
+pytestmark = pytest.mark.skipif(shutil.which("zstd") is None, reason="zstd binary required")
+
+
+def test_pack_and_unpack_snapshot_stream_without_tar_files(tmp_path: Path) -> None:
+    data_root = tmp_path / "odds_api"
+    snapshot_id = "2026-02-11T10-00-00Z"
+    snapshot_dir = data_root / "snapshots" / snapshot_id
+    (snapshot_dir / "derived").mkdir(parents=True)
+    (snapshot_dir / "manifest.json").write_text('{"snapshot_id": "x"}\n', encoding="utf-8")
+    payload = "".join(f'{{"row": {idx}}}\n' for idx in range(5000))
+    (snapshot_dir / "derived" / "event_props.jsonl").write_text(payload, encoding="utf-8")
+    (snapshot_dir / ".lock").write_text("", encoding="utf-8")
+
+    bundle_path, sidecar_path = pack_snapshot(
+        data_root=data_root, snapshot_id=snapshot_id, level=3, threads=2
+    )
+
+    assert bundle_path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    assert sidecar_path.exists()
+    assert {path.name for path in bundle_path.parent.iterdir()} == {
+        bundle_path.name,
+        sidecar_path.name,
+    }
+
+    restored_root = tmp_path / "restored"
+    result = unpack_snapshot(data_root=restored_root, bundle_path=bundle_path)
+
+    assert result["snapshot_ids"] == [snapshot_id]
+    assert result["files_extracted"] == 2
+    restored = restored_root / "snapshots" / snapshot_id / "derived" / "event_props.jsonl"
+    assert restored.read_text(encoding="utf-8") == payload
+
+
+def _tar_zst_bytes(members: list[tuple[str, bytes]]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, data in members:
+            member = tarfile.TarInfo(name)
+            member.size = len(data)
+            tar.addfile(member, io.BytesIO(data))
+    return subprocess.run(
+        ["zstd", "-q", "-c"], input=buffer.getvalue(), capture_output=True, check=True
+    ).stdout
+
+
+def test_extract_tar_zst_rejects_path_traversal(tmp_path: Path) -> None:
+    archive = tmp_path / "evil.tar.zst"
+    archive.write_bytes(
+        _tar_zst_bytes([("snapshots/a/manifest.json", b"{}"), ("../escape.txt", b"owned")])
+    )
+    destination = tmp_path / "out"
+
+    with pytest.raises(ArchiveError, match="unsafe tar member path"):
+        extract_tar_zst(zst_path=archive, destination=destination)
+    assert not (tmp_path / "escape.txt").exists()
+    assert list(destination.iterdir()) == []
+
+
+def test_extract_tar_zst_leaves_destination_untouched_on_truncated_stream(
+    tmp_path: Path,
+) -> None:
+    payload = _tar_zst_bytes([("snapshots/a/manifest.json", b"{}" * 50_000)])
+    archive = tmp_path / "truncated.tar.zst"
+    archive.write_bytes(payload[: len(payload) // 2])
+    destination = tmp_path / "out"
+    (destination / "snapshots").mkdir(parents=True)
+
+    with pytest.raises(ArchiveError):
+        extract_tar_zst(zst_path=archive, destination=destination)
+    assert [path.name for path in destination.iterdir()] == ["snapshots"]
+    assert list((destination / "snapshots").iterdir()) == []
@@ -1,5 +1,7 @@
 from prop_ev.brief_builder import (
+    append_game_cards_section,
     build_analyst_web_prompt,
+    build_brief_document,
     build_brief_input,
     default_analyst_take,
     default_pass1,
@@ -397,3 +399,52 @@ def test_enforce_snapshot_dates_et_inserts_fields_and_removes_llm_date_line() ->
     assert "- modeled_date_et: `2026-02-11`" in patched
     assert "- generated_at_et: `2026-02-11 12:00:00 PM EST`" in patched
     assert "Date: 2026-02-11" not in patched
+
+
+def test_build_brief_document_matches_rule_by_rule_markdown() -> None:
+    brief = build_brief_input(_sample_report(), top_n=5)
+    pass1 = default_pass1(brief)
+    analyst = render_analyst_take_section(
+        default_analyst_take(brief, pass1), mode="deterministic_fallback", brief_input=brief
+    )
+    markdown = (
+        "## Snapshot\n\nDate: Feb 11\n- source: llm\n\n"
+        "## Data Quality\n\n- roster missing\n\n<!-- pagebreak -->\n\n"
+        "## Pre-Bet Checklist\n\n- check\n\n"
+        "## Action Plan (GO / LEAN / NO-GO)\n\n"
+        "| Action | Game | Tier | Ticket | p(hit) | Edge Note | Why |\n"
+        "| --- | --- | --- | --- | --- | --- | --- |\n"
+        "| GO | — | — | — | — | — | No plays cleared as GO. |\n\n"
+        "## Risks and Watchouts\n\n- r\n\n"
+        "## Confidence\n\n- medium   \n\n\n"
+    )
+
+    expected = strip_risks_and_watchouts_section(markdown)
+    expected = strip_tier_b_view_section(expected)
+    expected = strip_empty_go_placeholder_rows(expected)
+    expected = enforce_readability_labels(expected, top_n=5)
+    expected = upsert_action_plan_table(expected, brief_input=brief, top_n=5)
+    expected = upsert_analyst_take_section(expected, analyst)
+    expected = upsert_best_available_section(expected, brief_input=brief)
+    expected = ensure_pagebreak_before_action_plan(expected)
+    expected = append_game_cards_section(expected, brief_input=brief)
+    expected = move_disclosures_to_end(expected)
+    expected = enforce_p_hit_notes(expected)
+    expected = enforce_snapshot_mode_labels(
+        expected, llm_pass1_status="ok", llm_pass2_status="fallback"
+    )
+    expected = enforce_snapshot_dates_et(expected, brief_input=brief)
+
+    document = build_brief_document(
+        markdown,
+        brief_input=brief,
+        top_n=5,
+        analyst_section_markdown=analyst,
+        llm_pass1_status="ok",
+        llm_pass2_status="fallback",
+    )
+    assert document.to_markdown() == expected
+    assert [section.title for section in document.sections][-2:] == [
+        "## Data Quality",
+        "## Confidence",
+    ]
@@ -173,3 +173,74 @@ def test_data_repair_derived_skips_incomplete_day(
     assert payload["repaired_days"] == 0
     assert payload["skipped_incomplete_days"] == 1
     assert payload["days"][0]["status"] == "skipped_incomplete"
+
+
+def test_data_repair_derived_runs_in_pool_and_skips_verified_snapshots(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    spec = _build_spec()
+    save_dataset_spec(data_root, spec)
+    store = SnapshotStore(data_root)
+    days = ["2026-02-12", "2026-02-13"]
+    for day in days:
+        snapshot_id = snapshot_id_for_day(spec, day)
+        snapshot_dir = store.ensure_snapshot(snapshot_id)
+        store.write_jsonl(
+            snapshot_dir / "derived" / "event_props.jsonl",
+            [
+                {
+                    "provider": "odds_api",
+                    "snapshot_id": snapshot_id,
+                    "schema_version": 1,
+                    "event_id": "event-1",
+                    "market": "player_points",
+                    "player": "Player A",
+                    "side": "Over",
+                    "price": -105,
+                    "point": point,
+                    "book": "draftkings",
+                    "last_update": "2026-02-12T18:00:00Z",
+                    "link": "",
+                }
+                for point in (10.5, 9.5)
+            ],
+        )
+        save_day_status(data_root, spec, day, _complete_status(day=day, snapshot_id=snapshot_id))
+
+    def _repair(*extra: str) -> dict[str, object]:
+        code = main(
+            [
+                "--data-dir",
+                str(data_root),
+                "data",
+                "repair-derived",
+                "--dataset-id",
+                dataset_id(spec),
+                "--from",
+                days[0],
+                "--to",
+                days[-1],
+                "--json",
+                *extra,
+            ]
+        )
+        assert code == 0
+        return json.loads(capsys.readouterr().out)
+
+    first = _repair("--workers", "2")
+    assert first["workers"] == 2
+    assert first["repaired_days"] == 2
+    assert [row["jsonl_rewritten"] for row in first["days"]] == [1, 1]
+
+    second = _repair("--workers", "1")
+    assert second["skipped_verified_days"] == 2
+    assert {row["status"] for row in second["days"]} == {"skipped_verified"}
+
+    snapshot_dir = data_root / "snapshots" / snapshot_id_for_day(spec, days[0])
+    props_path = snapshot_dir / "derived" / "event_props.jsonl"
+    props_path.write_text(props_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    third = _repair("--workers", "1")
+    assert third["skipped_verified_days"] == 1
+    assert [row["status"] for row in third["days"]] == ["repaired", "skipped_verified"]
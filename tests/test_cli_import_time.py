@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ("polars", "pyarrow", "numpy", "sklearn", "httpx", "tenacity", "pydantic_settings")
+IMPORT_BUDGET_S = float(os.environ.get("PROP_EV_CLI_IMPORT_BUDGET_S", "1.0"))
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from prop_ev.cli import main
+imported = time.perf_counter() - started
+try:
+    code = main(sys.argv[1:])
+except SystemExit as exc:
+    code = int(exc.code or 0)
+elapsed = time.perf_counter() - started
+heavy = sorted(name for name in json.loads(sys.stdin.read()) if name in sys.modules)
+result = {"code": code, "import_s": imported, "total_s": elapsed, "heavy": heavy}
+print("PROBE " + json.dumps(result))
+"""
+
+
+def _probe(argv: list[str]) -> dict:
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(src_dir), env.get("PYTHONPATH", "")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, *argv],
+        input=json.dumps(HEAVY_MODULES),
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    line = next(row for row in completed.stdout.splitlines() if row.startswith("PROBE "))
+    return json.loads(line.removeprefix("PROBE "))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["snapshot", "ls"],
+        ["snapshot", "show", "--snapshot-id", "missing"],
+        ["strategy", "ls"],
+        ["data", "datasets", "ls"],
+        ["credits", "report"],
+    ],
+)
+def test_lightweight_commands_cold_start_within_budget(tmp_path: Path, argv: list[str]) -> None:
+    result = _probe(["--data-dir", str(tmp_path / "odds_api"), *argv])
+
+    assert result["heavy"] == []
+    assert result["import_s"] < IMPORT_BUDGET_S
+    assert result["total_s"] < IMPORT_BUDGET_S
@@ -7,6 +7,7 @@ import pytest
 
 from prop_ev import runtime_config
 from prop_ev.cli import _run_strategy_for_playbook, main
+from prop_ev.odds_client import OddsResponse
 from prop_ev.playbook import report_outputs_root
 from prop_ev.report_paths import snapshot_reports_dir
 from prop_ev.storage import SnapshotStore
@@ -179,6 +180,135 @@ def test_snapshot_ls_show_diff(local_data_dir: Path, capsys) -> None:
     assert main(["snapshot", "verify", "--snapshot-id", snap_a]) == 0
 
 
+def test_snapshot_lines_ingests_existing_snapshots(local_data_dir: Path, capsys) -> None:
+    store = SnapshotStore(local_data_dir)
+    base = {
+        "event_id": "event-1",
+        "player": "Player A",
+        "market": "player_points",
+        "book": "draftkings",
+        "side": "Over",
+        "point": 20.5,
+    }
+    for snapshot_id, price, last_update in (
+        ("2026-02-11T10-00-00Z", -110, "2026-02-11T10:00:00Z"),
+        ("2026-02-11T11-00-00Z", -110, "2026-02-11T10:00:00Z"),
+        ("2026-02-11T12-00-00Z", -130, "2026-02-11T11:55:00Z"),
+    ):
+        store.ensure_snapshot(snapshot_id)
+        store.write_jsonl(
+            store.derived_path(snapshot_id, "event_props.jsonl"),
+            [{**base, "price": price, "last_update": last_update}],
+        )
+
+    assert main(["snapshot", "lines", "--ingest-all"]) == 0
+    out = capsys.readouterr().out
+    assert (
+        "snapshot_id=2026-02-11T11-00-00Z line_history_status=ok rows_in=1 rows_appended=0" in out
+    )
+    moves = json.loads(out[out.index("[") :])
+    assert moves[0]["open_price"] == -110
+    assert moves[0]["current_price"] == -130
+    assert moves[0]["observations"] == 2
+
+
+def test_snapshot_props_delta_refetches_only_changed_events(
+    local_data_dir: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    commence = "2099-01-01T00:00:00Z"
+    book_updates = {"event-1": "2026-02-11T10:00:00Z", "event-2": "2026-02-11T10:00:00Z"}
+    fetched: list[str] = []
+
+    def _response(data: object) -> OddsResponse:
+        return OddsResponse(data=data, status_code=200, headers={}, duration_ms=1, retry_count=0)
+
+    class FakeOddsClient:
+        def __init__(self, settings) -> None:
+            self.settings = settings
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+        def list_events(self, **kwargs):
+            return _response(
+                [{"id": event_id, "commence_time": commence} for event_id in book_updates]
+            )
+
+        def get_featured_odds(self, **kwargs):
+            return _response(
+                [
+                    {
+                        "id": event_id,
+                        "commence_time": commence,
+                        "bookmakers": [{"key": "draftkings", "last_update": last_update}],
+                    }
+                    for event_id, last_update in book_updates.items()
+                ]
+            )
+
+        def get_event_odds(self, **kwargs):
+            event_id = kwargs["event_id"]
+            fetched.append(event_id)
+            return _response(
+                {
+                    "id": event_id,
+                    "commence_time": commence,
+                    "bookmakers": [
+                        {
+                            "key": "draftkings",
+                            "last_update": book_updates[event_id],
+                            "markets": [
+                                {
+                                    "key": "player_points",
+                                    "last_update": book_updates[event_id],
+                                    "outcomes": [
+                                        {
+                                            "name": "Over",
+                                            "description": "Player A",
+                                            "price": -110,
+                                            "point": 20.5,
+                                        }
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            )
+
+    monkeypatch.setattr("prop_ev.cli_snapshot_impl.OddsAPIClient", FakeOddsClient)
+    base_args = ["snapshot", "props", "--bookmakers", "draftkings", "--delta"]
+
+    assert main([*base_args, "--snapshot-id", "2026-02-11T10-00-00Z"]) == 0
+    assert fetched == ["event-1", "event-2"]
+
+    fetched.clear()
+    book_updates["event-2"] = "2026-02-11T10:45:00Z"
+    assert main([*base_args, "--snapshot-id", "2026-02-11T11-00-00Z"]) == 0
+    out = capsys.readouterr().out
+
+    assert fetched == ["event-2"]
+    assert "delta_source=2026-02-11T10-00-00Z delta_refresh=1 delta_reuse=1" in out
+    store = SnapshotStore(local_data_dir)
+    rows = [
+        json.loads(line)
+        for line in store.derived_path("2026-02-11T11-00-00Z", "event_props.jsonl")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    ]
+    assert [row["event_id"] for row in rows] == ["event-1", "event-2"]
+    assert {row["snapshot_id"] for row in rows} == {"2026-02-11T11-00-00Z"}
+
+
+def test_snapshot_props_delta_rejects_offline(local_data_dir: Path, capsys) -> None:
+    assert main(["snapshot", "props", "--delta", "--offline"]) == 2
+    assert "cannot be combined with --offline" in capsys.readouterr().err
+
+
 def test_slate_dry_run_without_api_key(
     local_data_dir: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -300,6 +430,13 @@ def test_strategy_run_from_snapshot(local_data_dir: Path) -> None:
     )
     reports_dir = snapshot_reports_dir(store, snapshot_id)
     assert (reports_dir / "strategy-report.json").exists()
+    bundle_path = local_data_dir.parent / "runtime" / "strategy_inputs" / f"{snapshot_id}.pkl"
+    assert bundle_path.exists()
+    first_report = (reports_dir / "strategy-report.json").read_text(encoding="utf-8")
+    assert main(["strategy", "run", "--snapshot-id", snapshot_id, "--top-n", "5", "--offline"]) == 0
+    assert (reports_dir / "strategy-report.json").read_text(encoding="utf-8").count(
+        "Player A"
+    ) == first_report.count("Player A")
     assert not (reports_dir / "strategy-report.md").exists()
     assert not (reports_dir / "backtest-seed.jsonl").exists()
     assert not (reports_dir / "backtest-readiness.json").exists()
@@ -707,7 +707,9 @@ def test_strategy_backtest_summarize_analysis_pdf_missing_tool_keeps_tex(
         ],
     )
 
-    def _missing(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
+    def _missing(
+        *, tex_path: Path, pdf_path: Path, cache_dir: Path | None = None
+    ) -> dict[str, Any]:
         return {"status": "missing_tool", "message": "tectonic missing", "pdf_path": str(pdf_path)}
 
     monkeypatch.setattr("prop_ev.scoreboard_pdf.compile_pdf", _missing)
@@ -762,7 +764,7 @@ def test_strategy_backtest_summarize_analysis_pdf_keep_tex_flag(
         ],
     )
 
-    def _ok(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
+    def _ok(*, tex_path: Path, pdf_path: Path, cache_dir: Path | None = None) -> dict[str, Any]:
         pdf_path.write_bytes(b"%PDF-1.4\n")
         return {"status": "ok", "message": "pdf generated", "pdf_path": str(pdf_path)}
 
@@ -268,6 +268,64 @@ def test_strategy_run_writes_execution_plan_and_uses_default_max_picks(
     assert payload["constraints"]["max_picks"] == 5
 
 
+def test_strategy_run_builds_execution_quote_index_once_per_snapshot(
+    local_data_dir: Path,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from prop_ev.cli_strategy import context as strategy_context
+
+    store = SnapshotStore(local_data_dir)
+    snapshot_id = "2026-02-11T11-20-00Z"
+    _seed_strategy_snapshot(
+        store=store,
+        snapshot_id=snapshot_id,
+        injuries_payload={
+            "fetched_at_utc": _iso(datetime.now(UTC)),
+            "official": {
+                "status": "ok",
+                "parse_status": "ok",
+                "rows_count": 1,
+                "rows": [
+                    {
+                        "player": "Player A",
+                        "player_norm": "playera",
+                        "team": "Boston Celtics",
+                        "team_norm": "boston celtics",
+                        "status": "available",
+                        "note": "",
+                    }
+                ],
+            },
+            "secondary": {"status": "ok", "rows": []},
+        },
+    )
+    builds: list[int] = []
+    build = strategy_context.build_execution_quote_index
+
+    def _counting_build(rows):
+        builds.append(len(rows))
+        return build(rows)
+
+    monkeypatch.setattr(strategy_context, "build_execution_quote_index", _counting_build)
+    argv = [
+        "strategy",
+        "run",
+        "--snapshot-id",
+        snapshot_id,
+        "--offline",
+        "--execution-bookmakers",
+        "book_a",
+    ]
+
+    assert main(argv) == 0
+    assert main([*argv[:-1], "book_b"]) == 0
+    out = capsys.readouterr().out
+
+    assert builds == [2]
+    assert "execution_report_json=" in out
+
+
 def test_strategy_run_replay_uses_manifest_time_for_quote_age(
     local_data_dir: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
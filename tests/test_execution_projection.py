@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from prop_ev.execution_projection import ExecutionProjectionConfig, project_execution_report
+from prop_ev.execution_projection import (
+    ExecutionProjectionConfig,
+    build_execution_quote_index,
+    project_execution_report,
+)
 
 
 def _base_report(*, pre_bet_ready: bool = True) -> dict:
@@ -148,3 +152,45 @@ def test_project_execution_report_applies_pre_bet_gate() -> None:
     assert projected["watchlist"][0]["reason"] == "execution_pre_bet_not_ready"
     assert projected["strategy_mode"] == "watchlist_only"
     assert report["summary"]["eligible_lines"] == 1
+
+
+def test_project_execution_report_shares_quote_index_across_books() -> None:
+    report = _base_report()
+    event_props = [
+        {
+            "event_id": "event-1",
+            "player": "Player A",
+            "market": "player_points",
+            "point": 20.5,
+            "side": "over",
+            "book": book,
+            "price": price,
+            "link": "",
+            "last_update": "2026-02-13T01:23:45Z",
+        }
+        for book, price in (("draftkings", 120), ("FanDuel", 125), ("betmgm", 130))
+    ]
+    index = build_execution_quote_index(event_props)
+
+    def _config(*books: str) -> ExecutionProjectionConfig:
+        return ExecutionProjectionConfig(
+            bookmakers=books,
+            top_n=5,
+            requires_pre_bet_ready=False,
+            requires_meets_play_to=False,
+            tier_a_min_ev=0.03,
+            tier_b_min_ev=0.05,
+        )
+
+    dk_only = project_execution_report(report, None, _config("draftkings"), quote_index=index)
+    dk_fd = project_execution_report(
+        report, None, _config("draftkings", "fanduel"), quote_index=index
+    )
+
+    assert dk_only["candidates"][0]["selected_book"] == "draftkings"
+    assert dk_fd["candidates"][0]["selected_book"] == "FanDuel"
+    assert dk_fd["candidates"][0]["selected_price"] == 125
+    assert report["candidates"][0]["selected_book"] == "old_book"
+    assert report["audit"] == {}
+    assert report["health_report"]["strategy_mode"] == "full_board"
+    assert dk_fd["snapshot_id"] == report["snapshot_id"]
@@ -1,8 +1,22 @@
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from prop_ev.latex_renderer import compile_pdf, markdown_to_latex, render_pdf_from_markdown
+from prop_ev.latex_renderer import (
+    compile_pdf,
+    markdown_to_latex,
+    render_pdf_from_markdown,
+)
+
+
+def _fake_tectonic(calls: list[Path]):
+    def _run(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
+        calls.append(tex_path)
+        pdf_path.write_bytes(b"%PDF-1.4\n" + tex_path.read_bytes())
+        return {"status": "ok", "message": "pdf generated", "pdf_path": str(pdf_path)}
+
+    return _run
 
 
 def test_markdown_to_latex_basic_sections() -> None:
@@ -80,3 +94,28 @@ def test_render_pdf_from_markdown_writes_tex(
     )
     assert tex_path.exists()
     assert result["status"] == "missing_tool"
+
+
+def test_compile_pdf_reuses_render_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Path] = []
+    monkeypatch.setattr("prop_ev.latex_renderer._run_tectonic", _fake_tectonic(calls))
+    cache_dir = tmp_path / "render_cache"
+    first_tex = tmp_path / "a" / "brief.tex"
+    second_tex = tmp_path / "b" / "brief.tex"
+    for path in (first_tex, second_tex):
+        path.parent.mkdir(parents=True)
+        path.write_text("same document", encoding="utf-8")
+
+    first = compile_pdf(
+        tex_path=first_tex, pdf_path=first_tex.with_suffix(".pdf"), cache_dir=cache_dir
+    )
+    second = compile_pdf(
+        tex_path=second_tex, pdf_path=second_tex.with_suffix(".pdf"), cache_dir=cache_dir
+    )
+
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is True
+    assert second["status"] == "ok"
+    assert len(calls) == 1
+    assert second_tex.with_suffix(".pdf").read_bytes() == first_tex.with_suffix(".pdf").read_bytes()
+    assert (cache_dir / f"{first['tex_sha256']}.pdf").exists()
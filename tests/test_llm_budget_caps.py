@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 import pytest
@@ -41,6 +42,57 @@ def test_llm_budget_cap_blocks_live_calls(tmp_path: Path, monkeypatch: pytest.Mo
     assert called["value"] is False
 
 
+def test_llm_budget_reserves_in_flight_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+    monkeypatch.setenv("PROP_EV_LLM_MONTHLY_CAP_USD", "0.0001")
+    settings = Settings(_env_file=None)
+
+    in_flight = threading.Event()
+    release = threading.Event()
+    posted: list[str] = []
+
+    def fake_post(url: str, headers: dict[str, str], payload: dict, timeout: float) -> dict:
+        posted.append(str(payload.get("input", "")))
+        in_flight.set()
+        assert release.wait(timeout=10)
+        return {"output_text": "x", "usage": {"input_tokens": 1, "output_tokens": 1}}
+
+    client = LLMClient(settings=settings, data_root=tmp_path / "data", post_fn=fake_post)
+
+    def call(prompt: str) -> dict:
+        return client.cached_completion(
+            task="playbook_pass2",
+            prompt_version="v1",
+            prompt=prompt,
+            payload={"prompt": prompt},
+            snapshot_id="snap-1",
+            model="gpt-5-mini",
+            max_output_tokens=1000,
+            temperature=0.1,
+            refresh=False,
+            offline=False,
+        )
+
+    results: list[dict] = []
+    first = threading.Thread(target=lambda: results.append(call("first")))
+    first.start()
+    assert in_flight.wait(timeout=10)
+    try:
+        # The first call's reservation covers the remaining budget, so a second
+        # concurrent call is refused before it reaches the API.
+        with pytest.raises(LLMBudgetExceededError, match="in_flight"):
+            call("second")
+    finally:
+        release.set()
+        first.join(timeout=10)
+    assert len(posted) == 1
+    assert results and results[0]["text"] == "x"
+    assert client._reserved_usd == 0.0
+
+
 def test_openai_key_missing_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("ODDS_API_KEY", "odds-test")
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
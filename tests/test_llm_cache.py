@@ -1,9 +1,12 @@
 import json
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import httpx
 import pytest
 
+from prop_ev.cli import main
+from prop_ev.llm_cache import LLMResponseCache
 from prop_ev.llm_client import (
     LLMClient,
     LLMClientError,
@@ -11,6 +14,7 @@ from prop_ev.llm_client import (
     LLMResponseFormatError,
     _default_post,
 )
+from prop_ev.playbook import _run_analyst, _run_pass1, _run_pass2
 from prop_ev.settings import Settings
 
 
@@ -339,3 +343,185 @@ def test_request_options_text_schema_forwarded(
 
     payload = captured["payload"]
     assert payload.get("text", {}) == request_options["text"]
+
+
+def test_llm_cache_stores_payloads_once_and_gc_evicts(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path / "llm_cache")
+    brief_input = {"rows": [{"player": f"p{idx}", "ev": idx / 100} for idx in range(200)]}
+    for key, task in (("aa01", "playbook_pass2"), ("bb02", "playbook_analyst_web")):
+        cache.put(
+            key,
+            task=task,
+            prompt_version="v1",
+            model="gpt-5-mini",
+            snapshot_id="snap-1",
+            payload={"brief_input": brief_input},
+            request_options={},
+            response_text=f"text-{task}",
+            web_sources=[],
+            usage={"cost_usd": 0.001},
+        )
+    cache.put(
+        "cc03",
+        task="playbook_pass1",
+        prompt_version="v1",
+        model="gpt-5-mini",
+        snapshot_id="snap-2",
+        payload={"other": 1},
+        request_options={},
+        response_text="text-pass1",
+        web_sources=[],
+        usage={},
+    )
+
+    payload_files = sorted((tmp_path / "llm_cache" / "payloads").glob("*/*.json"))
+    assert len(payload_files) == 2
+    entry = cache.get("aa01", snapshot_id="snap-1")
+    assert entry is not None
+    assert "payload" not in entry
+    assert cache.load_payload(entry) == {"brief_input": brief_input}
+    index = {row["cache_key"]: row for row in cache.entries()}
+    assert index["aa01"]["task"] == "playbook_pass2"
+    assert index["cc03"]["snapshot_id"] == "snap-2"
+
+    # "aa01" was just read, so a size cap evicts "bb02" and "cc03" first; the shared
+    # payload stays while "aa01" still references it.
+    total = sum(row["entry_bytes"] for row in index.values()) + sum(
+        path.stat().st_size for path in payload_files
+    )
+    dry = cache.gc(max_bytes=total - 1, dry_run=True)
+    assert dry["evicted_entries"] == 1
+    assert cache.entry_path("cc03").exists()
+
+    summary = cache.gc(max_bytes=index["aa01"]["entry_bytes"] + index["aa01"]["payload_bytes"])
+    assert summary["entries_after"] == 1
+    assert summary["removed_payloads"] == 1
+    assert cache.get("cc03") is None
+    assert cache.get("aa01") is not None
+    assert len(cache.index_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    later = datetime.now(UTC) + timedelta(days=31)
+    assert cache.gc(max_age_days=30, now=later)["entries_after"] == 0
+    assert not list((tmp_path / "llm_cache" / "payloads").glob("*/*.json"))
+
+
+def test_llm_cache_migrates_flat_legacy_files_and_cli_gc(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+    data_root = tmp_path / "data" / "odds_api"
+    client = LLMClient(settings=Settings(_env_file=None), data_root=data_root)
+    cache_key = client._cache_key(
+        task="playbook_pass1", prompt_version="v1", model="gpt-5-mini", payload={"x": 1}
+    )
+    (client.cache_dir / f"{cache_key}.json").write_text(
+        json.dumps(
+            {
+                "cache_key": cache_key,
+                "task": "playbook_pass1",
+                "payload": {"x": 1},
+                "response_text": "legacy",
+                "usage": {},
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+    result = client.cached_completion(
+        task="playbook_pass1",
+        prompt_version="v1",
+        prompt="hello",
+        payload={"x": 1},
+        snapshot_id="snap-1",
+        model="gpt-5-mini",
+        max_output_tokens=120,
+        temperature=0.1,
+        refresh=False,
+        offline=True,
+    )
+    assert result["text"] == "legacy"
+    assert not (client.cache_dir / f"{cache_key}.json").exists()
+    assert client.cache.entry_path(cache_key).exists()
+
+    stray = client.cache_dir / f"{'0' * 64}.json"
+    stray.write_text(json.dumps({"response_text": "stray", "payload": {}}), encoding="utf-8")
+    index_before = client.cache.index_path.read_bytes()
+    dry = client.cache.gc(max_bytes=0, dry_run=True)
+    assert dry["legacy_files"] == 1
+    assert dry["legacy_bytes"] == stray.stat().st_size
+    assert dry["evicted_entries"] == 1
+    assert stray.exists()
+    assert client.cache.index_path.read_bytes() == index_before
+    stray.unlink()
+
+    code = main(
+        [
+            "--data-dir",
+            str(data_root),
+            "--runtime-dir",
+            str(client.runtime_root),
+            "playbook",
+            "cache-gc",
+            "--max-mb",
+            "0",
+        ]
+    )
+    summary = json.loads(capsys.readouterr().out)
+    assert code == 0
+    assert summary["evicted_entries"] == 1
+    assert not client.cache.entry_path(cache_key).exists()
+
+
+def test_llm_cache_stores_brief_input_once_across_playbook_passes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+
+    def fake_post(url: str, headers: dict[str, str], payload: dict, timeout: float) -> dict:
+        output_text = (
+            '{"slate_summary":"ok","top_plays_explained":[],'
+            '"watchouts":[],"data_quality_flags":[],"confidence_notes":[]}'
+        )
+        return {"output_text": output_text, "usage": {"input_tokens": 5, "output_tokens": 5}}
+
+    llm = LLMClient(
+        settings=Settings(_env_file=None), data_root=tmp_path / "data", post_fn=fake_post
+    )
+    brief_input = {
+        "snapshot_id": "snap-1",
+        "top_plays": [
+            {"player": f"p{idx}", "market": "points", "ev": idx / 100} for idx in range(40)
+        ],
+    }
+    llm_args = {
+        "brief_input": brief_input,
+        "snapshot_id": "snap-1",
+        "model": "gpt-5-mini",
+        "llm_refresh": False,
+        "llm_offline": False,
+    }
+    pass1, pass1_meta = _run_pass1(llm, **llm_args)
+    _, pass2_meta = _run_pass2(llm, pass1=pass1, **llm_args)
+    _, _, analyst_meta = _run_analyst(llm, pass1=pass1, **llm_args)
+
+    brief_text = json.dumps(brief_input, sort_keys=True, separators=(",", ":"))
+    blobs = [
+        path.read_text(encoding="utf-8").strip()
+        for path in (llm.cache.cache_dir / "payloads").glob("*/*.json")
+    ]
+    assert blobs.count(brief_text) == 1
+    assert all(brief_text not in blob for blob in blobs if blob != brief_text)
+
+    keys = [meta["cache_key"] for meta in (pass1_meta, pass2_meta, analyst_meta)]
+    entries = [llm.cache.get(key) for key in keys]
+    assert len({entry["payload_parts"]["brief_input"] for entry in entries if entry}) == 1
+    pass2_entry = entries[1]
+    assert pass2_entry is not None
+    assert llm.cache.load_payload(pass2_entry) == {
+        "brief_input": brief_input,
+        "pass1": pass1,
+        "task": "playbook_pass2",
+    }
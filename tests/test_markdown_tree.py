@@ -0,0 +1,54 @@
+from prop_ev.latex_renderer import document_to_latex, markdown_to_latex
+from prop_ev.markdown_tree import MarkdownDocument
+
+
+def test_document_round_trip_and_section_edits() -> None:
+    markdown = (
+        "# Brief\n\n"
+        "## Snapshot\n\n- a\n\n"
+        "## Data Quality\n\n- q\n\n<!-- pagebreak -->\n\n"
+        "## Action Plan\n\n| A | B |\n| --- | --- |\n| 1 | 2 |\n"
+    )
+    document = MarkdownDocument.parse(markdown)
+    assert document.preamble == ["# Brief", ""]
+    assert [section.title for section in document.sections] == [
+        "## Snapshot",
+        "## Data Quality",
+        "## Action Plan",
+    ]
+    assert document.to_markdown() == markdown
+
+    extracted = document.extract("## Data Quality")
+    assert extracted is not None
+    assert extracted.lines == ["", "- q"]
+    # The closing page break stays in front of the next section.
+    assert document.find("## Snapshot").lines[-3:] == ["", "<!-- pagebreak -->", ""]
+
+    document.insert(1, ["- before", "## Inserted", "", "- x", ""])
+    assert [section.title for section in document.sections] == [
+        "## Snapshot",
+        "## Inserted",
+        "## Action Plan",
+    ]
+    assert document.sections[0].lines[-1] == "- before"
+
+    document.drop("## Inserted")
+    assert document.index("## Inserted") is None
+
+
+def test_document_blocks_feed_latex_renderer() -> None:
+    markdown = "## First\n\n- one\n\n<!-- pagebreak -->\n\n### Sub\n\n| A | B |\n| --- | --- |\n"
+    document = MarkdownDocument.parse(markdown)
+    kinds = [block.kind for block in document.blocks()]
+    assert kinds == [
+        "heading",
+        "blank",
+        "list_item",
+        "blank",
+        "pagebreak",
+        "blank",
+        "heading",
+        "blank",
+        "table",
+    ]
+    assert document_to_latex(document, title="T") == markdown_to_latex(markdown, title="T")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
+from datetime import date
 from pathlib import Path
 
 import polars as pl
@@ -9,6 +11,7 @@ import pytest
 from prop_ev.nba_data.cli import main
 from prop_ev.nba_data.minutes_prob import model as minutes_prob_model
 from prop_ev.nba_data.minutes_prob.features import (
+    FEATURE_COLUMNS,
     MinutesProbFeatureConfig,
     build_minutes_prob_feature_frame,
 )
@@ -18,6 +21,11 @@ from prop_ev.nba_data.minutes_prob.model import (
     predict_minutes_probabilities,
     train_minutes_prob_model,
 )
+from prop_ev.nba_data.minutes_prob.rolling_state import (
+    build_pregame_feature_frame,
+    load_rolling_state,
+    update_rolling_state,
+)
 from prop_ev.nba_data.normalize import normalize_person_name
 from prop_ev.nba_data.store.layout import build_layout, slugify_season_type
 
@@ -411,3 +419,282 @@ def test_cli_minutes_prob_train_predict_evaluate(tmp_path: Path) -> None:
     assert evaluate_code == 0
     payload = json.loads(evaluate_path.read_text(encoding="utf-8"))
     assert int(payload.get("rows_scored", 0)) > 0
+
+
+def test_minutes_prob_hist_backend_parallel_fit_and_benchmark(tmp_path: Path) -> None:
+    data_root = tmp_path / "nba_data"
+    _seed_clean_minutes_prob_data(data_root)
+    out_root = tmp_path / "analysis"
+
+    code = main(
+        [
+            "minutes-prob",
+            "benchmark",
+            "--data-dir",
+            str(data_root),
+            "--out-dir",
+            str(out_root),
+            "--seasons",
+            "2025-26",
+            "--history-games",
+            "4",
+            "--min-history-games",
+            "2",
+            "--eval-days",
+            "3",
+            "--fit-workers",
+            "2",
+            "--json",
+        ]
+    )
+    assert code == 0
+
+    report = json.loads((out_root / "benchmark.json").read_text(encoding="utf-8"))
+    rows = {row["backend"]: row for row in report["results"]}
+    assert set(rows) == {"gbr", "hist"}
+    for row in rows.values():
+        assert row["mae"] is not None
+        assert row["coverage_p10_p90"] is not None
+        assert set(row["fit_wall_s"]) == {"p_active", "q10", "q50", "q90"}
+
+    hist_dir = Path(rows["hist"]["model_dir"])
+    assert hist_dir.name.endswith("-hist")
+    metadata = json.loads((hist_dir / "metadata.json").read_text(encoding="utf-8"))
+    assert metadata["training"]["backend"] == "hist"
+    assert metadata["training"]["fit_workers"] == 2
+    assert minutes_prob_model.load_minutes_prob_model(hist_dir).training_backend == "hist"
+
+
+def test_fit_models_hist_backend_matches_across_workers() -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(3)
+    matrix = rng.normal(size=(80, 4))
+    minutes = 24.0 + 4.0 * matrix[:, 0] + rng.normal(size=80)
+    jobs = [
+        {"name": "q10", "matrix": matrix, "target": minutes, "random_seed": 5, "backend": "hist"},
+        {"name": "q90", "matrix": matrix, "target": minutes, "random_seed": 5, "backend": "hist"},
+    ]
+
+    serial, serial_wall = minutes_prob_model._fit_models(jobs, workers=1)
+    parallel, parallel_wall = minutes_prob_model._fit_models(jobs, workers=2)
+
+    assert type(serial["q10"]).__name__ == "HistGradientBoostingRegressor"
+    assert set(serial_wall) == set(parallel_wall) == {"q10", "q90"}
+    assert np.allclose(serial["q90"].predict(matrix), parallel["q90"].predict(matrix))
+    assert float(np.mean(serial["q10"].predict(matrix))) < float(
+        np.mean(serial["q90"].predict(matrix))
+    )
+
+
+def test_minutes_prob_bundle_cache_and_mmap_format(tmp_path: Path) -> None:
+    data_root = tmp_path / "nba_data"
+    _seed_clean_minutes_prob_data(data_root)
+    layout = build_layout(data_root)
+    config = MinutesProbTrainConfig(
+        seasons=["2025-26"],
+        season_type="Regular Season",
+        history_games=4,
+        min_history_games=2,
+        eval_days=3,
+        schema_version=1,
+        random_seed=7,
+        model_version="minutes_prob_test_v1",
+        bundle_format="mmap",
+    )
+    summary = train_minutes_prob_model(layout=layout, config=config, out_dir=tmp_path / "out")
+    model_dir = Path(str(summary["artifacts"]["model_dir"]))
+    assert (model_dir / "bundle.json").exists()
+    assert (model_dir / "models.joblib").exists()
+    assert not (model_dir / "model.pkl").exists()
+
+    minutes_prob_model.clear_minutes_prob_model_cache()
+    first = minutes_prob_model.load_minutes_prob_model(model_dir)
+    assert minutes_prob_model.load_minutes_prob_model(model_dir) is first
+    assert first.seasons == ("2025-26",)
+    meta = json.loads((model_dir / "bundle.json").read_text(encoding="utf-8"))
+    assert first.fill_values == meta["fill_values"]
+
+    pickled = minutes_prob_model.write_minutes_prob_bundle(
+        replace(first, model_version="minutes_prob_test_v2"), model_dir=model_dir
+    )
+    assert pickled.name == "model.pkl"
+    assert not (model_dir / "bundle.json").exists()
+    reloaded = minutes_prob_model.load_minutes_prob_model(model_dir)
+    assert reloaded is not first
+    assert reloaded.model_version == "minutes_prob_test_v2"
+
+
+def _keep_clean_games(root: Path, game_ids: set[str]) -> None:
+    for table in ("games", "boxscore_players"):
+        for path in (root / "clean" / "schema_v1" / table).glob("**/*.parquet"):
+            frame = pl.read_parquet(path)
+            frame.filter(pl.col("game_id").is_in(sorted(game_ids))).write_parquet(path)
+
+
+def test_rolling_state_incremental_matches_rebuild_and_training_features(tmp_path: Path) -> None:
+    full_root = tmp_path / "full"
+    _seed_clean_minutes_prob_data(full_root)
+    feature_config = MinutesProbFeatureConfig(
+        seasons=["2025-26"],
+        season_type="Regular Season",
+        history_games=4,
+        min_history_games=2,
+        eval_days=3,
+        schema_version=1,
+    )
+    trained = build_minutes_prob_feature_frame(
+        layout=build_layout(full_root), config=feature_config
+    )
+    expected = trained.filter(pl.col("game_id") == "g8").sort(["team_id", "player_id"])
+
+    data_root = tmp_path / "nba_data"
+    _seed_clean_minutes_prob_data(data_root)
+    layout = build_layout(data_root)
+    state_kwargs = {
+        "layout": layout,
+        "seasons": ["2025-26"],
+        "season_type": "Regular Season",
+        "schema_version": 1,
+    }
+    incremental_dir = tmp_path / "state-incremental"
+    _keep_clean_games(data_root, {"g1", "g2", "g3"})
+    first = update_rolling_state(state_dir=incremental_dir, **state_kwargs)
+    assert first["mode"] == "rebuild"
+    _seed_clean_minutes_prob_data(data_root)
+    _keep_clean_games(data_root, {f"g{i}" for i in range(1, 8)})
+    second = update_rolling_state(state_dir=incremental_dir, **state_kwargs)
+    assert second["mode"] == "incremental"
+    assert second["games_added"] == 4
+    assert second["watermark_date"] == "2026-01-13"
+    rebuilt_dir = tmp_path / "state-rebuilt"
+    update_rolling_state(state_dir=rebuilt_dir, rebuild=True, **state_kwargs)
+
+    incremental = load_rolling_state(incremental_dir)
+    rebuilt = load_rolling_state(rebuilt_dir)
+    assert incremental is not None and rebuilt is not None
+    for table in ("players", "player_teams", "teams"):
+        assert incremental[table].equals(rebuilt[table])
+
+    game_day = date(2026, 1, 15)
+    schedule = [{"game_id": "g8", "date": "2026-01-15", "home_team_id": "2", "away_team_id": "1"}]
+    pregame = build_pregame_feature_frame(
+        state=incremental,
+        games=schedule,
+        game_date=game_day,
+        history_games=4,
+        min_history_games=2,
+    ).sort(["team_id", "player_id"])
+
+    assert pregame.get_column("player_id").to_list() == expected.get_column("player_id").to_list()
+    for column in (*FEATURE_COLUMNS, "team_id", "new_team_phase"):
+        assert pregame.get_column(column).to_list() == pytest.approx(
+            expected.get_column(column).to_list()
+        ), column
+    with pytest.raises(ValueError, match="already includes"):
+        build_pregame_feature_frame(
+            state=incremental,
+            games=schedule,
+            game_date=date(2026, 1, 13),
+            history_games=4,
+            min_history_games=2,
+        )
+
+
+def test_predict_pregame_minutes_probabilities_uses_schedule(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data_root = tmp_path / "nba_data"
+    _seed_clean_minutes_prob_data(data_root)
+    layout = build_layout(data_root)
+    out_root = tmp_path / "analysis"
+    train_minutes_prob_model(
+        layout=layout,
+        config=MinutesProbTrainConfig(
+            seasons=["2025-26"],
+            season_type="Regular Season",
+            history_games=4,
+            min_history_games=2,
+            eval_days=3,
+            schema_version=1,
+        ),
+        out_dir=out_root,
+    )
+    schedule_path = layout.schedule_path(season="2025-26", season_type="Regular Season")
+    schedule_path.parent.mkdir(parents=True, exist_ok=True)
+    schedule_path.write_text(
+        json.dumps(
+            {
+                "games": [
+                    {
+                        "game_id": "g9",
+                        "date": "2026-01-17",
+                        "home_team_id": "1",
+                        "away_team_id": "2",
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    def _no_full_rebuild(**kwargs):
+        raise AssertionError("a pre-game day must not rebuild the full feature frame")
+
+    monkeypatch.setattr(minutes_prob_model, "build_minutes_prob_feature_frame", _no_full_rebuild)
+    out_path = out_root / "predictions" / "snapshot_date=2026-01-17" / "predictions.parquet"
+    built = minutes_prob_model.maybe_auto_build_predictions_for_day(
+        layout=layout, model_root_dir=out_root, snapshot_day="2026-01-17"
+    )
+
+    assert built == out_path
+    predictions = pl.read_parquet(out_path)
+    assert set(predictions.get_column("event_id").to_list()) == {"g9"}
+    assert set(predictions.get_column("player_id").to_list()) == {"p1", "p2", "p3"}
+    assert predictions.get_column("actual_minutes").null_count() == predictions.height
+    written = json.loads(out_path.with_suffix(".meta.json").read_text(encoding="utf-8"))
+    assert written["mode"] == "pregame"
+    assert written["rolling_state_watermark"] == "2026-01-15"
+
+
+def test_predict_pregame_refreshes_rolling_state_for_new_games(tmp_path: Path) -> None:
+    data_root = tmp_path / "nba_data"
+    _seed_clean_minutes_prob_data(data_root)
+    layout = build_layout(data_root)
+    out_root = tmp_path / "analysis"
+    summary = train_minutes_prob_model(
+        layout=layout,
+        config=MinutesProbTrainConfig(
+            seasons=["2025-26"],
+            season_type="Regular Season",
+            history_games=4,
+            min_history_games=2,
+            eval_days=3,
+            schema_version=1,
+        ),
+        out_dir=out_root,
+    )
+    model_dir = Path(str(summary["artifacts"]["model_dir"]))
+    _keep_clean_games(data_root, {f"g{i}" for i in range(1, 8)})
+    schedule = [{"game_id": "g8", "date": "2026-01-15", "home_team_id": "2", "away_team_id": "1"}]
+    first = minutes_prob_model.predict_pregame_minutes_probabilities(
+        layout=layout,
+        model_dir=model_dir,
+        as_of_date="2026-01-15",
+        out_path=tmp_path / "first.parquet",
+        games=schedule,
+    )
+    assert first["rolling_state_watermark"] == "2026-01-13"
+
+    # g8 is ingested after the first pre-game call; the next call must fold it in.
+    _seed_clean_minutes_prob_data(data_root)
+    later = [{"game_id": "g9", "date": "2026-01-17", "home_team_id": "1", "away_team_id": "2"}]
+    second = minutes_prob_model.predict_pregame_minutes_probabilities(
+        layout=layout,
+        model_dir=model_dir,
+        as_of_date="2026-01-17",
+        out_path=tmp_path / "second.parquet",
+        games=later,
+    )
+    assert second["rolling_state_watermark"] == "2026-01-15"
+    assert set(pl.read_parquet(tmp_path / "second.parquet").get_column("event_id")) == {"g9"}
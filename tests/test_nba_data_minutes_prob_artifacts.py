@@ -125,3 +125,47 @@ def test_load_minutes_prob_index_auto_build_writes_snapshot_cache(
     assert key in payload["exact"]
     assert int(payload["meta"]["rows"]) == 1
     assert payload["meta"]["cache_mode"] == "snapshot_cache"
+
+
+def test_minutes_prob_index_lookup_and_join_match_exact_then_player(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.parquet"
+    pl.DataFrame(
+        {
+            "event_id": ["event-1", "event-1", "event-2", ""],
+            "market": ["PLAYER_POINTS", "player_rebounds", "player_points", "player_points"],
+            "player_id": ["p1", "p1", "p1", "p9"],
+            "player_name": ["Player One", "Player One", "Player One", "Bench Guy"],
+            "player_norm": ["", "playerone", "playerone", ""],
+            "minutes_p50": [30.0, 31.0, 28.0, 12.0],
+            "p_active": [0.98, 0.98, 0.9, 0.5],
+        }
+    ).write_parquet(path)
+
+    payload = minutes_artifacts.load_predictions_index(path)
+    index = payload["index"]
+
+    assert payload["meta"]["rows"] == 4
+    assert "event-1|playerone|player_points" in payload["exact"]
+    assert "|benchguy|player_points" not in payload["exact"]
+    assert payload["player"]["benchguy"]["minutes_p50"] == 12.0
+    assert payload["exact"]["event-1|playerone|player_points"]["player_norm"] == "playerone"
+    exact = index.lookup(event_id="event-1", player_norm="playerone", market="Player_Points")
+    assert exact["minutes_p50"] == 30.0
+    assert exact["minutes_p90"] is None
+    fallback = index.lookup(event_id="event-9", player_norm="playerone", market="player_points")
+    assert fallback["minutes_p50"] == 28.0
+    assert index.lookup(event_id="event-1", player_norm="", market="player_points") == {}
+
+    keys = [
+        ("event-1", "playerone", "player_points"),
+        ("event-9", "playerone", "player_points"),
+        ("event-1", "benchguy", "player_points"),
+        ("event-1", "nobody", "player_points"),
+        ("event-1", "", "player_points"),
+    ]
+    joined = index.join(keys)
+    assert joined == [
+        index.lookup(event_id=event_id, player_norm=player_norm, market=market)
+        for event_id, player_norm, market in keys
+    ]
+    assert [row.get("minutes_p50") for row in joined] == [30.0, 28.0, 12.0, None, None]
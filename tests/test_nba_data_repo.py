@@ -132,6 +132,25 @@ def test_historical_game_ids_for_day_reads_schedule_files(tmp_path: Path) -> Non
     assert repo._historical_game_ids_for_day("2026-02-12") == ["g1"]
 
 
+def test_boxscore_manifest_index_skips_malformed_lines(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path, snapshot_id="daily-20260115T000000Z")
+    boxscore = repo.nba_data_root / "raw" / "boxscore" / "g1.json"
+    boxscore.parent.mkdir(parents=True)
+    boxscore.write_text(json.dumps({"game": {"gameId": "g1"}}), encoding="utf-8")
+    manifest = (
+        repo.nba_data_root
+        / "manifests"
+        / "season=2025-26"
+        / "season_type=regular_season"
+        / "manifest.jsonl"
+    )
+    manifest.parent.mkdir(parents=True)
+    row = {"game_id": "g1", "resources": {"boxscore": {"path": "raw/boxscore/g1.json"}}}
+    manifest.write_text('{"game_id": \n[1]\n' + json.dumps(row) + "\n", encoding="utf-8")
+
+    assert repo._load_boxscore_from_local_manifest("g1") == {"game": {"gameId": "g1"}}
+
+
 def test_load_strategy_context_uses_repository_fetchers(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -26,3 +26,15 @@ def test_normalize_event_odds_fixture() -> None:
     assert rows[0]["market"] == "player_points"
     assert rows[0]["provider"] == "odds_api"
     assert rows[0]["last_update"] == "2026-02-11T15:00:00Z"
+
+
+def test_normalize_event_odds_accepts_raw_envelope_bytes() -> None:
+    fixture_path = Path("tests/fixtures/event_sample.json")
+    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
+    raw = json.dumps({"timestamp": "2026-02-11T15:00:00Z", "data": payload}).encode("utf-8")
+
+    rows = normalize_event_odds(
+        raw, snapshot_id="snap-1", provider="odds_api", payload_field="data"
+    )
+
+    assert rows == normalize_event_odds(payload, snapshot_id="snap-1", provider="odds_api")
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from prop_ev.odds_client import OddsResponse
+from prop_ev.odds_data.backfill import backfill_days
+from prop_ev.odds_data.backfill_queue import BackfillQueue
+from prop_ev.odds_data.day_index import load_day_status, snapshot_id_for_day
+from prop_ev.odds_data.policy import SpendPolicy
+from prop_ev.odds_data.request_plan import plan_requests
+from prop_ev.odds_data.spec import DatasetSpec
+from prop_ev.storage import SnapshotStore
+
+
+def _spec() -> DatasetSpec:
+    return DatasetSpec(
+        sport_key="basketball_nba",
+        markets=["player_points"],
+        regions="us",
+        bookmakers=None,
+        include_links=False,
+        include_sids=False,
+    )
+
+
+def _event(event_id: str) -> dict[str, Any]:
+    outcomes = [
+        {"description": "Player A", "name": "Over", "price": -110, "point": 20.5},
+        {"description": "Player A", "name": "Under", "price": -110, "point": 20.5},
+    ]
+    market = {"key": "player_points", "last_update": "2026-02-11T20:00:00Z", "outcomes": outcomes}
+    return {"id": event_id, "bookmakers": [{"key": "draftkings", "markets": [market]}]}
+
+
+def _response(data: Any, credits: int) -> OddsResponse:
+    return OddsResponse(
+        data=data,
+        status_code=200,
+        headers={"x-requests-last": str(credits)},
+        duration_ms=1,
+        retry_count=0,
+    )
+
+
+def test_backfill_queue_replays_done_calls_and_holds_lock(tmp_path: Path) -> None:
+    spec = _spec()
+    plan = plan_requests(spec, event_ids=["event-1", "event-2"])
+    first, second = plan.calls
+
+    queue = BackfillQueue(tmp_path, spec)
+    with queue.open():
+        queue.record_plan(
+            "2026-02-11",
+            "snap-1",
+            event_ids=["event-1", "event-2"],
+            historical_dates={},
+            calls=plan.calls,
+        )
+        queue.record_done("2026-02-11", first)
+        with (
+            pytest.raises(RuntimeError, match="held by another run"),
+            BackfillQueue(tmp_path, spec).open(),
+        ):
+            pass
+
+    reopened = BackfillQueue(tmp_path, spec)
+    with reopened.open():
+        queued = reopened.days["2026-02-11"]
+        assert queued.event_ids == ["event-1", "event-2"]
+        assert queued.pending == [second]
+        assert not queued.finalized
+        reopened.record_day("2026-02-11", complete=True)
+
+    lines = reopened.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    with BackfillQueue(tmp_path, spec).open() as replayed:
+        assert replayed.days["2026-02-11"].finalized
+
+
+def test_backfill_resumes_interrupted_day_from_queue(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    spec = _spec()
+    day = "2026-02-11"
+    snapshot_id = snapshot_id_for_day(spec, day)
+    store = SnapshotStore(data_root)
+    store.ensure_snapshot(snapshot_id)
+
+    # State left by an interrupted run: both calls queued, event-1 already landed.
+    plan = plan_requests(spec, event_ids=["event-1", "event-2"])
+    first, _second = plan.calls
+    store.write_response(snapshot_id, first.key(), _event("event-1"))
+    store.mark_request(
+        snapshot_id,
+        first.key(),
+        label=first.label,
+        path=first.path,
+        params=first.params,
+        status="ok",
+    )
+    queue = BackfillQueue(data_root, spec)
+    with queue.open():
+        queue.record_plan(
+            day,
+            snapshot_id,
+            event_ids=["event-1", "event-2"],
+            historical_dates={},
+            calls=plan.calls,
+        )
+        queue.record_done(day, first)
+
+    fetched: list[str] = []
+
+    class FakeOddsClient:
+        def __init__(self, settings) -> None:
+            self.settings = settings
+
+        def close(self) -> None:
+            return None
+
+        def list_events(self, **kwargs) -> OddsResponse:
+            raise AssertionError("a resumed day must not re-list its events")
+
+        def get_event_odds(self, **kwargs) -> OddsResponse:
+            fetched.append(str(kwargs["event_id"]))
+            return _response(_event(str(kwargs["event_id"])), 1)
+
+    monkeypatch.setattr("prop_ev.odds_data.backfill.OddsAPIClient", FakeOddsClient)
+
+    (summary,) = backfill_days(
+        data_root=data_root,
+        spec=spec,
+        days=[day],
+        tz_name="America/New_York",
+        policy=SpendPolicy(max_credits=5),
+        dry_run=False,
+        workers=2,
+    )
+
+    assert fetched == ["event-2"]
+    assert summary["actual_paid_credits"] == 1
+    assert summary["remaining_credits"] == 4
+    derived = store.derived_path(snapshot_id, "event_props.jsonl").read_text(encoding="utf-8")
+    assert '"event-1"' in derived
+    assert '"event-2"' in derived
+    with BackfillQueue(data_root, spec).open() as replayed:
+        assert replayed.days[day].finalized
+        assert replayed.days[day].pending == []
+
+
+def test_backfill_days_share_one_credit_budget(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    fetched: list[str] = []
+
+    class FakeOddsClient:
+        def __init__(self, settings) -> None:
+            self.settings = settings
+
+        def close(self) -> None:
+            return None
+
+        def list_events(self, **kwargs) -> OddsResponse:
+            day = str(kwargs["commence_from"])[:10]
+            return _response([{"id": f"event-{day}"}], 0)
+
+        def get_event_odds(self, **kwargs) -> OddsResponse:
+            fetched.append(str(kwargs["event_id"]))
+            return _response(_event(str(kwargs["event_id"])), 1)
+
+    monkeypatch.setattr("prop_ev.odds_data.backfill.OddsAPIClient", FakeOddsClient)
+
+    summaries = backfill_days(
+        data_root=data_root,
+        spec=_spec(),
+        days=["2026-02-11", "2026-02-12"],
+        tz_name="America/New_York",
+        policy=SpendPolicy(max_credits=1),
+        dry_run=False,
+        workers=4,
+    )
+
+    assert [row["day"] for row in summaries] == ["2026-02-11", "2026-02-12"]
+    assert len(fetched) == 1
+    assert sorted(row["error_code"] for row in summaries) == ["", "budget_exceeded"]
+    blocked = next(row for row in summaries if row["error_code"])
+    status = load_day_status(data_root, _spec(), blocked["day"])
+    assert isinstance(status, dict)
+    assert status["complete"] is False
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+
+import httpx
 import pytest
 
 from prop_ev.odds_client import OddsAPIClient, OddsAPIError, OddsResponse
+from prop_ev.odds_rate import AdaptiveRateController
 from prop_ev.settings import Settings
 
 
@@ -96,3 +100,27 @@ def test_list_events_historical_rejects_non_list(monkeypatch: pytest.MonkeyPatch
             historical_date="2026-02-11T17:00:00Z",
         )
     client.close()
+
+
+def test_get_event_odds_historical_keeps_raw_body_and_digest() -> None:
+    body = b'{"timestamp":"2026-02-11T19:30:00Z","data":{"id":"event-1","bookmakers":[]}}'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body)
+
+    client = OddsAPIClient(_settings(), controller=AdaptiveRateController())
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+    with client:
+        response = client.get_event_odds(
+            sport_key="basketball_nba",
+            event_id="event-1",
+            markets=["player_points"],
+            regions="us",
+            bookmakers=None,
+            historical_date="2026-02-11T19:30:00Z",
+        )
+
+    assert response.data == {"id": "event-1", "bookmakers": []}
+    assert response.raw == body
+    assert response.sha256 == hashlib.sha256(body).hexdigest()
+    assert response.payload_field == "data"
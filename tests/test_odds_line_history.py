@@ -0,0 +1,108 @@
+from pathlib import Path
+
+from prop_ev.odds_data.line_history import LineHistoryStore
+
+
+def _row(book: str, price: int, last_update: str, *, point: float = 20.5) -> dict:
+    return {
+        "event_id": "event-1",
+        "player": "Player A",
+        "market": "player_points",
+        "book": book,
+        "side": "Over",
+        "point": point,
+        "price": price,
+        "last_update": last_update,
+    }
+
+
+def test_append_snapshot_dedupes_unchanged_prices(tmp_path: Path) -> None:
+    store = LineHistoryStore(tmp_path)
+
+    first = store.append_snapshot(
+        "snap-1",
+        [
+            _row("draftkings", -110, "2026-02-13T10:00:00Z"),
+            _row("fanduel", -110, "2026-02-13T10:00:00Z"),
+        ],
+    )
+    second = store.append_snapshot(
+        "snap-2",
+        [
+            _row("draftkings", -110, "2026-02-13T10:00:00Z"),
+            _row("fanduel", -125, "2026-02-13T11:00:00Z"),
+        ],
+    )
+    repeat = store.append_snapshot("snap-2", [])
+
+    assert first["rows_appended"] == 2
+    assert second["rows_appended"] == 1
+    assert repeat["status"] == "already_ingested"
+    assert store.history().height == 3
+    current = {row["book"]: row["price"] for row in store.current().to_dicts()}
+    assert current == {"draftkings": -110, "fanduel": -125}
+    opening = {row["book"]: row["price"] for row in store.opening().to_dicts()}
+    assert opening == {"draftkings": -110, "fanduel": -110}
+
+
+def test_line_moves_and_steam_moves(tmp_path: Path) -> None:
+    store = LineHistoryStore(tmp_path)
+    store.append_snapshot(
+        "snap-1",
+        [
+            _row("draftkings", -110, "2026-02-13T10:00:00Z"),
+            _row("fanduel", -110, "2026-02-13T10:00:00Z"),
+            _row("betmgm", -110, "2026-02-13T10:00:00Z"),
+        ],
+    )
+    store.append_snapshot(
+        "snap-2",
+        [
+            _row("draftkings", -135, "2026-02-13T12:00:00Z"),
+            _row("fanduel", -130, "2026-02-13T12:05:00Z"),
+            _row("betmgm", -112, "2026-02-13T12:05:00Z"),
+        ],
+    )
+
+    moves = {row["book"]: row for row in store.line_moves(player="Player A").to_dicts()}
+    assert moves["draftkings"]["open_price"] == -110
+    assert moves["draftkings"]["current_price"] == -135
+    assert moves["draftkings"]["prob_delta"] > 0.05
+
+    steam = store.steam_moves(min_books=2, min_prob_delta=0.02).to_dicts()
+    assert len(steam) == 1
+    assert steam[0]["direction"] == "steam_up"
+    assert steam[0]["book_list"] == ["draftkings", "fanduel"]
+
+    assert store.steam_moves(since="2026-02-13T12:01:00Z").height == 0
+
+
+def test_append_snapshot_folds_out_of_order_ingest(tmp_path: Path) -> None:
+    store = LineHistoryStore(tmp_path)
+
+    store.append_snapshot("snap-evening", [_row("draftkings", -120, "2026-02-13T18:00:00Z")])
+    older = store.append_snapshot("snap-noon", [_row("draftkings", -110, "2026-02-13T12:00:00Z")])
+
+    assert older["rows_appended"] == 1
+    (current,) = store.current().to_dicts()
+    assert current["price"] == -120
+    assert [row["price"] for row in store.history().to_dicts()] == [-110, -120]
+    (move,) = store.line_moves().to_dicts()
+    assert (move["open_price"], move["current_price"]) == (-110, -120)
+
+    # A late quote between the two that repeats the evening price makes it the move.
+    store.append_snapshot("snap-afternoon", [_row("draftkings", -120, "2026-02-13T15:00:00Z")])
+    history = store.history().to_dicts()
+    assert [(row["price"], row["snapshot_id"]) for row in history] == [
+        (-110, "snap-noon"),
+        (-120, "snap-afternoon"),
+    ]
+    assert not (store.parts_dir / "snap-evening.parquet").exists()
+    (current,) = store.current().to_dicts()
+    assert current["price"] == -120
+    assert current["snapshot_id"] == "snap-afternoon"
+
+    # A repeat of the opening price before the afternoon move is not a change.
+    repeat = store.append_snapshot("snap-1pm", [_row("draftkings", -110, "2026-02-13T13:00:00Z")])
+    assert repeat["rows_appended"] == 0
+    assert store.history().height == 2
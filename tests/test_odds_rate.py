@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from prop_ev.odds_client import OddsAPIClient
+from prop_ev.odds_rate import AdaptiveRateController, endpoint_label
+from prop_ev.settings import Settings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+def _controller(clock: FakeClock, **kwargs) -> AdaptiveRateController:
+    return AdaptiveRateController(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_controller_paces_and_backs_off_on_throttle() -> None:
+    clock = FakeClock()
+    controller = _controller(clock, initial_rate=2.0, rate_increase=1.0)
+    path = "/sports/basketball_nba/events/event-1/odds"
+
+    for _ in range(2):
+        with controller.slot():
+            pass
+    assert clock.sleeps == [0.5]
+
+    controller.observe(path, status_code=200, latency_s=0.08)
+    assert controller.rate == 3.0
+
+    controller.observe(path, status_code=429, latency_s=0.02, headers={"Retry-After": "4"})
+    assert controller.rate == 1.5
+    assert controller.concurrency == 1
+    with controller.slot():
+        pass
+    assert clock.sleeps[-1] == 4.0
+
+    controller.observe(path, status_code=503, latency_s=3.0)
+    assert controller.rate == pytest.approx(1.2)
+
+
+def test_controller_clamps_concurrency_when_quota_runs_low() -> None:
+    controller = _controller(FakeClock(), initial_concurrency=4.0, low_quota_credits=50)
+    assert controller.concurrency == 4
+
+    controller.observe("/sports/x/odds", status_code=200, latency_s=0.1, headers={})
+    assert controller.concurrency == 4
+    controller.observe(
+        "/sports/x/odds",
+        status_code=200,
+        latency_s=0.1,
+        headers={"x-requests-remaining": "12"},
+    )
+    assert controller.concurrency == 1
+
+
+def test_client_records_histograms_per_endpoint_across_retries() -> None:
+    clock = FakeClock()
+    controller = _controller(clock)
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(
+            200, json={"id": "event-1", "bookmakers": []}, headers={"x-requests-remaining": "900"}
+        )
+
+    client = OddsAPIClient(Settings(ODDS_API_KEY="odds-test"), controller=controller)
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+    with client:
+        response = client.get_event_odds(
+            sport_key="basketball_nba",
+            event_id="event-1",
+            markets=["player_points"],
+            regions="us",
+            bookmakers=None,
+        )
+
+    assert response.retry_count == 1
+    stats = controller.stats()
+    label = endpoint_label("/sports/basketball_nba/events/event-1/odds")
+    assert label == "/sports/basketball_nba/events/{event_id}/odds"
+    row = stats["endpoints"][label]
+    assert row["requests"] == 1
+    assert row["attempts"] == 2
+    assert row["throttled"] == 1
+    assert row["retries"] == {"1": 1}
+    assert sum(row["latency_ms"].values()) == 2
+    assert stats["remaining_credits"] == 900.0
+    assert controller.describe()[0].startswith(f"odds_rate endpoint={label} requests=1")
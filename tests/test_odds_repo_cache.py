@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import threading
 from pathlib import Path
 
 import pytest
@@ -337,3 +339,101 @@ def test_refresh_forces_network_and_writes_through_cache(tmp_path: Path) -> None
     assert usage_files
     usage_payload = usage_files[0].read_text(encoding="utf-8")
     assert key in usage_payload
+
+
+def test_network_fetch_stores_raw_body_and_replaces_snapshot_copy(tmp_path: Path) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    store = SnapshotStore(data_root)
+    cache = GlobalCacheStore(data_root)
+    repo = OddsRepository(store=store, cache=cache)
+    snapshot_id = "snap-raw"
+    store.ensure_snapshot(snapshot_id)
+
+    path = "/historical/sports/basketball_nba/events/event-7/odds"
+    params = {"markets": "player_points", "regions": "us", "date": "2026-02-11T19:30:00Z"}
+    key = request_hash("GET", path, params)
+    store.write_response(snapshot_id, key, {"id": "event-7", "from": "stale"})
+    raw = b'{"timestamp":"2026-02-11T19:30:00Z","data":{"id":"event-7","bookmakers":[]}}'
+
+    def _fetcher() -> OddsResponse:
+        return OddsResponse(
+            data={"id": "event-7", "bookmakers": []},
+            status_code=200,
+            headers={"x-requests-last": "10"},
+            duration_ms=3,
+            retry_count=0,
+            raw=raw,
+            sha256=hashlib.sha256(raw).hexdigest(),
+            payload_field="data",
+        )
+
+    result = repo.get_or_fetch(
+        snapshot_id=snapshot_id,
+        req=OddsRequest(
+            method="GET", path=path, params=params, label="event_odds:event-7", is_paid=True
+        ),
+        fetcher=_fetcher,
+        policy=SpendPolicy(refresh=True),
+    )
+
+    assert result.status == "ok"
+    responses_dir = store.snapshot_dir(snapshot_id) / "responses"
+    assert sorted(item.name for item in responses_dir.iterdir()) == [f"{key}.json.gz"]
+    assert store.load_response_bytes(snapshot_id, key) == (raw, "data")
+    assert store.load_response(snapshot_id, key) == {"id": "event-7", "bookmakers": []}
+    assert cache.load_response(key) == {"id": "event-7", "bookmakers": []}
+    meta = store.load_meta(snapshot_id, key) or {}
+    assert meta["response_sha256"] == hashlib.sha256(raw).hexdigest()
+    assert meta["response_bytes"] == len(raw)
+
+
+def test_concurrent_misses_single_flight_one_paid_fetch(tmp_path: Path) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    store = SnapshotStore(data_root)
+    path = "/sports/basketball_nba/events/event-3/odds"
+    params = {"markets": "player_points", "regions": "us"}
+    in_flight = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def _fetcher() -> OddsResponse:
+        calls.append("fetch")
+        in_flight.set()
+        release.wait(timeout=5)
+        return OddsResponse(
+            data={"id": "event-3"},
+            status_code=200,
+            headers={"x-requests-last": "1"},
+            duration_ms=1,
+            retry_count=0,
+        )
+
+    results: dict[str, object] = {}
+
+    def _run(snapshot_id: str) -> None:
+        store.ensure_snapshot(snapshot_id)
+        repo = OddsRepository(store=store, cache=GlobalCacheStore(data_root))
+        results[snapshot_id] = repo.get_or_fetch(
+            snapshot_id=snapshot_id,
+            req=OddsRequest(
+                method="GET", path=path, params=params, label="event_odds:event-3", is_paid=True
+            ),
+            fetcher=_fetcher,
+            policy=SpendPolicy(),
+        )
+
+    first = threading.Thread(target=_run, args=("snap-a",))
+    first.start()
+    assert in_flight.wait(timeout=5)
+    second = threading.Thread(target=_run, args=("snap-b",))
+    second.start()
+    second.join(timeout=0.2)
+    assert second.is_alive()
+    release.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+
+    assert calls == ["fetch"]
+    assert results["snap-a"].cache_level == "network"  # type: ignore[attr-defined]
+    assert results["snap-b"].cache_level == "global"  # type: ignore[attr-defined]
+    assert store.load_response("snap-b", request_hash("GET", path, params)) == {"id": "event-3"}
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from prop_ev.odds_client import OddsResponse
+from prop_ev.odds_data.backfill import backfill_days
+from prop_ev.odds_data.day_index import load_day_status, snapshot_id_for_day
+from prop_ev.odds_data.policy import SpendPolicy
+from prop_ev.odds_data.request_plan import RequestPlan, event_odds_request, plan_requests
+from prop_ev.odds_data.spec import DatasetSpec
+from prop_ev.storage import SnapshotStore, request_hash
+
+
+def _spec(markets: list[str], *, historical: bool = False) -> DatasetSpec:
+    return DatasetSpec(
+        sport_key="basketball_nba",
+        markets=markets,
+        regions="us",
+        bookmakers=None,
+        include_links=False,
+        include_sids=False,
+        historical=historical,
+    )
+
+
+def _market(key: str, player: str) -> dict[str, Any]:
+    return {
+        "key": key,
+        "last_update": "2026-02-11T20:00:00Z",
+        "outcomes": [
+            {"description": player, "name": "Over", "price": -110, "point": 20.5},
+            {"description": player, "name": "Under", "price": -110, "point": 20.5},
+        ],
+    }
+
+
+def _event(event_id: str, markets: list[str]) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "bookmakers": [
+            {"key": "draftkings", "markets": [_market(key, "Player A") for key in markets]}
+        ],
+    }
+
+
+def test_plan_requests_merges_featured_events_and_subsets_event_markets() -> None:
+    spec = _spec(["h2h", "player_points", "player_rebounds"])
+    coverage = {
+        "event-1": {"player_points": "k1"},
+        "event-3": {"h2h": "k3"},
+    }
+
+    plan = plan_requests(
+        spec, event_ids=["event-1", "event-2", "event-3"], coverage=coverage, budget=None
+    )
+
+    featured, *event_calls = plan.calls
+    assert featured.endpoint == "featured_odds"
+    assert featured.event_ids == ("event-1", "event-2")
+    assert featured.params["eventIds"] == "event-1,event-2"
+    assert featured.credits == 1
+    assert [(call.event_ids, call.markets) for call in event_calls] == [
+        (("event-1",), ("player_rebounds",)),
+        (("event-2",), ("player_points", "player_rebounds")),
+        (("event-3",), ("player_points", "player_rebounds")),
+    ]
+    assert plan.missing_cells == 7
+    assert plan.cached_cells == 2
+    assert plan.total_credits == 6
+    assert plan.deferred == ()
+
+    capped = plan_requests(
+        spec, event_ids=["event-1", "event-2", "event-3"], coverage=coverage, budget=3
+    )
+    assert [call.credits for call in capped.calls] == [1, 1]
+    assert len(capped.deferred) == 2
+    assert capped.total_credits == plan.total_credits
+    assert capped.describe()[0].startswith("plan calls=2 deferred=2 missing_cells=7")
+
+
+def test_plan_requests_historical_uses_one_event_call_with_multiplier() -> None:
+    spec = _spec(["h2h", "player_points"], historical=True)
+
+    plan = plan_requests(
+        spec,
+        event_ids=["event-1"],
+        historical_dates={"event-1": "2026-02-11T19:30:00Z"},
+    )
+
+    (call,) = plan.calls
+    assert call.endpoint == "event_odds"
+    assert call.path == "/historical/sports/basketball_nba/events/event-1/odds"
+    assert call.params["date"] == "2026-02-11T19:30:00Z"
+    assert call.markets == ("h2h", "player_points")
+    assert call.credits == 20
+
+
+def test_backfill_fetches_only_markets_missing_from_earlier_calls(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    spec = _spec(["player_points", "player_rebounds"])
+    day = "2026-02-11"
+    snapshot_id = snapshot_id_for_day(spec, day)
+    store = SnapshotStore(data_root)
+    store.ensure_snapshot(snapshot_id)
+    path, params = event_odds_request(spec, "event-1", markets=["player_points"])
+    key = request_hash("GET", path, params)
+    store.write_response(snapshot_id, key, _event("event-1", ["player_points"]))
+    store.mark_request(
+        snapshot_id, key, label="event_odds:event-1", path=path, params=params, status="ok"
+    )
+
+    fetched_markets: list[list[str]] = []
+
+    class FakeOddsClient:
+        def __init__(self, settings) -> None:
+            self.settings = settings
+
+        def close(self) -> None:
+            return None
+
+        def list_events(self, **kwargs) -> OddsResponse:
+            return OddsResponse(
+                data=[{"id": "event-1"}],
+                status_code=200,
+                headers={"x-requests-last": "0"},
+                duration_ms=1,
+                retry_count=0,
+            )
+
+        def get_event_odds(self, **kwargs) -> OddsResponse:
+            fetched_markets.append(list(kwargs["markets"]))
+            return OddsResponse(
+                data=_event("event-1", list(kwargs["markets"])),
+                status_code=200,
+                headers={"x-requests-last": "1"},
+                duration_ms=1,
+                retry_count=0,
+            )
+
+    monkeypatch.setattr("prop_ev.odds_data.backfill.OddsAPIClient", FakeOddsClient)
+
+    plans: list[RequestPlan] = []
+    summaries = backfill_days(
+        data_root=data_root,
+        spec=spec,
+        days=[day],
+        tz_name="America/New_York",
+        policy=SpendPolicy(max_credits=5),
+        dry_run=False,
+        on_plan=lambda _day, plan: plans.append(plan),
+    )
+
+    assert fetched_markets == [["player_rebounds"]]
+    assert plans[0].cached_cells == 1
+    assert summaries[0]["estimated_paid_credits"] == 1
+    assert summaries[0]["complete"] is True
+    status = load_day_status(data_root, spec, day)
+    assert isinstance(status, dict)
+    assert status["complete"] is True
+    derived = store.derived_path(snapshot_id, "event_props.jsonl").read_text(encoding="utf-8")
+    assert '"player_points"' in derived
+    assert '"player_rebounds"' in derived
+
+    backfill_days(
+        data_root=data_root,
+        spec=spec,
+        days=[day],
+        tz_name="America/New_York",
+        policy=SpendPolicy(max_credits=5),
+        dry_run=False,
+        on_plan=lambda _day, plan: plans.append(plan),
+    )
+    assert fetched_markets == [["player_rebounds"]]
+    assert plans[-1].calls == ()
+
+
+def test_backfill_featured_call_keeps_include_flags(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_root = tmp_path / "data" / "odds_api"
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    spec = replace(_spec(["h2h"]), include_links=True, include_sids=True)
+    featured_kwargs: list[dict[str, Any]] = []
+
+    class FakeOddsClient:
+        def __init__(self, settings) -> None:
+            self.settings = settings
+
+        def close(self) -> None:
+            return None
+
+        def list_events(self, **kwargs) -> OddsResponse:
+            return OddsResponse(
+                data=[{"id": "event-1"}, {"id": "event-2"}],
+                status_code=200,
+                headers={"x-requests-last": "0"},
+                duration_ms=1,
+                retry_count=0,
+            )
+
+        def get_featured_odds(self, **kwargs) -> OddsResponse:
+            featured_kwargs.append(kwargs)
+            return OddsResponse(
+                data=[_event(event_id, ["h2h"]) for event_id in kwargs["event_ids"]],
+                status_code=200,
+                headers={"x-requests-last": "1"},
+                duration_ms=1,
+                retry_count=0,
+            )
+
+    monkeypatch.setattr("prop_ev.odds_data.backfill.OddsAPIClient", FakeOddsClient)
+
+    plans: list[RequestPlan] = []
+    backfill_days(
+        data_root=data_root,
+        spec=spec,
+        days=["2026-02-11"],
+        tz_name="America/New_York",
+        policy=SpendPolicy(max_credits=5),
+        dry_run=False,
+        on_plan=lambda _day, plan: plans.append(plan),
+    )
+
+    (call,) = plans[0].calls
+    assert call.endpoint == "featured_odds"
+    assert call.params["includeLinks"] == "true"
+    assert call.params["includeSids"] == "true"
+    (kwargs,) = featured_kwargs
+    assert kwargs["include_links"] is True
+    assert kwargs["include_sids"] is True
@@ -1,5 +1,6 @@
 import json
 import re
+import threading
 from pathlib import Path
 
 import pytest
@@ -404,6 +405,65 @@ def test_generate_brief_pass1_retries_then_succeeds(
     assert meta["llm"]["pass1"]["attempts"] == 2
 
 
+def test_generate_brief_runs_pass2_and_analyst_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ODDS_API_KEY", "odds-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+    monkeypatch.setenv("PROP_EV_DATA_DIR", str(tmp_path / "data" / "odds_api"))
+
+    store = SnapshotStore(tmp_path / "data" / "odds_api")
+    snapshot_id = "2026-02-11T18-30-00Z"
+    store.ensure_snapshot(snapshot_id)
+    reports_dir = snapshot_reports_dir(store, snapshot_id)
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    (reports_dir / "strategy-report.json").write_text(
+        json.dumps(_sample_strategy_report(), sort_keys=True, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+    # Both dependents of pass1 must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=10)
+    tasks: list[str] = []
+
+    class FakeLLMClient:
+        def __init__(self, **kwargs) -> None:
+            del kwargs
+
+        def cached_completion(self, **kwargs):
+            task = kwargs["task"]
+            tasks.append(task)
+            if task == "playbook_pass1":
+                text = (
+                    '{"slate_summary":"ok","top_plays_explained":[],"watchouts":[],'
+                    '"data_quality_flags":[],"confidence_notes":[]}'
+                )
+            elif task == "playbook_pass2":
+                barrier.wait()
+                text = "## Snapshot\n\n## Analyst Take\n\n## Confidence\n"
+            else:
+                barrier.wait()
+                text = '{"summary":"web take","bullets":[],"sources":[]}'
+            return {"text": text, "cached": False, "cache_key": task, "usage": {}}
+
+    monkeypatch.setattr(playbook, "LLMClient", FakeLLMClient)
+
+    result = generate_brief_for_snapshot(
+        store=store,
+        settings=Settings(_env_file=None),
+        snapshot_id=snapshot_id,
+        top_n=5,
+        llm_refresh=True,
+        llm_offline=False,
+        write_markdown=True,
+    )
+    meta = json.loads(Path(result["report_meta"]).read_text(encoding="utf-8"))
+    assert tasks[0] == "playbook_pass1"
+    assert set(tasks[1:3]) == {"playbook_pass2", "playbook_analyst_web"}
+    assert meta["llm"]["pass1"]["status"] == "ok"
+    assert not barrier.broken
+
+
 def test_generate_brief_offline_rerender_is_stable_after_normalization(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
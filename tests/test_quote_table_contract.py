@@ -88,3 +88,24 @@ def test_snapshot_lake_event_props_parquet_matches_canonical_jsonl(tmp_path: Pat
     )
     actual = frame.sort(list(EVENT_PROPS_SORT_COLUMNS))
     assert actual.to_dicts() == expected.to_dicts()
+
+
+def test_canonicalize_event_props_sorts_numeric_columns_by_value() -> None:
+    base = {
+        "provider": "odds_api",
+        "snapshot_id": "snap",
+        "event_id": "event-1",
+        "market": "player_points",
+        "player": "Player A",
+        "side": "Over",
+        "price": -110,
+        "book": "draftkings",
+        "last_update": "",
+        "link": "",
+    }
+    rows = [{**base, "point": point} for point in ("10.5", 9.5, None, -1.5, 2)]
+
+    canonical = canonicalize_event_props_rows(rows)
+
+    assert [row["point"] for row in canonical] == [None, -1.5, 2.0, 9.5, 10.5]
+    assert canonicalize_event_props_rows(list(reversed(canonical))) == canonical
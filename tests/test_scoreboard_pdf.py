@@ -59,7 +59,9 @@ def test_render_aggregate_scoreboard_pdf_keeps_tex_when_tool_missing(
     tmp_path: Path,
     monkeypatch,
 ) -> None:
-    def _missing(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
+    def _missing(
+        *, tex_path: Path, pdf_path: Path, cache_dir: Path | None = None
+    ) -> dict[str, Any]:
         return {"status": "missing_tool", "message": "tectonic missing", "pdf_path": str(pdf_path)}
 
     monkeypatch.setattr("prop_ev.scoreboard_pdf.compile_pdf", _missing)
@@ -81,7 +83,7 @@ def test_render_aggregate_scoreboard_pdf_removes_tex_on_success(
     tmp_path: Path,
     monkeypatch,
 ) -> None:
-    def _ok(*, tex_path: Path, pdf_path: Path) -> dict[str, Any]:
+    def _ok(*, tex_path: Path, pdf_path: Path, cache_dir: Path | None = None) -> dict[str, Any]:
         pdf_path.write_bytes(b"%PDF-1.4\n")
         return {"status": "ok", "message": "pdf generated", "pdf_path": str(pdf_path)}
 
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from prop_ev.odds_math import american_to_decimal, decimal_to_american, ev_from_prob_and_price
+from prop_ev.sgp_engine import (
+    DEFAULT_SGP_CORRELATION,
+    SGPCorrelationModel,
+    build_sgp_candidates,
+)
+from prop_ev.strategy_report.helpers import _build_sgp_candidates, _sgp_haircut
+
+MARKETS = ["player_points", "player_rebounds", "player_assists", "player_threes"]
+
+
+def _rows(seed: int, *, events: int = 4, per_event: int = 11) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    rows: list[dict[str, Any]] = []
+    for event in range(events):
+        for idx in range(per_event):
+            rows.append(
+                {
+                    "event_id": f"event-{event}",
+                    "game": f"Away{event} @ Home{event}",
+                    "player": f"Player {event}-{rng.randint(0, 6)}",
+                    "player_team": rng.choice(["home", "away"]),
+                    "market": rng.choice(MARKETS),
+                    "point": 10.5 + idx,
+                    "recommended_side": rng.choice(["over", "under"]),
+                    "selected_price": rng.choice([-130, -115, -110, 100, 105, 120, None]),
+                    "model_p_hit": rng.choice([None, round(rng.uniform(0.42, 0.68), 4)]),
+                    "best_ev": rng.choice([0.0, None, round(rng.uniform(-0.05, 0.12), 4)]),
+                }
+            )
+    return rows
+
+
+def _reference_candidates(eligible_rows: list[dict[str, Any]], top_n: int) -> list[dict[str, Any]]:
+    """Nested-loop builder the vectorized engine replaced."""
+    by_event: dict[str, list[dict[str, Any]]] = {}
+    for row in eligible_rows:
+        by_event.setdefault(str(row.get("event_id", "")), []).append(row)
+    candidates: list[dict[str, Any]] = []
+    for event_rows in by_event.values():
+        ranked = sorted(event_rows, key=lambda row: -(row.get("best_ev") or -999.0))[:8]
+        for i in range(len(ranked)):
+            for j in range(i + 1, len(ranked)):
+                leg_a, leg_b = ranked[i], ranked[j]
+                p_a, p_b = leg_a.get("model_p_hit"), leg_b.get("model_p_hit")
+                d_a = american_to_decimal(leg_a.get("selected_price"))
+                d_b = american_to_decimal(leg_b.get("selected_price"))
+                if p_a is None or p_b is None or d_a is None or d_b is None:
+                    continue
+                indep_p = p_a * p_b
+                haircut = _sgp_haircut([leg_a, leg_b])
+                adj_p = indep_p * (1.0 - haircut)
+                decimal_combo = d_a * d_b
+                ev = (adj_p * (decimal_combo - 1.0)) - (1.0 - adj_p)
+                american = decimal_to_american(decimal_combo)
+                kelly = None
+                leg_ev = ev_from_prob_and_price(adj_p, american)
+                if leg_ev is not None:
+                    kelly = round(leg_ev / (american_to_decimal(american) - 1.0), 6)
+                candidates.append(
+                    {
+                        "event_id": leg_a["event_id"],
+                        "players": [leg_a["player"], leg_b["player"]],
+                        "haircut": round(haircut, 4),
+                        "adjusted_joint_p": round(adj_p, 6),
+                        "unboosted_american": american,
+                        "ev_per_100": round(ev * 100.0, 3),
+                        "recommended_fractional_kelly": (
+                            round(kelly / 2.0, 6) if kelly is not None else None
+                        ),
+                    }
+                )
+    candidates.sort(key=lambda row: -(row.get("ev_per_100") or -999.0))
+    return candidates[:top_n]
+
+
+def _summary(candidates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "event_id": item["event_id"],
+            "players": [leg["player"] for leg in item["legs"]],
+            "haircut": item["haircut"],
+            "adjusted_joint_p": item["adjusted_joint_p"],
+            "unboosted_american": item["unboosted_american"],
+            "ev_per_100": item["ev_per_100"],
+            "recommended_fractional_kelly": item["recommended_fractional_kelly"],
+        }
+        for item in candidates
+    ]
+
+
+def test_build_sgp_candidates_matches_nested_loop_reference() -> None:
+    for seed in range(5):
+        rows = _rows(seed)
+        for top_n in (1, 5, 10, 500):
+            expected = _reference_candidates(rows, top_n)
+            assert _summary(_build_sgp_candidates(rows, top_n=top_n)) == expected
+
+
+def test_build_sgp_candidates_triples_use_model_haircut() -> None:
+    rows = _rows(7, events=2, per_event=9)
+    candidates = build_sgp_candidates(rows, top_n=20, max_legs_per_event=9, legs_per_combo=3)
+    assert candidates
+    by_key = {(row["event_id"], row["player"], row["point"]): row for row in rows}
+    for item in candidates:
+        assert len(item["legs"]) == 3
+        legs = [by_key[(item["event_id"], leg["player"], leg["point"])] for leg in item["legs"]]
+        assert item["haircut"] == round(DEFAULT_SGP_CORRELATION.haircut(legs), 4)
+    ev_values = [item["ev_per_100"] for item in candidates]
+    assert ev_values == sorted(ev_values, reverse=True)
+
+
+def test_correlation_model_pair_overrides_apply_to_both_orders() -> None:
+    model = SGPCorrelationModel.from_payload(
+        {
+            "default": 0.04,
+            "pairs": [
+                {"a": ["player_rebounds", "over"], "b": ["player_threes", "under"], "haircut": 0.2}
+            ],
+        }
+    )
+    rebounds = {"player": "A", "player_team": "home", "market": "player_rebounds"}
+    threes = {"player": "B", "player_team": "away", "market": "player_threes"}
+    legs = [
+        {**threes, "recommended_side": "under"},
+        {**rebounds, "recommended_side": "over"},
+    ]
+    assert model.haircut(legs) == 0.2
+    assert model.haircut(list(reversed(legs))) == 0.2
+    legs[0]["recommended_side"] = "over"
+    assert model.haircut(legs) == 0.04
+    assert model.volatile_market == DEFAULT_SGP_CORRELATION.volatile_market
+
+    rows = [
+        {
+            **leg,
+            "event_id": "event-1",
+            "game": "A @ B",
+            "point": 5.5,
+            "selected_price": 110,
+            "model_p_hit": 0.55,
+            "best_ev": 0.05,
+        }
+        for leg in legs
+    ]
+    rows[0]["recommended_side"] = "under"
+    (candidate,) = build_sgp_candidates(rows, top_n=3, correlation=model)
+    assert candidate["haircut"] == 0.2
+    assert build_sgp_candidates(rows, top_n=0) == []
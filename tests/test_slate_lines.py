@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from prop_ev.normalize import normalize_featured_odds
+from prop_ev.slate_lines import (
+    SLATE_LINES_FILENAME,
+    event_context_from_featured,
+    load_slate_lines,
+    summarize_slate_lines,
+)
+from prop_ev.storage import SnapshotStore
+from prop_ev.strategy_report.helpers import _event_line_index
+
+
+def _featured_payload() -> list[dict[str, Any]]:
+    def _book(key: str, spread: float, total: float) -> dict[str, Any]:
+        return {
+            "key": key,
+            "markets": [
+                {
+                    "key": "spreads",
+                    "outcomes": [
+                        {"name": "Boston Celtics", "price": -110, "point": spread},
+                        {"name": "New York Knicks", "price": -110, "point": -spread},
+                    ],
+                },
+                {
+                    "key": "totals",
+                    "outcomes": [
+                        {"name": "Over", "price": -110, "point": total},
+                        {"name": "Under", "price": -110, "point": total},
+                    ],
+                },
+            ],
+        }
+
+    return [
+        {
+            "id": "event-late",
+            "home_team": "Boston Celtics",
+            "away_team": "New York Knicks",
+            "commence_time": "2026-02-12T03:00:00Z",
+            "bookmakers": [_book("draftkings", -4.5, 221.5), _book("fanduel", -5.5, 222.5)],
+        },
+        {
+            "id": "event-early",
+            "home_team": "New York Knicks",
+            "away_team": "Boston Celtics",
+            "commence_time": "2026-02-12T00:00:00Z",
+            "bookmakers": [_book("draftkings", 3.0, 218.0)],
+        },
+    ]
+
+
+def test_event_line_index_matches_raw_rows_and_summary() -> None:
+    payload = _featured_payload()
+    rows = normalize_featured_odds(payload, snapshot_id="snap", provider="odds_api")
+    context = event_context_from_featured(payload)
+    context["event-no-lines"] = {
+        "home_team": "Miami Heat",
+        "away_team": "Chicago Bulls",
+        "commence_time": "2026-02-12T01:00:00Z",
+    }
+
+    summary = summarize_slate_lines(rows, context, snapshot_id="snap")
+
+    assert [row["event_id"] for row in summary] == ["event-early", "event-late"]
+    late = summary[1]
+    assert late["home_spread"] == -5.0
+    assert late["total"] == 222.0
+    assert late["spread_quotes"] == 4
+    assert _event_line_index(rows, context) == _event_line_index([], context, summary)
+    snapshot, _ = _event_line_index([], None, summary)
+    assert [row["event_id"] for row in snapshot] == ["event-early", "event-late"]
+
+
+def test_load_slate_lines_materializes_older_snapshots(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "odds_api")
+    snapshot_id = "2026-02-11T18-00-00Z"
+    store.ensure_snapshot(snapshot_id)
+    payload = _featured_payload()
+    store.write_response(snapshot_id, "slate-key", payload)
+    store.mark_request(
+        snapshot_id, "slate-key", label="slate_odds", path="/odds", params={}, status="ok"
+    )
+    featured = normalize_featured_odds(payload, snapshot_id=snapshot_id, provider="odds_api")
+    store.write_jsonl(store.derived_path(snapshot_id, "featured_odds.jsonl"), featured)
+
+    lines = load_slate_lines(store, snapshot_id)
+
+    assert store.derived_path(snapshot_id, SLATE_LINES_FILENAME).exists()
+    assert lines == load_slate_lines(store, snapshot_id)
+    early = lines[0]
+    assert early["home_team"] == "New York Knicks"
+    assert early["home_spread"] == -3.0
+    assert early["snapshot_id"] == snapshot_id
+    assert load_slate_lines(store, "2026-02-11T19-00-00Z") == []
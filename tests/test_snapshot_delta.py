@@ -0,0 +1,81 @@
+from datetime import UTC, datetime
+
+from prop_ev.snapshot_delta import (
+    event_book_updates_from_featured,
+    index_event_book_updates,
+    plan_delta_refresh,
+)
+
+
+def test_event_book_updates_from_featured_flattens_bookmakers() -> None:
+    payload = [
+        {
+            "id": "event-2",
+            "commence_time": "2026-02-12T00:00:00Z",
+            "bookmakers": [
+                {"key": "fanduel", "last_update": "2026-02-11T18:00:00Z"},
+                {"key": "draftkings", "last_update": "2026-02-11T18:05:00Z"},
+            ],
+        },
+        {"id": "", "bookmakers": [{"key": "draftkings"}]},
+        "not-an-event",
+    ]
+
+    rows = event_book_updates_from_featured(payload)
+
+    assert [(row["event_id"], row["book"]) for row in rows] == [
+        ("event-2", "draftkings"),
+        ("event-2", "fanduel"),
+    ]
+    assert index_event_book_updates(rows) == {
+        "event-2": {
+            "draftkings": "2026-02-11T18:05:00Z",
+            "fanduel": "2026-02-11T18:00:00Z",
+        }
+    }
+
+
+def test_plan_delta_refresh_reuses_only_unchanged_events_outside_pre_tip() -> None:
+    books = {"draftkings": "2026-02-11T18:00:00Z"}
+    plan = plan_delta_refresh(
+        event_ids=["same", "moved", "soon", "new"],
+        current={
+            "same": books,
+            "moved": {"draftkings": "2026-02-11T18:30:00Z"},
+            "soon": books,
+            "new": books,
+        },
+        previous={"same": books, "moved": books, "soon": books},
+        previous_event_ids={"same", "moved", "soon"},
+        commence_times={
+            "same": "2026-02-12T03:00:00Z",
+            "moved": "2026-02-12T03:00:00Z",
+            "soon": "2026-02-11T19:30:00Z",
+            "new": "2026-02-12T03:00:00Z",
+        },
+        now=datetime(2026, 2, 11, 19, 0, tzinfo=UTC),
+        pre_tip_minutes=60,
+        source_snapshot_id="2026-02-11T18-00-00Z",
+    )
+
+    assert plan.reuse == ["same"]
+    assert plan.refresh == ["moved", "soon", "new"]
+    assert plan.reasons["moved"] == "books_changed"
+    assert plan.reasons["soon"] == "inside_pre_tip_window"
+    assert plan.reasons["new"] == "no_previous_rows"
+
+
+def test_plan_delta_refresh_without_source_fetches_everything() -> None:
+    plan = plan_delta_refresh(
+        event_ids=["a", "b"],
+        current={},
+        previous={},
+        previous_event_ids=set(),
+        commence_times={},
+        now=datetime(2026, 2, 11, 19, 0, tzinfo=UTC),
+        pre_tip_minutes=60,
+        source_snapshot_id="",
+    )
+
+    assert plan.refresh == ["a", "b"]
+    assert plan.reuse == []
@@ -0,0 +1,105 @@
+from prop_ev.strategy_context_impl import (
+    AvailabilityIndex,
+    injury_index,
+    resolve_player_team,
+    roster_status,
+)
+
+EVENT_CONTEXT = {
+    "event-1": {"home_team": "Boston Celtics", "away_team": "New York Knicks"},
+    "event-2": {"home_team": "Los Angeles Lakers", "away_team": "Denver Nuggets"},
+    "event-3": {"home_team": "", "away_team": "Denver Nuggets"},
+}
+ROSTER = {
+    "teams": {
+        "boston celtics": {
+            "active": ["jaysontatum"],
+            "inactive": ["kristapsporzingis"],
+            "all": ["jaysontatum", "kristapsporzingis", "jrueholiday"],
+        },
+        "new york knicks": {
+            "active": ["jalenbrunson"],
+            "inactive": [],
+            "all": ["jalenbrunson", "jrueholiday"],
+        },
+        "los angeles lakers": {"active": [], "inactive": [], "all": ["lebronjames"]},
+    }
+}
+IDENTITY_MAP = {
+    "players": {
+        "nicclaxton": {"aliases": ["nicolasclaxton"], "teams": ["Brooklyn Nets"]},
+        "derrickwhite": {"aliases": [], "teams": ["Boston Celtics"]},
+    }
+}
+INJURIES = {
+    "official": {
+        "rows": [
+            {"player": "Josh Hart", "team": "New York Knicks", "status": "questionable"},
+        ]
+    }
+}
+PLAYERS = [
+    "Jayson Tatum",
+    "Kristaps Porzingis",
+    "Jrue Holiday",
+    "Jalen Brunson",
+    "LeBron James",
+    "Josh Hart",
+    "Derrick White",
+    "Nic Claxton",
+    "Nobody Here",
+]
+
+
+def test_availability_index_matches_per_call_helpers() -> None:
+    injuries_by_player = injury_index(INJURIES)
+    index = AvailabilityIndex(
+        event_context=EVENT_CONTEXT,
+        roster=ROSTER,
+        injuries_by_player=injuries_by_player,
+        player_identity_map=IDENTITY_MAP,
+    )
+
+    for event_id in [*EVENT_CONTEXT, "missing-event"]:
+        for player in PLAYERS:
+            found = index.lookup(player_name=player, event_id=event_id)
+            assert found.roster_status == roster_status(
+                player_name=player,
+                event_id=event_id,
+                event_context=EVENT_CONTEXT,
+                roster=ROSTER,
+                player_identity_map=IDENTITY_MAP,
+            )
+            assert found.injury_row == injuries_by_player.get(index.player_norm(player), {})
+            if event_id in EVENT_CONTEXT:
+                assert found.team == resolve_player_team(
+                    player_name=player,
+                    event_id=event_id,
+                    event_context=EVENT_CONTEXT,
+                    roster=ROSTER,
+                    injury_row=found.injury_row,
+                    player_identity_map=IDENTITY_MAP,
+                )
+
+    first = index.lookup(player_name="Jrue Holiday", event_id="event-1")
+    assert (first.roster_status, first.team) == ("rostered", "")
+    assert index.lookup(player_name="Josh Hart", event_id="event-1").team == "new york knicks"
+    assert index.lookup(player_name="Derrick White", event_id="event-1").team == "boston celtics"
+
+
+def test_availability_index_unknown_roster_and_event() -> None:
+    no_roster = AvailabilityIndex(event_context=EVENT_CONTEXT, roster=None)
+    no_events = AvailabilityIndex(event_context=None, roster=ROSTER)
+
+    assert no_roster.roster_status(player_name="Jayson Tatum", event_id="event-1") == (
+        "unknown_roster"
+    )
+    assert no_roster.roster_status(player_name="Jayson Tatum", event_id="event-3") == (
+        "unknown_roster"
+    )
+    assert no_events.roster_status(player_name="Jayson Tatum", event_id="event-1") == (
+        "unknown_event"
+    )
+    index = AvailabilityIndex(event_context=EVENT_CONTEXT, roster=ROSTER)
+    assert index.roster_status(player_name="LeBron James", event_id="event-2") == ("unknown_roster")
+    assert index.roster_status(player_name="Jayson Tatum", event_id="event-3") == ("unknown_event")
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from prop_ev.strategy_inputs_bundle import StrategyInputsBundle, bundle_path_for
+
+
+def test_bundle_sections_follow_source_content(tmp_path: Path) -> None:
+    props = tmp_path / "event_props.jsonl"
+    props.write_text('{"event_id": "e1"}\n', encoding="utf-8")
+    missing = tmp_path / "slate_lines.jsonl"
+    sources = {"event_props": props, "slate_lines": missing}
+    path = bundle_path_for(tmp_path / "runtime", "2026-02-11T10-00-00Z")
+
+    StrategyInputsBundle(path).put("snapshot", sources, {"rows": [{"event_id": "e1"}]})
+
+    assert path.exists()
+    assert StrategyInputsBundle(path).get("snapshot", sources) == {"rows": [{"event_id": "e1"}]}
+    assert StrategyInputsBundle(path).get("identity", sources) is None
+    assert StrategyInputsBundle(path, enabled=False).get("snapshot", sources) is None
+
+    # Touching a source without changing its bytes keeps the section valid.
+    stat = props.stat()
+    os.utime(props, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert StrategyInputsBundle(path).get("snapshot", sources) is not None
+
+    props.write_text('{"event_id": "e2"}\n', encoding="utf-8")
+    assert StrategyInputsBundle(path).get("snapshot", sources) is None
+    props.write_text('{"event_id": "e1"}\n', encoding="utf-8")
+    missing.write_text("", encoding="utf-8")
+    assert StrategyInputsBundle(path).get("snapshot", sources) is None
+
+    path.write_bytes(b"not a pickle")
+    assert StrategyInputsBundle(path).get("snapshot", sources) is None
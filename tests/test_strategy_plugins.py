@@ -1,12 +1,16 @@
 from dataclasses import replace
 from datetime import UTC, datetime
 
+import pytest
+
+from prop_ev.sgp_engine import SGPCorrelationModel
 from prop_ev.strategies import get_strategy
 from prop_ev.strategies.base import (
     StrategyInputs,
     StrategyRecipe,
     StrategyRunConfig,
     compose_strategy_recipes,
+    run_strategy_recipe,
 )
 
 
@@ -123,6 +127,36 @@ def test_compose_strategy_recipes_combines_layers() -> None:
     assert combined.rolling_priors_source_strategy_id == "s010"
 
 
+def test_recipe_sgp_settings_reach_sgp_builder(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict = {}
+
+    def _capture(eligible_rows, top_n, **kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr("prop_ev.strategy_report.build._build_sgp_candidates", _capture)
+    correlation = {"default": 0.03, "volatile_market": 0.1}
+    recipe = compose_strategy_recipes(
+        StrategyRecipe(sgp_max_legs_per_event=6),
+        StrategyRecipe(sgp_legs_per_combo=3, sgp_correlation=correlation),
+    )
+    report = run_strategy_recipe(
+        inputs=_sample_inputs(), config=_sample_config(), recipe=recipe
+    ).report
+
+    assert captured["max_legs_per_event"] == 6
+    assert captured["legs_per_combo"] == 3
+    assert captured["correlation"] == SGPCorrelationModel.from_payload(correlation)
+    assert report["audit"]["sgp_legs_per_combo"] == 3
+    assert report["audit"]["sgp_correlation"] == correlation
+    with pytest.raises(ValueError, match="sgp_legs_per_combo"):
+        run_strategy_recipe(
+            inputs=_sample_inputs(),
+            config=_sample_config(),
+            recipe=StrategyRecipe(sgp_legs_per_combo=4),
+        )
+
+
 def test_strategies_force_allow_tier_b() -> None:
     for strategy_id in ("s002", "s014", "s015", "s016", "s017", "s020"):
         result = get_strategy(strategy_id).run(inputs=_sample_inputs(), config=_sample_config())
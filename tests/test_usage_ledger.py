@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from prop_ev.budget import read_llm_usage, read_odds_usage
+from prop_ev.cli import main
+from prop_ev.storage import SnapshotStore
+from prop_ev.usage_ledger import append_usage_row, load_usage_rollup, rollup_path_for
+
+
+def _odds_row(day: str, endpoint: str, credits: str, remaining: str) -> dict[str, object]:
+    return {
+        "timestamp_utc": f"{day}T12:00:00Z",
+        "endpoint": endpoint,
+        "snapshot_id": f"snap-{day}",
+        "cached": False,
+        "x_requests_last": credits,
+        "x_requests_remaining": remaining,
+    }
+
+
+def test_rollup_checkpoint_folds_only_new_rows(tmp_path: Path) -> None:
+    ledger = tmp_path / "usage" / "usage-2026-02.jsonl"
+    append_usage_row(ledger, _odds_row("2026-02-10", "featured", "3", "497"), kind="odds")
+    append_usage_row(ledger, _odds_row("2026-02-11", "event_odds", "5", "492"), kind="odds")
+
+    rollup = json.loads(rollup_path_for(ledger).read_text(encoding="utf-8"))
+    assert rollup["offset"] == ledger.stat().st_size
+    assert rollup["totals"]["credits"] == 8
+    assert rollup["by_endpoint"]["event_odds"]["credits"] == 5
+    assert rollup["by_day"]["2026-02-10"] == {"cached_rows": 0, "credits": 3, "rows": 1}
+
+    # Rows written by an older writer (no sidecar update) plus a torn trailing line.
+    with ledger.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(_odds_row("2026-02-11", "featured", "2", "490")) + "\n")
+        handle.write('{"x_requests_last": "9"')
+    caught_up = load_usage_rollup(ledger, kind="odds")
+    assert caught_up["totals"]["credits"] == 10
+    assert caught_up["last"]["provider_remaining"] == "490"
+    assert caught_up["offset"] < ledger.stat().st_size
+
+    ledger.write_text("", encoding="utf-8")
+    assert load_usage_rollup(ledger, kind="odds")["totals"]["credits"] == 0
+
+
+def test_budget_readers_use_rollup_totals(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "data")
+    for credits in ("1", "2", "bad"):
+        store.append_usage(
+            endpoint="featured",
+            request_key="k",
+            snapshot_id="s1",
+            status_code=200,
+            duration_ms=5,
+            retry_count=0,
+            headers={"x-requests-last": credits, "x-requests-remaining": "100"},
+            cached=False,
+        )
+    month = next(store.usage_dir.glob("usage-*.jsonl")).stem.removeprefix("usage-")
+    odds = read_odds_usage(store.root, month)
+    assert odds["rows"] == 3
+    assert odds["total_credits"] == 3
+    assert odds["provider_remaining"] == "100"
+
+    llm_ledger = tmp_path / "runtime" / "llm_usage" / "usage-2026-02.jsonl"
+    for cost in (0.1, 0.2, 0.3):
+        append_usage_row(
+            llm_ledger,
+            {"task": "brief", "cost_usd": cost, "input_tokens": 10, "output_tokens": 5},
+            kind="llm",
+        )
+    llm = read_llm_usage(tmp_path / "runtime", "2026-02")
+    assert llm["request_count"] == 3
+    assert llm["total_cost_usd"] == round(0.1 + 0.2 + 0.3, 6)
+    assert llm["total_tokens"] == 45
+
+
+def test_credits_report_slices_by_day(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    data_dir = tmp_path / "data"
+    ledger = data_dir / "usage" / "usage-2026-02.jsonl"
+    append_usage_row(ledger, _odds_row("2026-02-11", "event_odds", "5", "492"), kind="odds")
+    append_usage_row(ledger, _odds_row("2026-02-10", "featured", "3", "497"), kind="odds")
+
+    code = main(
+        [
+            "--data-dir",
+            str(data_dir),
+            "credits",
+            "report",
+            "--month",
+            "2026-02",
+            "--by",
+            "day",
+            "--json",
+        ]
+    )
+    assert code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["total_credits"] == 8
+    assert payload["slices"] == [
+        {"day": "2026-02-10", "credits": 3, "rows": 1},
+        {"day": "2026-02-11", "credits": 5, "rows": 1},
+    ]
+
+    code = main(
+        [
+            "--data-dir",
+            str(data_dir),
+            "credits",
+            "report",
+            "--month",
+            "2026-02",
+            "--day",
+            "2026-02-11",
+        ]
+    )
+    assert code == 0
+    out = capsys.readouterr().out
+    assert "month=2026-02 day=2026-02-11 total_credits=5 remaining=497" in out
+    assert "endpoint=event_odds credits=5 rows=1" in out
+    assert "endpoint=featured" not in out
+
+    code = main(
+        [
+            "--data-dir",
+            str(data_dir),
+            "credits",
+            "report",
+            "--month",
+            "2026-02",
+            "--day",
+            "2026-02-11",
+            "--by",
+            "snapshot",
+        ]
+    )
+    assert code == 2
+    assert "--day cannot be combined with --by snapshot" in capsys.readouterr().err
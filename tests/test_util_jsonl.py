@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from prop_ev.cli import main
+from prop_ev.util import jsonl
+from prop_ev.util.jsonl import JsonlRowError, iter_jsonl, read_jsonl, write_jsonl
+
+
+def test_write_jsonl_matches_legacy_bytes_and_round_trips(tmp_path: Path) -> None:
+    rows = [{"b": 1, "a": "é"}, {"nested": {"z": 1.5, "y": None}}]
+    path = tmp_path / "rows.jsonl"
+
+    assert write_jsonl(path, rows, batch_rows=1) == 2
+
+    expected = "".join(f"{json.dumps(row, sort_keys=True, ensure_ascii=True)}\n" for row in rows)
+    assert path.read_text(encoding="utf-8") == expected
+    assert read_jsonl(path) == rows
+    assert not [item for item in tmp_path.iterdir() if item.name.startswith(".tmp-")]
+
+    compact = tmp_path / "compact.jsonl"
+    write_jsonl(compact, rows, compact=True)
+    assert compact.read_text(encoding="utf-8").splitlines()[0] == '{"a":"\\u00e9","b":1}'
+
+
+def test_iter_jsonl_streams_skips_blanks_and_enforces_strict(tmp_path: Path) -> None:
+    path = tmp_path / "mixed.jsonl"
+    path.write_text('{"a": 1}\n\n  \n[1, 2]\n{"a": NaN}\n', encoding="utf-8")
+
+    stream = iter_jsonl(path)
+    assert next(stream) == {"a": 1}
+    stream.close()
+    rows = read_jsonl(path)
+    assert len(rows) == 2
+    assert rows[1]["a"] != rows[1]["a"]
+    with pytest.raises(JsonlRowError, match=r"mixed\.jsonl:4"):
+        read_jsonl(path, strict=True)
+    broken = tmp_path / "broken.jsonl"
+    broken.write_text('{"a": 1}\n{"a": \n{"a": 2}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_jsonl(broken)
+    assert list(iter_jsonl(broken, skip_invalid=True)) == [{"a": 1}, {"a": 2}]
+    assert read_jsonl(tmp_path / "missing.jsonl", missing_ok=True) == []
+    with pytest.raises(FileNotFoundError):
+        read_jsonl(tmp_path / "missing.jsonl")
+
+
+@pytest.mark.skipif(shutil.which("zstd") is None, reason="zstd binary not installed")
+def test_zst_paths_compress_on_the_fly(tmp_path: Path) -> None:
+    rows = [{"i": idx, "player": f"Player {idx}"} for idx in range(2500)]
+    path = tmp_path / "rows.jsonl.zst"
+
+    write_jsonl(path, rows)
+
+    assert path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    assert read_jsonl(path) == rows
+    assert next(iter_jsonl(path)) == rows[0]
+
+
+def test_data_bench_jsonl_reports_each_backend(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    data_dir = tmp_path / "data"
+    derived = data_dir / "snapshots" / "2026-02-11T17-00-00Z" / "derived"
+    write_jsonl(derived / "event_props.jsonl", [{"event_id": "e1", "price": -110}] * 5)
+
+    code = main(["--data-dir", str(data_dir), "data", "bench-jsonl", "--repeat", "1", "--json"])
+
+    assert code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["path"].endswith("2026-02-11T17-00-00Z/derived/event_props.jsonl")
+    assert [row["backend"] for row in payload["results"]] == list(jsonl.PARSER_BACKENDS)
+    assert {row["rows"] for row in payload["results"]} == {5}